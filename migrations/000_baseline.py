@@ -0,0 +1,349 @@
+"""
+Migration 000: Temel şema (baseline).
+
+Boş bir veritabanını güncel şemaya getirir. Migration motorundan önce oluşturulmuş
+(eski init_db / ensure_database_schema ile yönetilen) veritabanlarını da tek seferde
+aynı şemaya yükseltir:
+    - users tablosundaki gereksiz kolonlar temizlenir (department -> cohort)
+    - eksik kolonlar eklenir (polls.message_*, *.updated_at, challenge_evaluations.*)
+    - challenge_hubs.canvas_id kolonu kaldırılır (002)
+    - şeması eskide kalmış matches / votes / help_requests tabloları veri korunarak yenilenir
+
+Index'ler burada değil, src/clients/index_registry.py kaydında tanımlanır ve
+her açılışta DatabaseClient.init_db tarafından eşitlenir.
+
+001-003 numaralı SQL migration'ları bu baseline'a dahildir; baseline uygulanan
+veritabanlarında ayrıca çalıştırılmazlar (BASELINE_VERSION).
+"""
+
+import sqlite3
+
+BASELINE_VERSION = 3
+
+USERS_COLUMNS = [
+    "id", "slack_id", "first_name", "middle_name", "surname",
+    "full_name", "birthday", "cohort", "created_at", "updated_at",
+]
+
+TABLES = {
+    "users": """
+        CREATE TABLE IF NOT EXISTS users (
+            id TEXT PRIMARY KEY,
+            slack_id TEXT UNIQUE,
+            first_name TEXT,
+            middle_name TEXT,
+            surname TEXT,
+            full_name TEXT,
+            birthday TEXT,
+            cohort TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "matches": """
+        CREATE TABLE IF NOT EXISTS matches (
+            id TEXT PRIMARY KEY,
+            channel_id TEXT,
+            coffee_channel_id TEXT,
+            user1_id TEXT,
+            user2_id TEXT,
+            status TEXT DEFAULT 'active',
+            summary TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user1_id) REFERENCES users(slack_id) ON DELETE SET NULL,
+            FOREIGN KEY (user2_id) REFERENCES users(slack_id) ON DELETE SET NULL
+        )
+    """,
+    "polls": """
+        CREATE TABLE IF NOT EXISTS polls (
+            id TEXT PRIMARY KEY,
+            topic TEXT,
+            options TEXT, -- JSON formatında seçenekler
+            result_summary TEXT, -- Oylama bittiğinde LLM özeti veya ham sonuç
+            creator_id TEXT,
+            allow_multiple INTEGER DEFAULT 0, -- Çoklu oy opsiyonu
+            is_closed INTEGER DEFAULT 0,
+            expires_at TIMESTAMP,
+            message_ts TEXT, -- Oylama mesajının timestamp'i (güncelleme için)
+            message_channel TEXT, -- Oylama mesajının kanalı
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "votes": """
+        CREATE TABLE IF NOT EXISTS votes (
+            id TEXT PRIMARY KEY,
+            poll_id TEXT,
+            user_id TEXT,
+            option_index INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(poll_id, user_id, option_index),
+            FOREIGN KEY (poll_id) REFERENCES polls(id) ON DELETE CASCADE,
+            FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
+        )
+    """,
+    "feedbacks": """
+        CREATE TABLE IF NOT EXISTS feedbacks (
+            id TEXT PRIMARY KEY,
+            content TEXT,
+            category TEXT DEFAULT 'general',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "help_requests": """
+        CREATE TABLE IF NOT EXISTS help_requests (
+            id TEXT PRIMARY KEY,
+            requester_id TEXT NOT NULL,
+            topic TEXT NOT NULL,
+            description TEXT NOT NULL,
+            status TEXT DEFAULT 'open',
+            helper_id TEXT,
+            channel_id TEXT,
+            help_channel_id TEXT,
+            message_ts TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            resolved_at TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (requester_id) REFERENCES users(slack_id) ON DELETE CASCADE,
+            FOREIGN KEY (helper_id) REFERENCES users(slack_id) ON DELETE SET NULL
+        )
+    """,
+    "challenge_themes": """
+        CREATE TABLE IF NOT EXISTS challenge_themes (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE,
+            description TEXT,
+            icon TEXT,
+            difficulty_range TEXT,
+            is_active INTEGER DEFAULT 1,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "challenge_projects": """
+        CREATE TABLE IF NOT EXISTS challenge_projects (
+            id TEXT PRIMARY KEY,
+            theme TEXT NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT,
+            objectives TEXT,
+            deliverables TEXT,
+            tasks TEXT,
+            difficulty_level TEXT DEFAULT 'intermediate',
+            estimated_hours INTEGER DEFAULT 48,
+            min_team_size INTEGER DEFAULT 2,
+            max_team_size INTEGER DEFAULT 6,
+            learning_objectives TEXT,
+            skills_required TEXT,
+            skills_developed TEXT,
+            resources TEXT,
+            knowledge_base_refs TEXT,
+            llm_customizable INTEGER DEFAULT 1,
+            llm_enhancement_prompt TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """,
+    "challenge_hubs": """
+        CREATE TABLE IF NOT EXISTS challenge_hubs (
+            id TEXT PRIMARY KEY,
+            creator_id TEXT NOT NULL,
+            theme TEXT NOT NULL,
+            team_size INTEGER NOT NULL,
+            status TEXT DEFAULT 'recruiting',
+            challenge_channel_id TEXT,
+            hub_channel_id TEXT,
+            selected_project_id TEXT,
+            llm_customizations TEXT,
+            deadline_hours INTEGER DEFAULT 48,
+            difficulty TEXT DEFAULT 'intermediate',
+            deadline TIMESTAMP,
+            started_at TIMESTAMP,
+            completed_at TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            project_name TEXT,
+            project_description TEXT,
+            summary_message_ts TEXT,
+            summary_message_channel_id TEXT,
+            ended_at TIMESTAMP,
+            FOREIGN KEY (creator_id) REFERENCES users(slack_id) ON DELETE CASCADE
+        )
+    """,
+    "challenge_participants": """
+        CREATE TABLE IF NOT EXISTS challenge_participants (
+            id TEXT PRIMARY KEY,
+            challenge_hub_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            role TEXT,
+            joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            points_earned INTEGER DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(challenge_hub_id, user_id),
+            FOREIGN KEY (challenge_hub_id) REFERENCES challenge_hubs(id) ON DELETE CASCADE,
+            FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
+        )
+    """,
+    "challenge_submissions": """
+        CREATE TABLE IF NOT EXISTS challenge_submissions (
+            id TEXT PRIMARY KEY,
+            challenge_hub_id TEXT NOT NULL,
+            team_name TEXT,
+            project_name TEXT,
+            solution_summary TEXT,
+            deliverables TEXT,
+            learning_outcomes TEXT,
+            llm_enhanced_features TEXT,
+            submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            points_awarded INTEGER DEFAULT 0,
+            creativity_score INTEGER DEFAULT 0,
+            teamwork_score INTEGER DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (challenge_hub_id) REFERENCES challenge_hubs(id) ON DELETE CASCADE
+        )
+    """,
+    "challenge_evaluations": """
+        CREATE TABLE IF NOT EXISTS challenge_evaluations (
+            id TEXT PRIMARY KEY,
+            challenge_hub_id TEXT NOT NULL,
+            evaluation_channel_id TEXT,
+            github_repo_url TEXT,
+            github_repo_public INTEGER DEFAULT 0,
+            status TEXT DEFAULT 'pending',
+            true_votes INTEGER DEFAULT 0,
+            false_votes INTEGER DEFAULT 0,
+            final_result TEXT,
+            admin_approval TEXT DEFAULT 'pending',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            deadline_at TIMESTAMP,
+            completed_at TIMESTAMP,
+            jury_status TEXT DEFAULT 'recruiting',
+            FOREIGN KEY (challenge_hub_id) REFERENCES challenge_hubs(id) ON DELETE CASCADE
+        )
+    """,
+    "challenge_evaluators": """
+        CREATE TABLE IF NOT EXISTS challenge_evaluators (
+            id TEXT PRIMARY KEY,
+            evaluation_id TEXT NOT NULL,
+            user_id TEXT NOT NULL,
+            vote TEXT,
+            voted_at TIMESTAMP,
+            FOREIGN KEY (evaluation_id) REFERENCES challenge_evaluations(id) ON DELETE CASCADE,
+            FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
+        )
+    """,
+    "user_challenge_stats": """
+        CREATE TABLE IF NOT EXISTS user_challenge_stats (
+            user_id TEXT PRIMARY KEY,
+            total_challenges INTEGER DEFAULT 0,
+            completed_challenges INTEGER DEFAULT 0,
+            total_points INTEGER DEFAULT 0,
+            creativity_points INTEGER DEFAULT 0,
+            teamwork_points INTEGER DEFAULT 0,
+            favorite_theme TEXT,
+            last_challenge_date DATE,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
+        )
+    """,
+}
+
+# Eski veritabanlarında eksik olabilecek kolonlar: (tablo, kolon, tanım)
+# SQLite'da ALTER TABLE ile DEFAULT CURRENT_TIMESTAMP kullanılamaz, updated_at NULL ile eklenir.
+LEGACY_COLUMNS = [
+    ("polls", "message_ts", "TEXT"),
+    ("polls", "message_channel", "TEXT"),
+    ("challenge_hubs", "updated_at", "TIMESTAMP"),
+    ("challenge_hubs", "project_name", "TEXT"),
+    ("challenge_hubs", "project_description", "TEXT"),
+    ("challenge_hubs", "summary_message_ts", "TEXT"),
+    ("challenge_hubs", "summary_message_channel_id", "TEXT"),
+    ("challenge_hubs", "ended_at", "TIMESTAMP"),
+    ("challenge_participants", "updated_at", "TIMESTAMP"),
+    ("challenge_submissions", "updated_at", "TIMESTAMP"),
+    ("challenge_evaluations", "admin_approval", "TEXT DEFAULT 'pending'"),
+    ("challenge_evaluations", "jury_status", "TEXT DEFAULT 'recruiting'"),
+]
+
+def _columns(conn: sqlite3.Connection, table: str) -> list:
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()]
+
+
+def _upgrade_legacy_users(conn: sqlite3.Connection) -> None:
+    """Eski users tablosunu (department vb. kolonlar) tek bir INSERT ... SELECT ile temizler."""
+    columns = _columns(conn, "users")
+    if set(columns) == set(USERS_COLUMNS):
+        return
+
+    def source(col: str, default: str = "''") -> str:
+        return f"COALESCE({col}, {default})" if col in columns else default
+
+    cohort_source = "department" if "department" in columns else "cohort"
+    conn.execute("DROP TABLE IF EXISTS users_new")
+    conn.execute(TABLES["users"].replace("IF NOT EXISTS users", "users_new"))
+    conn.execute(f"""
+        INSERT INTO users_new (id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort, created_at, updated_at)
+        SELECT
+            id,
+            slack_id,
+            {source('first_name')},
+            {source('middle_name')},
+            {source('surname')},
+            {source('full_name')},
+            {'birthday' if 'birthday' in columns else 'NULL'},
+            {source(cohort_source)},
+            {source('created_at', 'CURRENT_TIMESTAMP')},
+            {source('updated_at', 'CURRENT_TIMESTAMP')}
+        FROM users
+    """)
+    conn.execute("DROP TABLE users")
+    conn.execute("ALTER TABLE users_new RENAME TO users")
+
+
+def _rebuild_table(conn: sqlite3.Connection, table: str) -> None:
+    """
+    Tabloyu güncel tanımıyla yeniden oluşturur; ortak kolonlardaki veriyi tek bir
+    INSERT ... SELECT ile taşır (SQLite'da kolon kaldırma/FK değiştirme bu şekilde yapılır).
+    """
+    target = _columns_of_ddl(conn, table)
+    current = _columns(conn, table)
+    if set(current) == set(target):
+        return
+    kept_str = ", ".join(c for c in current if c in target)
+    conn.execute(f"DROP TABLE IF EXISTS {table}_new")
+    conn.execute(TABLES[table].replace(f"IF NOT EXISTS {table}", f"{table}_new"))
+    conn.execute(f"INSERT INTO {table}_new ({kept_str}) SELECT {kept_str} FROM {table}")
+    conn.execute(f"DROP TABLE {table}")
+    conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+
+
+def _columns_of_ddl(conn: sqlite3.Connection, table: str) -> list:
+    """TABLES içindeki tanımın kolon listesini geçici bir tablo üzerinden okur."""
+    probe = f"_probe_{table}"
+    ddl = TABLES[table].replace(f"CREATE TABLE IF NOT EXISTS {table}", f"CREATE TEMP TABLE {probe}")
+    conn.execute(ddl)
+    columns = [row[1] for row in conn.execute(f"PRAGMA temp.table_info({probe})").fetchall()]
+    conn.execute(f"DROP TABLE temp.{probe}")
+    return columns
+
+
+def upgrade(conn: sqlite3.Connection) -> None:
+    existing = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+    }
+
+    for table, ddl in TABLES.items():
+        conn.execute(ddl)
+
+    if "users" in existing:
+        _upgrade_legacy_users(conn)
+    # challenge_hubs: canvas_id kaldırılır (002).
+    # matches / votes / help_requests: eski init_db bu tabloları her açılışta silip yeniden
+    # oluşturuyordu; şeması farklı kalmış bir kopya varsa veri korunarak yenilenir.
+    for table in ("challenge_hubs", "matches", "votes", "help_requests"):
+        if table in existing:
+            _rebuild_table(conn, table)
+
+    for table, column, definition in LEGACY_COLUMNS:
+        if table in existing and column not in _columns(conn, table):
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+
+    conn.execute("UPDATE challenge_evaluations SET jury_status = 'recruiting' WHERE jury_status IS NULL")
@@ -5,8 +5,9 @@
 --              Bu kolon gereksiz olduğu için kaldırılıyor.
 
 -- NOT: SQLite'da kolon kaldırmak için tabloyu yeniden oluşturmak gerekir.
--- Bu migration __main__.py'deki ensure_database_schema() fonksiyonu tarafından
--- otomatik olarak uygulanacaktır.
+-- Bu adım 000_baseline.py içinde otomatik olarak uygulanır: upgrade() mevcut
+-- challenge_hubs tablosunu _rebuild_table ile TABLES'daki (canvas_id'siz) şemaya göre yeniden kurar;
+-- baseline uygulanmış veritabanlarında bu dosya yalnızca kayıt altına alınır.
 
 -- Manuel uygulama için:
 -- 1. Mevcut verileri yedekle
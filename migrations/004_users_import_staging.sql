@@ -0,0 +1,15 @@
+-- Migration: CSV import için staging tablosu
+-- Description: UserRepository.import_from_csv satırları önce bu tabloya parça parça yükler,
+--              ardından tek bir kısa transaction'da users tablosuna aktarır. Böylece import
+--              sırasında users tablosu hiçbir an boş kalmaz (eşzamanlı /profil sorguları etkilenmez).
+
+CREATE TABLE IF NOT EXISTS users_import_staging (
+    slack_id TEXT PRIMARY KEY,
+    id TEXT NOT NULL,
+    first_name TEXT,
+    middle_name TEXT,
+    surname TEXT,
+    full_name TEXT,
+    birthday TEXT,
+    cohort TEXT
+);
@@ -0,0 +1,20 @@
+-- Migration: İstatistik zaman serisi rollup tablosu
+-- Description: StatisticsService saatlik ve günlük sayaçları periyodik olarak bu tabloya yazar;
+--              /admin-istatistik trendleri geçmiş tabloları taramadan, yalnızca bucket'ları okuyarak çizer.
+--              stats_rollup_state her granülerlik için en son işlenen bucket'ı tutar (artımlı güncelleme).
+
+CREATE TABLE IF NOT EXISTS stats_snapshots (
+    granularity TEXT NOT NULL,              -- 'hour' veya 'day'
+    metric TEXT NOT NULL,                   -- örn. 'matches_created', 'help_resolved'
+    dimension TEXT NOT NULL DEFAULT '',     -- örn. cohort (boyutsuz metriklerde '')
+    bucket TEXT NOT NULL,                   -- '2024-03-10 14:00' (hour) / '2024-03-10' (day)
+    value INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (granularity, metric, dimension, bucket)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS stats_rollup_state (
+    granularity TEXT PRIMARY KEY,
+    last_bucket TEXT NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,95 @@
+-- Migration: Tam metin arama (FTS5) index'leri
+-- Description: Yardım talepleri, geri bildirimler, eşleşme özetleri ve challenge projeleri için
+--              external-content FTS5 tabloları. Metin kaynak tabloda kalır; FTS tablosu yalnızca
+--              index'i tutar ve kaynak satırın rowid'i ile eşleşir. Trigger'lar index'i her
+--              INSERT / UPDATE / DELETE'te aynı transaction içinde günceller.
+--              Son ifadeler mevcut satırları index'ler ('rebuild').
+--              NOT: Bu tablolarda açık INTEGER PRIMARY KEY yok; VACUUM rowid'leri değiştirebilir,
+--              VACUUM sonrası BaseRepository.rebuild_search_index() çalıştırılmalıdır.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS help_requests_fts USING fts5(
+    topic, description,
+    content='help_requests', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS help_requests_fts_ai AFTER INSERT ON help_requests BEGIN
+    INSERT INTO help_requests_fts(rowid, topic, description) VALUES (new.rowid, new.topic, new.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS help_requests_fts_ad AFTER DELETE ON help_requests BEGIN
+    INSERT INTO help_requests_fts(help_requests_fts, rowid, topic, description)
+    VALUES ('delete', old.rowid, old.topic, old.description);
+END;
+
+CREATE TRIGGER IF NOT EXISTS help_requests_fts_au AFTER UPDATE OF topic, description ON help_requests BEGIN
+    INSERT INTO help_requests_fts(help_requests_fts, rowid, topic, description)
+    VALUES ('delete', old.rowid, old.topic, old.description);
+    INSERT INTO help_requests_fts(rowid, topic, description) VALUES (new.rowid, new.topic, new.description);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS feedbacks_fts USING fts5(
+    content,
+    content='feedbacks', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS feedbacks_fts_ai AFTER INSERT ON feedbacks BEGIN
+    INSERT INTO feedbacks_fts(rowid, content) VALUES (new.rowid, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS feedbacks_fts_ad AFTER DELETE ON feedbacks BEGIN
+    INSERT INTO feedbacks_fts(feedbacks_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS feedbacks_fts_au AFTER UPDATE OF content ON feedbacks BEGIN
+    INSERT INTO feedbacks_fts(feedbacks_fts, rowid, content) VALUES ('delete', old.rowid, old.content);
+    INSERT INTO feedbacks_fts(rowid, content) VALUES (new.rowid, new.content);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS matches_fts USING fts5(
+    summary,
+    content='matches', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS matches_fts_ai AFTER INSERT ON matches BEGIN
+    INSERT INTO matches_fts(rowid, summary) VALUES (new.rowid, new.summary);
+END;
+
+CREATE TRIGGER IF NOT EXISTS matches_fts_ad AFTER DELETE ON matches BEGIN
+    INSERT INTO matches_fts(matches_fts, rowid, summary) VALUES ('delete', old.rowid, old.summary);
+END;
+
+CREATE TRIGGER IF NOT EXISTS matches_fts_au AFTER UPDATE OF summary ON matches BEGIN
+    INSERT INTO matches_fts(matches_fts, rowid, summary) VALUES ('delete', old.rowid, old.summary);
+    INSERT INTO matches_fts(rowid, summary) VALUES (new.rowid, new.summary);
+END;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS challenge_projects_fts USING fts5(
+    name, description, skills_required,
+    content='challenge_projects', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+
+CREATE TRIGGER IF NOT EXISTS challenge_projects_fts_ai AFTER INSERT ON challenge_projects BEGIN
+    INSERT INTO challenge_projects_fts(rowid, name, description, skills_required)
+    VALUES (new.rowid, new.name, new.description, new.skills_required);
+END;
+
+CREATE TRIGGER IF NOT EXISTS challenge_projects_fts_ad AFTER DELETE ON challenge_projects BEGIN
+    INSERT INTO challenge_projects_fts(challenge_projects_fts, rowid, name, description, skills_required)
+    VALUES ('delete', old.rowid, old.name, old.description, old.skills_required);
+END;
+
+CREATE TRIGGER IF NOT EXISTS challenge_projects_fts_au AFTER UPDATE OF name, description, skills_required ON challenge_projects BEGIN
+    INSERT INTO challenge_projects_fts(challenge_projects_fts, rowid, name, description, skills_required)
+    VALUES ('delete', old.rowid, old.name, old.description, old.skills_required);
+    INSERT INTO challenge_projects_fts(rowid, name, description, skills_required)
+    VALUES (new.rowid, new.name, new.description, new.skills_required);
+END;
+
+INSERT INTO help_requests_fts(help_requests_fts) VALUES ('rebuild');
+INSERT INTO feedbacks_fts(feedbacks_fts) VALUES ('rebuild');
+INSERT INTO matches_fts(matches_fts) VALUES ('rebuild');
+INSERT INTO challenge_projects_fts(challenge_projects_fts) VALUES ('rebuild');
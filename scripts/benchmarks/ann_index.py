@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Vektör indeks tipleri için recall@k / sorgu gecikmesi benchmark'ı (flat tam taramaya karşı).
+
+Gömme modeli indirmeden çalışsın diye cümle gömmelerine benzer sentetik veri kullanılır:
+birim uzunlukta, konu kümeleri etrafında dağılmış vektörler. Sorgular korpustaki
+parçaların gürültülü kopyalarıdır (aynı konuda farklı ifade edilmiş soru gibi).
+Her sorgu /sor'daki gibi tek tek çalıştırılır. "boyut" indeksin RAM'deki (serialize) boyutudur;
+IVF-PQ yeniden sıralamasında kullanılan ham vektörler diskte (mmap) kalır.
+
+Kullanım:
+    python scripts/benchmarks/ann_index.py --chunks 100000 --queries 200
+"""
+
+import argparse
+
+import faiss
+import numpy as np
+
+from common import percentile, fmt_ms, Timer
+from src.clients.vector_index import VectorIndexConfig, apply_search_params, build_index, resolve_nlist, search_index
+
+DIMENSION = 384  # all-MiniLM-L6-v2
+
+
+def make_corpus(chunks: int, queries: int, topics: int, seed: int = 42):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(topics, DIMENSION)).astype("float32")
+    vectors = centers[rng.integers(0, topics, size=chunks)] + 0.6 * rng.normal(size=(chunks, DIMENSION)).astype("float32")
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    picked = rng.choice(chunks, size=queries, replace=False)
+    query_vectors = vectors[picked] + 0.05 * rng.normal(size=(queries, DIMENSION)).astype("float32")
+    query_vectors /= np.linalg.norm(query_vectors, axis=1, keepdims=True)
+    return np.ascontiguousarray(vectors), np.ascontiguousarray(query_vectors)
+
+
+def measure(index, config: VectorIndexConfig, vectors: np.ndarray, query_vectors: np.ndarray, truth: np.ndarray, k: int):
+    latencies, hits = [], 0
+    for i in range(len(query_vectors)):
+        with Timer() as t:
+            _, ids = search_index(index, config, query_vectors[i:i + 1], k, vectors)
+        latencies.append(t.elapsed)
+        hits += len(set(ids[0]) & set(truth[i]))
+    return hits / truth.size, latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=100000, help="Korpustaki parça sayısı")
+    parser.add_argument("--queries", type=int, default=200, help="Sorgu sayısı")
+    parser.add_argument("--topics", type=int, default=500, help="Sentetik konu kümesi sayısı")
+    parser.add_argument("-k", type=int, default=10, help="recall@k için k")
+    args = parser.parse_args()
+
+    vectors, query_vectors = make_corpus(args.chunks, args.queries, args.topics)
+    print(f"Korpus: {args.chunks} parça x {DIMENSION} boyut, {args.queries} sorgu, recall@{args.k}\n")
+
+    # (etiket, indeks ayarı, denenecek arama ayarları)
+    variants = [
+        ("flat", VectorIndexConfig(index_type="flat"), [{}]),
+        ("ivf", VectorIndexConfig(index_type="ivf"), [{"nprobe": n} for n in (1, 4, 16, 64)]),
+        ("hnsw", VectorIndexConfig(index_type="hnsw"), [{"ef_search": ef} for ef in (16, 64, 128)]),
+        # pq_refine=0: yalnızca sıkıştırılmış kodlar; >0: adaylar ham vektörlerle (mmap) yeniden sıralanır
+        ("ivfpq", VectorIndexConfig(index_type="ivfpq"), [
+            {"nprobe": 16, "pq_refine": 0}, {"nprobe": 16, "pq_refine": 4}, {"nprobe": 16, "pq_refine": 10},
+        ]),
+    ]
+
+    truth = None
+    print(f"{'indeks':<40}{'kurulum':>10}{'boyut':>10}{'recall':>9}{'p50':>11}{'p95':>11}")
+    for label, config, search_params in variants:
+        with Timer() as build:
+            index = build_index(config, DIMENSION, vectors)
+        size_mb = len(faiss.serialize_index(index)) / 1e6
+        if truth is None:
+            _, truth = index.search(query_vectors, args.k)
+
+        for params in search_params:
+            search_config = config._replace(**params)
+            apply_search_params(index, search_config)
+            recall, latencies = measure(index, search_config, vectors, query_vectors, truth, args.k)
+            name = label
+            if "nprobe" in params:
+                name += f" nlist={resolve_nlist(config, args.chunks)} nprobe={params['nprobe']}"
+                if "pq_refine" in params:
+                    name += f" refine={params['pq_refine']}"
+            elif "ef_search" in params:
+                name += f" M={config.hnsw_m} efSearch={params['ef_search']}"
+            print(
+                f"{name:<40}{build.elapsed:>9.1f}s{size_mb:>8.1f}MB{recall:>9.3f}"
+                f"{fmt_ms(percentile(latencies, 50)):>11}{fmt_ms(percentile(latencies, 95)):>11}"
+            )
+
+
+if __name__ == "__main__":
+    main()
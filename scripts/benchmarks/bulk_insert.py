@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Toplu ekleme benchmark'ı: satır satır create() ile create_many() (executemany) karşılaştırması
+ve 10k üyelik bir kohort CSV import'u.
+
+Kullanım:
+    python scripts/benchmarks/bulk_insert.py --rows 10000
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+
+from common import temp_database, Timer
+from src.repositories import UserRepository
+
+
+def make_rows(n: int, prefix: str) -> list:
+    return [
+        {"slack_id": f"{prefix}{i:06d}", "first_name": "Ad", "surname": f"Soyad{i}",
+         "full_name": f"Ad Soyad{i}", "cohort": "Yapay Zeka"}
+        for i in range(n)
+    ]
+
+
+def write_csv(path: str, n: int) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Cohort", "Slack ID", "First Name", "Middle Name", "Surname", "Birthday"])
+        for i in range(n):
+            writer.writerow(["Yapay Zeka", f"U{i:07d}", "Ad", "", f"Soyad{i}", f"{i % 28 + 1}.{i % 12 + 1}.1998"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="create() vs create_many() benchmark'ı")
+    parser.add_argument("--rows", type=int, default=10000)
+    args = parser.parse_args()
+
+    print(f"Satır sayısı: {args.rows}\n")
+    print(f"{'yöntem':<24} {'süre (sn)':>10} {'satır/sn':>12}")
+
+    with temp_database() as db:
+        repo = UserRepository(db)
+
+        rows = make_rows(args.rows, "UROW")
+        with Timer() as t:
+            for row in rows:
+                repo.create(row)
+        print(f"{'create (satır satır)':<24} {t.elapsed:>10.2f} {args.rows / t.elapsed:>12.0f}")
+
+        rows = make_rows(args.rows, "UBULK")
+        with Timer() as t:
+            repo.create_many(rows)
+        print(f"{'create_many':<24} {t.elapsed:>10.2f} {args.rows / t.elapsed:>12.0f}")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "cohort.csv")
+            write_csv(path, args.rows)
+            with Timer() as t:
+                imported = repo.import_from_csv(path)
+        print(f"{'import_from_csv':<24} {t.elapsed:>10.2f} {imported / t.elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Vektör parça deposu yükleme benchmark'ı: pickle edilmiş döküman listesi ile mmap'li ChunkStore.
+
+Her iki biçim için aynı korpus yazılır; ardından açılış süresi, açılışta Python heap'ine
+alınan bellek (tracemalloc) ve bir /sor aramasının isabetlerini (top_k * 5 parça)
+okuma süresi ölçülür.
+
+Kullanım:
+    python scripts/benchmarks/chunk_store.py --chunks 100000
+"""
+
+import argparse
+import os
+import pickle
+import random
+import shutil
+import tempfile
+import tracemalloc
+
+from common import percentile, fmt_ms, Timer
+from src.clients.chunk_store import ChunkStore
+
+WORDS = "eğitim takvimi kurallar proje ödev sınav mentor topluluk etkinlik başvuru sertifika kamp".split()
+
+
+def make_corpus(chunks: int, chunk_chars: int, sources: int, seed: int = 42):
+    rng = random.Random(seed)
+    texts, metadata = [], []
+    for i in range(chunks):
+        words = []
+        while sum(len(w) + 1 for w in words) < chunk_chars:
+            words.append(rng.choice(WORDS))
+        texts.append(f"{i}: " + " ".join(words))
+        metadata.append({"source": f"dokuman_{i % sources}.pdf"})
+    return texts, metadata
+
+
+def measure_open(open_fn):
+    tracemalloc.start()
+    with Timer() as t:
+        store = open_fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return store, t.elapsed, peak
+
+
+def measure_hits(store, total: int, queries: int, hits: int) -> list:
+    rng = random.Random(7)
+    latencies = []
+    for _ in range(queries):
+        ids = rng.sample(range(total), hits)
+        with Timer() as t:
+            [dict(store[i]) for i in ids]
+        latencies.append(t.elapsed)
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chunks", type=int, default=100000, help="Korpustaki parça sayısı")
+    parser.add_argument("--chunk-chars", type=int, default=1200, help="Parça uzunluğu (KnowledgeService chunk_size)")
+    parser.add_argument("--sources", type=int, default=200, help="Farklı kaynak dosya sayısı")
+    parser.add_argument("--queries", type=int, default=500, help="Ölçülecek arama sayısı")
+    parser.add_argument("--hits", type=int, default=25, help="Arama başına okunan parça (top_k * 5)")
+    args = parser.parse_args()
+
+    texts, metadata = make_corpus(args.chunks, args.chunk_chars, args.sources)
+    temp_dir = tempfile.mkdtemp(prefix="cemil_bench_chunks_")
+    try:
+        pkl_path = os.path.join(temp_dir, "vector_store.pkl")
+        with open(pkl_path, "wb") as f:
+            pickle.dump([{"text": t, "metadata": m} for t, m in zip(texts, metadata)], f)
+        store_path = os.path.join(temp_dir, "vector_store.chunks")
+        with Timer() as write:
+            ChunkStore(store_path).append(texts, metadata)
+        del texts, metadata
+
+        def open_pickle():
+            with open(pkl_path, "rb") as f:
+                return pickle.load(f)
+
+        def open_store():
+            store = ChunkStore(store_path)
+            store.load()
+            return store
+
+        print(f"Korpus: {args.chunks} parça x ~{args.chunk_chars} karakter, {args.sources} kaynak")
+        print(f"Disk: pickle {os.path.getsize(pkl_path) / 1e6:.1f} MB, ChunkStore "
+              f"{sum(os.path.getsize(os.path.join(temp_dir, n)) for n in os.listdir(temp_dir) if n.startswith('vector_store.chunks')) / 1e6:.1f} MB "
+              f"(yazma {write.elapsed:.2f} sn)\n")
+
+        print(f"{'':<14}{'açılış':>12}{'heap':>12}{'isabet p50':>14}{'isabet p95':>14}")
+        for label, open_fn in (("pickle", open_pickle), ("ChunkStore", open_store)):
+            store, elapsed, peak = measure_open(open_fn)
+            latencies = measure_hits(store, args.chunks, args.queries, args.hits)
+            print(
+                f"{label:<14}{fmt_ms(elapsed):>12}{peak / 1e6:>10.1f}MB"
+                f"{fmt_ms(percentile(latencies, 50)):>14}{fmt_ms(percentile(latencies, 95)):>14}"
+            )
+            if isinstance(store, ChunkStore):
+                store.close()
+            del store
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
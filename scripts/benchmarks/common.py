@@ -0,0 +1,63 @@
+"""
+Benchmark scriptleri için ortak yardımcılar.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Iterator, List
+
+# Proje kök dizinini sys.path'e ekle
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if ROOT_DIR not in sys.path:
+    sys.path.append(ROOT_DIR)
+
+import logging
+from src.core.logger import logger
+from src.core.singleton import SingletonMeta
+from src.clients.database_client import DatabaseClient
+
+# Benchmark çıktısı log gürültüsünde kaybolmasın
+logger.setLevel(logging.ERROR)
+
+
+@contextmanager
+def temp_database(**client_kwargs) -> Iterator[DatabaseClient]:
+    """Geçici dizinde taze bir DatabaseClient açar; çıkışta siler (singleton sıfırlanır)."""
+    temp_dir = tempfile.mkdtemp(prefix="cemil_bench_")
+    SingletonMeta._instances.pop(DatabaseClient, None)
+    client = DatabaseClient(db_path=os.path.join(temp_dir, "bench.db"), **client_kwargs)
+    try:
+        yield client
+    finally:
+        client.close()
+        SingletonMeta._instances.pop(DatabaseClient, None)
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Basit yüzdelik hesabı (örnekler saniye cinsinden)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def fmt_ms(seconds: float) -> str:
+    return f"{seconds * 1000:.2f} ms"
+
+
+class Timer:
+    """`with Timer() as t:` ile geçen süreyi ölçer."""
+
+    def __enter__(self) -> "Timer":
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.elapsed = time.perf_counter() - self.started
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Oy yazma trafiği + eşzamanlı okuyucular altında SQLite kilit çekişmesi benchmark'ı.
+
+Varsayılan rollback-journal profili (journal_mode=DELETE, synchronous=FULL) ile
+WAL profilini (DEFAULT_PRAGMAS) karşılaştırır.
+
+Kullanım:
+    python scripts/benchmarks/db_contention.py --writers 4 --readers 4 --votes 250
+"""
+
+import argparse
+import threading
+import uuid
+
+from common import temp_database, percentile, fmt_ms, Timer
+from src.clients.database_client import DEFAULT_PRAGMAS
+from src.core.exceptions import DatabaseError
+from src.repositories import PollRepository, VoteRepository, UserRepository
+
+PROFILES = {
+    "rollback": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "busy_timeout": 5000,
+        "cache_size": -2000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+    },
+    "wal": dict(DEFAULT_PRAGMAS),
+}
+
+
+def run_profile(name: str, writers: int, readers: int, votes_per_writer: int) -> dict:
+    with temp_database(pool_size=writers + readers + 1, pragmas=PROFILES[name]) as db:
+        poll_repo = PollRepository(db)
+        vote_repo = VoteRepository(db)
+        user_repo = UserRepository(db)
+
+        poll_id = poll_repo.create({"topic": "bench", "options": "[]"})
+        user_ids = [f"UBENCH{i:05d}" for i in range(writers * votes_per_writer)]
+        for slack_id in user_ids:
+            user_repo.create({"slack_id": slack_id, "full_name": slack_id})
+
+        write_latencies = []
+        read_counts = [0] * readers
+        errors = []
+        done = threading.Event()
+        lock = threading.Lock()
+
+        def writer(idx: int):
+            local = []
+            for n in range(votes_per_writer):
+                user_id = user_ids[idx * votes_per_writer + n]
+                with Timer() as t:
+                    try:
+                        vote_repo.create({
+                            "id": str(uuid.uuid4()),
+                            "poll_id": poll_id,
+                            "user_id": user_id,
+                            "option_index": n % 4,
+                        })
+                    except DatabaseError as e:
+                        errors.append(str(e))
+                local.append(t.elapsed)
+            with lock:
+                write_latencies.extend(local)
+
+        def reader(idx: int):
+            while not done.is_set():
+                try:
+                    vote_repo.list(filters={"poll_id": poll_id})
+                    vote_repo.has_user_voted(poll_id, user_ids[0])
+                    read_counts[idx] += 2
+                except DatabaseError as e:
+                    errors.append(str(e))
+
+        reader_threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+        writer_threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+
+        for t in reader_threads:
+            t.start()
+        with Timer() as total:
+            for t in writer_threads:
+                t.start()
+            for t in writer_threads:
+                t.join()
+        done.set()
+        for t in reader_threads:
+            t.join()
+
+        total_votes = writers * votes_per_writer
+        return {
+            "profile": name,
+            "votes_per_sec": total_votes / total.elapsed if total.elapsed else 0.0,
+            "write_p50": percentile(write_latencies, 50),
+            "write_p95": percentile(write_latencies, 95),
+            "reads_per_sec": sum(read_counts) / total.elapsed if total.elapsed else 0.0,
+            "errors": len(errors),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite oy yazma çekişmesi benchmark'ı")
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--votes", type=int, default=250, help="Yazıcı başına oy sayısı")
+    args = parser.parse_args()
+
+    print(f"Yazıcı: {args.writers}, okuyucu: {args.readers}, yazıcı başına oy: {args.votes}\n")
+    print(f"{'profil':<10} {'oy/sn':>10} {'yazma p50':>12} {'yazma p95':>12} {'okuma/sn':>10} {'hata':>6}")
+    for name in PROFILES:
+        r = run_profile(name, args.writers, args.readers, args.votes)
+        print(
+            f"{r['profile']:<10} {r['votes_per_sec']:>10.1f} {fmt_ms(r['write_p50']):>12} "
+            f"{fmt_ms(r['write_p95']):>12} {r['reads_per_sec']:>10.1f} {r['errors']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+CPU'da gömme hızı (parça/sn) benchmark'ı: önceki yol ile EmbeddingEngine.
+
+Önceki yol: ingest hattının her 64 parçalık grubu için `model.encode(grup)` ve ardından
+`np.array(...).astype("float32")` kopyası. EmbeddingEngine: tüm girdi uzunluğa göre
+kovalanır, çıktı doğrudan float32 dizisine yazılır.
+
+`--model` verilmezse (ağ erişimi olmayan ortamlar için) all-MiniLM-L6-v2 ile aynı mimaride
+(6 katman, 384 boyut, 256 token) rastgele ağırlıklı bir model ve yerel WordPiece sözlüğü kurulur;
+hız ölçümü için ağırlıkların eğitilmiş olması gerekmez.
+
+Kullanım:
+    python scripts/benchmarks/embedding.py --chunks 768
+    python scripts/benchmarks/embedding.py --model all-MiniLM-L6-v2 --threads 4
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+
+import numpy as np
+import torch
+
+from common import percentile, fmt_ms, Timer
+from src.clients.embedding_engine import EmbeddingEngine
+
+
+def build_offline_model(model_dir: str, seed: int = 1):
+    """all-MiniLM-L6-v2 mimarisinde rastgele ağırlıklı SentenceTransformer."""
+    from tokenizers import BertWordPieceTokenizer
+    from transformers import BertConfig, BertModel, BertTokenizerFast
+    from sentence_transformers import SentenceTransformer, models
+
+    rng = random.Random(seed)
+    syllables = ["ka", "le", "mi", "ro", "tu", "şe", "ğa", "çı", "ön", "bar", "lar", "ler", "dir", "mek", "ya", "zı"]
+    words = ["".join(rng.choice(syllables) for _ in range(rng.randint(1, 4))) for _ in range(5000)]
+    corpus = [" ".join(rng.choice(words) for _ in range(rng.randint(10, 200))) for _ in range(3000)]
+
+    tokenizer = BertWordPieceTokenizer(lowercase=True)
+    tokenizer.train_from_iterator(corpus, vocab_size=30522)
+    tokenizer.save_model(model_dir)
+    BertTokenizerFast(os.path.join(model_dir, "vocab.txt")).save_pretrained(model_dir)
+    config = BertConfig(
+        vocab_size=tokenizer.get_vocab_size(), hidden_size=384, num_hidden_layers=6,
+        num_attention_heads=12, intermediate_size=1536,
+    )
+    BertModel(config).save_pretrained(model_dir)
+
+    transformer = models.Transformer(model_dir, max_seq_length=256)
+    return SentenceTransformer(modules=[transformer, models.Pooling(384, "mean"), models.Normalize()], device="cpu")
+
+
+def make_chunks(model, count: int, seed: int = 3) -> list:
+    """Bilgi küpüne benzer karışım: yarısı tam boy (1200 karakter) parça, yarısı dosya sonu / tablo satırı."""
+    rng = random.Random(seed)
+    vocab = list(model.tokenizer.get_vocab())[1000:6000]
+
+    def text(chars: int) -> str:
+        words = []
+        while sum(len(w) + 1 for w in words) < chars:
+            words.append(rng.choice(vocab))
+        return " ".join(words)
+
+    return [text(1200) if rng.random() < 0.5 else text(rng.randint(30, 400)) for _ in range(count)]
+
+
+def previous_path(model, chunks: list, group: int = 64) -> np.ndarray:
+    return np.concatenate([np.array(model.encode(chunks[i:i + group])).astype("float32") for i in range(0, len(chunks), group)])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=None, help="SentenceTransformer model adı/yolu (varsayılan: çevrimdışı kurulan model)")
+    parser.add_argument("--chunks", type=int, default=768, help="Gömülecek parça sayısı")
+    parser.add_argument("--queries", type=int, default=50, help="Tek sorgu gecikmesi için sorgu sayısı")
+    parser.add_argument("--threads", type=int, default=0, help="torch thread sayısı (0 = varsayılan)")
+    args = parser.parse_args()
+
+    model_dir = tempfile.mkdtemp(prefix="cemil_bench_model_")
+    try:
+        if args.model:
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer(args.model, device="cpu")
+        else:
+            model = build_offline_model(model_dir)
+        if args.threads:
+            torch.set_num_threads(args.threads)
+        chunks = make_chunks(model, args.chunks)
+        print(f"Model: {args.model or 'çevrimdışı MiniLM-L6 mimarisi'}, {args.chunks} parça, torch thread={torch.get_num_threads()}\n")
+
+        with Timer() as t:
+            reference = previous_path(model, chunks)
+        print(f"{'yol':<34}{'parça/sn':>10}")
+        print(f"{'önceki (64lük gruplar)':<34}{len(chunks) / t.elapsed:>10.1f}")
+        for batch_size in (16, 32, 64):
+            engine = EmbeddingEngine(model, batch_size=batch_size)
+            with Timer() as t:
+                embeddings = engine.encode(chunks)
+            assert np.allclose(embeddings, reference, atol=1e-4)
+            print(f"{f'EmbeddingEngine batch_size={batch_size}':<34}{len(chunks) / t.elapsed:>10.1f}")
+
+        engine = EmbeddingEngine(model)
+        queries = [chunk[:80] for chunk in chunks[:args.queries]]
+        for label, encode in (
+            ("sorgu: önceki", lambda q: np.array(model.encode([q])).astype("float32")),
+            ("sorgu: EmbeddingEngine", lambda q: engine.encode([q])),
+        ):
+            latencies = []
+            for query in queries:
+                with Timer() as t:
+                    encode(query)
+                latencies.append(t.elapsed)
+            print(f"{label:<34}p50 {fmt_ms(percentile(latencies, 50))}  p95 {fmt_ms(percentile(latencies, 95))}")
+    finally:
+        shutil.rmtree(model_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tam metin arama benchmark'ı: sentetik yardım talebi korpusunda FTS5 search() ile
+list() + Python'da tarama ve LIKE '%...%' sorgusu karşılaştırması.
+Sorgular iki gruptadır: sık geçen terimler (satırların ~%15'i eşleşir) ve nadir terimler
+(~20 satır). LIKE tüm eşleşmeleri saymak için tabloyu tarar; search() ilk 20'yi BM25 ile sıralar.
+Trigger'lı index bakımının toplu ekleme maliyeti de raporlanır.
+
+Kullanım:
+    python scripts/benchmarks/fulltext_search.py --rows 100000 --queries 50
+"""
+
+import argparse
+import random
+
+from common import temp_database, percentile, fmt_ms, Timer
+from src.repositories import UserRepository, HelpRepository
+
+TOPICS = [
+    "pandas", "numpy", "docker", "kubernetes", "sql", "join", "regresyon", "sınıflandırma", "transformer",
+    "embedding", "flask", "fastapi", "git", "rebase", "overfitting", "tokenizer", "matplotlib", "asyncio",
+    "pytorch", "tensorflow", "veritabanı", "index", "bellek", "thread", "deployment", "vektör", "faiss",
+]
+FILLER = [
+    "hata", "alıyorum", "nasıl", "yapabilirim", "çalışmıyor", "örnek", "kod", "veri", "model", "eğitim",
+    "sonuç", "yavaş", "dosya", "sütun", "satır", "parametre", "fonksiyon", "proje", "ödev", "soru",
+]
+# Her açıklamada bir tane geçen nadir terimler
+RARE = [f"kavram{i}" for i in range(5000)]
+
+
+def make_rows(n: int, rng: random.Random) -> list:
+    rows = []
+    for i in range(n):
+        topic = " ".join(rng.sample(TOPICS, 2))
+        words = rng.choices(FILLER, k=18) + rng.sample(TOPICS, 2) + [rng.choice(RARE)]
+        rng.shuffle(words)
+        rows.append({
+            "requester_id": "U0", "topic": f"{topic} sorusu #{i}", "description": " ".join(words),
+            "status": "resolved" if i % 3 else "open",
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FTS5 search() benchmark'ı")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    with temp_database() as db:
+        UserRepository(db).create({"slack_id": "U0", "full_name": "Bench"})
+        repo = HelpRepository(db)
+
+        with Timer() as t:
+            repo.create_many(make_rows(args.rows, rng))
+        print(f"Korpus: {args.rows} satır, create_many (trigger'lı FTS bakımı dahil): {t.elapsed:.2f} sn "
+              f"({args.rows / t.elapsed:.0f} satır/sn)\n")
+
+        query_sets = {
+            "sık": [" ".join(rng.sample(TOPICS, rng.choice((1, 2)))) for _ in range(args.queries)],
+            "nadir": [rng.choice(RARE) for _ in range(args.queries)],
+        }
+
+        def python_scan(query: str) -> list:
+            words = query.lower().split()
+            return [
+                row for row in repo.list()
+                if all(w in f"{row['topic']} {row['description']}".lower() for w in words)
+            ][:20]
+
+        def like_query(query: str) -> int:
+            conditions = " AND ".join(["(topic LIKE ? OR description LIKE ?)"] * len(query.split()))
+            params = [p for w in query.split() for p in (f"%{w}%", f"%{w}%")]
+            with db.get_connection() as conn:
+                return conn.execute(
+                    f"SELECT COUNT(*) FROM help_requests WHERE {conditions}", params
+                ).fetchone()[0]
+
+        methods = [
+            ("search() (FTS5 + bm25)", lambda q: repo.search(q), args.queries),
+            ("LIKE '%..%' (COUNT)", like_query, args.queries),
+            ("list() + Python tarama", python_scan, min(5, args.queries)),
+        ]
+
+        print(f"{'terim':<6} {'yöntem':<26} {'sorgu':>6} {'p50':>12} {'p95':>12} {'maks':>12}")
+        for kind, queries in query_sets.items():
+            for name, func, count in methods:
+                samples = []
+                for query in queries[:count]:
+                    with Timer() as t:
+                        func(query)
+                    samples.append(t.elapsed)
+                print(
+                    f"{kind:<6} {name:<26} {count:>6} {fmt_ms(percentile(samples, 50)):>12} "
+                    f"{fmt_ms(percentile(samples, 95)):>12} {fmt_ms(max(samples)):>12}"
+                )
+
+        with db.get_connection() as conn:
+            pages = conn.execute(
+                "SELECT COUNT(*) FROM dbstat WHERE name LIKE 'help_requests_fts%'"
+            ).fetchone()[0] if _has_dbstat(conn) else None
+        if pages is not None:
+            print(f"\nFTS index boyutu: ~{pages * 4096 / 1024 / 1024:.1f} MB")
+
+
+def _has_dbstat(conn) -> bool:
+    try:
+        conn.execute("SELECT 1 FROM dbstat LIMIT 1")
+        return True
+    except Exception:
+        return False
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Çevrimiçi yedekleme sırasında oy yazma gecikmesi benchmark'ı.
+
+Büyük bir veritabanında oy yazma (VoteRepository.create) gecikmesini önce yedeklemesiz,
+sonra arka planda art arda DatabaseClient.backup() çalışırken ölçer. `--step-delay 0` ile
+adımlar arası bekleme kapatılarak kısıtlamasız kopyanın etkisi görülebilir.
+
+Kullanım:
+    python scripts/benchmarks/online_backup.py --rows 200000 --votes 2000
+"""
+
+import argparse
+import os
+import tempfile
+import threading
+import uuid
+
+from common import temp_database, percentile, fmt_ms, Timer
+from src.clients.database_client import BACKUP_PAGES_PER_STEP, BACKUP_STEP_DELAY
+from src.repositories import PollRepository, VoteRepository, UserRepository
+
+
+def measure_votes(vote_repo: VoteRepository, poll_id: str, user_ids: list) -> list:
+    latencies = []
+    for n, user_id in enumerate(user_ids):
+        with Timer() as t:
+            vote_repo.create({
+                "id": str(uuid.uuid4()),
+                "poll_id": poll_id,
+                "user_id": user_id,
+                "option_index": n % 4,
+            })
+        latencies.append(t.elapsed)
+    return latencies
+
+
+def run(rows: int, votes: int, pages_per_step: int, step_delay: float) -> None:
+    with temp_database(pool_size=6) as db:
+        user_repo = UserRepository(db)
+        poll_repo = PollRepository(db)
+        vote_repo = VoteRepository(db)
+
+        with Timer() as t:
+            user_repo.create_many(
+                {"slack_id": f"UBENCH{i:07d}", "full_name": f"Kullanıcı {i} " + "x" * 200}
+                for i in range(rows)
+            )
+        db.checkpoint("TRUNCATE")
+        size_mb = os.path.getsize(db.db_path) / 1e6
+        print(f"Veritabanı: {rows} kullanıcı, {size_mb:.1f} MB (hazırlık {t.elapsed:.1f} sn)\n")
+
+        voters = [f"UBENCH{i:07d}" for i in range(votes * 2)]
+        poll_ids = [poll_repo.create({"topic": f"bench-{n}", "options": "[]"}) for n in range(2)]
+
+        baseline = measure_votes(vote_repo, poll_ids[0], voters[:votes])
+
+        backups = []
+        done = threading.Event()
+        backup_dir = tempfile.mkdtemp(prefix="cemil_bench_backup_")
+
+        def backup_loop():
+            dest = os.path.join(backup_dir, "bench-backup.db")
+            while not done.is_set():
+                backups.append(db.backup(dest, pages_per_step=pages_per_step, step_delay=step_delay))
+
+        thread = threading.Thread(target=backup_loop)
+        thread.start()
+        try:
+            during = measure_votes(vote_repo, poll_ids[1], voters[votes:])
+        finally:
+            done.set()
+            thread.join()
+        for name in os.listdir(backup_dir):
+            os.remove(os.path.join(backup_dir, name))
+        os.rmdir(backup_dir)
+
+        print(f"{'':<22}{'p50':>10}{'p95':>10}{'p99':>10}{'maks':>10}")
+        for label, samples in (("yedeklemesiz", baseline), ("yedekleme sürerken", during)):
+            print(
+                f"{label:<22}{fmt_ms(percentile(samples, 50)):>10}{fmt_ms(percentile(samples, 95)):>10}"
+                f"{fmt_ms(percentile(samples, 99)):>10}{fmt_ms(max(samples)):>10}"
+            )
+        if backups:
+            avg_ms = sum(b["elapsed_ms"] for b in backups) / len(backups)
+            print(
+                f"\n{len(backups)} yedek alındı ({pages_per_step} sayfa/adım, {step_delay * 1000:.0f} ms bekleme), ortalama {avg_ms:.0f} ms, "
+                f"baştan başlama: {sum(b['restarts'] for b in backups)}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200000, help="Veritabanını büyütmek için eklenecek kullanıcı sayısı")
+    parser.add_argument("--votes", type=int, default=2000, help="Her ölçümde yazılacak oy sayısı")
+    parser.add_argument("--pages-per-step", type=int, default=BACKUP_PAGES_PER_STEP, help="Yedekleme adımı başına sayfa")
+    parser.add_argument("--step-delay", type=float, default=BACKUP_STEP_DELAY, help="Adımlar arası bekleme (sn)")
+    args = parser.parse_args()
+    run(args.rows, args.votes, args.pages_per_step, args.step_delay)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Satır temsili benchmark'ı: dict(row) ile Record (named tuple row factory) karşılaştırması.
+Her yöntem için tüm tabloyu okuma süresi (medyan) ve sonuç listesinin bellek tepe değeri ölçülür.
+
+Kullanım:
+    python scripts/benchmarks/row_representation.py --rows 100000 --repeat 5
+"""
+
+import argparse
+import gc
+import statistics
+import tracemalloc
+
+from common import temp_database, Timer
+from src.repositories import UserRepository
+
+
+def make_rows(n: int) -> list:
+    return [
+        {"slack_id": f"U{i:07d}", "first_name": "Ad", "surname": f"Soyad{i}", "full_name": f"Ad Soyad{i}",
+         "cohort": "Yapay Zeka", "birthday": f"1998-{i % 12 + 1:02d}-{i % 28 + 1:02d}"}
+        for i in range(n)
+    ]
+
+
+def measure(func, repeat: int):
+    """(medyan süre sn, tracemalloc tepe bellek byte) döndürür."""
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        with Timer() as t:
+            result = func()
+        timings.append(t.elapsed)
+        del result
+
+    gc.collect()
+    tracemalloc.start()
+    result = func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return statistics.median(timings), peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="dict(row) vs Record benchmark'ı")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with temp_database() as db:
+        repo = UserRepository(db)
+        repo.create_many(make_rows(args.rows))
+
+        def raw_rows():
+            with db.get_connection() as conn:
+                return conn.execute("SELECT * FROM users").fetchall()
+
+        methods = {
+            "sqlite3.Row (ham)": raw_rows,
+            "list() -> dict": lambda: repo.list(),
+            "list(records=True)": lambda: repo.list(records=True),
+            "iter_rows() -> dict": lambda: sum(1 for _ in repo.iter_rows()),
+            "iter_rows(records=True)": lambda: sum(1 for _ in repo.iter_rows(records=True)),
+        }
+
+        print(f"Satır sayısı: {args.rows}, tekrar: {args.repeat}\n")
+        print(f"{'yöntem':<26} {'süre (ms)':>10} {'satır/sn':>12} {'tepe bellek (MB)':>18} {'bayt/satır':>11}")
+        for name, func in methods.items():
+            elapsed, peak = measure(func, args.repeat)
+            print(
+                f"{name:<26} {elapsed * 1000:>10.1f} {args.rows / elapsed:>12.0f} "
+                f"{peak / 1024 / 1024:>18.1f} {peak / args.rows:>11.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+ChallengeHubService._start_challenge gecikme benchmark'ı: senkron repository çağrıları
+(event loop'u bloklar) ile async repository yolu (DatabaseExecutor) karşılaştırması.
+
+Aynı event loop'ta N challenge eşzamanlı başlatılır; arka planda bir yazıcı thread'i
+veritabanına sürekli yazarak kilit çekişmesi oluşturur. Slack ve Groq çağrıları sahte
+nesnelerle, gecikmeleri `--llm-ms` ile simüle edilir. Ayrıca event loop gecikmesi
+(heartbeat lag) ölçülür: bloklayan DB çağrıları bu değeri doğrudan artırır.
+
+Kullanım:
+    python scripts/benchmarks/start_challenge.py --challenges 20 --llm-ms 200
+"""
+
+import argparse
+import asyncio
+import threading
+import time
+import types
+import uuid
+
+from common import temp_database, percentile, fmt_ms
+import src.services.challenge_hub_service as hub_module
+from src.services.challenge_hub_service import ChallengeHubService
+from src.repositories import (
+    ChallengeHubRepository,
+    ChallengeParticipantRepository,
+    ChallengeProjectRepository,
+    ChallengeSubmissionRepository,
+    ChallengeThemeRepository,
+    UserChallengeStatsRepository,
+    UserRepository,
+    FeedbackRepository,
+)
+
+
+class InlineExecutor:
+    """Eski davranış: DB çağrısı doğrudan event loop thread'inde (bloklayarak) çalışır."""
+
+    async def read(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    async def write(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    def shutdown(self, wait: bool = True):
+        pass
+
+
+class FakeSlack:
+    """Slack yöneticileri için sahte nesne: her çağrı başarılı bir yanıt döndürür."""
+
+    def __getattr__(self, name):
+        def call(*args, **kwargs):
+            if name == "get_members":
+                return []
+            return {"id": f"C{uuid.uuid4().hex[:10].upper()}", "ok": True, "ts": "1.0"}
+        return call
+
+
+class FakeEnhancement:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def enhance_project(self, base_project, **kwargs):
+        await asyncio.sleep(self.latency)
+        return dict(base_project, llm_enhanced_features=["bench"])
+
+
+class FakeCron:
+    def add_once_job(self, **kwargs):
+        pass
+
+
+def build_service(db, llm_latency: float) -> ChallengeHubService:
+    slack = FakeSlack()
+    return ChallengeHubService(
+        chat_manager=slack,
+        conv_manager=slack,
+        user_manager=slack,
+        challenge_hub_repo=ChallengeHubRepository(db),
+        participant_repo=ChallengeParticipantRepository(db),
+        project_repo=ChallengeProjectRepository(db),
+        submission_repo=ChallengeSubmissionRepository(db),
+        theme_repo=ChallengeThemeRepository(db),
+        stats_repo=UserChallengeStatsRepository(db),
+        enhancement_service=FakeEnhancement(llm_latency),
+        groq_client=None,
+        cron_client=FakeCron(),
+        db_client=db,
+    )
+
+
+def seed_challenges(db, count: int, team_size: int = 3) -> list:
+    users = UserRepository(db)
+    hubs = ChallengeHubRepository(db)
+    participants = ChallengeParticipantRepository(db)
+    ids = []
+    for n in range(count):
+        creator = f"UC{n:05d}"
+        users.create({"slack_id": creator, "full_name": creator})
+        hub_id = hubs.create({"creator_id": creator, "theme": "Web App", "team_size": team_size, "status": "recruiting"})
+        for m in range(team_size):
+            member = f"UM{n:05d}{m}"
+            users.create({"slack_id": member, "full_name": member})
+            participants.create({"challenge_hub_id": hub_id, "user_id": member, "role": "member"})
+        ids.append(hub_id)
+    return ids
+
+
+async def heartbeat(stop: asyncio.Event, lags: list, interval: float = 0.005):
+    """Event loop'un ne kadar geç uyandığını ölçer."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - started - interval)
+
+
+async def run_starts(service: ChallengeHubService, challenge_ids: list) -> tuple:
+    latencies, lags = [], []
+    stop = asyncio.Event()
+    beat = asyncio.create_task(heartbeat(stop, lags))
+
+    async def one(challenge_id):
+        started = time.perf_counter()
+        await service._start_challenge(challenge_id)
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(cid) for cid in challenge_ids))
+    total = time.perf_counter() - started
+    stop.set()
+    await beat
+    return latencies, lags, total
+
+
+def run_mode(mode: str, args) -> dict:
+    with temp_database(pool_size=8) as db:
+        if mode == "sync":
+            db.executor.shutdown()
+            db.executor = InlineExecutor()
+
+        challenge_ids = seed_challenges(db, args.challenges)
+        service = build_service(db, args.llm_ms / 1000)
+
+        # Arka plan yazma yükü: kısa transaction'lar halinde sürekli insert
+        done = threading.Event()
+        feedback = FeedbackRepository(db)
+
+        def writer():
+            while not done.is_set():
+                with db.get_connection() as conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    for i in range(args.writer_rows):
+                        conn.execute(
+                            "INSERT INTO feedbacks (id, content) VALUES (?, ?)",
+                            (str(uuid.uuid4()), "yük"),
+                        )
+                    time.sleep(args.writer_hold_ms / 1000)
+                    conn.commit()
+
+        background = threading.Thread(target=writer, daemon=True)
+        background.start()
+        try:
+            latencies, lags, total = asyncio.run(run_starts(service, challenge_ids))
+        finally:
+            done.set()
+            background.join()
+
+        return {
+            "mode": mode,
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "total": total,
+            "lag_max": max(lags) if lags else 0.0,
+            "lag_p95": percentile(lags, 95),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="_start_challenge sync vs async DB yolu benchmark'ı")
+    parser.add_argument("--challenges", type=int, default=20)
+    parser.add_argument("--llm-ms", type=float, default=200, help="Simüle edilen Groq gecikmesi")
+    parser.add_argument("--writer-rows", type=int, default=200, help="Arka plan yazıcısının transaction başına satırı")
+    parser.add_argument("--writer-hold-ms", type=float, default=20, help="Yazma kilidinin tutulma süresi")
+    parser.add_argument("--sleep-scale", type=float, default=0.0,
+                        help="_start_challenge içindeki Slack senkronizasyon beklemelerinin ölçeği (0 = atla)")
+    args = parser.parse_args()
+
+    # Slack senkronizasyonu için yapılan 1 sn / 5 sn beklemeler ölçeklenir
+    real_sleep = asyncio.sleep
+    hub_module.asyncio = types.SimpleNamespace(
+        **{name: getattr(asyncio, name) for name in dir(asyncio) if not name.startswith("_")}
+    )
+    hub_module.asyncio.sleep = lambda delay, *a, **kw: real_sleep(delay * args.sleep_scale, *a, **kw)
+
+    print(f"Challenge: {args.challenges}, LLM gecikmesi: {args.llm_ms:.0f} ms, "
+          f"arka plan yazma kilidi: {args.writer_hold_ms:.0f} ms\n")
+    print(f"{'yol':<6} {'p50':>10} {'p95':>10} {'toplam':>10} {'loop lag p95':>14} {'loop lag max':>14}")
+    for mode in ("sync", "async"):
+        r = run_mode(mode, args)
+        print(
+            f"{r['mode']:<6} {fmt_ms(r['p50']):>10} {fmt_ms(r['p95']):>10} {fmt_ms(r['total']):>10} "
+            f"{fmt_ms(r['lag_p95']):>14} {fmt_ms(r['lag_max']):>14}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -100,7 +100,7 @@ class ChallengeManager:
             # Gereksiz kolon kontrolü (canvas_id - kodda kullanılmıyor)
             if "canvas_id" in cols:
                 console.print("[yellow]⚠️ Gereksiz canvas_id kolonu tespit edildi (summary_message_ts kullanılıyor).[/yellow]")
-                console.print("[yellow]   Bu kolon __main__.py'deki ensure_database_schema() tarafından otomatik temizlenecektir.[/yellow]")
+                console.print("[yellow]   Bu kolon bot açılışında migration (migrations/000_baseline.py) ile otomatik temizlenecektir.[/yellow]")
         except Exception as e:
             console.print(f"[bold red]⚠️ Şema kontrolü sırasında hata: {e}[/bold red]")
         finally:
@@ -823,6 +823,99 @@ class ChallengeManager:
         except Exception as e:
             console.print(f"[bold red]❌ Error: {e}[/bold red]")
 
+    def backfill_stats(self, since: Optional[str] = None):
+        """Rebuild the stats_snapshots rollup table (hourly + daily buckets) from history."""
+        from src.clients.database_client import DatabaseClient
+        from src.repositories import StatsSnapshotRepository
+        from src.repositories.stats_snapshot_repository import HOURLY_RETENTION_DAYS
+
+        try:
+            since_dt = datetime.strptime(since, "%Y-%m-%d") if since else None
+        except ValueError:
+            console.print(f"[red]❌ Invalid date: {since} (expected YYYY-MM-DD)[/red]")
+            return
+
+        try:
+            # DatabaseClient açılışta bekleyen migration'ları (stats_snapshots tablosu dahil) uygular
+            db_client = DatabaseClient(db_path=self.db_path)
+            with console.status("[cyan]Rebuilding stats snapshots...[/cyan]"):
+                result = StatsSnapshotRepository(db_client).backfill(since_dt)
+            db_client.close()
+        except Exception as e:
+            console.print(f"[bold red]❌ Backfill failed: {e}[/bold red]")
+            return
+
+        table = Table(title="Stats Snapshot Backfill")
+        table.add_column("Granularity", style="cyan")
+        table.add_column("Since", style="magenta")
+        table.add_column("Buckets", justify="right", style="green")
+        for granularity, info in result.items():
+            table.add_row(granularity, info["since"] or "(beginning)", str(info["buckets"]))
+        console.print(table)
+        console.print(f"[dim]Hourly buckets are kept for the last {HOURLY_RETENTION_DAYS} days only.[/dim]")
+
+    def backup_database(self, dest: Optional[str] = None):
+        """Take an online backup of the database (safe while the bot is running)."""
+        from src.clients.database_client import DatabaseClient
+        from src.clients.db_backup import backup_filename, rotate_backups
+
+        backup_dir = self.settings.db_backup_dir
+        dest = dest or os.path.join(backup_dir, backup_filename(self.db_path))
+        try:
+            db_client = DatabaseClient(db_path=self.db_path)
+            with console.status("[cyan]Backing up database...[/cyan]"):
+                result = db_client.backup(dest, pages_per_step=self.settings.db_backup_pages_per_step)
+            db_client.close()
+        except Exception as e:
+            console.print(f"[bold red]❌ Backup failed: {e}[/bold red]")
+            return
+
+        console.print(
+            f"[bold green]✅ Backup written:[/bold green] {result['path']} "
+            f"({result['bytes'] // 1024} KiB, {result['steps']} steps, {result['elapsed_ms']} ms)"
+        )
+        if os.path.dirname(os.path.abspath(dest)) == os.path.abspath(backup_dir):
+            removed = rotate_backups(backup_dir, self.db_path, self.settings.db_backup_keep)
+            if removed:
+                console.print(f"[dim]Removed {len(removed)} old backup(s), keeping {self.settings.db_backup_keep}.[/dim]")
+
+    def restore_database(self, backup_path: Optional[str] = None, skip_confirm: bool = False):
+        """Restore the database from a backup file (stop the bot first)."""
+        from src.clients.db_backup import list_backups, restore_backup
+
+        backups = list_backups(self.settings.db_backup_dir, self.db_path)
+        if not backup_path:
+            if not backups:
+                console.print(f"[red]❌ No backups found in {self.settings.db_backup_dir}[/red]")
+                return
+            table = Table(title="Available Backups")
+            table.add_column("#", style="dim")
+            table.add_column("File", style="cyan")
+            table.add_column("Size", justify="right", style="green")
+            for i, path in enumerate(backups, start=1):
+                table.add_row(str(i), os.path.basename(path), f"{os.path.getsize(path) // 1024} KiB")
+            console.print(table)
+            choice = input("Select backup [1]: ").strip() or "1"
+            if not choice.isdigit() or not 1 <= int(choice) <= len(backups):
+                console.print("[red]Invalid selection![/red]")
+                return
+            backup_path = backups[int(choice) - 1]
+
+        console.print(f"[bold yellow]⚠️  {self.db_path} will be replaced with {backup_path}.[/bold yellow]")
+        console.print("[yellow]Make sure the bot is stopped. The current database is kept as a .pre-restore copy.[/yellow]")
+        if not skip_confirm and input("Type 'RESTORE' to continue: ") != "RESTORE":
+            console.print("[yellow]Cancelled.[/yellow]")
+            return
+
+        try:
+            result = restore_backup(backup_path, self.db_path)
+        except Exception as e:
+            console.print(f"[bold red]❌ Restore failed: {e}[/bold red]")
+            return
+        console.print(f"[bold green]✅ Restored {result['pages']} pages from {backup_path}[/bold green]")
+        if result["safety_copy"]:
+            console.print(f"[dim]Previous database saved as {result['safety_copy']}[/dim]")
+
 
 def interactive_menu():
     """Show interactive menu."""
@@ -843,6 +936,8 @@ def interactive_menu():
         console.print("[9] 📥 Restore from JSON")
         console.print("[10] 📤 Export to JSON")
         console.print("[11] 🧹 Clear All Challenges (Sıfırdan Başla)")
+        console.print("[12] 💾 Backup Database")
+        console.print("[13] ♻️  Restore Database from Backup")
         console.print("[0] 🚪 Exit")
         
         choice = input("\n👉 Select an option: ")
@@ -927,6 +1022,14 @@ def interactive_menu():
         elif choice == "11":
             manager.clear_all_challenges()
             input("\nPress Enter to continue...")
+
+        elif choice == "12":
+            manager.backup_database()
+            input("\nPress Enter to continue...")
+
+        elif choice == "13":
+            manager.restore_database()
+            input("\nPress Enter to continue...")
                 
         elif choice == "0":
             console.print("[yellow]Bye! 👋[/yellow]")
@@ -974,6 +1077,18 @@ def main():
     clear_parser = subparsers.add_parser("clear-all", help="Clear all challenge data (start fresh)")
     clear_parser.add_argument("--yes", action="store_true", help="Skip confirmation")
 
+    # Backfill stats rollups
+    backfill_parser = subparsers.add_parser("backfill-stats", help="Rebuild stats_snapshots rollups from history")
+    backfill_parser.add_argument("--since", help="Only rebuild buckets from this date (YYYY-MM-DD)")
+
+    # Database backup / restore
+    backup_parser = subparsers.add_parser("backup", help="Take an online backup of the database (bot may be running)")
+    backup_parser.add_argument("--dest", help="Backup file path (default: DB_BACKUP_DIR/<name>-<timestamp>.db)")
+
+    restore_db_parser = subparsers.add_parser("restore-db", help="Restore the database from a backup (stop the bot first)")
+    restore_db_parser.add_argument("backup", nargs="?", help="Backup file (default: choose from DB_BACKUP_DIR)")
+    restore_db_parser.add_argument("--yes", action="store_true", help="Skip confirmation")
+
     # Eğer argüman verilmemişse interaktif moda geç
     if len(sys.argv) == 1:
         try:
@@ -1002,6 +1117,12 @@ def main():
         manager.restore_from_json()
     elif args.command == "clear-all":
         manager.clear_all_challenges(skip_confirm=args.yes)
+    elif args.command == "backfill-stats":
+        manager.backfill_stats(args.since)
+    elif args.command == "backup":
+        manager.backup_database(args.dest)
+    elif args.command == "restore-db":
+        manager.restore_database(args.backup, skip_confirm=args.yes)
     else:
         parser.print_help()
 
@@ -18,118 +18,6 @@ from src.core.logger import logger
 from src.core.settings import get_settings
 from dotenv import load_dotenv
 
-def ensure_database_schema():
-    """
-    Veritabanı şemasının güncel olduğundan emin olur.
-    Eksik kolonları otomatik ekler, gereksiz kolonları temizler.
-    """
-    try:
-        logger.info("[>] Veritabanı şema kontrolü yapılıyor...")
-        conn = db_client.get_connection()
-        cursor = conn.cursor()
-        
-        # challenge_hubs tablosundaki kolonları kontrol et
-        cursor.execute("PRAGMA table_info(challenge_hubs)")
-        cols = {row["name"] for row in cursor.fetchall()}
-        
-        # Gerekli yeni kolonlar - eksikse ekle
-        migrations = []
-        if "project_name" not in cols:
-            migrations.append("ALTER TABLE challenge_hubs ADD COLUMN project_name TEXT;")
-        if "project_description" not in cols:
-            migrations.append("ALTER TABLE challenge_hubs ADD COLUMN project_description TEXT;")
-        if "summary_message_ts" not in cols:
-            migrations.append("ALTER TABLE challenge_hubs ADD COLUMN summary_message_ts TEXT;")
-        if "summary_message_channel_id" not in cols:
-            migrations.append("ALTER TABLE challenge_hubs ADD COLUMN summary_message_channel_id TEXT;")
-        if "ended_at" not in cols:
-            migrations.append("ALTER TABLE challenge_hubs ADD COLUMN ended_at TIMESTAMP;")
-        
-        # challenge_evaluations tablosundaki kolonları kontrol et
-        cursor.execute("PRAGMA table_info(challenge_evaluations)")
-        eval_cols = {row["name"] for row in cursor.fetchall()}
-        
-        if "jury_status" not in eval_cols:
-            migrations.append("ALTER TABLE challenge_evaluations ADD COLUMN jury_status TEXT DEFAULT 'recruiting';")
-            logger.info("[i] jury_status kolonu eksik, eklenecek...")
-        
-        # Gereksiz kolonları temizle (canvas_id - kodda kullanılmıyor, summary_message_ts kullanılıyor)
-        if "canvas_id" in cols:
-            logger.info("[i] Gereksiz canvas_id kolonu tespit edildi (summary_message_ts kullanılıyor). Kaldırılıyor...")
-            try:
-                # SQLite'da kolon kaldırmak için tabloyu yeniden oluşturmak gerekir
-                # Önce mevcut verileri yedekle
-                cursor.execute("SELECT * FROM challenge_hubs")
-                rows = cursor.fetchall()
-                col_names = [desc[0] for desc in cursor.description]
-                
-                # canvas_id hariç kolonları al
-                new_cols = [col for col in col_names if col != "canvas_id"]
-                new_cols_str = ", ".join(new_cols)
-                
-                # Yeni tablo oluştur (canvas_id olmadan)
-                cursor.execute("""
-                    CREATE TABLE challenge_hubs_new (
-                        id TEXT PRIMARY KEY,
-                        creator_id TEXT NOT NULL,
-                        theme TEXT NOT NULL,
-                        team_size INTEGER NOT NULL,
-                        status TEXT DEFAULT 'recruiting',
-                        challenge_channel_id TEXT,
-                        hub_channel_id TEXT,
-                        selected_project_id TEXT,
-                        llm_customizations TEXT,
-                        deadline_hours INTEGER DEFAULT 48,
-                        difficulty TEXT DEFAULT 'intermediate',
-                        deadline TIMESTAMP,
-                        started_at TIMESTAMP,
-                        completed_at TIMESTAMP,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        project_name TEXT,
-                        project_description TEXT,
-                        summary_message_ts TEXT,
-                        summary_message_channel_id TEXT,
-                        ended_at TIMESTAMP,
-                        FOREIGN KEY (creator_id) REFERENCES users(slack_id) ON DELETE CASCADE
-                    )
-                """)
-                
-                # Verileri kopyala (canvas_id hariç)
-                if rows:
-                    placeholders = ", ".join(["?"] * len(new_cols))
-                    for row in rows:
-                        row_dict = dict(zip(col_names, row))
-                        values = [row_dict[col] for col in new_cols]
-                        cursor.execute(f"INSERT INTO challenge_hubs_new ({new_cols_str}) VALUES ({placeholders})", values)
-                
-                # Eski tabloyu sil ve yenisini yeniden adlandır
-                cursor.execute("DROP TABLE challenge_hubs")
-                cursor.execute("ALTER TABLE challenge_hubs_new RENAME TO challenge_hubs")
-                
-                # Index'leri yeniden oluştur
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_challenge_hubs_status ON challenge_hubs(status)")
-                cursor.execute("CREATE INDEX IF NOT EXISTS idx_challenge_hubs_creator ON challenge_hubs(creator_id)")
-                
-                logger.info("[+] Gereksiz canvas_id kolonu kaldırıldı.")
-            except Exception as e:
-                logger.warning(f"[!] canvas_id kolonu kaldırılırken hata (devam ediliyor): {e}")
-        
-        # Eksik kolonları ekle
-        for migration in migrations:
-            cursor.execute(migration)
-            logger.info(f"[+] Şema güncellendi: {migration.split('ADD COLUMN')[1].strip()}")
-        
-        if migrations or "canvas_id" in cols:
-            conn.commit()
-            logger.info("[+] Veritabanı şeması güncellendi.")
-        else:
-            logger.info("[+] Veritabanı şeması güncel.")
-        
-        conn.close()
-    except Exception as e:
-        logger.error(f"[X] Şema kontrolü sırasında hata: {e}", exc_info=True)
-
 # Non-interactive mod (CI / prod deploy) için flag
 NON_INTERACTIVE = os.environ.get("CEMIL_NON_INTERACTIVE") == "1"
 
@@ -179,10 +67,13 @@ def graceful_shutdown(signum=None, frame=None):
         except Exception as e:
             logger.warning(f"[!] Zamanlayıcılar durdurulurken hata: {e}")
         
-        # 3. Veritabanı bağlantılarını kapat (SQLite otomatik kapanır ama yine de kontrol edelim)
+        # 3. Veritabanı bağlantı havuzunu kapat
         logger.info("[>] Veritabanı bağlantıları kapatılıyor...")
-        # SQLite connection'lar context manager ile otomatik kapanır
-        logger.info("[+] Veritabanı bağlantıları temizlendi.")
+        try:
+            db_client.close()
+            logger.info("[+] Veritabanı bağlantıları temizlendi.")
+        except Exception as e:
+            logger.warning(f"[!] Veritabanı bağlantıları kapatılırken hata: {e}")
         
         logger.info("[+] Graceful shutdown tamamlandı. Görüşmek üzere! 👋")
         print("\n[+] Bot başarıyla kapatıldı. Görüşmek üzere! 👋\n")
@@ -222,11 +113,9 @@ def main():
 
     # 1. Veritabanı
     logger.info("[>] Veritabanı kontrol ediliyor...")
+    # Şema, DatabaseClient.init_db içinde sürümlü migration'larla güncellenir (migrations/)
     db_client.init_db()
     
-    # Şema güncellemelerini uygula (yeni kolonlar varsa ekle)
-    ensure_database_schema()
-    
     # Challenge tablolarını temizle (startup'ta) - Settings'e bağlı
     if settings.db_clean_on_startup:
         logger.info("[>] Challenge tabloları TEMİZLENİYOR (Settings gereği)...")
@@ -275,11 +164,11 @@ def main():
     cron_client.start()
 
     # 3. Vektör Veritabanı Kontrolü
-    vector_index_exists = os.path.exists(settings.vector_store_path) and os.path.exists(settings.vector_store_pkl_path)
+    vector_index_exists = os.path.exists(settings.vector_store_path) and os.path.exists(settings.vector_store_chunks_path)
     
     if vector_index_exists:
         # Mevcut veriler var
-        print(f"\n[?] Vektör veritabanı bulundu (mevcut veriler: {len(vector_client.documents) if vector_client.documents else 0} parça).")
+        print(f"\n[?] Vektör veritabanı bulundu (mevcut veriler: {vector_client.documents.live_count} parça).")
         
         if settings.kb_rebuild_index:
             print("[i] Vektör veritabanı yeniden oluşturuluyor (Settings gereği)...")
@@ -361,7 +250,8 @@ def main():
                     "    • 48 saat içinde public bir GitHub linki eklenmiş olmalı.\n"
                     "• *Admin Komutları:*\n"
                     "  - `/admin-basarili-projeler` → Başarılı challenge'ları, ekipleri ve GitHub linklerini listeler.\n"
-                    "  - `/admin-istatistik` → Genel kullanım ve challenge istatistiklerini gösterir.\n\n"
+                    "  - `/admin-istatistik` → Genel kullanım ve challenge istatistiklerini gösterir.\n"
+                    "  - `/admin-ara <kelimeler>` → Yardım talepleri, geri bildirimler, eşleşme özetleri ve projelerde arar.\n\n"
                     
                     "🧠 *Bilgi Küpü (RAG Sistemi)*\n"
                     "• *Komut:* `/sor <soru>`\n"
@@ -384,7 +274,8 @@ def main():
                     
                     "📊 *Admin İstatistikleri* (Admin)\n"
                     "• *Komut:* `/admin-istatistik` - Genel bot kullanım istatistiklerini görüntüle\n"
-                    "• *Komut:* `/admin-basarili-projeler` - Başarılı challenge projelerini, ekipleri ve GitHub linklerini görüntüle\n\n"
+                    "• *Komut:* `/admin-basarili-projeler` - Başarılı challenge projelerini, ekipleri ve GitHub linklerini görüntüle\n"
+                    "• *Komut:* `/admin-ara <kelimeler>` - Geçmiş yardım konuları, geri bildirimler ve eşleşme özetlerinde ara\n\n"
                     
                     "🏥 *Bot Sağlık Kontrolü*\n"
                     "• *Komut:* `/cemil-health`\n"
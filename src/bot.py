@@ -21,6 +21,8 @@ from src.clients import (
     VectorClient,
     SMTPClient
 )
+from src.clients.query_instrumentation import QueryInstrumentation
+from src.clients.db_backup import run_scheduled_backup
 
 # --- Commands (Slack API Wrappers) ---
 from src.commands import (
@@ -45,7 +47,8 @@ from src.repositories import (
     ChallengeThemeRepository,
     UserChallengeStatsRepository,
     ChallengeEvaluationRepository,
-    ChallengeEvaluatorRepository
+    ChallengeEvaluatorRepository,
+    StatsSnapshotRepository
 )
 
 # --- Services ---
@@ -97,10 +100,27 @@ app = App(token=settings.slack_bot_token)
 # ============================================================================
 
 logger.info("[i] Client'lar ilklendiriliyor...")
-db_client = DatabaseClient(db_path=settings.database_path)
+db_client = DatabaseClient(
+    db_path=settings.database_path,
+    pool_size=settings.db_pool_size,
+    pool_timeout=settings.db_pool_timeout,
+    pool_max_idle=settings.db_pool_max_idle,
+    reader_threads=settings.db_reader_threads,
+    pragmas=settings.get_db_pragmas(),
+    instrumentation=(
+        QueryInstrumentation(slow_query_ms=settings.db_slow_query_ms)
+        if settings.db_query_stats_enabled else None
+    ),
+    row_cache_enabled=settings.db_row_cache_enabled,
+    driver=settings.db_driver,
+)
 groq_client = GroqClient()
 cron_client = CronClient()
-vector_client = VectorClient()
+vector_client = VectorClient(
+    index_options=settings.get_vector_index_options(),
+    embed_batch_size=settings.vector_embed_batch_size,
+    embed_threads=settings.vector_embed_threads,
+)
 smtp_client = SMTPClient()
 logger.info("[+] Client'lar hazır.")
 
@@ -141,6 +161,7 @@ challenge_project_repo = ChallengeProjectRepository(db_client)
 challenge_submission_repo = ChallengeSubmissionRepository(db_client)
 challenge_theme_repo = ChallengeThemeRepository(db_client)
 user_challenge_stats_repo = UserChallengeStatsRepository(db_client)
+stats_snapshot_repo = StatsSnapshotRepository(db_client)
 challenge_evaluation_repo = ChallengeEvaluationRepository(db_client)
 challenge_evaluator_repo = ChallengeEvaluatorRepository(db_client)
 logger.info("[+] Repository'ler hazır.")
@@ -160,13 +181,17 @@ feedback_service = FeedbackService(
     chat_manager, smtp_client, feedback_repo
 )
 knowledge_service = KnowledgeService(
-    vector_client, groq_client
+    vector_client, groq_client,
+    parse_workers=settings.kb_parse_workers,
+    embed_batch_size=settings.kb_embed_batch_size,
+    queue_size=settings.kb_queue_size,
 )
 help_service = HelpService(
     chat_manager, conv_manager, user_manager, help_repo, user_repo, groq_client, cron_client
 )
 statistics_service = StatisticsService(
-    user_repo, match_repo, help_repo, feedback_repo, poll_repo, vote_repo
+    user_repo, match_repo, help_repo, feedback_repo, poll_repo, vote_repo,
+    stats_snapshot_repo
 )
 challenge_enhancement_service = ChallengeEnhancementService(
     groq_client, knowledge_service
@@ -254,6 +279,55 @@ try:
 except Exception as e:
     logger.warning(f"[!] Challenge recruitment zaman aşımı kontrolü başlatılamadı: {e}")
 
+# İstatistik rollup tablosunu (saatlik + günlük bucket'lar) artımlı olarak güncelle
+try:
+    cron_client.add_cron_job(
+        func=statistics_service.refresh_snapshots,
+        cron_expression={"minute": "5"},  # Her saat başını 5 geçe
+        job_id="refresh_stats_snapshots"
+    )
+    logger.info("[+] İstatistik rollup görevi başlatıldı (her 1 saatte bir)")
+except Exception as e:
+    logger.warning(f"[!] İstatistik rollup görevi başlatılamadı: {e}")
+
+# WAL dosyasının büyümesini önlemek için periyodik checkpoint
+if settings.db_wal_checkpoint_minutes > 0 and settings.db_journal_mode == "WAL":
+    try:
+        cron_client.add_interval_job(
+            func=db_client.checkpoint,
+            interval={"minutes": settings.db_wal_checkpoint_minutes},
+            job_id="db_wal_checkpoint",
+            args=[settings.db_wal_checkpoint_mode]
+        )
+        logger.info(f"[+] WAL checkpoint görevi başlatıldı (her {settings.db_wal_checkpoint_minutes} dakikada bir)")
+    except Exception as e:
+        logger.warning(f"[!] WAL checkpoint görevi başlatılamadı: {e}")
+
+# Çevrimiçi veritabanı yedeği (yazmaları bloklamaz) + eski yedeklerin silinmesi
+if settings.db_backup_interval_hours > 0:
+    try:
+        cron_client.add_interval_job(
+            func=run_scheduled_backup,
+            interval={"hours": settings.db_backup_interval_hours},
+            job_id="db_backup",
+            args=[db_client, settings.db_backup_dir, settings.db_backup_keep, settings.db_backup_pages_per_step]
+        )
+        logger.info(f"[+] Veritabanı yedekleme görevi başlatıldı (her {settings.db_backup_interval_hours} saatte bir, {settings.db_backup_keep} yedek saklanır)")
+    except Exception as e:
+        logger.warning(f"[!] Veritabanı yedekleme görevi başlatılamadı: {e}")
+
+# Sorgu istatistiklerinin periyodik olarak log dosyasına yazılması
+if settings.db_query_stats_enabled and settings.db_query_stats_dump_minutes > 0:
+    try:
+        cron_client.add_interval_job(
+            func=db_client.dump_query_stats,
+            interval={"minutes": settings.db_query_stats_dump_minutes},
+            job_id="db_query_stats_dump"
+        )
+        logger.info(f"[+] Sorgu istatistikleri log görevi başlatıldı (her {settings.db_query_stats_dump_minutes} dakikada bir)")
+    except Exception as e:
+        logger.warning(f"[!] Sorgu istatistikleri log görevi başlatılamadı: {e}")
+
 # ============================================================================
 # EVENT HANDLERS (Challenge Kanalı Yetkisiz Kullanıcı Kontrolü)
 # ============================================================================
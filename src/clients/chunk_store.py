@@ -0,0 +1,179 @@
+import os
+import json
+import mmap
+import pickle
+from typing import Any, Dict, Iterable, List, Optional
+import numpy as np
+from src.core.logger import logger
+
+# Parça başına bir satır: metnin .bin içindeki başlangıcı, bayt uzunluğu ve metadata kodu
+# (silinmiş parçalarda meta = REMOVED; satır numarası parça id'si olduğundan satırlar kaydırılmaz)
+REMOVED = -1
+INDEX_DTYPE = np.dtype([("offset", "<i8"), ("length", "<i4"), ("meta", "<i4")])
+
+
+class ChunkStore:
+    """
+    Vektör indeksindeki parçaların (metin + metadata) disk üzerindeki sütunsal deposu.
+
+    {path}.bin       UTF-8 metinler art arda; yalnızca sona eklenir, mmap ile okunur
+    {path}.idx.npy   parça başına (offset, length, meta) satırı; mmap ile okunur
+    {path}.meta.json birbirinden farklı metadata sözlükleri (sözlük kodlaması: aynı
+                     kaynaktan gelen binlerce parça tek bir kaydı paylaşır)
+
+    Yükleme yalnızca dosyaları eşler; metinler `store[i]` ile istenen parça için okunur.
+    Liste gibi kullanılır (`len`, indeksleme), böylece `documents` listesinin yerine geçer.
+    `len` silinmişler dahil satır (id) sayısıdır; canlı parça sayısı `live_count`'tur.
+
+    Yazmalar (`append`, `remove`) yeni dosyaları eşledikten sonra referansları değiştirir; eski
+    eşleme kapatılmaz, son okuyucu bıraktığında serbest kalır. Böylece başka bir thread'deki
+    `store[i]` yazma sırasında kapanmış bir eşlemeye denk gelmez.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.index = np.empty(0, dtype=INDEX_DTYPE)
+        self.metadata: List[Dict[str, Any]] = []
+        self._meta_codes: Dict[str, int] = {}
+        self._mmap = None
+
+    @property
+    def bin_path(self) -> str:
+        return f"{self.path}.bin"
+
+    @property
+    def index_path(self) -> str:
+        return f"{self.path}.idx.npy"
+
+    @property
+    def meta_path(self) -> str:
+        return f"{self.path}.meta.json"
+
+    def exists(self) -> bool:
+        return os.path.exists(self.index_path)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def live_count(self) -> int:
+        return int((self.index["meta"] != REMOVED).sum())
+
+    def live_ids(self) -> np.ndarray:
+        """Silinmemiş parçaların id'leri (artan sırada)."""
+        return np.flatnonzero(self.index["meta"] != REMOVED)
+
+    def __getitem__(self, i: int) -> Dict[str, Any]:
+        """i. parçayı {"text", "metadata"} sözlüğü olarak okur (her çağrıda yeni sözlük)."""
+        return {"text": self.text(i), "metadata": dict(self.metadata[self.index[i]["meta"]])}
+
+    def text(self, i: int) -> str:
+        offset, length, _ = self.index[i]
+        return self._mmap[offset:offset + length].decode("utf-8")
+
+    def load(self) -> None:
+        """Mevcut depoyu eşler; metinler belleğe alınmaz."""
+        if not self.exists():
+            self.close()
+            return
+        with open(self.meta_path, encoding="utf-8") as f:
+            metadata = json.load(f)
+        index = np.load(self.index_path, mmap_mode="r")
+        texts = self._map_texts()
+        # Yeni görünüm hazır: önce metadata ve metinler, en son indeks (eski indeksin satırları
+        # yeni dosyalarda da geçerlidir; .bin ve metadata yalnızca büyür)
+        self._meta_codes = {self._meta_key(meta): code for code, meta in enumerate(metadata)}
+        self.metadata = metadata
+        self._mmap = texts
+        self.index = index
+
+    def append(self, texts: List[str], metadata: Optional[Iterable[Dict[str, Any]]] = None) -> None:
+        """
+        Parçaları sona ekler. Sıra çökme durumunda tutarlılığı korur: önce metinler .bin'e eklenir,
+        sonra metadata ve en son indeks dosyası atomik olarak değiştirilir; indekste olmayan
+        .bin kuyruğu okunmaz.
+        """
+        if not texts:
+            return
+        metadata = list(metadata) if metadata is not None else [{}] * len(texts)
+
+        encoded = [text.encode("utf-8") for text in texts]
+        rows = np.empty(len(texts), dtype=INDEX_DTYPE)
+        with open(self.bin_path, "ab") as f:
+            start = f.tell()
+            f.write(b"".join(encoded))
+            f.flush()
+            os.fsync(f.fileno())
+        lengths = np.fromiter((len(data) for data in encoded), dtype="<i8", count=len(encoded))
+        rows["offset"] = start + np.concatenate([[0], np.cumsum(lengths)[:-1]])
+        rows["length"] = lengths
+        rows["meta"] = [self._meta_code(meta or {}) for meta in metadata]
+
+        self._replace(self.meta_path, lambda f: f.write(json.dumps(self.metadata, ensure_ascii=False).encode("utf-8")))
+        index = np.concatenate([self.index, rows])
+        self._replace(self.index_path, lambda f: np.save(f, index))
+        self.load()
+
+    def remove(self, ids: Iterable[int]) -> None:
+        """Parçaları silinmiş olarak işaretler; metinleri .bin'de kalır, id'ler yeniden kullanılmaz."""
+        ids = np.asarray(list(ids), dtype="int64")
+        if not len(ids):
+            return
+        index = np.array(self.index)
+        index["meta"][ids] = REMOVED
+        self._replace(self.index_path, lambda f: np.save(f, index))
+        self.load()
+
+    def clear(self) -> None:
+        """Depoyu tamamen siler (tam yeniden indeksleme; silinmiş parçaların yeri de geri kazanılır)."""
+        self.index = np.empty(0, dtype=INDEX_DTYPE)
+        self._mmap = b""
+        self.metadata = []
+        self._meta_codes = {}
+        for path in (self.bin_path, self.index_path, self.meta_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def import_pickle(self, pkl_path: str) -> int:
+        """
+        Eski biçimdeki (pickle edilmiş döküman listesi) depoyu bir kez içe aktarır ve pickle
+        dosyasını siler. Yalnızca botun kendi yazdığı dosya okunur.
+        """
+        with open(pkl_path, "rb") as f:
+            documents = pickle.load(f)
+        self.append([doc["text"] for doc in documents], [doc.get("metadata") or {} for doc in documents])
+        os.remove(pkl_path)
+        logger.info(f"[+] Eski döküman deposu (pickle) parça deposuna taşındı: {len(documents)} parça.")
+        return len(documents)
+
+    def close(self) -> None:
+        """Metin eşlemesini kapatır (kapanışta; eşzamanlı okuyucu yokken çağrılmalı)."""
+        if isinstance(self._mmap, mmap.mmap):
+            self._mmap.close()
+        self._mmap = None
+
+    def _map_texts(self):
+        # mmap dosya tanıtıcısını kendisi çoğaltır; dosya hemen kapatılabilir
+        with open(self.bin_path, "rb") as f:
+            # Boş dosya eşlenemez; bu durumda okunacak parça da yoktur
+            if os.fstat(f.fileno()).st_size:
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            return b""
+
+    def _meta_code(self, meta: Dict[str, Any]) -> int:
+        key = self._meta_key(meta)
+        if key not in self._meta_codes:
+            self._meta_codes[key] = len(self.metadata)
+            self.metadata.append(meta)
+        return self._meta_codes[key]
+
+    @staticmethod
+    def _meta_key(meta: Dict[str, Any]) -> str:
+        return json.dumps(meta, sort_keys=True, ensure_ascii=False)
+
+    @staticmethod
+    def _replace(path: str, write) -> None:
+        # Geçici dosyaya yazıp taşı: eşlenmiş (mmap) eski dosya yazma sırasında kesilmez
+        with open(f"{path}.tmp", "wb") as f:
+            write(f)
+        os.replace(f"{path}.tmp", path)
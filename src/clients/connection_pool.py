@@ -0,0 +1,384 @@
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Any, Optional, Tuple
+from src.core.logger import logger
+from src.core.exceptions import DatabaseError
+
+
+class _Lease:
+    """
+    Bir thread'in o an elinde tuttuğu fiziksel bağlantı, iç içe kullanım derinliği ve
+    açık yönetilen transaction (src.core.transaction) derinliği.
+    """
+
+    __slots__ = ("conn", "depth", "tx_depth")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+        self.depth = 1
+        self.tx_depth = 0
+
+
+class ConnectionPool:
+    """
+    Thread-aware, sınırlı boyutlu SQLite bağlantı havuzu.
+
+    - Her thread aynı anda en fazla bir fiziksel bağlantı tutar; aynı thread içinde
+      iç içe `get_connection()` çağrıları aynı bağlantıyı paylaşır (reentrant).
+    - Havuz doluysa yeni istekler `timeout` saniye boyunca boşa çıkan bağlantıyı bekler.
+    - `max_idle_seconds` boyunca kullanılmayan boştaki bağlantılar kapatılır.
+    - `render` verilirse `PooledConnection` üzerinden çalışan her SQL metni çalıştırılmadan
+      önce bir kez ondan geçirilir (sürücünün dialect'i: `?` -> sürücünün parametre stili).
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], sqlite3.Connection],
+        max_size: int = 8,
+        timeout: float = 10.0,
+        max_idle_seconds: float = 300.0,
+        render: Optional[Callable[[str], str]] = None,
+    ):
+        if max_size <= 0:
+            raise ValueError("Havuz boyutu pozitif olmalı")
+
+        self._factory = factory
+        self.render = render
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle_seconds = max_idle_seconds
+
+        self._cond = threading.Condition(threading.Lock())
+        self._idle: Deque[Tuple[sqlite3.Connection, float]] = deque()
+        self._leases: Dict[int, _Lease] = {}
+        self._size = 0  # Açık fiziksel bağlantı sayısı (boşta + kullanımda)
+        self._closed = False
+
+        # Metrikler
+        self._created = 0
+        self._evicted = 0
+        self._checkouts = 0
+        self._reuses = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+
+    # ------------------------------------------------------------------
+    # Checkout / checkin
+    # ------------------------------------------------------------------
+
+    def acquire(self) -> sqlite3.Connection:
+        """Çağıran thread için bir bağlantı kiralar (aynı thread'de reentrant)."""
+        thread_id = threading.get_ident()
+
+        with self._cond:
+            if self._closed:
+                raise DatabaseError("Bağlantı havuzu kapatıldı")
+
+            lease = self._leases.get(thread_id)
+            if lease is not None:
+                lease.depth += 1
+                return lease.conn
+
+            self._checkouts += 1
+            self._evict_idle_locked()
+
+            waited = 0.0
+            if not self._idle and self._size >= self.max_size:
+                self._waits += 1
+                started = time.monotonic()
+                deadline = started + self.timeout
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise DatabaseError(
+                            f"Veritabanı bağlantı havuzu dolu ({self.max_size}), "
+                            f"{self.timeout:.1f} sn içinde bağlantı alınamadı"
+                        )
+                    self._cond.wait(remaining)
+                    if self._closed:
+                        raise DatabaseError("Bağlantı havuzu kapatıldı")
+                waited = time.monotonic() - started
+                self._wait_time_total += waited
+                self._wait_time_max = max(self._wait_time_max, waited)
+
+            if self._idle:
+                conn, _ = self._idle.pop()  # LIFO: en sıcak bağlantıyı kullan
+                self._reuses += 1
+            else:
+                # Fiziksel bağlantıyı kilit dışında açmak için yer ayır
+                self._size += 1
+                conn = None
+
+        if conn is None:
+            try:
+                conn = self._factory()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._created += 1
+
+        if waited > 1.0:
+            logger.warning(f"[!] Veritabanı bağlantısı için {waited:.2f} sn beklendi")
+
+        with self._cond:
+            self._leases[thread_id] = _Lease(conn)
+        return conn
+
+    def release(self, conn: sqlite3.Connection, thread_id: Optional[int] = None) -> None:
+        """Kiralanan bağlantıyı havuza geri bırakır (iç içe kullanımda derinliği azaltır)."""
+        thread_id = thread_id if thread_id is not None else threading.get_ident()
+
+        with self._cond:
+            lease = self._leases.get(thread_id)
+            if lease is None or lease.conn is not conn:
+                return
+            lease.depth -= 1
+            if lease.depth > 0:
+                return
+            del self._leases[thread_id]
+
+        # Commit edilmemiş yarım işlem bir sonraki kullanıcıya sızmasın
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error as e:
+            logger.warning(f"[!] Havuza dönen bağlantı temizlenemedi, kapatılıyor: {e}")
+            self._discard(conn)
+            return
+
+        with self._cond:
+            if self._closed:
+                self._size -= 1
+                self._close_quietly(conn)
+            else:
+                self._idle.append((conn, time.monotonic()))
+                self._evict_idle_locked()
+            self._cond.notify()
+
+    def transaction_depth(self, thread_id: Optional[int] = None) -> int:
+        """Thread'in bağlantısında açık olan yönetilen transaction derinliği (0: yok)."""
+        thread_id = thread_id if thread_id is not None else threading.get_ident()
+        with self._cond:
+            lease = self._leases.get(thread_id)
+            return lease.tx_depth if lease is not None else 0
+
+    def enter_transaction(self) -> int:
+        """Thread'in kiraladığı bağlantıda yönetilen transaction derinliğini artırır ve döndürür."""
+        with self._cond:
+            lease = self._leases.get(threading.get_ident())
+            if lease is None:
+                raise DatabaseError("Transaction için önce bağlantı kiralanmalı")
+            lease.tx_depth += 1
+            return lease.tx_depth
+
+    def exit_transaction(self) -> None:
+        with self._cond:
+            lease = self._leases.get(threading.get_ident())
+            if lease is not None and lease.tx_depth > 0:
+                lease.tx_depth -= 1
+
+    def lease_depth(self, thread_id: Optional[int] = None) -> int:
+        """Thread'in kiraladığı bağlantının iç içe kullanım derinliği (0: kirası yok)."""
+        thread_id = thread_id if thread_id is not None else threading.get_ident()
+        with self._cond:
+            lease = self._leases.get(thread_id)
+            return lease.depth if lease is not None else 0
+
+    def connection(self) -> "PooledConnection":
+        """Havuzdan bir bağlantı kiralayıp `PooledConnection` vekili olarak döndürür."""
+        nested = self.lease_depth() > 0
+        return PooledConnection(self, self.acquire(), nested=nested, render=self.render)
+
+    # ------------------------------------------------------------------
+    # Bakım
+    # ------------------------------------------------------------------
+
+    def _evict_idle_locked(self) -> None:
+        """Boşta `max_idle_seconds`'tan uzun bekleyen bağlantıları kapatır (kilit tutulurken çağrılır)."""
+        if not self._idle or self.max_idle_seconds <= 0:
+            return
+        cutoff = time.monotonic() - self.max_idle_seconds
+        # En eski bağlantılar deque'nun solunda durur
+        while self._idle and self._idle[0][1] < cutoff:
+            conn, _ = self._idle.popleft()
+            self._size -= 1
+            self._evicted += 1
+            self._close_quietly(conn)
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        self._close_quietly(conn)
+        with self._cond:
+            self._size -= 1
+            self._cond.notify()
+
+    @staticmethod
+    def _close_quietly(conn: sqlite3.Connection) -> None:
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def close_all(self) -> None:
+        """Boştaki tüm bağlantıları kapatır; kullanımdakiler geri döndüğünde kapanır."""
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                conn, _ = self._idle.popleft()
+                self._size -= 1
+                self._close_quietly(conn)
+            self._cond.notify_all()
+        logger.info("[+] Veritabanı bağlantı havuzu kapatıldı.")
+
+    def stats(self) -> Dict[str, Any]:
+        """Havuz boyutu ve bekleme süresi metriklerini döndürür."""
+        with self._cond:
+            return {
+                "max_size": self.max_size,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": len(self._leases),
+                "created": self._created,
+                "evicted": self._evicted,
+                "checkouts": self._checkouts,
+                "reuses": self._reuses,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "wait_time_total_ms": round(self._wait_time_total * 1000, 2),
+                "wait_time_max_ms": round(self._wait_time_max * 1000, 2),
+            }
+
+
+class PooledConnection:
+    """
+    Havuzdan kiralanmış bir sqlite3.Connection için vekil nesne.
+
+    `sqlite3.Connection` ile aynı şekilde kullanılır (`cursor()`, `execute()`, `commit()` ...).
+    `with` bloğundan çıkışta commit/rollback yapılır ve bağlantı havuza geri bırakılır;
+    `close()` fiziksel bağlantıyı kapatmak yerine havuza iade eder.
+
+    Thread'de açık bir `transaction()` varsa bağlantı ona katılır: `commit()` / `rollback()`
+    çağrıları etkisizdir, işlemin sonucunu dıştaki transaction belirler. Aynı thread'de iç içe
+    alınan bağlantılar (`nested`) da böyledir: yalnızca en dıştaki kira commit/rollback yapar,
+    içteki blok yalnızca derinliği bırakır.
+
+    `execute` / `executemany` ve `cursor()` ile alınan cursor'lar SQL'i havuzun `render`
+    fonksiyonundan geçirir; repository'ler SQL'i her sürücü için `?` yer tutucusuyla yazar.
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        conn: sqlite3.Connection,
+        nested: bool = False,
+        render: Optional[Callable[[str], str]] = None,
+    ):
+        self._pool = pool
+        self._conn = conn
+        self._nested = nested
+        self._render = render
+        self._thread_id = threading.get_ident()
+        self._released = False
+
+    @property
+    def raw(self) -> sqlite3.Connection:
+        """Alttaki fiziksel sqlite3 bağlantısı."""
+        return self._conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def __enter__(self) -> "PooledConnection":
+        return self
+
+    def cursor(self, *args, **kwargs):
+        cursor = self._conn.cursor(*args, **kwargs)
+        return RenderingCursor(cursor, self._render) if self._render else cursor
+
+    def execute(self, sql: str, parameters=()):
+        if self._render:
+            sql = self._render(sql)
+        return self._conn.execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters):
+        if self._render:
+            sql = self._render(sql)
+        return self._conn.executemany(sql, seq_of_parameters)
+
+    @property
+    def in_managed_transaction(self) -> bool:
+        """Bağlantı şu an yönetilen (ambient) bir transaction'a ait mi?"""
+        return self._pool.transaction_depth(self._thread_id) > 0
+
+    @property
+    def owns_transaction(self) -> bool:
+        """commit/rollback bu vekilin kararı mı? (en dıştaki kira ve yönetilen transaction yok)"""
+        return not self._nested and not self.in_managed_transaction
+
+    def commit(self) -> None:
+        if self.owns_transaction:
+            self._conn.commit()
+
+    def rollback(self) -> None:
+        # Ambient transaction'da / dış kirada hata, exception olarak dıştaki bloğa ulaşınca geri alınır
+        if self.owns_transaction:
+            self._conn.rollback()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            self.close()
+        return False
+
+    def close(self) -> None:
+        """Bağlantıyı havuza iade eder (birden fazla çağrı güvenlidir)."""
+        if not self._released:
+            self._released = True
+            self._pool.release(self._conn, self._thread_id)
+
+    def __del__(self):
+        # `with` kullanılmadan alınıp kapatılmayan bağlantılar havuzda sızıntı yapmasın
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+class RenderingCursor:
+    """`execute` / `executemany` SQL'ini render fonksiyonundan geçiren cursor vekili."""
+
+    def __init__(self, cursor: sqlite3.Cursor, render: Callable[[str], str]):
+        self._cursor = cursor
+        self._render = render
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __setattr__(self, name, value):
+        # row_factory, arraysize gibi ayarlar alttaki cursor'a yazılır
+        if name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._cursor, name, value)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def execute(self, sql: str, parameters=()) -> "RenderingCursor":
+        self._cursor.execute(self._render(sql), parameters)
+        return self
+
+    def executemany(self, sql: str, seq_of_parameters) -> "RenderingCursor":
+        self._cursor.executemany(self._render(sql), seq_of_parameters)
+        return self
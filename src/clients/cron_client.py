@@ -63,6 +63,27 @@ class CronClient(metaclass=SingletonMeta):
             logger.error(f"[X] Cron görevi eklenirken hata: {e}")
             raise CemilBotError(f"Cron işi eklenemedi: {e}")
 
+    def add_interval_job(self, func: Callable, interval: Dict[str, Any], job_id: Optional[str] = None, args: Optional[List] = None) -> str:
+        """
+        Sabit aralıkla çalışan bir görev ekler (örn. {"minutes": 90}); cron'un "*/N" adımlarından
+        farklı olarak aralık saatin/günün sınırlarına bağlı değildir.
+        """
+        try:
+            wrapped_func, wrapped_args = self._wrap_async(func, args or [])
+
+            job = self.scheduler.add_job(
+                wrapped_func,
+                'interval',
+                id=job_id,
+                args=wrapped_args,
+                **interval
+            )
+            logger.info(f"[+] Aralıklı görev eklendi: {job.id} ({interval})")
+            return job.id
+        except Exception as e:
+            logger.error(f"[X] Aralıklı görev eklenirken hata: {e}")
+            raise CemilBotError(f"Aralıklı iş eklenemedi: {e}")
+
     def add_once_job(self, func: Callable, run_date: Optional[datetime] = None, delay_minutes: Optional[int] = None, job_id: Optional[str] = None, args: Optional[List] = None) -> str:
         """
         Bir kez çalışacak bir görev ekler.
@@ -1,153 +1,265 @@
+import os
 import sqlite3
+import time
 import uuid
-import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 from src.core.logger import logger
 from src.core.exceptions import DatabaseError
 from src.core.singleton import SingletonMeta
+from src.clients.connection_pool import ConnectionPool, PooledConnection
+from src.clients.schema_cache import SchemaCache
+from src.clients.db_executor import DatabaseExecutor
+from src.clients.query_instrumentation import QueryInstrumentation
+from src.clients.index_registry import sync_indexes
+from src.clients.row_cache import RowCacheRegistry
+from src.clients.db_driver import DatabaseDriver, DEFAULT_PRAGMAS, create_driver
+
+# Çevrimiçi yedeklemede adım başına kopyalanan sayfa sayısı (4 KiB sayfa ile ~1 MB)
+BACKUP_PAGES_PER_STEP = 256
+# Adımlar arası bekleme (sn): yedekleme diski ve GIL'i sürekli tutmasın, oy yazma gecikmesi artmasın
+BACKUP_STEP_DELAY = 0.005
+# Araya giren yazmalar kopyayı bu kadar kez baştan başlatırsa tek adımda kopyalanır
+BACKUP_MAX_RESTARTS = 3
+
+
+class _BackupRestarted(Exception):
+    """backup() ilerleme callback'inden kopyayı kesmek için kullanılır."""
+
 
 class DatabaseClient(metaclass=SingletonMeta):
     """
     Cemil Bot için merkezi veritabanı yönetim sınıfı.
-    SQLite bağlantı yönetiminden sorumludur.
+    Bağlantı havuzu, şema ve önbelleklerden sorumludur; fiziksel bağlantılar ve SQL
+    dialect'i sürücüden (`driver`, varsayılan dosya tabanlı SQLite) gelir.
     """
 
-    def __init__(self, db_path: str = "data/cemil_bot.db"):
+    def __init__(
+        self,
+        db_path: str = "data/cemil_bot.db",
+        pool_size: int = 8,
+        pool_timeout: float = 10.0,
+        pool_max_idle: float = 300.0,
+        pragmas: Optional[Dict[str, Any]] = None,
+        reader_threads: int = 4,
+        instrumentation: Optional[QueryInstrumentation] = None,
+        row_cache_enabled: bool = True,
+        driver: Union[str, DatabaseDriver] = "sqlite",
+    ):
         """
         db_path:
             - Normalde settings.database_path üzerinden gelir.
             - Bazı ortamlarda env değişkeni boş string gelebilir (""), bu durumda
               default "data/cemil_bot.db" kullanılmalıdır.
+        pool_size / pool_timeout / pool_max_idle:
+            - Bağlantı havuzunun boyutu, dolu havuzda bekleme süresi (sn) ve
+              boştaki bağlantıların kapatılmadan önce bekleyebileceği süre (sn).
+        pragmas:
+            - DEFAULT_PRAGMAS üzerine yazılacak PRAGMA değerleri (örn. settings'ten gelen profil).
+        reader_threads:
+            - Async repository çağrıları için okuma thread sayısı (yazmalar tek thread'de sıralanır).
+        instrumentation:
+            - Verilirse tüm sorgular ölçülür (süre, satır, çağıran metod, yavaş sorgu planı). Varsayılan kapalı.
+        row_cache_enabled:
+            - Sıcak okuma yapan repository'lerin (CACHE_TTL > 0) TTL + LRU önbelleği. Kapalıysa her okuma SQLite'a gider.
+        driver:
+            - Sürücü adı (db_driver.DRIVERS: "sqlite", "sqlite-format") veya hazır bir DatabaseDriver.
+              Ad verilirse db_path / pragmas / instrumentation sürücüye aktarılır.
         """
         # Boş veya sadece whitespace bir yol geldiyse güvenli default'a dön
         if not db_path or not str(db_path).strip():
             db_path = "data/cemil_bot.db"
 
-        self.db_path = db_path
+        if isinstance(driver, str):
+            driver = create_driver(driver, db_path, pragmas=pragmas, instrumentation=instrumentation)
+        self.driver = driver
+        self.dialect = driver.dialect
+        self.db_path = getattr(driver, "db_path", db_path)
+        self.pragmas = getattr(driver, "pragmas", {})
+        self.instrumentation = instrumentation
+
+        self.pool = ConnectionPool(
+            self._create_connection,
+            max_size=pool_size,
+            timeout=pool_timeout,
+            max_idle_seconds=pool_max_idle,
+            render=self.dialect.render,
+        )
+        # Repository'lerin kullandığı tablo metadata'sı ve hazır SQL metinleri
+        self.schema = SchemaCache(self)
+        # Repository okuma önbellekleri (tablo bazında, yazmalarda geçersiz kılınır)
+        self.row_cache = RowCacheRegistry(enabled=row_cache_enabled)
+        # Async repository çağrıları için tek writer + N reader thread
+        self.executor = DatabaseExecutor(reader_threads=min(reader_threads, max(1, pool_size - 1)))
+
+        self._apply_persistent_pragmas()
+        self.init_db()
+
+    def _create_connection(self):
+        """Sürücüden yeni bir fiziksel bağlantı açar (havuzun bağlantı fabrikası)."""
+        return self.driver.connect()
+
+    def _apply_persistent_pragmas(self):
+        """Sürücünün açılış kurulumunu (örn. SQLite journal_mode) bir kez çalıştırır."""
+        with self.get_connection() as conn:
+            self.driver.setup(conn)
+
+    def checkpoint(self, mode: str = "PASSIVE") -> Dict[str, int]:
+        """
+        WAL dosyasını ana veritabanına aktarır (wal_checkpoint).
+        mode: PASSIVE (kimseyi bekletmez), FULL, RESTART veya TRUNCATE (WAL dosyasını sıfırlar).
+        """
+        mode = mode.upper()
+        if mode not in ("PASSIVE", "FULL", "RESTART", "TRUNCATE"):
+            raise ValueError(f"Geçersiz checkpoint modu: {mode}")
+        try:
+            with self.get_connection() as conn:
+                busy, log_frames, checkpointed = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+            result = {"busy": busy, "log_frames": log_frames, "checkpointed": checkpointed}
+            logger.debug(f"[i] WAL checkpoint ({mode}): {result}")
+            return result
+        except sqlite3.Error as e:
+            logger.error(f"[X] WAL checkpoint hatası: {e}")
+            raise DatabaseError(f"WAL checkpoint başarısız: {e}")
+
+    def backup(
+        self, dest: str, pages_per_step: int = BACKUP_PAGES_PER_STEP, step_delay: float = BACKUP_STEP_DELAY
+    ) -> Dict[str, Any]:
+        """
+        Veritabanının tutarlı bir kopyasını `dest` dosyasına alır (SQLite online backup API).
+
+        Kopya `pages_per_step` sayfalık adımlarla yapılır; adımlar arasında kilit tutulmaz.
+        WAL modunda kopya boyunca tek bir okuma snapshot'ı açık tutulur: yazıcılar beklemez
+        ve araya giren commit'ler kopyayı baştan başlatmaz (kopya başlangıç anını yansıtır).
+        Rollback-journal modunda snapshot tutulamaz (yazıcıları bloklar); araya giren yazmalar
+        kopyayı baştan başlatır, BACKUP_MAX_RESTARTS aşılırsa kopya tek adımda (yazıcıları
+        kopya süresince bekleterek) tamamlanır.
 
-        # Klasör yoksa oluştur (sadece geçerli bir dizin adı varsa)
-        dir_name = os.path.dirname(db_path)
+        Dosya önce `dest.part` olarak yazılır ve tamamlanınca yerine taşınır; yarım kalan
+        yedek hiçbir zaman `dest` adıyla görünmez. `step_delay` (sn) adımlar arasında bekletir.
+        """
+        if pages_per_step <= 0:
+            raise ValueError("pages_per_step pozitif olmalı")
+        dir_name = os.path.dirname(dest)
         if dir_name:
             os.makedirs(dir_name, exist_ok=True)
 
-        self.init_db()
+        partial = f"{dest}.part"
+        steps = 0
+        restarts = 0
+        last_remaining = None
+        started = time.perf_counter()
+
+        def progress(status, remaining, total):
+            nonlocal steps, restarts, last_remaining
+            steps += 1
+            if last_remaining is not None and remaining > last_remaining:
+                restarts += 1
+                if restarts > BACKUP_MAX_RESTARTS:
+                    raise _BackupRestarted()
+            last_remaining = remaining
+            if step_delay and remaining:
+                time.sleep(step_delay)
 
-    def get_connection(self):
-        """SQLite bağlantısı döndürür."""
+        source = self.driver.connect()
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # Dict benzeri erişim için
-            # FOREIGN KEY desteğini etkinleştir (her connection için zorunlu)
-            conn.execute("PRAGMA foreign_keys = ON")
-            # Foreign key'lerin açık olduğunu doğrula
-            result = conn.execute("PRAGMA foreign_keys").fetchone()
-            if result and result[0] == 0:
-                logger.warning("[!] Foreign key'ler açılamadı, tekrar deniyor...")
-                conn.execute("PRAGMA foreign_keys = ON")
-            return conn
+            wal = (source.execute("PRAGMA journal_mode").fetchone()[0] or "").lower() == "wal"
+            if wal:
+                # Okuma snapshot'ını sabitle (BEGIN ertelenmiştir, ilk okuma kilidi alır)
+                source.execute("BEGIN")
+                source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+            target = sqlite3.connect(partial)
+            try:
+                try:
+                    source.backup(target, pages=pages_per_step, progress=progress)
+                except _BackupRestarted:
+                    logger.warning(f"[!] Yedek {restarts} kez baştan başladı, tek adımda kopyalanıyor")
+                    source.backup(target, pages=-1)
+                pages = target.execute("PRAGMA page_count").fetchone()[0]
+            finally:
+                target.close()
+            if wal:
+                source.rollback()
+            os.replace(partial, dest)
         except sqlite3.Error as e:
-            logger.error(f"[X] Veritabanı bağlantı hatası: {e}")
-            raise DatabaseError(f"Veritabanına bağlanılamadı: {e}")
+            if os.path.exists(partial):
+                os.remove(partial)
+            logger.error(f"[X] Veritabanı yedekleme hatası: {e}")
+            raise DatabaseError(f"Yedek alınamadı: {e}")
+        finally:
+            source.close()
+
+        result = {
+            "path": dest,
+            "pages": pages,
+            "steps": steps,
+            "restarts": restarts,
+            "bytes": os.path.getsize(dest),
+            "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+        logger.info(
+            f"[+] Veritabanı yedeği alındı: {dest} "
+            f"({result['bytes'] // 1024} KiB, {steps} adım, {result['elapsed_ms']} ms)"
+        )
+        return result
+
+    def get_connection(self) -> PooledConnection:
+        """
+        Havuzdan bir SQLite bağlantısı döndürür.
+        `with` bloğu sonunda commit/rollback yapılır ve bağlantı havuza iade edilir;
+        `with` kullanılmıyorsa `close()` ile iade edilmelidir.
+        """
+        return self.pool.connection()
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """Bağlantı havuzu metriklerini (boyut, bekleme süreleri) döndürür."""
+        return self.pool.stats()
+
+    def get_query_stats(self, limit: int = 10) -> Optional[Dict[str, Any]]:
+        """Sorgu ölçüm özetini, en pahalı ifadeleri ve yavaş sorguları döndürür (ölçüm kapalıysa None)."""
+        if not self.instrumentation:
+            return None
+        return {
+            "summary": self.instrumentation.summary(),
+            "top": self.instrumentation.top(limit),
+            "slow": self.instrumentation.slow_queries(),
+        }
+
+    def get_cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Repository okuma önbelleklerinin tablo bazında hit/miss sayaçlarını döndürür."""
+        return self.row_cache.stats()
+
+    def dump_query_stats(self, limit: int = 10):
+        """Sorgu istatistiklerini log dosyasına yazar (periyodik cron görevi)."""
+        if self.instrumentation:
+            self.instrumentation.dump(limit)
+
+    def close(self):
+        """Executor thread'lerini durdurur ve havuzdaki tüm bağlantıları kapatır (shutdown için)."""
+        self.executor.shutdown()
+        self.pool.close_all()
+        self.driver.close()
 
     def init_db(self):
-        """Temel tabloları hazırlar (Gerekirse)."""
+        """
+        Şemayı migrations/ klasöründeki sürümlü migration'larla günceller, ardından seed verisini ekler.
+        Güncel bir veritabanında hiçbir DDL çalıştırılmaz ve mevcut veriler korunur.
+        """
+        from src.clients.migration_runner import MigrationRunner
+
+        MigrationRunner(self).run()
+        self.schema.load()
+
+        # Index'leri kayıtla eşitle (index_registry.INDEXES); güncel veritabanında DDL çalışmaz
+        try:
+            with self.get_connection() as conn:
+                sync_indexes(conn)
+        except sqlite3.Error as e:
+            logger.error(f"[X] Index eşitleme hatası: {e}")
+            raise DatabaseError(f"Index'ler oluşturulamadı: {e}")
+
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                # Foreign key'leri aç (tüm tablolar için)
-                cursor.execute("PRAGMA foreign_keys = ON")
-                
-                # Kullanıcılar Tablosu (Users)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS users (
-                        id TEXT PRIMARY KEY,
-                        slack_id TEXT UNIQUE,
-                        first_name TEXT,
-                        middle_name TEXT,
-                        surname TEXT,
-                        full_name TEXT,
-                        birthday TEXT,
-                        cohort TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Migration: Gereksiz kolonları kaldır ve sadece gerekli kolonları bırak
-                cursor.execute("PRAGMA table_info(users)")
-                columns = [column[1] for column in cursor.fetchall()]
-                
-                required_columns = ['id', 'slack_id', 'first_name', 'middle_name', 'surname', 'full_name', 'birthday', 'cohort', 'created_at', 'updated_at']
-                has_unnecessary_columns = any(col not in required_columns for col in columns)
-                missing_cohort = 'cohort' not in columns
-                missing_middle_name = 'middle_name' not in columns
-                has_department = 'department' in columns
-                
-                # Eğer middle_name kolonu yoksa ekle
-                if missing_middle_name:
-                    logger.info("[i] middle_name kolonu ekleniyor...")
-                    cursor.execute("ALTER TABLE users ADD COLUMN middle_name TEXT")
-                    logger.info("[+] middle_name kolonu eklendi.")
-                
-                if has_unnecessary_columns or missing_cohort or has_department or missing_middle_name:
-                    logger.info("[i] Veritabanı şeması güncelleniyor...")
-                    # Yeni temiz tablo oluştur
-                    cursor.execute("DROP TABLE IF EXISTS users_new")
-                    cursor.execute("""
-                        CREATE TABLE users_new (
-                            id TEXT PRIMARY KEY,
-                            slack_id TEXT UNIQUE,
-                            first_name TEXT,
-                            middle_name TEXT,
-                            surname TEXT,
-                            full_name TEXT,
-                            birthday TEXT,
-                            cohort TEXT,
-                            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        )
-                    """)
-                    
-                    # Mevcut verileri kopyala (sadece mevcut kolonlar varsa)
-                    if 'id' in columns and 'slack_id' in columns:
-                        # Department varsa cohort'a çevir, yoksa boş bırak
-                        if has_department:
-                            cursor.execute("""
-                                INSERT INTO users_new (id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort, created_at, updated_at)
-                                SELECT 
-                                    id, 
-                                    slack_id, 
-                                    COALESCE(first_name, '') as first_name,
-                                    COALESCE(middle_name, '') as middle_name,
-                                    COALESCE(surname, '') as surname,
-                                    COALESCE(full_name, '') as full_name,
-                                    birthday,
-                                    COALESCE(department, '') as cohort,
-                                    COALESCE(created_at, CURRENT_TIMESTAMP) as created_at,
-                                    COALESCE(updated_at, CURRENT_TIMESTAMP) as updated_at
-                                FROM users
-                            """)
-                        else:
-                            cursor.execute("""
-                                INSERT INTO users_new (id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort, created_at, updated_at)
-                                SELECT 
-                                    id, 
-                                    slack_id, 
-                                    COALESCE(first_name, '') as first_name,
-                                    COALESCE(middle_name, '') as middle_name,
-                                    COALESCE(surname, '') as surname,
-                                    COALESCE(full_name, '') as full_name,
-                                    birthday,
-                                    COALESCE(cohort, '') as cohort,
-                                    COALESCE(created_at, CURRENT_TIMESTAMP) as created_at,
-                                    COALESCE(updated_at, CURRENT_TIMESTAMP) as updated_at
-                                FROM users
-                            """)
-                    
-                    # Eski tabloyu sil ve yenisini yeniden adlandır
-                    cursor.execute("DROP TABLE users")
-                    cursor.execute("ALTER TABLE users_new RENAME TO users")
-                    logger.info("[+] Veritabanı şeması temizlendi: Sadece gerekli kolonlar kaldı (id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort).")
 
                 # Akademi admin kullanıcısını garanti altına al
                 try:
@@ -168,312 +280,13 @@ class DatabaseClient(metaclass=SingletonMeta):
                 except Exception as admin_seed_error:
                     logger.warning(f"[!] Akademi admin kullanıcısı seed edilirken hata: {admin_seed_error}")
 
-                # Eşleşme Takip Tablosu (Matches)
-                # Mevcut şemada foreign key'ler users(id)'ye bağlıydı, ancak uygulama Slack ID kullanıyor.
-                # Foreign key hatalarını önlemek için tabloyu yeniden oluşturup users(slack_id)'ye bağlarız.
-                cursor.execute("DROP TABLE IF EXISTS matches")
-                cursor.execute("""
-                    CREATE TABLE matches (
-                        id TEXT PRIMARY KEY,
-                        channel_id TEXT,
-                        coffee_channel_id TEXT,
-                        user1_id TEXT,
-                        user2_id TEXT,
-                        status TEXT DEFAULT 'active',
-                        summary TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (user1_id) REFERENCES users(slack_id) ON DELETE SET NULL,
-                        FOREIGN KEY (user2_id) REFERENCES users(slack_id) ON DELETE SET NULL
-                    )
-                """)
-
-                # Oylama Başlıkları Tablosu (Polls)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS polls (
-                        id TEXT PRIMARY KEY,
-                        topic TEXT,
-                        options TEXT, -- JSON formatında seçenekler
-                        result_summary TEXT, -- Oylama bittiğinde LLM özeti veya ham sonuç
-                        creator_id TEXT,
-                        allow_multiple INTEGER DEFAULT 0, -- Çoklu oy opsiyonu
-                        is_closed INTEGER DEFAULT 0,
-                        expires_at TIMESTAMP,
-                        message_ts TEXT, -- Oylama mesajının timestamp'i (güncelleme için)
-                        message_channel TEXT, -- Oylama mesajının kanalı
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Migration: Eğer message_ts ve message_channel kolonları yoksa ekle
-                cursor.execute("PRAGMA table_info(polls)")
-                columns = [column[1] for column in cursor.fetchall()]
-                if 'message_ts' not in columns:
-                    cursor.execute("ALTER TABLE polls ADD COLUMN message_ts TEXT")
-                    logger.info("[i] polls tablosuna message_ts kolonu eklendi.")
-                if 'message_channel' not in columns:
-                    cursor.execute("ALTER TABLE polls ADD COLUMN message_channel TEXT")
-                    logger.info("[i] polls tablosuna message_channel kolonu eklendi.")
-
-                # Oylar Tablosu (Votes) - User & Poll Ara Tablo
-                # Mevcut şemada foreign key users(id)'ye bağlıydı, ancak uygulama Slack ID kullanıyor.
-                # Foreign key hatalarını önlemek için tabloyu yeniden oluşturup users(slack_id)'ye bağlarız.
-                cursor.execute("DROP TABLE IF EXISTS votes")
-                cursor.execute("""
-                    CREATE TABLE votes (
-                        id TEXT PRIMARY KEY,
-                        poll_id TEXT,
-                        user_id TEXT,
-                        option_index INTEGER,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(poll_id, user_id, option_index),
-                        FOREIGN KEY (poll_id) REFERENCES polls(id) ON DELETE CASCADE,
-                        FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
-                    )
-                """)
-
-                # Anonim Geri Bildirim Tablosu (Feedbacks)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS feedbacks (
-                        id TEXT PRIMARY KEY,
-                        content TEXT,
-                        category TEXT DEFAULT 'general',
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Yardım İstekleri Tablosu (Help Requests)
-                # Mevcut şemada foreign key'ler users(id)'ye bağlıydı, ancak uygulama Slack ID kullanıyor.
-                # Foreign key hatalarını önlemek için tabloyu yeniden oluşturup users(slack_id)'ye bağlarız.
-                cursor.execute("DROP TABLE IF EXISTS help_requests")
-                cursor.execute("""
-                    CREATE TABLE help_requests (
-                        id TEXT PRIMARY KEY,
-                        requester_id TEXT NOT NULL,
-                        topic TEXT NOT NULL,
-                        description TEXT NOT NULL,
-                        status TEXT DEFAULT 'open',
-                        helper_id TEXT,
-                        channel_id TEXT,
-                        help_channel_id TEXT,
-                        message_ts TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        resolved_at TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (requester_id) REFERENCES users(slack_id) ON DELETE CASCADE,
-                        FOREIGN KEY (helper_id) REFERENCES users(slack_id) ON DELETE SET NULL
-                    )
-                """)
-                
-                # Challenge Hub Tabloları
-                # Foreign key'leri aç (challenge tabloları için)
-                cursor.execute("PRAGMA foreign_keys = ON")
-                
-                # NOT: Artık tabloları her açılışta DROP etmiyoruz (Veri kaybını önlemek için)
-                # Sadece eksik tablolar oluşturulur.
-                logger.debug("[i] Challenge tabloları kontrol ediliyor...")
-                
-                # Challenge Themes (Temalar)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS challenge_themes (
-                        id TEXT PRIMARY KEY,
-                        name TEXT NOT NULL UNIQUE,
-                        description TEXT,
-                        icon TEXT,
-                        difficulty_range TEXT,
-                        is_active INTEGER DEFAULT 1,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Challenge Projects (Proje Şablonları)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS challenge_projects (
-                        id TEXT PRIMARY KEY,
-                        theme TEXT NOT NULL,
-                        name TEXT NOT NULL,
-                        description TEXT,
-                        objectives TEXT,
-                        deliverables TEXT,
-                        tasks TEXT,
-                        difficulty_level TEXT DEFAULT 'intermediate',
-                        estimated_hours INTEGER DEFAULT 48,
-                        min_team_size INTEGER DEFAULT 2,
-                        max_team_size INTEGER DEFAULT 6,
-                        learning_objectives TEXT,
-                        skills_required TEXT,
-                        skills_developed TEXT,
-                        resources TEXT,
-                        knowledge_base_refs TEXT,
-                        llm_customizable INTEGER DEFAULT 1,
-                        llm_enhancement_prompt TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Challenge Hubs (Ana Challenge'lar)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS challenge_hubs (
-                        id TEXT PRIMARY KEY,
-                        creator_id TEXT NOT NULL,
-                        theme TEXT NOT NULL,
-                        team_size INTEGER NOT NULL,
-                        status TEXT DEFAULT 'recruiting',
-                        challenge_channel_id TEXT,
-                        hub_channel_id TEXT,
-                        selected_project_id TEXT,
-                        llm_customizations TEXT,
-                        deadline_hours INTEGER DEFAULT 48,
-                        difficulty TEXT DEFAULT 'intermediate',
-                        deadline TIMESTAMP,
-                        started_at TIMESTAMP,
-                        completed_at TIMESTAMP,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (creator_id) REFERENCES users(slack_id) ON DELETE CASCADE
-                    )
-                """)
-                
-                # Migration: updated_at kolonu yoksa ekle
-                cursor.execute("PRAGMA table_info(challenge_hubs)")
-                columns = [column[1] for column in cursor.fetchall()]
-                if 'updated_at' not in columns:
-                    logger.info("[i] challenge_hubs tablosuna updated_at kolonu ekleniyor...")
-                    # SQLite'da ALTER TABLE ile DEFAULT CURRENT_TIMESTAMP kullanılamaz, NULL ile ekle
-                    cursor.execute("ALTER TABLE challenge_hubs ADD COLUMN updated_at TIMESTAMP")
-                    logger.info("[+] challenge_hubs.updated_at kolonu eklendi.")
-                
-                # Challenge Participants (Katılımcılar)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS challenge_participants (
-                        id TEXT PRIMARY KEY,
-                        challenge_hub_id TEXT NOT NULL,
-                        user_id TEXT NOT NULL,
-                        role TEXT,
-                        joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        points_earned INTEGER DEFAULT 0,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        UNIQUE(challenge_hub_id, user_id),
-                        FOREIGN KEY (challenge_hub_id) REFERENCES challenge_hubs(id) ON DELETE CASCADE,
-                        FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
-                    )
-                """)
-                
-                # Migration: updated_at kolonu yoksa ekle
-                cursor.execute("PRAGMA table_info(challenge_participants)")
-                columns = [column[1] for column in cursor.fetchall()]
-                if 'updated_at' not in columns:
-                    logger.info("[i] challenge_participants tablosuna updated_at kolonu ekleniyor...")
-                    # SQLite'da ALTER TABLE ile DEFAULT CURRENT_TIMESTAMP kullanılamaz, NULL ile ekle
-                    cursor.execute("ALTER TABLE challenge_participants ADD COLUMN updated_at TIMESTAMP")
-                    logger.info("[+] challenge_participants.updated_at kolonu eklendi.")
-                
-                # Challenge Submissions (Takım Çıktıları)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS challenge_submissions (
-                        id TEXT PRIMARY KEY,
-                        challenge_hub_id TEXT NOT NULL,
-                        team_name TEXT,
-                        project_name TEXT,
-                        solution_summary TEXT,
-                        deliverables TEXT,
-                        learning_outcomes TEXT,
-                        llm_enhanced_features TEXT,
-                        submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        points_awarded INTEGER DEFAULT 0,
-                        creativity_score INTEGER DEFAULT 0,
-                        teamwork_score INTEGER DEFAULT 0,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (challenge_hub_id) REFERENCES challenge_hubs(id) ON DELETE CASCADE
-                    )
-                """)
-                
-                # Migration: updated_at kolonu yoksa ekle
-                cursor.execute("PRAGMA table_info(challenge_submissions)")
-                columns = [column[1] for column in cursor.fetchall()]
-                if 'updated_at' not in columns:
-                    logger.info("[i] challenge_submissions tablosuna updated_at kolonu ekleniyor...")
-                    # SQLite'da ALTER TABLE ile DEFAULT CURRENT_TIMESTAMP kullanılamaz, NULL ile ekle
-                    cursor.execute("ALTER TABLE challenge_submissions ADD COLUMN updated_at TIMESTAMP")
-                    logger.info("[+] challenge_submissions.updated_at kolonu eklendi.")
-                
-                # Challenge Evaluations (Değerlendirme Sistemi)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS challenge_evaluations (
-                        id TEXT PRIMARY KEY,
-                        challenge_hub_id TEXT NOT NULL,
-                        evaluation_channel_id TEXT,
-                        github_repo_url TEXT,
-                        github_repo_public INTEGER DEFAULT 0,
-                        status TEXT DEFAULT 'pending',
-                        true_votes INTEGER DEFAULT 0,
-                        false_votes INTEGER DEFAULT 0,
-                        final_result TEXT,
-                        admin_approval TEXT DEFAULT 'pending',
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        deadline_at TIMESTAMP,
-                        completed_at TIMESTAMP,
-                        FOREIGN KEY (challenge_hub_id) REFERENCES challenge_hubs(id) ON DELETE CASCADE
-                    )
-                """)
-                
-                # Migration: admin_approval kolonu yoksa ekle
-                cursor.execute("PRAGMA table_info(challenge_evaluations)")
-                columns = [column[1] for column in cursor.fetchall()]
-                if 'admin_approval' not in columns:
-                    logger.info("[i] challenge_evaluations tablosuna admin_approval kolonu ekleniyor...")
-                    cursor.execute("ALTER TABLE challenge_evaluations ADD COLUMN admin_approval TEXT DEFAULT 'pending'")
-                    logger.info("[+] challenge_evaluations.admin_approval kolonu eklendi.")
-                
-                # Migration: jury_status kolonu yoksa ekle
-                if 'jury_status' not in columns:
-                    logger.info("[i] challenge_evaluations tablosuna jury_status kolonu ekleniyor...")
-                    cursor.execute("ALTER TABLE challenge_evaluations ADD COLUMN jury_status TEXT DEFAULT 'recruiting'")
-                    logger.info("[+] challenge_evaluations.jury_status kolonu eklendi.")
-                
-                # Challenge Evaluators (Değerlendiriciler)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS challenge_evaluators (
-                        id TEXT PRIMARY KEY,
-                        evaluation_id TEXT NOT NULL,
-                        user_id TEXT NOT NULL,
-                        vote TEXT,
-                        voted_at TIMESTAMP,
-                        FOREIGN KEY (evaluation_id) REFERENCES challenge_evaluations(id) ON DELETE CASCADE,
-                        FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
-                    )
-                """)
-                
-                # User Challenge Stats (Kullanıcı İstatistikleri)
-                cursor.execute("""
-                    CREATE TABLE IF NOT EXISTS user_challenge_stats (
-                        user_id TEXT PRIMARY KEY,
-                        total_challenges INTEGER DEFAULT 0,
-                        completed_challenges INTEGER DEFAULT 0,
-                        total_points INTEGER DEFAULT 0,
-                        creativity_points INTEGER DEFAULT 0,
-                        teamwork_points INTEGER DEFAULT 0,
-                        favorite_theme TEXT,
-                        last_challenge_date DATE,
-                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                        FOREIGN KEY (user_id) REFERENCES users(slack_id) ON DELETE CASCADE
-                    )
-                """)
-                
-                conn.commit()
-                logger.debug("[i] Veritabanı tabloları kontrol edildi.")
-                
-                # Index'leri oluştur (performans için)
-                self._create_indexes(cursor)
-                conn.commit()
-                
                 # Seed data: Temalar ve Projeler
                 self._seed_challenge_data(cursor)
                 conn.commit()
-                
+
         except sqlite3.Error as e:
             logger.error(f"[X] Veritabanı ilklendirme hatası: {e}")
-            raise DatabaseError(f"Tablolar oluşturulamadı: {e}")
+            raise DatabaseError(f"Seed verisi eklenemedi: {e}")
     
     def _seed_challenge_data(self, cursor):
         """Challenge temaları ve projeler için seed data ekler. Açılışta kontrol eder, yoksa ekler."""
@@ -498,19 +311,25 @@ class DatabaseClient(metaclass=SingletonMeta):
                 ("theme_automation", "Automation", "İş süreçlerini otomatikleştirme", "⚙️", "intermediate", 1),
             ]
             
-            themes_added = 0
-            for theme_id, name, desc, icon, diff_range, is_active in themes:
-                # Önce kontrol et
-                cursor.execute("SELECT id FROM challenge_themes WHERE id = ?", (theme_id,))
-                exists = cursor.fetchone()
-                
-                if not exists:
-                    cursor.execute("""
-                        INSERT INTO challenge_themes (id, name, description, icon, difficulty_range, is_active)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (theme_id, name, desc, icon, diff_range, is_active))
-                    themes_added += 1
-                    logger.debug(f"[+] Tema eklendi: {name}")
+            from src.repositories.challenge_theme_repository import ChallengeThemeRepository
+            from src.repositories.challenge_project_repository import ChallengeProjectRepository
+
+            conn = cursor.connection
+            # Mevcut temalar olduğu gibi kalır (ON CONFLICT DO NOTHING); eklenen sayısı satır sayısı farkından
+            # (total_changes FTS trigger'larının yazdığı satırları da sayar)
+            cursor.execute("SELECT COUNT(*) FROM challenge_themes")
+            themes_before = cursor.fetchone()[0]
+            ChallengeThemeRepository(self).upsert_many(
+                (
+                    {"id": theme_id, "name": name, "description": desc, "icon": icon,
+                     "difficulty_range": diff_range, "is_active": is_active}
+                    for theme_id, name, desc, icon, diff_range, is_active in themes
+                ),
+                update_columns=(),
+                conn=conn,
+            )
+            cursor.execute("SELECT COUNT(*) FROM challenge_themes")
+            themes_added = cursor.fetchone()[0] - themes_before
             
             if themes_added > 0:
                 logger.info(f"[+] {themes_added} yeni tema eklendi.")
@@ -1313,37 +1132,31 @@ class DatabaseClient(metaclass=SingletonMeta):
     }
 ]
             
-            projects_added = 0
-            for project in all_projects:
-                # Önce kontrol et - proje var mı?
-                cursor.execute("SELECT id FROM challenge_projects WHERE id = ?", (project["id"],))
-                exists = cursor.fetchone()
-                
-                if not exists:
-                    # objectives ve deliverables JSON formatına çevir
-                    objectives_json = json.dumps(project["objectives"], ensure_ascii=False)
-                    deliverables_json = json.dumps(project["deliverables"], ensure_ascii=False)
-                    tasks_json = json.dumps(project["tasks"], ensure_ascii=False)
-                    
-                    cursor.execute("""
-                        INSERT INTO challenge_projects 
-                        (id, theme, name, description, objectives, deliverables, tasks, difficulty_level, estimated_hours, min_team_size, max_team_size)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        project["id"],
-                        project["theme"],
-                        project["name"],
-                        project["description"],
-                        objectives_json,
-                        deliverables_json,
-                        tasks_json,
-                        project["difficulty_level"],
-                        project["estimated_hours"],
-                        project["min_team_size"],
-                        project["max_team_size"]
-                    ))
-                    projects_added += 1
-                    logger.debug(f"[+] Proje eklendi: {project['name']} ({project['theme']})")
+            # objectives, deliverables ve tasks JSON formatında saklanır
+            cursor.execute("SELECT COUNT(*) FROM challenge_projects")
+            projects_before = cursor.fetchone()[0]
+            ChallengeProjectRepository(self).upsert_many(
+                (
+                    {
+                        "id": project["id"],
+                        "theme": project["theme"],
+                        "name": project["name"],
+                        "description": project["description"],
+                        "objectives": json.dumps(project["objectives"], ensure_ascii=False),
+                        "deliverables": json.dumps(project["deliverables"], ensure_ascii=False),
+                        "tasks": json.dumps(project["tasks"], ensure_ascii=False),
+                        "difficulty_level": project["difficulty_level"],
+                        "estimated_hours": project["estimated_hours"],
+                        "min_team_size": project["min_team_size"],
+                        "max_team_size": project["max_team_size"],
+                    }
+                    for project in all_projects
+                ),
+                update_columns=(),
+                conn=conn,
+            )
+            cursor.execute("SELECT COUNT(*) FROM challenge_projects")
+            projects_added = cursor.fetchone()[0] - projects_before
             
             if projects_added > 0:
                 logger.info(f"[+] {projects_added} yeni proje eklendi.")
@@ -1360,52 +1173,6 @@ class DatabaseClient(metaclass=SingletonMeta):
         except Exception as e:
             logger.warning(f"[!] Challenge seed data eklenirken hata: {e}")
     
-    def _create_indexes(self, cursor):
-        """Performans için index'leri oluşturur."""
-        try:
-            indexes = [
-                # Challenge indexes
-                ("idx_challenge_hubs_status", "challenge_hubs", "status"),
-                ("idx_challenge_hubs_creator", "challenge_hubs", "creator_id"),
-                ("idx_challenge_participants_hub", "challenge_participants", "challenge_hub_id"),
-                ("idx_challenge_participants_user", "challenge_participants", "user_id"),
-                ("idx_challenge_submissions_hub", "challenge_submissions", "challenge_hub_id"),
-                ("idx_challenge_evaluations_hub", "challenge_evaluations", "challenge_hub_id"),
-                ("idx_challenge_evaluations_status", "challenge_evaluations", "status"),
-                ("idx_challenge_evaluators_evaluation", "challenge_evaluators", "evaluation_id"),
-                ("idx_challenge_evaluators_user", "challenge_evaluators", "user_id"),
-                
-                # Help indexes
-                ("idx_help_requests_status", "help_requests", "status"),
-                ("idx_help_requests_requester", "help_requests", "requester_id"),
-                ("idx_help_requests_helper", "help_requests", "helper_id"),
-                
-                # Match indexes
-                ("idx_matches_status", "matches", "status"),
-                ("idx_matches_user1", "matches", "user1_id"),
-                ("idx_matches_user2", "matches", "user2_id"),
-                
-                # Poll indexes
-                ("idx_polls_is_closed", "polls", "is_closed"),
-                ("idx_polls_creator", "polls", "creator_id"),
-                ("idx_votes_poll", "votes", "poll_id"),
-                ("idx_votes_user", "votes", "user_id"),
-                
-                # User indexes
-                ("idx_users_slack_id", "users", "slack_id"),
-            ]
-            
-            for index_name, table_name, column_name in indexes:
-                try:
-                    cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name}({column_name})")
-                    logger.debug(f"[+] Index oluşturuldu: {index_name}")
-                except sqlite3.Error as e:
-                    logger.warning(f"[!] Index oluşturulamadı ({index_name}): {e}")
-            
-            logger.info("[+] Veritabanı index'leri kontrol edildi.")
-        except Exception as e:
-            logger.warning(f"[!] Index oluşturulurken hata: {e}")
-    
     def clean_challenge_tables(self):
         """Challenge tablolarını temizler (startup için)."""
         try:
@@ -1415,26 +1182,31 @@ class DatabaseClient(metaclass=SingletonMeta):
                 # Foreign key constraint'leri geçici olarak devre dışı bırak
                 cursor.execute("PRAGMA foreign_keys = OFF")
                 
-                # Sırayla temizle (foreign key bağımlılıklarına göre)
-                tables = [
-                    "challenge_evaluators",
-                    "challenge_evaluations",
-                    "challenge_submissions",
-                    "challenge_participants",
-                    "challenge_hubs",
-                    "user_challenge_stats"
-                ]
-                
-                deleted_counts = {}
-                for table in tables:
-                    cursor.execute(f"DELETE FROM {table}")
-                    deleted_counts[table] = cursor.rowcount
-                    logger.debug(f"[+] {table} temizlendi: {cursor.rowcount} kayıt silindi")
-                
-                # Foreign key constraint'leri tekrar etkinleştir
-                cursor.execute("PRAGMA foreign_keys = ON")
-                
-                conn.commit()
+                try:
+                    # Sırayla temizle (foreign key bağımlılıklarına göre)
+                    tables = [
+                        "challenge_evaluators",
+                        "challenge_evaluations",
+                        "challenge_submissions",
+                        "challenge_participants",
+                        "challenge_hubs",
+                        "user_challenge_stats"
+                    ]
+                    
+                    deleted_counts = {}
+                    for table in tables:
+                        cursor.execute(f"DELETE FROM {table}")
+                        deleted_counts[table] = cursor.rowcount
+                        logger.debug(f"[+] {table} temizlendi: {cursor.rowcount} kayıt silindi")
+                    
+                    conn.commit()
+                finally:
+                    # Foreign key constraint'leri tekrar etkinleştir.
+                    # PRAGMA transaction içinde etkisizdir; bağlantı havuza döneceği için
+                    # commit/rollback sonrasında aynı bağlantıda mutlaka geri açılmalı.
+                    if conn.in_transaction:
+                        conn.rollback()
+                    conn.execute("PRAGMA foreign_keys = ON")
                 
                 total_deleted = sum(deleted_counts.values())
                 if total_deleted > 0:
@@ -1445,10 +1217,4 @@ class DatabaseClient(metaclass=SingletonMeta):
                 return deleted_counts
         except Exception as e:
             logger.error(f"[X] Challenge tabloları temizlenirken hata: {e}", exc_info=True)
-            # Hata durumunda foreign key'leri tekrar etkinleştir
-            try:
-                with self.get_connection() as conn:
-                    conn.execute("PRAGMA foreign_keys = ON")
-            except:
-                pass
-            return {}
\ No newline at end of file
+            return {}
@@ -0,0 +1,110 @@
+import os
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from src.core.logger import logger
+from src.core.exceptions import DatabaseError
+
+# Yedek dosya adı: <veritabanı adı>-YYYYMMDD-HHMMSS.db (ada göre sıralama = zamana göre sıralama)
+BACKUP_TIMESTAMP_FORMAT = "%Y%m%d-%H%M%S"
+
+
+def _stem(db_path: str) -> str:
+    return os.path.splitext(os.path.basename(db_path))[0] or "cemil_bot"
+
+
+def backup_filename(db_path: str, moment: Optional[datetime] = None) -> str:
+    """Veritabanı yolu için zaman damgalı yedek dosya adı."""
+    return f"{_stem(db_path)}-{(moment or datetime.now()).strftime(BACKUP_TIMESTAMP_FORMAT)}.db"
+
+
+def list_backups(directory: str, db_path: str) -> List[str]:
+    """Klasördeki bu veritabanına ait tamamlanmış yedekler, en yeniden eskiye."""
+    if not os.path.isdir(directory):
+        return []
+    prefix = f"{_stem(db_path)}-"
+    names = [
+        name for name in os.listdir(directory)
+        if name.startswith(prefix) and name.endswith(".db")
+    ]
+    return [os.path.join(directory, name) for name in sorted(names, reverse=True)]
+
+
+def rotate_backups(directory: str, db_path: str, keep: int) -> List[str]:
+    """En yeni `keep` yedeği tutar, kalanları siler; silinen dosyaları döndürür."""
+    removed = []
+    for path in list_backups(directory, db_path)[max(keep, 1):]:
+        try:
+            os.remove(path)
+            removed.append(path)
+        except OSError as e:
+            logger.warning(f"[!] Eski yedek silinemedi: {path} ({e})")
+    return removed
+
+
+def run_scheduled_backup(db_client, directory: str, keep: int, pages_per_step: int) -> Optional[Dict[str, Any]]:
+    """Cron görevi: yeni yedek alır ve eski yedekleri döndürür (hata loglanır, yükseltilmez)."""
+    try:
+        dest = os.path.join(directory, backup_filename(db_client.db_path))
+        result = db_client.backup(dest, pages_per_step=pages_per_step)
+        result["removed"] = rotate_backups(directory, db_client.db_path, keep)
+        if result["removed"]:
+            logger.info(f"[i] {len(result['removed'])} eski yedek silindi (saklanan: {keep})")
+        return result
+    except Exception as e:
+        logger.error(f"[X] Zamanlanmış yedekleme hatası: {e}")
+        return None
+
+
+def verify_backup(backup_path: str) -> None:
+    """Yedeği salt okunur açıp PRAGMA integrity_check ile doğrular (bozuksa DatabaseError)."""
+    if not os.path.isfile(backup_path):
+        raise DatabaseError(f"Yedek dosyası bulunamadı: {backup_path}")
+    try:
+        conn = sqlite3.connect(f"file:{backup_path}?mode=ro", uri=True)
+        try:
+            result = conn.execute("PRAGMA integrity_check").fetchone()[0]
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        raise DatabaseError(f"Yedek okunamadı: {e}")
+    if result != "ok":
+        raise DatabaseError(f"Yedek bozuk: {result}")
+
+
+def restore_backup(backup_path: str, db_path: str, safety_copy: bool = True) -> Dict[str, Any]:
+    """
+    Yedeği `db_path` veritabanına geri yükler. Bot kapalıyken çalıştırılmalıdır.
+
+    Yedek önce doğrulanır; `safety_copy` açıksa mevcut veritabanı `<db_path>.pre-restore-<zaman>`
+    olarak saklanır. Geri yükleme de backup API ile hedef bağlantı üzerinden yapılır, böylece
+    hedefteki WAL / journal dosyaları tutarlı kalır.
+    """
+    verify_backup(backup_path)
+    result: Dict[str, Any] = {"source": backup_path, "target": db_path, "safety_copy": None}
+    try:
+        target = sqlite3.connect(db_path, timeout=30)
+        try:
+            if safety_copy and os.path.exists(db_path):
+                copy_path = f"{db_path}.pre-restore-{datetime.now().strftime(BACKUP_TIMESTAMP_FORMAT)}"
+                copy = sqlite3.connect(copy_path)
+                try:
+                    target.backup(copy)
+                finally:
+                    copy.close()
+                result["safety_copy"] = copy_path
+
+            source = sqlite3.connect(f"file:{backup_path}?mode=ro", uri=True)
+            try:
+                source.backup(target)
+            finally:
+                source.close()
+            result["pages"] = target.execute("PRAGMA page_count").fetchone()[0]
+        finally:
+            target.close()
+    except sqlite3.Error as e:
+        logger.error(f"[X] Yedekten geri yükleme hatası: {e}")
+        raise DatabaseError(f"Yedek geri yüklenemedi: {e}")
+
+    logger.info(f"[+] Veritabanı yedekten geri yüklendi: {backup_path} -> {db_path}")
+    return result
@@ -0,0 +1,300 @@
+import os
+import re
+import sqlite3
+from functools import lru_cache
+from typing import Any, Dict, Optional, Sequence
+from src.core.logger import logger
+from src.core.exceptions import DatabaseError
+from src.clients.query_instrumentation import QueryInstrumentation, InstrumentedConnection, InstrumentedCursor
+
+# Varsayılan SQLite PRAGMA profili.
+# WAL modunda okuyucular yazıcıları bloklamaz; synchronous=NORMAL WAL ile güvenlidir
+# (yalnızca elektrik kesintisinde son commit'ler kaybolabilir, bozulma olmaz).
+DEFAULT_PRAGMAS: Dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 5000,       # ms - kilitli veritabanında bekleme süresi
+    "cache_size": -16384,       # Negatif değer KiB cinsindendir (16 MB)
+    "mmap_size": 134217728,     # 128 MB bellek eşlemeli okuma
+    "temp_store": "MEMORY",
+}
+
+# Veritabanı dosyasında kalıcı olan (bağlantı başına tekrar edilmesi gerekmeyen) PRAGMA'lar
+PERSISTENT_PRAGMAS = {"journal_mode"}
+
+
+class Dialect:
+    """
+    Repository'lerin ürettiği SQL'deki veritabanına özgü parçalar.
+
+    Repository kodu SQL'i `?` yer tutucularıyla yazar; farklı bir parametre stili kullanan
+    sürücü, metni çalıştırmadan önce `render` ile çevirir. Tarih fonksiyonları ve upsert
+    cümlesi de buradan üretilir. Varsayılan gerçekleme SQLite söz dizimidir.
+    """
+
+    name = "sqlite"
+    paramstyle = "qmark"
+
+    def render(self, sql: str) -> str:
+        """`?` yer tutuculu SQL'i sürücünün parametre stiline çevirir."""
+        return sql
+
+    def time_bucket(self, fmt: str, expr: str) -> str:
+        """Zaman damgasını strftime biçiminde metne çeviren ifade (örn. '%Y-%m-%d')."""
+        return f"strftime('{fmt}', {expr})"
+
+    def now(self) -> str:
+        """Şu anki UTC zamanı (CURRENT_TIMESTAMP ile aynı biçim)."""
+        return "datetime('now')"
+
+    def upsert_clause(self, conflict_columns: Sequence[str], update_columns: Sequence[str], touch_updated_at: bool = False) -> str:
+        """INSERT'e eklenen ON CONFLICT cümlesi (güncellenecek kolon yoksa DO NOTHING)."""
+        sql = f" ON CONFLICT({', '.join(conflict_columns)}) DO "
+        if not update_columns:
+            return sql + "NOTHING"
+        set_clause = ", ".join([f"{key} = excluded.{key}" for key in update_columns])
+        if touch_updated_at:
+            set_clause += ", updated_at = CURRENT_TIMESTAMP"
+        return sql + "UPDATE SET " + set_clause
+
+
+class SQLiteDialect(Dialect):
+    """SQLite söz dizimi (varsayılan)."""
+
+
+# strftime -> PostgreSQL to_char karşılıkları (%W: SQLite'ta pazartesi başlangıçlı hafta no,
+# PostgreSQL'de ISO hafta; yıl başındaki ilk günlerde farklı hafta numarası verebilir)
+_PG_TIME_FORMATS = {"%Y": "YYYY", "%m": "MM", "%d": "DD", "%H": "HH24", "%M": "MI", "%S": "SS", "%W": "IW"}
+# Tek tırnaklı metinler, çift tırnaklı adlar, yer tutucu ve % karakteri
+_QMARK_TOKENS = re.compile(r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|[?%]")
+
+
+@lru_cache(maxsize=1024)
+def _qmark_to_format(sql: str) -> str:
+    def replace(match: re.Match) -> str:
+        token = match.group(0)
+        if token == "?":
+            return "%s"
+        if token == "%":
+            return "%%"
+        return token.replace("%", "%%")
+
+    return _QMARK_TOKENS.sub(replace, sql)
+
+
+class PostgresDialect(Dialect):
+    """
+    PostgreSQL söz dizimi (psycopg `format` parametre stili). Upsert cümlesi SQLite ile aynıdır.
+    Bu dialect yalnızca repository'lerin ortak SQL'ini çevirir; migration'lar ve FTS5 araması
+    SQLite'a özgüdür.
+
+    PostgreSQL desteği şimdilik yalnızca dialect düzeyindedir: arkasında bir sürücü (DRIVERS'ta
+    bir kayıt) yoktur. `format` stilindeki çeviri yolu SQLiteFormatDriver ile sınanır.
+    """
+
+    name = "postgres"
+    paramstyle = "format"
+
+    def render(self, sql: str) -> str:
+        return _qmark_to_format(sql)
+
+    def time_bucket(self, fmt: str, expr: str) -> str:
+        parts = []
+        i = 0
+        while i < len(fmt):
+            token = fmt[i:i + 2]
+            if token in _PG_TIME_FORMATS:
+                parts.append(_PG_TIME_FORMATS[token])
+                i += 2
+                continue
+            # Harfler to_char'da kalıp sayılabilir, sabit metin olarak tırnaklanır
+            parts.append(f'"{fmt[i]}"' if fmt[i].isalpha() else fmt[i])
+            i += 1
+        return f"to_char(({expr})::timestamp, '{''.join(parts)}')"
+
+    def now(self) -> str:
+        return "(now() AT TIME ZONE 'UTC')"
+
+
+class SQLiteFormatDialect(SQLiteDialect):
+    """
+    SQLite söz dizimi, `format` parametre stiliyle (`%s`). SQLiteFormatDriver bunu kullanır:
+    `?` dışında bir stile çeviren sürücü yolunu (render + sürücü tarafında geri çevirme)
+    PostgreSQL sunucusu olmadan da çalıştırır.
+    """
+
+    paramstyle = "format"
+
+    def render(self, sql: str) -> str:
+        return _qmark_to_format(sql)
+
+
+# `format` stilindeki yer tutucu ve kaçışlı % (soldan sağa tek geçişte çözülür)
+_FORMAT_TOKENS = re.compile(r"%[%s]")
+
+
+@lru_cache(maxsize=1024)
+def _format_to_qmark(sql: str) -> str:
+    return _FORMAT_TOKENS.sub(lambda match: "?" if match.group(0) == "%s" else "%", sql)
+
+
+class _FormatCursorMixin:
+    """`format` stilinde gelen SQL'i sqlite3'ün anladığı `?` stiline geri çevirir."""
+
+    def execute(self, sql, parameters=()):
+        return super().execute(_format_to_qmark(sql), parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return super().executemany(_format_to_qmark(sql), seq_of_parameters)
+
+
+class FormatCursor(_FormatCursorMixin, sqlite3.Cursor):
+    pass
+
+
+class InstrumentedFormatCursor(_FormatCursorMixin, InstrumentedCursor):
+    pass
+
+
+class FormatConnection(sqlite3.Connection):
+    """`format` parametre stilini kabul eden sqlite3 bağlantısı (sqlite3.connect factory)."""
+
+    cursor_factory = FormatCursor
+
+    def cursor(self, factory=None):
+        return super().cursor(factory or self.cursor_factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+class InstrumentedFormatConnection(FormatConnection, InstrumentedConnection):
+    cursor_factory = InstrumentedFormatCursor
+
+
+class DatabaseDriver:
+    """
+    DatabaseClient'ın fiziksel bağlantı katmanı: bağlantı açma, bağlantı başına ayarlar,
+    açılışta bir kez yapılan kurulum ve SQL dialect'i. Havuzlama sürücüden bağımsızdır;
+    ConnectionPool `connect`'i bağlantı fabrikası olarak kullanır.
+    """
+
+    name = "base"
+    dialect: Dialect = Dialect()
+
+    def connect(self):
+        raise NotImplementedError
+
+    def setup(self, conn) -> None:
+        """Havuzdan alınan ilk bağlantıyla açılışta bir kez çalışır."""
+
+    def close(self) -> None:
+        """Havuz kapatıldıktan sonra sürücünün tuttuğu kaynakları bırakır."""
+
+    def describe(self) -> str:
+        return self.name
+
+
+class SQLiteDriver(DatabaseDriver):
+    """Dosya tabanlı SQLite (varsayılan). PRAGMA profili bağlantı başına uygulanır."""
+
+    name = "sqlite"
+    dialect = SQLiteDialect()
+    connection_class = sqlite3.Connection
+    instrumented_connection_class = InstrumentedConnection
+
+    def __init__(
+        self,
+        db_path: str,
+        pragmas: Optional[Dict[str, Any]] = None,
+        instrumentation: Optional[QueryInstrumentation] = None,
+    ):
+        self.db_path = db_path
+        self.pragmas = {**DEFAULT_PRAGMAS, **(pragmas or {})}
+        self.instrumentation = instrumentation
+
+        # Klasör yoksa oluştur (sadece geçerli bir dizin adı varsa)
+        dir_name = os.path.dirname(db_path)
+        if dir_name:
+            os.makedirs(dir_name, exist_ok=True)
+
+    def _open(self) -> sqlite3.Connection:
+        busy_timeout_ms = int(self.pragmas.get("busy_timeout") or 5000)
+        # Havuzdaki bağlantılar thread'ler arasında (sırayla) el değiştirebilir
+        return sqlite3.connect(
+            self.db_path,
+            timeout=busy_timeout_ms / 1000,
+            check_same_thread=False,
+            factory=self.instrumented_connection_class if self.instrumentation else self.connection_class
+        )
+
+    def connect(self) -> sqlite3.Connection:
+        """Yeni bir fiziksel SQLite bağlantısı açar; PRAGMA'lar bağlantı başına bir kez uygulanır."""
+        try:
+            conn = self._open()
+            if self.instrumentation:
+                conn.instrumentation = self.instrumentation
+            conn.row_factory = sqlite3.Row  # Dict benzeri erişim için
+            # FOREIGN KEY desteğini etkinleştir (her fiziksel connection için zorunlu)
+            conn.execute("PRAGMA foreign_keys = ON")
+            for name, value in self.pragmas.items():
+                if name in PERSISTENT_PRAGMAS or value is None:
+                    continue
+                conn.execute(f"PRAGMA {name} = {value}")
+            return conn
+        except sqlite3.Error as e:
+            logger.error(f"[X] Veritabanı bağlantı hatası: {e}")
+            raise DatabaseError(f"Veritabanına bağlanılamadı: {e}")
+
+    def setup(self, conn) -> None:
+        """journal_mode gibi dosyada kalıcı PRAGMA'ları açılışta bir kez uygular."""
+        journal_mode = self.pragmas.get("journal_mode")
+        if not journal_mode:
+            return
+        row = conn.execute(f"PRAGMA journal_mode = {journal_mode}").fetchone()
+        active_mode = (row[0] if row else "").upper()
+        if active_mode != str(journal_mode).upper():
+            logger.warning(f"[!] journal_mode={journal_mode} uygulanamadı, aktif mod: {active_mode}")
+        else:
+            logger.debug(f"[i] SQLite journal_mode: {active_mode}")
+
+    def describe(self) -> str:
+        return f"{self.name} ({self.db_path})"
+
+
+class SQLiteFormatDriver(SQLiteDriver):
+    """
+    `format` parametre stilli ikinci sürücü: dosya tabanlı SQLite (PRAGMA profili ve WAL aynı),
+    ancak dialect'i `%s` yer tutucusu üretir ve bağlantı bunu sqlite3'e `?` olarak geri verir.
+    `?` kullanmayan bir sunucu sürücüsünün izleyeceği yolu yerel olarak çalıştırır; repository
+    testleri her sürücü için ayrı bir geçici veritabanı dosyasıyla tekrarlanır.
+    """
+
+    name = "sqlite-format"
+    dialect = SQLiteFormatDialect()
+    connection_class = FormatConnection
+    instrumented_connection_class = InstrumentedFormatConnection
+
+
+# Ayarlardaki `db_driver` adı -> sürücü sınıfı
+DRIVERS = {
+    SQLiteDriver.name: SQLiteDriver,
+    SQLiteFormatDriver.name: SQLiteFormatDriver,
+}
+
+
+def create_driver(
+    name: str,
+    db_path: str,
+    pragmas: Optional[Dict[str, Any]] = None,
+    instrumentation: Optional[QueryInstrumentation] = None,
+) -> DatabaseDriver:
+    """Adı verilen sürücüyü oluşturur (bilinmeyen ad için ValueError)."""
+    try:
+        driver_class = DRIVERS[name]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen veritabanı sürücüsü: {name} (geçerli: {', '.join(DRIVERS)})") from None
+    return driver_class(db_path, pragmas=pragmas, instrumentation=instrumentation)
@@ -0,0 +1,52 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict
+from src.core.logger import logger
+
+
+class DatabaseExecutor:
+    """
+    Async servisler için SQLite işlerini event loop dışında çalıştıran thread havuzu.
+
+    - Yazmalar tek bir writer thread'inde sıralanır (SQLite aynı anda tek yazıcıya izin verir;
+      böylece "database is locked" beklemeleri thread'ler arasında değil kuyrukta olur).
+    - Okumalar N reader thread'ine dağıtılır (WAL modunda yazıcıyı beklemezler).
+    Her thread havuzdan kendi bağlantısını alır; ConnectionPool boyutu reader_threads + 1'den küçük olmamalı.
+    """
+
+    def __init__(self, reader_threads: int = 4):
+        self.reader_threads = max(1, reader_threads)
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cemil-db-writer")
+        self._readers = ThreadPoolExecutor(max_workers=self.reader_threads, thread_name_prefix="cemil-db-reader")
+        self._lock = threading.Lock()
+        self._counters = {"reads": 0, "writes": 0}
+        self._closed = False
+
+    async def _submit(self, executor: ThreadPoolExecutor, kind: str, func: Callable, *args, **kwargs) -> Any:
+        with self._lock:
+            self._counters[kind] += 1
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, partial(func, *args, **kwargs))
+
+    async def read(self, func: Callable, *args, **kwargs) -> Any:
+        """Salt-okunur bir DB çağrısını reader thread'lerinden birinde çalıştırır."""
+        return await self._submit(self._readers, "reads", func, *args, **kwargs)
+
+    async def write(self, func: Callable, *args, **kwargs) -> Any:
+        """Yazan bir DB çağrısını tek writer thread'inde (sırayla) çalıştırır."""
+        return await self._submit(self._writer, "writes", func, *args, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"reader_threads": self.reader_threads, **self._counters}
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Kuyruktaki işleri bitirip thread'leri kapatır (shutdown için)."""
+        if self._closed:
+            return
+        self._closed = True
+        self._writer.shutdown(wait=wait)
+        self._readers.shutdown(wait=wait)
+        logger.debug("[i] Veritabanı executor thread'leri kapatıldı.")
@@ -0,0 +1,50 @@
+from typing import List
+import faiss
+import numpy as np
+import torch
+from src.core.logger import logger
+
+
+class EmbeddingEngine:
+    """
+    SentenceTransformer modeli etrafında toplu gömme motoru.
+
+    Girdiler uzunluğa göre sıralanıp `batch_size`'lık kovalara bölünür: her kovadaki metinler
+    birbirine yakın uzunlukta olduğundan dolgu (padding) için boşa hesap yapılmaz. Model, bir
+    çağrıdaki metinleri kendi içinde de sıralar; ancak ingest hattı metinleri parça parça
+    verdiğinden sıralamanın tüm girdi üzerinde yapılması gerekir.
+
+    Çıktı FAISS'e doğrudan verilebilecek C-sıralı float32 (n, boyut) dizisidir ve birim
+    uzunluğa tek seferde normalize edilir (model zaten normalize ediyorsa tekrar edilmez).
+    """
+
+    def __init__(self, model, batch_size: int = 16, num_threads: int = 0, normalize: bool = True):
+        self.model = model
+        self.batch_size = max(1, batch_size)
+        self.dimension = model.get_sentence_embedding_dimension()
+        # Modelin son katmanı Normalize ise gömmeler zaten birim uzunluktadır
+        self.normalize = normalize and not any(type(module).__name__ == "Normalize" for module in model)
+        if num_threads > 0:
+            # İşlem geneli ayar: ingest sırasında ayrıştırma süreçleriyle CPU paylaşımını sınırlar
+            torch.set_num_threads(num_threads)
+        logger.info(
+            f"[i] Gömme motoru hazır: batch_size={self.batch_size}, torch thread={torch.get_num_threads()}, "
+            f"normalize={'motor' if self.normalize else 'model'}"
+        )
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Metinlerin gömmelerini girdi sırasıyla döner."""
+        embeddings = np.empty((len(texts), self.dimension), dtype="float32")
+        order = np.argsort([len(text) for text in texts], kind="stable")
+        for start in range(0, len(order), self.batch_size):
+            bucket = order[start:start + self.batch_size]
+            embeddings[bucket] = self.model.encode(
+                [texts[i] for i in bucket],
+                batch_size=len(bucket),
+                convert_to_numpy=True,
+                normalize_embeddings=False,
+                show_progress_bar=False,
+            )
+        if self.normalize and len(texts):
+            faiss.normalize_L2(embeddings)
+        return embeddings
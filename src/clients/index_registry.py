@@ -0,0 +1,163 @@
+import re
+import sqlite3
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from src.core.logger import logger
+
+
+class IndexDefinition(NamedTuple):
+    """
+    Tek bir index tanımı.
+    columns: kolon adları veya ifadeler (örn. "strftime('%m-%d', birthday)").
+    Bileşik index'lerde kolon sırası sorgudaki eşitlik -> aralık/sıralama sırasını izlemelidir.
+    """
+    name: str
+    table: str
+    columns: Tuple[str, ...]
+    unique: bool = False
+    where: Optional[str] = None
+    reason: str = ""
+
+    @property
+    def sql(self) -> str:
+        unique = "UNIQUE " if self.unique else ""
+        sql = f"CREATE {unique}INDEX {self.name} ON {self.table}({', '.join(self.columns)})"
+        if self.where:
+            sql += f" WHERE {self.where}"
+        return sql
+
+
+# Repository sorgularına göre index tanımları (tek kaynak).
+# Tablo tanımındaki UNIQUE kısıtlarının otomatik index'leri burada tekrarlanmaz:
+#   users(slack_id), votes(poll_id, user_id, option_index), challenge_participants(challenge_hub_id, user_id)
+INDEXES: List[IndexDefinition] = [
+    # Users
+    IndexDefinition(
+        "idx_users_birthday_md", "users", ("strftime('%m-%d', birthday)",),
+        reason="UserRepository.get_users_with_birthday_today",
+    ),
+    IndexDefinition("idx_users_created", "users", ("created_at",), reason="StatsSnapshotRepository.rollup"),
+
+    # Challenge hubs
+    IndexDefinition(
+        "idx_challenge_hubs_status_created", "challenge_hubs", ("status", "created_at"),
+        reason="get_active_challenge / get_all_active (status filtresi + created_at sıralaması)",
+    ),
+    IndexDefinition(
+        "idx_challenge_hubs_channel", "challenge_hubs", ("challenge_channel_id",),
+        reason="get_by_channel_id (her member_joined_channel event'inde)",
+    ),
+    IndexDefinition("idx_challenge_hubs_creator", "challenge_hubs", ("creator_id",)),
+    IndexDefinition("idx_challenge_hubs_theme", "challenge_hubs", ("theme",), reason="get_by_theme"),
+
+    # Challenge participants / submissions
+    IndexDefinition(
+        "idx_challenge_participants_user", "challenge_participants", ("user_id",),
+        reason="get_user_active_challenges (JOIN)",
+    ),
+    IndexDefinition("idx_challenge_submissions_hub", "challenge_submissions", ("challenge_hub_id",)),
+
+    # Challenge evaluations / evaluators
+    IndexDefinition("idx_challenge_evaluations_hub", "challenge_evaluations", ("challenge_hub_id",)),
+    IndexDefinition(
+        "idx_challenge_evaluations_status_deadline", "challenge_evaluations", ("status", "deadline_at"),
+        reason="get_pending_evaluations (status = ? AND deadline_at <= ? ORDER BY deadline_at)",
+    ),
+    IndexDefinition(
+        "idx_challenge_evaluations_channel", "challenge_evaluations", ("evaluation_channel_id",),
+        reason="ChallengeEvaluationRepository.get_by_channel_id",
+    ),
+    IndexDefinition(
+        "idx_challenge_evaluations_completed", "challenge_evaluations", ("completed_at",),
+        reason="StatsSnapshotRepository.rollup",
+    ),
+    IndexDefinition(
+        "idx_challenge_evaluators_evaluation_user", "challenge_evaluators", ("evaluation_id", "user_id"),
+        reason="get_by_evaluation / get_by_evaluation_and_user",
+    ),
+    IndexDefinition("idx_challenge_evaluators_user", "challenge_evaluators", ("user_id",)),
+
+    # Challenge projects / themes
+    IndexDefinition("idx_challenge_projects_theme", "challenge_projects", ("theme",), reason="get_by_theme / get_random_project"),
+    IndexDefinition("idx_challenge_themes_active", "challenge_themes", ("is_active",), reason="get_active_themes"),
+
+    # Help requests
+    IndexDefinition(
+        "idx_help_requests_status_created", "help_requests", ("status", "created_at"),
+        reason="get_open_requests (status = 'open' ORDER BY created_at DESC LIMIT ?)",
+    ),
+    IndexDefinition("idx_help_requests_requester", "help_requests", ("requester_id",)),
+    IndexDefinition("idx_help_requests_helper", "help_requests", ("helper_id",)),
+    IndexDefinition("idx_help_requests_created", "help_requests", ("created_at",), reason="StatsSnapshotRepository.rollup"),
+    IndexDefinition("idx_help_requests_resolved", "help_requests", ("resolved_at",), reason="StatsSnapshotRepository.rollup"),
+
+    # Matches
+    IndexDefinition("idx_matches_status", "matches", ("status",)),
+    IndexDefinition("idx_matches_user1", "matches", ("user1_id",)),
+    IndexDefinition("idx_matches_user2", "matches", ("user2_id",)),
+    IndexDefinition("idx_matches_created", "matches", ("created_at",), reason="StatsSnapshotRepository.rollup"),
+
+    # Polls / votes
+    IndexDefinition("idx_polls_is_closed", "polls", ("is_closed",)),
+    IndexDefinition("idx_polls_creator", "polls", ("creator_id",)),
+    IndexDefinition("idx_votes_user", "votes", ("user_id",)),
+]
+
+# Yerini bileşik index'lere veya UNIQUE otomatik index'lerine bırakan eski tek kolonlu index'ler
+OBSOLETE_INDEXES: Tuple[str, ...] = (
+    "idx_users_slack_id",                   # users.slack_id UNIQUE
+    "idx_votes_poll",                       # UNIQUE(poll_id, user_id, option_index)
+    "idx_challenge_participants_hub",       # UNIQUE(challenge_hub_id, user_id)
+    "idx_challenge_hubs_status",            # idx_challenge_hubs_status_created
+    "idx_challenge_evaluations_status",     # idx_challenge_evaluations_status_deadline
+    "idx_challenge_evaluators_evaluation",  # idx_challenge_evaluators_evaluation_user
+    "idx_help_requests_status",             # idx_help_requests_status_created
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _normalize(sql: Optional[str]) -> str:
+    return _WHITESPACE.sub(" ", sql or "").strip().lower()
+
+
+def sync_indexes(
+    conn: sqlite3.Connection,
+    indexes: List[IndexDefinition] = INDEXES,
+    obsolete: Tuple[str, ...] = OBSOLETE_INDEXES,
+) -> Dict[str, List[str]]:
+    """
+    Veritabanındaki index'leri kayıtla eşitler:
+    eksikleri oluşturur, tanımı değişenleri yeniden oluşturur, eskimiş olanları kaldırır.
+    Güncel bir veritabanında tek bir SELECT dışında hiçbir şey çalıştırmaz.
+    """
+    existing = {
+        row[0]: row[1]
+        for row in conn.execute("SELECT name, sql FROM sqlite_master WHERE type = 'index'").fetchall()
+    }
+    tables = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'").fetchall()
+    }
+
+    created, dropped = [], []
+    for name in obsolete:
+        if name in existing:
+            conn.execute(f"DROP INDEX IF EXISTS {name}")
+            dropped.append(name)
+
+    for index in indexes:
+        if index.table not in tables:
+            continue
+        current = existing.get(index.name)
+        if current is not None and _normalize(current) == _normalize(index.sql):
+            continue
+        if current is not None:
+            conn.execute(f"DROP INDEX IF EXISTS {index.name}")
+            dropped.append(index.name)
+        conn.execute(index.sql)
+        created.append(index.name)
+
+    if created or dropped:
+        # Yeni index'ler için planlayıcı istatistiklerini güncelle
+        conn.execute("PRAGMA optimize")
+        logger.info(f"[+] Index kaydı eşitlendi: {len(created)} oluşturuldu, {len(dropped)} kaldırıldı.")
+    return {"created": created, "dropped": dropped}
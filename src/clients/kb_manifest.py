@@ -0,0 +1,101 @@
+import os
+import json
+import hashlib
+from typing import Dict, List, NamedTuple, Set
+from src.core.logger import logger
+
+MANIFEST_VERSION = 1
+
+
+class FileState(NamedTuple):
+    """Bilgi küpündeki bir dosyanın manifestteki kimliği."""
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+class ManifestPlan(NamedTuple):
+    """Bir tarama sonucunda yapılacak işler."""
+    changed: Dict[str, FileState]  # yeni veya içeriği değişmiş dosyalar (yeniden parçalanacak)
+    removed: List[str]             # klasörden silinmiş dosyalar
+    unchanged: int
+
+
+def file_sha256(path: str, block_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class KnowledgeManifest:
+    """
+    Bilgi küpü dosyalarının (boyut, mtime, içerik hash'i) -> parça id'leri eşlemesi.
+
+    Boyutu ve mtime'ı aynı kalan dosya okunmaz bile; ikisinden biri değişmişse içerik hash'i
+    hesaplanır ve yalnızca hash de değiştiyse dosya yeniden parçalanıp gömülür.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.files: Dict[str, dict] = {}
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            self.files = {}
+            return
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f)
+        self.files = data.get("files", {}) if data.get("version") == MANIFEST_VERSION else {}
+
+    def save(self) -> None:
+        # Geçici dosyaya yazıp taşı: yarım yazılmış manifest okunmaz
+        with open(f"{self.path}.tmp", "w", encoding="utf-8") as f:
+            json.dump({"version": MANIFEST_VERSION, "files": self.files}, f, ensure_ascii=False)
+        os.replace(f"{self.path}.tmp", self.path)
+
+    def plan(self, folder_path: str, filenames: List[str]) -> ManifestPlan:
+        """Klasördeki dosyaları manifestle karşılaştırır; yalnızca gerekirse hash hesaplar."""
+        changed: Dict[str, FileState] = {}
+        unchanged = 0
+        for filename in filenames:
+            stat = os.stat(os.path.join(folder_path, filename))
+            entry = self.files.get(filename)
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                unchanged += 1
+                continue
+
+            sha256 = file_sha256(os.path.join(folder_path, filename))
+            if entry and entry["sha256"] == sha256:
+                # Yalnızca dokunulmuş (kopyalanmış, geri yüklenmiş) dosya: içerik aynı
+                entry.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+                unchanged += 1
+                continue
+            changed[filename] = FileState(stat.st_size, stat.st_mtime_ns, sha256)
+
+        present = set(filenames)
+        removed = [filename for filename in self.files if filename not in present]
+        return ManifestPlan(changed, removed, unchanged)
+
+    def record(self, filename: str, state: FileState, chunk_ids: List[int]) -> None:
+        self.files[filename] = {**state._asdict(), "chunk_ids": list(chunk_ids)}
+
+    def forget(self, filename: str) -> List[int]:
+        """Dosyayı manifestten çıkarır ve ona ait parça id'lerini döner."""
+        entry = self.files.pop(filename, None)
+        return entry["chunk_ids"] if entry else []
+
+    def chunk_ids(self) -> Set[int]:
+        return {chunk_id for entry in self.files.values() for chunk_id in entry["chunk_ids"]}
+
+    def orphans(self, live_ids) -> List[int]:
+        """
+        İndekste olup hiçbir dosyaya ait olmayan parçalar: manifestten önce oluşturulmuş indeks
+        veya manifest kaydedilmeden kesilmiş bir ingest. Bunlar silinip dosyalar yeniden eklenir.
+        """
+        known = self.chunk_ids()
+        orphans = [int(chunk_id) for chunk_id in live_ids if int(chunk_id) not in known]
+        if orphans:
+            logger.info(f"[i] Manifestte olmayan {len(orphans)} parça bulundu, yeniden indekslenecek.")
+        return orphans
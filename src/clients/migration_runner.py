@@ -0,0 +1,212 @@
+import os
+import re
+import hashlib
+import sqlite3
+import importlib.util
+from typing import List, Dict, Optional
+from src.core.logger import logger
+from src.core.exceptions import DatabaseError
+
+# Proje kökündeki migrations/ klasörü
+MIGRATIONS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    "migrations"
+)
+
+# 001_add_canvas_fields.sql, 004_composite_indexes.py ...
+_FILE_PATTERN = re.compile(r"^(\d+)_([\w\-]+)\.(sql|py)$")
+
+SCHEMA_VERSION_TABLE = "schema_version"
+
+
+def split_sql_statements(script: str) -> List[str]:
+    """
+    SQL script'ini tek tek çalıştırılabilir ifadelere böler.
+    `executescript` örtük COMMIT yaptığı için migration'lar tek transaction'da
+    çalışabilsin diye ifadeler tek tek yürütülür.
+    """
+    statements = []
+    buffer = ""
+    for line in script.splitlines(keepends=True):
+        if not buffer and line.strip().startswith("--"):
+            continue
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statement = buffer.strip()
+            if statement.rstrip(";").strip():
+                statements.append(statement)
+            buffer = ""
+    if buffer.strip():
+        statements.append(buffer.strip())
+    return statements
+
+
+class Migration:
+    """migrations/ klasöründeki tek bir SQL veya Python migration dosyası."""
+
+    def __init__(self, version: int, name: str, path: str, kind: str):
+        self.version = version
+        self.name = name
+        self.path = path
+        self.kind = kind  # "sql" veya "py"
+        self._module = None
+
+    @property
+    def checksum(self) -> str:
+        with open(self.path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    @property
+    def module(self):
+        """Python migration modülünü (bir kez) yükler."""
+        if self._module is None:
+            spec = importlib.util.spec_from_file_location(
+                f"cemil_migration_{self.version:03d}_{self.name}", self.path
+            )
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            self._module = module
+        return self._module
+
+    @property
+    def baseline_version(self) -> Optional[int]:
+        """Baseline migration'ları kapsadıkları en yüksek sürümü bildirir (BASELINE_VERSION)."""
+        if self.kind != "py":
+            return None
+        return getattr(self.module, "BASELINE_VERSION", None)
+
+    def apply(self, conn: sqlite3.Connection) -> None:
+        if self.kind == "sql":
+            with open(self.path, "r", encoding="utf-8") as f:
+                for statement in split_sql_statements(f.read()):
+                    conn.execute(statement)
+        else:
+            self.module.upgrade(conn)
+
+    def __repr__(self) -> str:
+        return f"Migration({self.version:03d}_{self.name}.{self.kind})"
+
+
+class MigrationRunner:
+    """
+    Sürümlü şema migration motoru.
+
+    - `schema_version` tablosunda uygulanmış sürümleri tutar.
+    - migrations/ altındaki `NNN_ad.sql` ve `NNN_ad.py` (upgrade(conn) fonksiyonu)
+      dosyalarını sürüm sırasıyla, her biri tam olarak bir kez uygular.
+    - Bekleyen tüm migration'lar tek bir transaction içinde çalışır; hata olursa hiçbiri uygulanmaz.
+    - Güncel bir veritabanında (warm start) hiçbir DDL çalıştırmaz: tek bir SELECT yeterlidir.
+    """
+
+    def __init__(self, db_client, migrations_dir: str = MIGRATIONS_DIR):
+        self.db_client = db_client
+        self.migrations_dir = migrations_dir
+
+    def discover(self) -> List[Migration]:
+        """Migration dosyalarını sürüm sırasıyla listeler."""
+        if not os.path.isdir(self.migrations_dir):
+            return []
+
+        migrations: Dict[int, Migration] = {}
+        for filename in os.listdir(self.migrations_dir):
+            match = _FILE_PATTERN.match(filename)
+            if not match:
+                continue
+            version = int(match.group(1))
+            if version in migrations:
+                raise DatabaseError(f"Aynı sürüme sahip birden fazla migration var: {version:03d}")
+            migrations[version] = Migration(
+                version, match.group(2), os.path.join(self.migrations_dir, filename), match.group(3)
+            )
+        return [migrations[v] for v in sorted(migrations)]
+
+    def applied_versions(self, conn: sqlite3.Connection) -> Dict[int, str]:
+        """Uygulanmış sürümleri döndürür (tablo yoksa DDL çalıştırmadan boş döner)."""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (SCHEMA_VERSION_TABLE,)
+        ).fetchone()
+        if not exists:
+            return {}
+        rows = conn.execute(f"SELECT version, name FROM {SCHEMA_VERSION_TABLE}").fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def current_version(self) -> int:
+        """Veritabanının şu anki şema sürümü (hiç migration yoksa -1)."""
+        with self.db_client.get_connection() as conn:
+            applied = self.applied_versions(conn)
+        return max(applied) if applied else -1
+
+    def pending(self) -> List[Migration]:
+        with self.db_client.get_connection() as conn:
+            applied = self.applied_versions(conn)
+        return [m for m in self.discover() if m.version not in applied]
+
+    def run(self) -> List[int]:
+        """Bekleyen migration'ları uygular ve uygulanan sürümleri döndürür."""
+        migrations = self.discover()
+
+        with self.db_client.get_connection() as conn:
+            applied = self.applied_versions(conn)
+            pending = [m for m in migrations if m.version not in applied]
+            if not pending:
+                logger.debug(f"[i] Veritabanı şeması güncel (sürüm {max(applied) if applied else '-'}).")
+                return []
+
+            logger.info(f"[>] {len(pending)} migration uygulanacak: {', '.join(repr(m) for m in pending)}")
+
+            # Tablo yeniden oluşturma (copy-table) adımlarında DROP TABLE'ın
+            # ON DELETE CASCADE tetiklememesi için FK kontrolü transaction dışında kapatılır.
+            conn.execute("PRAGMA foreign_keys = OFF")
+            newly_applied = []
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} (
+                        version INTEGER PRIMARY KEY,
+                        name TEXT NOT NULL,
+                        checksum TEXT,
+                        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+
+                covered_up_to = -1
+                for migration in pending:
+                    if migration.version <= covered_up_to:
+                        # Baseline tarafından kapsanan eski migration: sadece kayıt düş
+                        self._record(conn, migration, note="baseline")
+                        newly_applied.append(migration.version)
+                        continue
+
+                    migration.apply(conn)
+                    self._record(conn, migration)
+                    newly_applied.append(migration.version)
+                    logger.info(f"[+] Migration uygulandı: {migration!r}")
+
+                    if not applied and migration.baseline_version is not None:
+                        covered_up_to = migration.baseline_version
+
+                violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+                if violations:
+                    logger.warning(f"[!] Migration sonrası {len(violations)} foreign key ihlali tespit edildi.")
+
+                conn.commit()
+            except Exception as e:
+                conn.rollback()
+                logger.error(f"[X] Migration hatası, hiçbir değişiklik uygulanmadı: {e}")
+                raise DatabaseError(f"Migration başarısız: {e}")
+            finally:
+                conn.execute("PRAGMA foreign_keys = ON")
+                # Şema (kısmen de olsa) değişmiş olabilir: repository metadata önbelleği geçersiz
+                self.db_client.schema.invalidate()
+
+        logger.info(f"[+] Veritabanı şeması sürüm {max(newly_applied)} seviyesine yükseltildi.")
+        return newly_applied
+
+    @staticmethod
+    def _record(conn: sqlite3.Connection, migration: Migration, note: Optional[str] = None) -> None:
+        name = f"{migration.name} ({note})" if note else migration.name
+        conn.execute(
+            f"INSERT INTO {SCHEMA_VERSION_TABLE} (version, name, checksum) VALUES (?, ?, ?)",
+            (migration.version, name, migration.checksum)
+        )
@@ -0,0 +1,242 @@
+import itertools
+import os
+import re
+import sys
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+from src.core.logger import logger
+
+_REPOSITORIES_DIR = os.path.join("src", "repositories") + os.sep
+# Çağıran aranırken atlanan altyapı katmanları
+_INFRA_DIRS = (os.path.join("src", "clients") + os.sep, os.path.join("src", "core") + os.sep)
+_WHITESPACE = re.compile(r"\s+")
+
+# EXPLAIN QUERY PLAN yalnızca bu ifadeler için anlamlıdır
+_EXPLAINABLE = ("SELECT", "UPDATE", "DELETE", "INSERT", "WITH", "REPLACE")
+
+
+def normalize_sql(sql: str) -> str:
+    """SQL metnini istatistik anahtarı olarak kullanılacak tek satırlık hale getirir."""
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def _find_caller() -> str:
+    """
+    Sorguyu tetikleyen repository metodunu bulur (örn. "ChallengeHubRepository.get_all_active").
+    En dıştaki repository çerçevesi alınır; repository dışından gelen sorgular için modül:fonksiyon.
+    """
+    frame = sys._getframe(2)
+    caller = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if _REPOSITORIES_DIR in filename:
+            owner = frame.f_locals.get("self")
+            name = type(owner).__name__ if owner is not None else os.path.basename(filename)[:-3]
+            caller = f"{name}.{frame.f_code.co_name}"
+        elif caller is not None:
+            return caller
+        elif not any(d in filename for d in _INFRA_DIRS) and "sqlite3" not in filename:
+            return f"{os.path.basename(filename)[:-3]}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return caller or "?"
+
+
+class QueryInstrumentation:
+    """
+    DatabaseClient bağlantıları için opsiyonel sorgu ölçüm katmanı.
+
+    - İfade başına çağrı sayısı, toplam/maks süre, satır sayısı ve çağıran repository metodu tutulur.
+    - `slow_query_ms` üzerindeki sorgular EXPLAIN QUERY PLAN çıktısıyla birlikte saklanır.
+    Parametre değerleri (kişisel veri içerebilir) hiçbir zaman kaydedilmez.
+    """
+
+    def __init__(self, slow_query_ms: float = 100.0, max_slow_queries: int = 50):
+        self.slow_query_ms = slow_query_ms
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._slow = deque(maxlen=max_slow_queries)
+        self._started = time.time()
+
+    def record(
+        self,
+        sql: str,
+        elapsed_ms: float,
+        rows: int,
+        caller: str,
+        plan: Optional[List[str]] = None,
+    ) -> None:
+        key = normalize_sql(sql)
+        with self._lock:
+            entry = self._stats.get(key)
+            if entry is None:
+                entry = self._stats[key] = {
+                    "sql": key, "count": 0, "total_ms": 0.0, "max_ms": 0.0, "rows": 0, "callers": {},
+                }
+            entry["count"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["rows"] += rows
+            if elapsed_ms > entry["max_ms"]:
+                entry["max_ms"] = elapsed_ms
+            entry["callers"][caller] = entry["callers"].get(caller, 0) + 1
+
+            if plan is not None:
+                self._slow.append({
+                    "sql": key,
+                    "ms": round(elapsed_ms, 2),
+                    "rows": rows,
+                    "caller": caller,
+                    "plan": plan,
+                    "at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                })
+
+    def add_rows(self, sql: str, rows: int, elapsed_ms: float) -> None:
+        """SELECT sonuçları okundukça satır sayısını ve fetch süresini ekler."""
+        key = normalize_sql(sql)
+        with self._lock:
+            entry = self._stats.get(key)
+            if entry is not None:
+                entry["rows"] += rows
+                entry["total_ms"] += elapsed_ms
+
+    def top(self, limit: int = 10, order_by: str = "total_ms") -> List[Dict[str, Any]]:
+        """En çok zaman harcayan ifadeler (order_by: total_ms, count, max_ms, rows)."""
+        with self._lock:
+            entries = [dict(e, callers=dict(e["callers"])) for e in self._stats.values()]
+        entries.sort(key=lambda e: e[order_by], reverse=True)
+        for e in entries:
+            e["avg_ms"] = round(e["total_ms"] / e["count"], 3) if e["count"] else 0.0
+            e["total_ms"] = round(e["total_ms"], 2)
+            e["max_ms"] = round(e["max_ms"], 2)
+        return entries[:limit]
+
+    def slow_queries(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return list(self._slow)
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            count = sum(e["count"] for e in self._stats.values())
+            total_ms = sum(e["total_ms"] for e in self._stats.values())
+            return {
+                "statements": len(self._stats),
+                "queries": count,
+                "total_ms": round(total_ms, 2),
+                "slow_queries": len(self._slow),
+                "since": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self._started)),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+            self._slow.clear()
+            self._started = time.time()
+
+    def dump(self, limit: int = 10) -> None:
+        """Özet, en pahalı ifadeler ve yavaş sorguları log'a (rotating file) yazar."""
+        summary = self.summary()
+        logger.info(
+            f"[i] Sorgu istatistikleri ({summary['since']} itibarıyla): {summary['queries']} sorgu, "
+            f"{summary['statements']} farklı ifade, toplam {summary['total_ms']} ms, "
+            f"{summary['slow_queries']} yavaş sorgu"
+        )
+        for e in self.top(limit):
+            callers = ", ".join(f"{name} x{n}" for name, n in sorted(e["callers"].items(), key=lambda c: -c[1])[:3])
+            logger.info(
+                f"[i]   {e['total_ms']:>9} ms | {e['count']:>6} çağrı | ort {e['avg_ms']} ms | "
+                f"maks {e['max_ms']} ms | {e['rows']} satır | {callers} | {e['sql'][:160]}"
+            )
+        for q in self.slow_queries():
+            logger.warning(
+                f"[!] Yavaş sorgu {q['ms']} ms ({q['caller']}, {q['at']}): {q['sql'][:160]} "
+                f"| plan: {' / '.join(q['plan'])}"
+            )
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Süre, satır sayısı ve çağıranı QueryInstrumentation'a bildiren cursor."""
+
+    _last_sql: Optional[str] = None
+
+    def _instrumented(self, method, sql: str, params, explain_params):
+        instr: QueryInstrumentation = self.connection.instrumentation
+        started = time.perf_counter()
+        result = method(sql, params)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self._last_sql = sql
+
+        rows = self.rowcount if self.rowcount > 0 else 0
+        plan = None
+        if elapsed_ms >= instr.slow_query_ms:
+            plan = self._explain(sql, explain_params)
+        instr.record(sql, elapsed_ms, rows, _find_caller(), plan)
+        return result
+
+    def _explain(self, sql: str, params) -> List[str]:
+        if not sql.lstrip().upper().startswith(_EXPLAINABLE):
+            return []
+        try:
+            # Ölçülmeyen düz bir cursor ile (kendi istatistiğini kirletmesin)
+            plan_cursor = sqlite3.Cursor(self.connection)
+            rows = plan_cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params if params is not None else ()).fetchall()
+            return [row[3] for row in rows]
+        except sqlite3.Error as e:
+            return [f"plan alınamadı: {e}"]
+
+    def execute(self, sql, parameters=()):
+        return self._instrumented(super().execute, sql, parameters, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        # Plan, partinin ilk parametre setiyle alınır (üreteçler tüketilmeden önce okunur)
+        if isinstance(seq_of_parameters, (list, tuple)):
+            first = seq_of_parameters[0] if seq_of_parameters else None
+        else:
+            iterator = iter(seq_of_parameters)
+            first = next(iterator, None)
+            seq_of_parameters = itertools.chain(() if first is None else (first,), iterator)
+        return self._instrumented(super().executemany, sql, seq_of_parameters, first)
+
+    def _fetched(self, rows: int, elapsed_ms: float) -> None:
+        if self._last_sql is not None:
+            self.connection.instrumentation.add_rows(self._last_sql, rows, elapsed_ms)
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(1 if row is not None else 0, (time.perf_counter() - started) * 1000)
+        return row
+
+    def fetchmany(self, size: int = -1):
+        started = time.perf_counter()
+        rows = super().fetchmany(size) if size != -1 else super().fetchmany()
+        self._fetched(len(rows), (time.perf_counter() - started) * 1000)
+        return rows
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(len(rows), (time.perf_counter() - started) * 1000)
+        return rows
+
+    def __next__(self):
+        started = time.perf_counter()
+        row = super().__next__()
+        self._fetched(1, (time.perf_counter() - started) * 1000)
+        return row
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Tüm ifadeleri InstrumentedCursor üzerinden çalıştıran bağlantı (sqlite3.connect factory)."""
+
+    instrumentation: QueryInstrumentation
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
@@ -0,0 +1,87 @@
+from collections import namedtuple
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+
+class Record(tuple):
+    """
+    Sorgu satırları için kompakt, değiştirilemez kayıt tipi (named tuple tabanlı).
+
+    Satır başına bir `dict` yerine tek bir tuple tutulur; kolon adları sınıf üzerinde
+    bir kez saklanır. Okuma arayüzü dict ile uyumludur, mevcut çağıranlar değişmeden çalışır:
+
+        row["full_name"], row.get("cohort"), row.keys(), row.items(), dict(row)
+        row.full_name  # attribute erişimi
+
+    Farklar: kayıtlar değiştirilemez (değiştirmek için `to_dict()`), iterasyon ve `json.dumps`
+    kolon adları yerine değerleri verir (tuple gibi).
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _index: Dict[str, int] = {}
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            try:
+                key = self._index[key]
+            except KeyError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        index = self._index.get(key)
+        return default if index is None else tuple.__getitem__(self, index)
+
+    def __contains__(self, key) -> bool:
+        return key in self._index
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._fields
+
+    def values(self) -> Tuple[Any, ...]:
+        return tuple(self)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return zip(self._fields, self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(self._fields, self))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name, value in self.items())
+        return f"{type(self).__name__}({fields})"
+
+
+def make_record_class(name: str, columns: Tuple[str, ...]) -> type:
+    """
+    Kolon listesinden bir Record alt sınıfı üretir. Geçerli identifier olmayan kolonlar
+    (örn. "COUNT(*)") attribute olarak `_0`, `_1`... adını alır; `row["COUNT(*)"]` ile okunur.
+    """
+    base = namedtuple(f"{name}Fields", columns, rename=True)
+    return type(name, (Record, base), {
+        "__slots__": (),
+        "_fields": tuple(columns),
+        # Aynı ad birden fazla kez geçerse (JOIN) sqlite3.Row gibi ilki döner
+        "_index": {column: i for i, column in reversed(list(enumerate(columns)))},
+        "_make": classmethod(lambda cls, iterable: tuple.__new__(cls, iterable)),
+    })
+
+
+def record_row_factory(record_class: type) -> Callable[[Any, tuple], Record]:
+    """sqlite3 `row_factory` olarak kullanılacak, ham tuple'ı doğrudan kayda çeviren fonksiyon."""
+    new = tuple.__new__
+
+    def factory(_cursor, row: tuple) -> Record:
+        return new(record_class, row)
+
+    return factory
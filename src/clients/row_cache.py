@@ -0,0 +1,132 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set
+
+# Önbellekte olmayan anahtar için dönen işaret (None geçerli bir değer olabilir)
+MISSING = object()
+
+
+class TTLCache:
+    """
+    Süre (TTL) ve boyut (LRU) sınırlı, thread-safe anahtar/değer önbelleği.
+
+    - Süresi dolan kayıtlar okunurken düşürülür; dolu önbellekte en uzun süredir
+      kullanılmayan kayıt çıkarılır.
+    - `generation` her invalidation'da artar: okuma sırasında araya bir yazma girdiyse
+      eski sonuç önbelleğe yazılmaz (`set(..., generation=...)`).
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 256, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Kaydı döndürür; yoksa veya süresi dolmuşsa MISSING."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return MISSING
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> bool:
+        """Kaydı yazar; `generation` verilmiş ve o andan beri invalidation olmuşsa yazmaz."""
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def invalidate(self, key: Hashable = MISSING) -> None:
+        """Tek bir anahtarı veya (anahtar verilmezse) tüm önbelleği geçersiz kılar."""
+        with self._lock:
+            self.generation += 1
+            self.invalidations += 1
+            if key is MISSING:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+class RowCacheRegistry:
+    """
+    Repository okuma önbelleklerinin tablo bazında kaydı (DatabaseClient.row_cache).
+
+    Aynı tabloya bakan tüm repository örnekleri aynı önbelleği paylaşır; böylece bir
+    örnek üzerinden yapılan yazma diğerlerinin önbelleğini de geçersiz kılar.
+    Transaction içindeki yazmalar commit/rollback anında bir kez daha geçersiz kılınır
+    (`defer` / `flush_deferred`): commit'ten önce başka bir thread'in okuduğu eski veri kalmaz.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._caches: Dict[str, TTLCache] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def for_table(self, table: str, ttl: float, max_entries: int) -> TTLCache:
+        cache = self._caches.get(table)
+        if cache is None:
+            with self._lock:
+                cache = self._caches.setdefault(table, TTLCache(ttl, max_entries))
+        return cache
+
+    def invalidate(self, table: Optional[str] = None) -> None:
+        """Bir tablonun (verilmezse tüm tabloların) önbelleğini temizler."""
+        caches = [self._caches.get(table)] if table else list(self._caches.values())
+        for cache in caches:
+            if cache is not None:
+                cache.invalidate()
+
+    def defer(self, table: str) -> None:
+        """Tabloyu, thread'in transaction'ı bittiğinde tekrar geçersiz kılınmak üzere işaretler."""
+        pending: Set[str] = getattr(self._local, "pending", None)
+        if pending is None:
+            pending = self._local.pending = set()
+        pending.add(table)
+
+    def flush_deferred(self) -> None:
+        pending = getattr(self._local, "pending", None)
+        if pending:
+            self._local.pending = set()
+            for table in pending:
+                self.invalidate(table)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Tablo bazında hit/miss sayaçları."""
+        return {table: cache.stats() for table, cache in sorted(self._caches.items())}
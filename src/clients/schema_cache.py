@@ -0,0 +1,116 @@
+import sqlite3
+import threading
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+from src.core.logger import logger
+from src.clients.records import make_record_class
+
+
+class TableInfo:
+    """Bir tablonun önbelleğe alınmış şema bilgisi."""
+
+    __slots__ = ("name", "columns", "primary_key", "has_updated_at")
+
+    def __init__(self, name: str, columns: Tuple[str, ...], primary_key: Tuple[str, ...]):
+        self.name = name
+        self.columns = columns
+        self.primary_key = primary_key
+        self.has_updated_at = "updated_at" in columns
+
+    def __repr__(self) -> str:
+        return f"TableInfo({self.name}, columns={len(self.columns)}, pk={self.primary_key})"
+
+
+class SchemaCache:
+    """
+    Repository katmanı için şema metadata önbelleği.
+
+    - Tablo kolonları, primary key ve updated_at bilgisi açılışta bir kez okunur
+      (her update'te `PRAGMA table_info` çalıştırmak yerine).
+    - (tablo, işlem, kolon seti) başına üretilen SQL metinleri saklanır; sıcak yolda string üretilmez.
+    - Sorgu sonuçları için kolon seti başına bir kez üretilen Record sınıfları saklanır.
+    - Şema değiştiğinde (MigrationRunner) `invalidate()` ile tamamen temizlenir.
+    """
+
+    def __init__(self, db_client):
+        self.db_client = db_client
+        self._tables: Dict[str, TableInfo] = {}
+        self._statements: Dict[Hashable, str] = {}
+        self._records: Dict[Tuple[str, ...], type] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _read_table(conn: sqlite3.Connection, table: str) -> Optional[TableInfo]:
+        rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
+        if not rows:
+            return None
+        columns = tuple(row[1] for row in rows)
+        # pk kolonu: 0 = PK değil, 1..n = bileşik PK içindeki sıra
+        primary_key = tuple(row[1] for row in sorted(rows, key=lambda r: r[5]) if row[5])
+        return TableInfo(table, columns, primary_key)
+
+    def load(self) -> None:
+        """Tüm tabloların metadata'sını tek seferde okur (açılışta çağrılır)."""
+        tables: Dict[str, TableInfo] = {}
+        with self.db_client.get_connection() as conn:
+            names = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+            ).fetchall()
+            for (name,) in names:
+                info = self._read_table(conn, name)
+                if info:
+                    tables[name] = info
+        with self._lock:
+            self._tables = tables
+            self._statements = {}
+            self._records = {}
+        logger.debug(f"[i] Şema önbelleği yüklendi: {len(tables)} tablo.")
+
+    def table(self, table: str) -> TableInfo:
+        """Tablonun metadata'sını döndürür; önbellekte yoksa bir kez okuyup saklar."""
+        info = self._tables.get(table)
+        if info is not None:
+            return info
+        with self.db_client.get_connection() as conn:
+            info = self._read_table(conn, table)
+        if info is None:
+            # Bilinmeyen tablo: kolonsuz kayıt tutulmaz, SQLite hatayı sorgu anında verir
+            return TableInfo(table, (), ())
+        with self._lock:
+            self._tables[table] = info
+        return info
+
+    def columns(self, table: str) -> Tuple[str, ...]:
+        return self.table(table).columns
+
+    def statement(self, key: Hashable, builder: Callable[[], str]) -> str:
+        """`key` için önbellekteki SQL metnini döndürür; yoksa `builder()` ile üretip saklar."""
+        sql = self._statements.get(key)
+        if sql is None:
+            sql = builder()
+            with self._lock:
+                self._statements[key] = sql
+        return sql
+
+    def record_class(self, columns: Tuple[str, ...], table: Optional[str] = None) -> type:
+        """Kolon seti için Record sınıfını döndürür (örn. `UsersRecord`); yoksa üretip saklar."""
+        cls = self._records.get(columns)
+        if cls is None:
+            name = "".join(part.capitalize() for part in (table or "row").split("_")) + "Record"
+            cls = make_record_class(name, columns)
+            with self._lock:
+                cls = self._records.setdefault(columns, cls)
+        return cls
+
+    def invalidate(self) -> None:
+        """Şema değiştiğinde tüm metadata ve SQL önbelleğini temizler."""
+        with self._lock:
+            self._tables = {}
+            self._statements = {}
+            self._records = {}
+        logger.debug("[i] Şema önbelleği temizlendi.")
+
+    def stats(self) -> Dict[str, int]:
+        return {"tables": len(self._tables), "statements": len(self._statements)}
+
+    def table_names(self) -> List[str]:
+        return sorted(self._tables)
@@ -1,24 +1,61 @@
 import os
+import json
+import threading
 import faiss
 import numpy as np
-import pickle
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 from sentence_transformers import SentenceTransformer
 from src.core.logger import logger
 from src.core.singleton import SingletonMeta
+from src.clients.chunk_store import ChunkStore
+from src.clients.embedding_engine import EmbeddingEngine
+from src.clients.vector_index import (
+    VectorIndexConfig,
+    apply_search_params,
+    build_index,
+    describe_index,
+    needs_rebuild,
+    remove_ids,
+    search_index,
+)
 
 class VectorClient(metaclass=SingletonMeta):
     """
     Yerel FAISS indeksi ve SentenceTransformers kullanarak 
     ücretsiz ve limitsiz vektör arama işlemlerini yönetir.
+
+    İndeks tipi `index_options` (VectorIndexConfig alanları) ile seçilir: flat (tam tarama),
+    ivf, hnsw veya ivfpq; "auto" küçük korpusta flat, büyüdükçe IVF kullanır. Ham vektörler
+    ayrıca saklanır, böylece korpus büyüdüğünde veya ayar değiştiğinde indeks yeniden eğitilebilir.
+
+    Parça id'si, parçanın ChunkStore ve `vectors` içindeki satır numarasıdır; silinen parçalar
+    indeksten çıkarılır, satırları ise tam yeniden indekslemeye (`clear`) kadar yerinde kalır.
+
+    Bilgi küpü arka plan thread'inde yeniden indekslenirken `/sor` aramaları sürer: indeksi,
+    vektörleri ve parça deposunu değiştiren ya da okuyan adımlar `_lock` altında çalışır
+    (gömme hesabı kilit dışındadır).
     """
 
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2", index_path: str = "data/vector_store"):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        index_path: str = "data/vector_store",
+        index_options: Optional[Dict[str, Any]] = None,
+        embed_batch_size: int = 16,
+        embed_threads: int = 0,
+    ):
         self.model = SentenceTransformer(model_name)
+        self.embedder = EmbeddingEngine(self.model, batch_size=embed_batch_size, num_threads=embed_threads)
         self.index_path = index_path
+        self.index_config = VectorIndexConfig(**(index_options or {}))
         self.index = None
-        self.documents = []  # Chunks/Texts
+        # Parça metinleri + metadata (mmap'li depo; aramada yalnızca isabetler okunur)
+        self.documents = ChunkStore(f"{index_path}.chunks")
         self.dimension = self.model.get_sentence_embedding_dimension()
+        # Parça id sırasıyla ham vektörler (yeniden eğitim için) ve son eğitimdeki vektör sayısı
+        self.vectors = np.empty((0, self.dimension), dtype="float32")
+        self.trained_on = 0
+        self._lock = threading.RLock()
         
         # Dizini oluştur
         os.makedirs(os.path.dirname(index_path) if os.path.dirname(index_path) else "data", exist_ok=True)
@@ -26,25 +63,63 @@ class VectorClient(metaclass=SingletonMeta):
         # Mevcut indeksi yükle
         self.load_index()
 
-    def add_texts(self, texts: List[str], metadata: List[Dict] = None):
-        """Metinleri vektörleştirir ve indekse ekler."""
+    def add_texts(self, texts: List[str], metadata: List[Dict] = None) -> List[int]:
+        """Metinleri vektörleştirir ve indekse ekler; eklenen parçaların id'lerini döner."""
         if not texts:
-            return
+            return []
+        return self.add_embeddings(texts, metadata, self.encode(texts))
 
-        embeddings = self.model.encode(texts)
-        embeddings = np.array(embeddings).astype('float32')
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Metinlerin gömmelerini hesaplar (indekse dokunmaz; ayrı bir thread'de çalıştırılabilir)."""
+        return self.embedder.encode(texts)
 
-        if self.index is None:
-            self.index = faiss.IndexFlatL2(self.dimension)
-        
-        self.index.add(embeddings)
-        
-        for i, text in enumerate(texts):
-            meta = metadata[i] if metadata else {}
-            self.documents.append({"text": text, "metadata": meta})
-        
-        self.save_index()
+    def add_embeddings(
+        self,
+        texts: List[str],
+        metadata: Optional[List[Dict]],
+        embeddings: np.ndarray,
+        save: bool = True,
+    ) -> List[int]:
+        """
+        Gömmeleri hesaplanmış parçaları indekse ekler. Toplu ingest'te her partiden sonra diske
+        yazmamak için `save=False` verilip sonunda bir kez `save_index` çağrılır.
+        """
+        if not texts:
+            return []
+
+        with self._lock:
+            ids = np.arange(len(self.vectors), len(self.vectors) + len(texts), dtype="int64")
+            self.vectors = np.concatenate([self.vectors, embeddings])
+            self.documents.append(texts, metadata)
+            if needs_rebuild(self.index, self.index_config, self.trained_on, self.documents.live_count):
+                self.rebuild_index()
+            else:
+                self.index.add_with_ids(embeddings, ids)
+
+            if save:
+                self.save_index()
         logger.info(f"[+] {len(texts)} yeni parça vektör indeksine eklendi.")
+        return ids.tolist()
+
+    def remove_ids(self, ids: List[int]):
+        """Parçaları indeksten ve parça deposundan siler."""
+        if not ids:
+            return
+        with self._lock:
+            self.documents.remove(ids)
+            if self.index is not None and not remove_ids(self.index, ids):
+                self.rebuild_index()
+            self.save_index()
+        logger.info(f"[-] {len(ids)} parça vektör indeksinden silindi.")
+
+    def clear(self):
+        """İndeksi, ham vektörleri ve parça deposunu tamamen boşaltır (tam yeniden indeksleme için)."""
+        with self._lock:
+            self.documents.clear()
+            self.vectors = np.empty((0, self.dimension), dtype="float32")
+            self.rebuild_index()
+            self.save_index()
+        logger.info("[i] Vektör indeksi boşaltıldı.")
 
     def search(self, query: str, top_k: int = 5, threshold: float = 0.8) -> List[Dict]:
         """
@@ -59,16 +134,22 @@ class VectorClient(metaclass=SingletonMeta):
         Returns:
             Eşleşen dökümanlar listesi (score ile sıralı)
         """
-        if self.index is None or not self.documents:
-            logger.warning(f"[!] Vector search: İndeks veya döküman yok | Toplam döküman: {len(self.documents) if self.documents else 0}")
+        if self.index is None or not self.index.ntotal:
+            logger.warning(f"[!] Vector search: İndeks veya döküman yok | Toplam döküman: {self.documents.live_count}")
             return []
 
-        query_embedding = self.model.encode([query])
-        query_embedding = np.array(query_embedding).astype('float32')
+        query_embedding = self.embedder.encode([query])
+        with self._lock:
+            return self._search(query_embedding, top_k, threshold)
+
+    def _search(self, query_embedding: np.ndarray, top_k: int, threshold: float) -> List[Dict]:
+        # Gömme hesaplanırken indeks boşaltılmış olabilir (tam yeniden indeksleme)
+        if self.index is None or not self.index.ntotal:
+            return []
 
         # Daha fazla sonuç al, sonra filtrele (top_k * 5 ile daha geniş arama)
-        search_k = min(top_k * 5, len(self.documents)) if self.documents else top_k
-        distances, indices = self.index.search(query_embedding, search_k)
+        search_k = min(top_k * 5, self.index.ntotal)
+        distances, indices = search_index(self.index, self.index_config, query_embedding, search_k, self.vectors)
         
         results = []
         filtered_count = 0
@@ -119,18 +200,61 @@ class VectorClient(metaclass=SingletonMeta):
         
         return results
 
+    def rebuild_index(self):
+        """İndeksi silinmemiş parçaların ham vektörlerinden mevcut ayarlarla baştan kurar (gerekirse eğitir)."""
+        with self._lock:
+            ids = self.documents.live_ids()
+            self.index = build_index(self.index_config, self.dimension, np.ascontiguousarray(self.vectors[ids]), ids)
+            self.trained_on = len(ids)
+
+    def describe_index(self) -> str:
+        """İndeks tipi ve arama ayarlarının kısa özeti (health mesajı için)."""
+        return describe_index(self.index) if self.index is not None else "indeks yok"
+
     def save_index(self):
-        """İndeksi ve dökümanları diske kaydeder."""
-        if self.index is not None:
-            faiss.write_index(self.index, f"{self.index_path}.index")
-            with open(f"{self.index_path}.pkl", "wb") as f:
-                pickle.dump(self.documents, f)
-            logger.debug("[i] Vektör indeksi diske kaydedildi.")
+        """İndeksi ve ham vektörleri diske kaydeder (parçalar eklenirken ChunkStore'a yazılır)."""
+        with self._lock:
+            if self.index is not None:
+                faiss.write_index(self.index, f"{self.index_path}.index")
+                # Geçici dosyaya yazıp taşı: yüklenmiş (mmap) eski dosya yazma sırasında kesilmez
+                with open(f"{self.index_path}.vectors.npy.tmp", "wb") as f:
+                    np.save(f, self.vectors)
+                os.replace(f"{self.index_path}.vectors.npy.tmp", f"{self.index_path}.vectors.npy")
+                with open(f"{self.index_path}.meta.json", "w", encoding="utf-8") as f:
+                    json.dump({"trained_on": self.trained_on}, f)
+                logger.debug("[i] Vektör indeksi diske kaydedildi.")
 
     def load_index(self):
-        """İndeksi ve dökümanları diskten yükler."""
+        """İndeksi ve dökümanları diskten yükler; ayarlar değiştiyse indeksi yeniden kurar."""
         if os.path.exists(f"{self.index_path}.index"):
             self.index = faiss.read_index(f"{self.index_path}.index")
-            with open(f"{self.index_path}.pkl", "rb") as f:
-                self.documents = pickle.load(f)
-            logger.info(f"[i] Vektör indeksi yüklendi: {len(self.documents)} parça.")
+            if not self.documents.exists() and os.path.exists(f"{self.index_path}.pkl"):
+                self.documents.import_pickle(f"{self.index_path}.pkl")
+            self.documents.load()
+
+            if os.path.exists(f"{self.index_path}.vectors.npy"):
+                self.vectors = np.load(f"{self.index_path}.vectors.npy", mmap_mode="r")
+            else:
+                # Ham vektörler saklanmadan önce oluşturulmuş (flat) indeks: vektörler indeksin kendisinde
+                self.vectors = self.index.reconstruct_n(0, self.index.ntotal)
+            if os.path.exists(f"{self.index_path}.meta.json"):
+                with open(f"{self.index_path}.meta.json", encoding="utf-8") as f:
+                    self.trained_on = json.load(f).get("trained_on", self.index.ntotal)
+            else:
+                self.trained_on = self.index.ntotal
+
+            if len(self.documents) > len(self.vectors):
+                # Parçalar depoya yazılmış ama vektörler kaydedilmeden kesilmiş ekleme: bu parçalar
+                # silinmiş sayılır (bilgi küpü manifestinde yer almadıklarından yeniden eklenirler)
+                missing = np.arange(len(self.vectors), len(self.documents))
+                logger.warning(f"[!] Yarım kalmış eklemeden {len(missing)} parça atlanıyor.")
+                self.documents.remove(missing)
+                self.vectors = np.concatenate([self.vectors, np.zeros((len(missing), self.dimension), dtype="float32")])
+
+            if needs_rebuild(self.index, self.index_config, self.trained_on, self.documents.live_count):
+                logger.info("[i] Vektör indeksi ayarları değişmiş, indeks yeniden kuruluyor...")
+                self.rebuild_index()
+                self.save_index()
+            else:
+                apply_search_params(self.index, self.index_config)
+            logger.info(f"[i] Vektör indeksi yüklendi: {self.documents.live_count} parça ({self.describe_index()}).")
@@ -0,0 +1,202 @@
+import math
+from typing import NamedTuple, Optional, Tuple
+import faiss
+import numpy as np
+from src.core.logger import logger
+
+# Desteklenen indeks tipleri; "auto" korpus boyutuna göre flat / ivf seçer
+INDEX_TYPES = ("auto", "flat", "ivf", "hnsw", "ivfpq")
+
+# Eğitim gerektiren indeksler (ivf, ivfpq) bu sayıdan az vektörle eğitilmez, flat kullanılır
+MIN_TRAIN_VECTORS = 1000
+# faiss k-means'in küme başına istediği asgari eğitim noktası
+POINTS_PER_CENTROID = 39
+
+
+class VectorIndexConfig(NamedTuple):
+    """
+    FAISS indeks ayarları (settings.get_vector_index_options ile doldurulur).
+
+    index_type: auto | flat | ivf | hnsw | ivfpq
+    nlist: IVF küme sayısı (0 = 4 * sqrt(n))
+    nprobe: sorguda taranan IVF kümesi (yüksek = daha iyi recall, daha yavaş)
+    hnsw_m / ef_construction / ef_search: HNSW graf derecesi ve arama genişlikleri
+    pq_m / pq_bits: IVF-PQ alt vektör sayısı (boyutu bölmeli) ve kod genişliği
+    pq_refine: IVF-PQ'da k * pq_refine aday çekilir ve ham vektörlerle tam mesafeye göre sıralanır (0 = kapalı)
+    auto_ivf_threshold: "auto" modunda bu vektör sayısından itibaren IVF kullanılır
+    retrain_growth: korpus son eğitimdeki boyutun bu katına ulaşınca yeniden eğitilir
+    """
+    index_type: str = "auto"
+    nlist: int = 0
+    nprobe: int = 16
+    hnsw_m: int = 32
+    ef_construction: int = 200
+    ef_search: int = 64
+    pq_m: int = 16
+    pq_bits: int = 8
+    pq_refine: int = 10
+    auto_ivf_threshold: int = 20000
+    retrain_growth: float = 2.0
+
+
+def resolve_index_type(config: VectorIndexConfig, total: int) -> str:
+    """Verilen korpus boyutu için kullanılacak gerçek indeks tipi."""
+    if config.index_type not in INDEX_TYPES:
+        raise ValueError(f"Geçersiz indeks tipi: {config.index_type} (geçerli: {', '.join(INDEX_TYPES)})")
+    if config.index_type == "auto":
+        return "ivf" if total >= config.auto_ivf_threshold else "flat"
+    if config.index_type in ("ivf", "ivfpq") and total < MIN_TRAIN_VECTORS:
+        return "flat"
+    # PQ kod kitapları (2^pq_bits merkez) yeterli noktayla eğitilemiyorsa sıkıştırmasız IVF
+    if config.index_type == "ivfpq" and total < (2 ** config.pq_bits) * POINTS_PER_CENTROID:
+        return "ivf"
+    return config.index_type
+
+
+def resolve_nlist(config: VectorIndexConfig, total: int) -> int:
+    """Küme sayısı: verilmezse 4 * sqrt(n); her kümeye yeterli eğitim noktası düşecek şekilde sınırlanır."""
+    nlist = config.nlist or int(4 * math.sqrt(total))
+    return max(1, min(nlist, total // POINTS_PER_CENTROID))
+
+
+def build_index(
+    config: VectorIndexConfig,
+    dimension: int,
+    vectors: np.ndarray,
+    ids: Optional[np.ndarray] = None,
+) -> faiss.Index:
+    """
+    Vektörlerin tamamından yeni bir indeks kurar (gerekirse eğitir) ve arama ayarlarını uygular.
+    Aramalar `ids` (varsayılan 0..n-1, parça id'leri) döndürür ve parçalar `remove_ids` ile
+    silinebilir: IVF id'leri kendi listelerinde tutar, flat / hnsw IndexIDMap ile sarılır.
+    Mesafe ölçüsü her tipte L2'dir.
+    """
+    total = len(vectors)
+    index_type = resolve_index_type(config, total)
+
+    if index_type == "flat":
+        index = faiss.IndexFlatL2(dimension)
+    elif index_type == "hnsw":
+        index = faiss.IndexHNSWFlat(dimension, config.hnsw_m)
+        index.hnsw.efConstruction = config.ef_construction
+    elif index_type == "ivf":
+        index = faiss.index_factory(dimension, f"IVF{resolve_nlist(config, total)},Flat")
+    else:
+        if dimension % config.pq_m:
+            raise ValueError(f"pq_m ({config.pq_m}) vektör boyutunu ({dimension}) bölmeli")
+        index = faiss.index_factory(dimension, f"IVF{resolve_nlist(config, total)},PQ{config.pq_m}x{config.pq_bits}")
+
+    if not index.is_trained:
+        index.train(vectors)
+    # IndexIDMap, IVF üzerinde remove_ids sonrası id'leri kaydırır; IVF sarılmaz
+    if _ivf(index) is None:
+        index = faiss.IndexIDMap(index)
+    if total:
+        index.add_with_ids(vectors, np.arange(total, dtype="int64") if ids is None else np.asarray(ids, dtype="int64"))
+    apply_search_params(index, config)
+    logger.info(f"[i] Vektör indeksi kuruldu: {describe_index(index)}")
+    return index
+
+
+def apply_search_params(index: faiss.Index, config: VectorIndexConfig) -> None:
+    """nprobe (IVF) ve efSearch (HNSW) ayarlarını uygular; indeks diskten okunduktan sonra da çağrılır."""
+    ivf = _ivf(index)
+    if ivf is not None:
+        ivf.nprobe = max(1, min(config.nprobe, ivf.nlist))
+    elif isinstance(_base(index), faiss.IndexHNSW):
+        _base(index).hnsw.efSearch = config.ef_search
+
+
+def remove_ids(index: faiss.Index, ids) -> bool:
+    """
+    Parça id'lerini indeksten siler. HNSW grafı silmeyi desteklemez; bu durumda False döner
+    ve indeks kalan vektörlerden yeniden kurulmalıdır.
+    """
+    if index_kind(index) == "hnsw":
+        return False
+    index.remove_ids(np.asarray(ids, dtype="int64"))
+    return True
+
+
+def search_index(
+    index: faiss.Index,
+    config: VectorIndexConfig,
+    queries: np.ndarray,
+    k: int,
+    vectors: Optional[np.ndarray] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `index.search` ile aynı (mesafeler, id'ler) çıktısını verir. IVF-PQ'da sıkıştırılmış kodların
+    yaklaşık mesafeleri sıralamayı bozar: `vectors` (ham vektörler, mmap olabilir) verilmişse
+    k * pq_refine aday çekilip yalnızca bu adayların ham vektörleriyle tam L2 mesafesine göre sıralanır.
+    """
+    if vectors is None or config.pq_refine <= 1 or index_kind(index) != "ivfpq":
+        return index.search(queries, k)
+
+    _, candidates = index.search(queries, k * config.pq_refine)
+    distances = np.full((len(queries), k), np.inf, dtype="float32")
+    ids = np.full((len(queries), k), -1, dtype="int64")
+    for row, (query, found) in enumerate(zip(queries, candidates)):
+        # mmap'te sıralı okuma için id'ler artan sırada
+        found = np.sort(found[found >= 0])
+        exact = ((np.asarray(vectors[found]) - query) ** 2).sum(axis=1)
+        order = np.argsort(exact)[:k]
+        distances[row, :len(order)] = exact[order]
+        ids[row, :len(order)] = found[order]
+    return distances, ids
+
+
+def needs_rebuild(index: Optional[faiss.Index], config: VectorIndexConfig, trained_on: int, total: int) -> bool:
+    """
+    Korpus `total` boyutuna ulaştığında indeksin baştan kurulması gerekiyor mu?
+    Tip değişiyorsa (örn. auto: flat -> ivf) veya eğitimli indeksin korpusu
+    `retrain_growth` katına çıktıysa (küme sayısı eski boyuta göre kalmıştır) True döner.
+    """
+    if index is None:
+        return True
+    # id eşlemesi olmayan (eski, sarılmamış flat) indeksler parça silmeyi desteklemez
+    if not isinstance(index, faiss.IndexIDMap) and _ivf(index) is None:
+        return True
+    if index_kind(index) != resolve_index_type(config, total):
+        return True
+    if _ivf(index) is not None:
+        return total >= max(trained_on, 1) * config.retrain_growth
+    return False
+
+
+def index_kind(index: faiss.Index) -> str:
+    """Mevcut indeksin tipi (flat, ivf, hnsw, ivfpq)."""
+    ivf = _ivf(index)
+    if ivf is not None:
+        return "ivfpq" if isinstance(faiss.downcast_index(ivf), faiss.IndexIVFPQ) else "ivf"
+    if isinstance(_base(index), faiss.IndexHNSW):
+        return "hnsw"
+    return "flat"
+
+
+def describe_index(index: faiss.Index) -> str:
+    """Log ve health mesajları için kısa özet (örn. "ivf (nlist=512, nprobe=16), 120000 vektör")."""
+    kind = index_kind(index)
+    ivf = _ivf(index)
+    if ivf is not None:
+        detail = f" (nlist={ivf.nlist}, nprobe={ivf.nprobe})"
+    elif kind == "hnsw":
+        hnsw = _base(index).hnsw
+        detail = f" (M={hnsw.nb_neighbors(1)}, efSearch={hnsw.efSearch})"
+    else:
+        detail = ""
+    return f"{kind}{detail}, {index.ntotal} vektör"
+
+
+def _base(index: faiss.Index) -> faiss.Index:
+    """IndexIDMap'in sardığı asıl indeks."""
+    if isinstance(index, faiss.IndexIDMap):
+        return faiss.downcast_index(index.index)
+    return index
+
+
+def _ivf(index: faiss.Index):
+    try:
+        return faiss.extract_index_ivf(index)
+    except RuntimeError:
+        return None
@@ -51,7 +51,17 @@ class BotSettings(BaseSettings):
     
     # Vector Store Ayarları
     vector_store_path: str = Field("data/vector_store.index", description="Vector store dosya yolu")
-    vector_store_pkl_path: str = Field("data/vector_store.pkl", description="Vector store pickle dosya yolu")
+    vector_store_chunks_path: str = Field("data/vector_store.chunks.idx.npy", description="Vector store parça deposu indeks dosyası")
+    vector_index_type: str = Field("auto", description="FAISS indeks tipi (auto, flat, ivf, hnsw, ivfpq)")
+    vector_ivf_nlist: int = Field(0, description="IVF küme sayısı (0 = 4 * sqrt(parça sayısı))")
+    vector_nprobe: int = Field(16, description="IVF sorgusunda taranan küme sayısı")
+    vector_hnsw_m: int = Field(32, description="HNSW graf derecesi (M)")
+    vector_hnsw_ef_search: int = Field(64, description="HNSW arama genişliği (efSearch)")
+    vector_pq_m: int = Field(16, description="IVF-PQ alt vektör sayısı (gömme boyutunu bölmeli)")
+    vector_pq_refine: int = Field(10, description="IVF-PQ adaylarını ham vektörlerle yeniden sıralama çarpanı (0 = kapalı)")
+    vector_auto_ivf_threshold: int = Field(20000, description="auto modunda IVF'e geçilen parça sayısı")
+    vector_embed_batch_size: int = Field(16, description="Gömme modeline tek seferde verilen metin sayısı (uzunluğa göre kovalanır)")
+    vector_embed_threads: int = Field(0, description="Gömme için torch thread sayısı (0 = torch varsayılanı)")
     
     # Database Ayarları
     database_path: str = Field(
@@ -59,14 +69,44 @@ class BotSettings(BaseSettings):
         description="SQLite veritabanı yolu",
         validation_alias="DB_PATH"
     )
+    db_driver: str = Field("sqlite", description="Veritabanı sürücüsü (sqlite, sqlite-format)")
+    db_pool_size: int = Field(8, description="SQLite bağlantı havuzu boyutu")
+    db_pool_timeout: float = Field(10.0, description="Havuz doluyken bağlantı bekleme süresi (saniye)")
+    db_pool_max_idle: float = Field(300.0, description="Boştaki bağlantıların kapatılma süresi (saniye)")
+    db_reader_threads: int = Field(4, description="Async repository okuma thread sayısı (yazmalar tek thread'de)")
+    
+    # SQLite PRAGMA Profili
+    db_journal_mode: str = Field("WAL", description="SQLite journal_mode (WAL, DELETE, TRUNCATE...)")
+    db_synchronous: str = Field("NORMAL", description="SQLite synchronous (OFF, NORMAL, FULL)")
+    db_busy_timeout_ms: int = Field(5000, description="Kilitli veritabanında bekleme süresi (ms)")
+    db_cache_size_kb: int = Field(16384, description="Bağlantı başına sayfa önbelleği (KiB)")
+    db_mmap_size: int = Field(134217728, description="Bellek eşlemeli okuma boyutu (byte, 0 = kapalı)")
+    db_temp_store: str = Field("MEMORY", description="Geçici tabloların yeri (DEFAULT, FILE, MEMORY)")
+    db_wal_checkpoint_minutes: int = Field(15, description="Periyodik WAL checkpoint aralığı (dakika, 0-1440, 0 = kapalı)")
+    db_wal_checkpoint_mode: str = Field("PASSIVE", description="WAL checkpoint modu (PASSIVE, FULL, RESTART, TRUNCATE)")
+
+    # Sorgu Ölçümü (opsiyonel)
+    db_query_stats_enabled: bool = Field(False, description="Sorgu süre/satır istatistiklerini topla")
+    db_slow_query_ms: float = Field(100.0, description="Bu süreyi aşan sorgular EXPLAIN QUERY PLAN ile kaydedilir (ms, 0-60000)")
+    db_query_stats_dump_minutes: int = Field(60, description="Sorgu istatistiklerinin log'a yazılma aralığı (dakika, 0-1440, 0 = kapalı)")
+    db_row_cache_enabled: bool = Field(True, description="Sık okunan repository'ler için TTL + LRU okuma önbelleği")
+
+    # Çevrimiçi yedekleme (SQLite backup API)
+    db_backup_dir: str = Field("data/backups", description="Yedeklerin yazılacağı klasör")
+    db_backup_interval_hours: int = Field(24, description="Yedekleme aralığı (saat, 0-168, 0 = kapalı)")
+    db_backup_keep: int = Field(7, description="Saklanacak en yeni yedek sayısı")
+    db_backup_pages_per_step: int = Field(256, description="Yedekleme adımı başına kopyalanan sayfa sayısı")
     
     # Knowledge Base Ayarları
     knowledge_base_path: str = Field("knowledge_base", description="Bilgi küpü klasör yolu")
+    kb_parse_workers: int = Field(0, description="Döküman ayrıştırma süreç sayısı (0 = CPU sayısı)")
+    kb_embed_batch_size: int = Field(256, description="İndekslemede tek seferde gömme motoruna verilen parça sayısı")
+    kb_queue_size: int = Field(8, description="Gömülmeyi bekleyen ayrıştırılmış döküman kuyruğu boyutu")
     
     # Başlangıç Senaryo Ayarları (Soruları Otomatize Etmek İçin)
     db_clean_on_startup: bool = Field(False, description="Başlangıçta challenge tablolarını temizle")
     db_import_initial_users: bool = Field(False, description="Başlangıçta data/initial_users.csv dosyasını içe aktar")
-    kb_rebuild_index: bool = Field(False, description="Başlangıçta bilgi küpü vektör indeksini yeniden oluştur")
+    kb_rebuild_index: bool = Field(False, description="Başlangıçta bilgi küpünü klasörle eşitle (yalnızca değişen dökümanlar işlenir)")
     slack_send_welcome_message: bool = Field(False, description="Sanal ortamda hoşgeldin mesajı gönder")
     
     @field_validator('log_level')
@@ -78,7 +118,10 @@ class BotSettings(BaseSettings):
             raise ValueError(f"Log seviyesi {valid_levels} arasından biri olmalı")
         return v.upper()
     
-    @field_validator('rate_limit_requests', 'rate_limit_window')
+    @field_validator(
+        'rate_limit_requests', 'rate_limit_window', 'db_pool_size', 'db_reader_threads',
+        'db_backup_keep', 'db_backup_pages_per_step'
+    )
     @classmethod
     def validate_positive_int(cls, v: int) -> int:
         """Pozitif integer doğrula."""
@@ -86,6 +129,88 @@ class BotSettings(BaseSettings):
             raise ValueError("Değer pozitif olmalı")
         return v
     
+    @field_validator('db_wal_checkpoint_minutes')
+    @classmethod
+    def validate_wal_checkpoint_minutes(cls, v: int) -> int:
+        """WAL checkpoint aralığını doğrula (0 = kapalı, en fazla bir gün)."""
+        if not 0 <= v <= 1440:
+            raise ValueError("WAL checkpoint aralığı 0-1440 dakika arasında olmalı")
+        return v
+    
+    @field_validator('db_backup_interval_hours')
+    @classmethod
+    def validate_backup_interval_hours(cls, v: int) -> int:
+        """Yedekleme aralığını doğrula (0 = kapalı, en fazla bir hafta)."""
+        if not 0 <= v <= 168:
+            raise ValueError("Yedekleme aralığı 0-168 saat arasında olmalı")
+        return v
+    
+    @field_validator('db_slow_query_ms')
+    @classmethod
+    def validate_slow_query_ms(cls, v: float) -> float:
+        """Yavaş sorgu eşiğini doğrula (0 = her sorgunun planı alınır, en fazla bir dakika)."""
+        if not 0 <= v <= 60000:
+            raise ValueError("Yavaş sorgu eşiği 0-60000 ms arasında olmalı")
+        return v
+    
+    @field_validator('db_query_stats_dump_minutes')
+    @classmethod
+    def validate_query_stats_dump_minutes(cls, v: int) -> int:
+        """Sorgu istatistiği log aralığını doğrula (0 = kapalı, en fazla bir gün)."""
+        if not 0 <= v <= 1440:
+            raise ValueError("Sorgu istatistiği log aralığı 0-1440 dakika arasında olmalı")
+        return v
+    
+    @field_validator('vector_index_type')
+    @classmethod
+    def validate_vector_index_type(cls, v: str) -> str:
+        """FAISS indeks tipini doğrula."""
+        valid_types = ['auto', 'flat', 'ivf', 'hnsw', 'ivfpq']
+        if v.lower() not in valid_types:
+            raise ValueError(f"Vektör indeks tipi {valid_types} arasından biri olmalı")
+        return v.lower()
+    
+    @field_validator('db_driver')
+    @classmethod
+    def validate_db_driver(cls, v: str) -> str:
+        """Sürücü adını doğrula."""
+        from src.clients.db_driver import DRIVERS
+        if v.lower() not in DRIVERS:
+            raise ValueError(f"Veritabanı sürücüsü {list(DRIVERS)} arasından biri olmalı")
+        return v.lower()
+    
+    @field_validator('db_journal_mode', 'db_synchronous', 'db_temp_store', 'db_wal_checkpoint_mode')
+    @classmethod
+    def validate_pragma_keyword(cls, v: str) -> str:
+        """PRAGMA anahtar kelimelerini doğrula (SQL'e doğrudan yazıldıkları için)."""
+        if not v.isalpha():
+            raise ValueError("PRAGMA değeri sadece harflerden oluşmalı")
+        return v.upper()
+    
+    def get_db_pragmas(self) -> dict:
+        """DatabaseClient için PRAGMA profilini döndürür."""
+        return {
+            "journal_mode": self.db_journal_mode,
+            "synchronous": self.db_synchronous,
+            "busy_timeout": self.db_busy_timeout_ms,
+            "cache_size": -abs(self.db_cache_size_kb),
+            "mmap_size": self.db_mmap_size,
+            "temp_store": self.db_temp_store,
+        }
+    
+    def get_vector_index_options(self) -> dict:
+        """VectorClient için FAISS indeks ayarlarını döndürür (VectorIndexConfig alanları)."""
+        return {
+            "index_type": self.vector_index_type,
+            "nlist": self.vector_ivf_nlist,
+            "nprobe": self.vector_nprobe,
+            "hnsw_m": self.vector_hnsw_m,
+            "ef_search": self.vector_hnsw_ef_search,
+            "pq_m": self.vector_pq_m,
+            "pq_refine": self.vector_pq_refine,
+            "auto_ivf_threshold": self.vector_auto_ivf_threshold,
+        }
+    
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
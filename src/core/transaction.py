@@ -1,36 +1,161 @@
 """
 Database transaction yönetimi için context manager.
+
+- İç içe `transaction()` blokları SAVEPOINT ile çalışır; içteki blok hata verirse
+  yalnızca kendi değişiklikleri geri alınır.
+- En dıştaki blok varsayılan olarak `BEGIN IMMEDIATE` ile yazma kilidini baştan alır;
+  kilit alınamazsa ("database is locked") jitter'lı üstel bekleme ile tekrar denenir.
+- Blok içinde çağrılan repository metodları aynı thread'deki bağlantıyı paylaşır ve
+  transaction'a katılır (kendi commit'leri etkisizdir): çok adımlı bir işlem tek bağlantı
+  ve tek commit (tek fsync) ile tamamlanır.
 """
 
+import random
+import sqlite3
+import time
 from contextlib import contextmanager
-from typing import Generator
+from typing import Any, Callable, Generator, Optional
 from src.clients.database_client import DatabaseClient
+from src.clients.connection_pool import PooledConnection
 from src.core.logger import logger
 from src.core.exceptions import DatabaseError
 
+# Kilit alınamadığında yapılacak tekrar sayısı ve bekleme sınırları (sn)
+DEFAULT_RETRIES = 5
+BACKOFF_BASE = 0.05
+BACKOFF_MAX = 1.0
+
+_BUSY_MESSAGES = ("database is locked", "database is busy", "database table is locked")
+
+
+def is_busy_error(error: Optional[BaseException]) -> bool:
+    """Hata SQLITE_BUSY / SQLITE_LOCKED kaynaklı mı? (DatabaseError'a sarılmışsa zincire bakılır)"""
+    while error is not None:
+        if isinstance(error, (sqlite3.OperationalError, DatabaseError)):
+            if any(message in str(error).lower() for message in _BUSY_MESSAGES):
+                return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def _backoff_delay(attempt: int, base: float, cap: float) -> float:
+    """Üstel bekleme + jitter: aynı anda kilitlenen yazıcılar aynı anda tekrar denemesin."""
+    return min(cap, base * (2 ** attempt)) * random.uniform(0.5, 1.5)
+
+
+def _begin(conn: sqlite3.Connection, immediate: bool, retries: int, backoff: float, max_backoff: float) -> None:
+    statement = "BEGIN IMMEDIATE" if immediate else "BEGIN"
+    for attempt in range(retries + 1):
+        try:
+            conn.execute(statement)
+            return
+        except sqlite3.OperationalError as e:
+            if not is_busy_error(e) or attempt >= retries:
+                raise
+            delay = _backoff_delay(attempt, backoff, max_backoff)
+            logger.warning(
+                f"[!] Veritabanı kilitli, {delay:.2f} sn sonra tekrar denenecek "
+                f"(deneme {attempt + 1}/{retries})"
+            )
+            time.sleep(delay)
+
 
 @contextmanager
-def transaction(db_client: DatabaseClient) -> Generator:
+def transaction(
+    db_client: DatabaseClient,
+    immediate: bool = True,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = BACKOFF_BASE,
+    max_backoff: float = BACKOFF_MAX,
+) -> Generator[PooledConnection, None, None]:
     """
     Database transaction context manager.
-    
+
     Usage:
         with transaction(db_client) as conn:
-            cursor = conn.cursor()
-            cursor.execute("INSERT INTO ...")
-            # commit otomatik yapılır
+            poll = poll_repo.get(poll_id)          # aynı bağlantı
+            vote_repo.delete_all_user_votes(...)   # commit etmez, transaction'a katılır
+            conn.execute("INSERT INTO ...")
+            # blok sonunda tek commit; hata olursa hepsi geri alınır
+
+    immediate:
+        - True: yazma niyeti; kilit baştan alınır, blok ortasında "database is locked" oluşmaz.
+        - False: ertelenmiş BEGIN (salt-okunur veya nadiren yazan bloklar için).
+    sqlite3 hataları DatabaseError'a çevrilir; diğer hatalar olduğu gibi yükseltilir.
     """
-    conn = None
+    conn = db_client.get_connection()
+    pool = db_client.pool
+    # Dıştaki transaction() ya da commit edilmemiş örtük bir işlem varsa ona SAVEPOINT ile katıl
+    nested = conn.in_managed_transaction or conn.in_transaction
+    depth = pool.enter_transaction()
+    savepoint = f"cemil_sp_{depth}"
+
+    try:
+        if nested:
+            conn.execute(f"SAVEPOINT {savepoint}")
+        else:
+            _begin(conn.raw, immediate, retries, backoff, max_backoff)
+    except sqlite3.Error as e:
+        pool.exit_transaction()
+        conn.close()
+        logger.error(f"[X] Transaction başlatılamadı: {e}")
+        raise DatabaseError(f"Transaction başlatılamadı: {e}") from e
+
     try:
-        conn = db_client.get_connection()
-        yield conn
-        conn.commit()
-        logger.debug("[+] Transaction başarıyla commit edildi")
-    except Exception as e:
-        if conn:
-            conn.rollback()
-            logger.error(f"[X] Transaction rollback edildi: {e}")
-        raise DatabaseError(f"Transaction hatası: {e}")
+        try:
+            yield conn
+            if nested:
+                conn.execute(f"RELEASE SAVEPOINT {savepoint}")
+            else:
+                conn.raw.commit()
+                logger.debug("[+] Transaction başarıyla commit edildi")
+        except BaseException as e:
+            try:
+                if nested:
+                    conn.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+                    conn.execute(f"RELEASE SAVEPOINT {savepoint}")
+                else:
+                    conn.raw.rollback()
+                logger.error(f"[X] Transaction rollback edildi: {e}")
+            except sqlite3.Error as rollback_error:
+                logger.error(f"[X] Transaction rollback başarısız: {rollback_error}")
+            raise
+    except sqlite3.Error as e:
+        raise DatabaseError(f"Transaction hatası: {e}") from e
     finally:
-        if conn:
-            conn.close()
+        pool.exit_transaction()
+        conn.close()
+        if not nested:
+            # Transaction içinde yazılan tabloların okuma önbelleği commit/rollback sonrası tekrar temizlenir
+            db_client.row_cache.flush_deferred()
+
+
+def run_in_transaction(
+    db_client: DatabaseClient,
+    func: Callable[..., Any],
+    *args,
+    immediate: bool = True,
+    retries: int = DEFAULT_RETRIES,
+    backoff: float = BACKOFF_BASE,
+    max_backoff: float = BACKOFF_MAX,
+    **kwargs,
+) -> Any:
+    """
+    `func`'ı bir transaction içinde çalıştırır; blok ortasında "database is locked" alınırsa
+    (örn. ertelenmiş transaction'da okuma kilidini yazmaya yükseltirken) tüm işlemi baştan dener.
+    Dıştaki bir transaction'a katılan çağrılar tekrar edilmez (kararı dıştaki blok verir).
+    """
+    for attempt in range(retries + 1):
+        outermost = db_client.pool.transaction_depth() == 0
+        try:
+            with transaction(db_client, immediate, retries, backoff, max_backoff):
+                return func(*args, **kwargs)
+        except DatabaseError as e:
+            if not outermost or not is_busy_error(e) or attempt >= retries:
+                raise
+            delay = _backoff_delay(attempt, backoff, max_backoff)
+            logger.warning(
+                f"[!] Transaction kilit nedeniyle geri alındı, {delay:.2f} sn sonra tekrar denenecek "
+                f"(deneme {attempt + 1}/{retries})"
+            )
+            time.sleep(delay)
@@ -3,6 +3,7 @@ Challenge Hub komut handler'ları.
 """
 
 import asyncio
+import logging
 import re
 from datetime import datetime
 from slack_bolt import App
@@ -505,14 +506,14 @@ def setup_challenge_handlers(
             evaluation = eval_repo.get_by_channel_id(channel_id)
             if not evaluation:
                 # Debug: Tüm evaluation'ları kontrol et (sadece log için)
-                all_evaluations = eval_repo.list()
                 logger.warning(
                     f"[!] Evaluation kanalı bulunamadı | "
                     f"Channel: {channel_id} | "
-                    f"Toplam evaluation: {len(all_evaluations)}"
+                    f"Toplam evaluation: {eval_repo.count_where()}"
                 )
-                if all_evaluations:
-                    for ev in all_evaluations:
+                if logger.isEnabledFor(logging.DEBUG):
+                    # Tabloyu belleğe almadan parça parça dolaş
+                    for ev in eval_repo.iter_rows(records=True):
                         ev_channel = ev.get('evaluation_channel_id')
                         logger.debug(
                             f"[i] Evaluation ID: {ev.get('id', '')[:8] if ev.get('id') else 'N/A'} | "
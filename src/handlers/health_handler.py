@@ -13,7 +13,35 @@ def check_database(db_client: DatabaseClient) -> tuple[bool, str]:
     try:
         with db_client.get_connection() as conn:
             conn.execute("SELECT 1")
-        return True, "✅ Veritabanı bağlantısı aktif"
+        pool = db_client.get_pool_stats()
+        message = (
+            f"✅ Veritabanı bağlantısı aktif [{db_client.driver.describe()}] "
+            f"(havuz: {pool['in_use']}/{pool['size']} kullanımda, maks {pool['max_size']}, "
+            f"bekleme: {pool['waits']} kez, en uzun {pool['wait_time_max_ms']} ms)"
+        )
+
+        # Sorgu ölçümü açıksa en pahalı ifadeleri ekle
+        query_stats = db_client.get_query_stats(limit=3)
+        if query_stats:
+            summary = query_stats["summary"]
+            message += (
+                f"\n   • Sorgular: {summary['queries']} ({summary['statements']} farklı ifade), "
+                f"toplam {summary['total_ms']} ms, yavaş: {summary['slow_queries']}"
+            )
+            for entry in query_stats["top"]:
+                caller = max(entry["callers"], key=entry["callers"].get) if entry["callers"] else "?"
+                message += (
+                    f"\n   • `{caller}` {entry['total_ms']} ms / {entry['count']} çağrı "
+                    f"(ort {entry['avg_ms']} ms, maks {entry['max_ms']} ms)"
+                )
+
+        # Okuma önbellekleri: SQLite'a gitmeden karşılanan sorgular
+        for table, cache in db_client.get_cache_stats().items():
+            message += (
+                f"\n   • Önbellek `{table}`: {cache['hits']} hit / {cache['misses']} miss "
+                f"(%{cache['hit_ratio'] * 100:.0f}), {cache['size']}/{cache['max_entries']} kayıt"
+            )
+        return True, message
     except Exception as e:
         logger.error(f"[X] Database health check hatası: {e}")
         return False, f"❌ Veritabanı hatası: {str(e)[:50]}"
@@ -35,8 +63,8 @@ def check_vector_store(vector_client: VectorClient) -> tuple[bool, str]:
     """Vector store'u kontrol eder."""
     try:
         if hasattr(vector_client, 'documents') and vector_client.documents:
-            doc_count = len(vector_client.documents)
-            return True, f"✅ Vector store aktif ({doc_count} doküman)"
+            doc_count = vector_client.documents.live_count
+            return True, f"✅ Vector store aktif ({doc_count} doküman, {vector_client.describe_index()})"
         return True, "✅ Vector store hazır (boş)"
     except Exception as e:
         logger.error(f"[X] Vector store health check hatası: {e}")
@@ -3,6 +3,8 @@ Bilgi küpü (RAG) komut handler'ları.
 """
 
 import asyncio
+import threading
+import time
 from slack_bolt import App
 from src.core.logger import logger
 from src.core.settings import get_settings
@@ -12,6 +14,9 @@ from src.commands import ChatManager
 from src.services import KnowledgeService
 from src.repositories import UserRepository
 
+# /cemil-indeksle ilerleme mesajının en sık güncellenme aralığı (saniye)
+PROGRESS_UPDATE_INTERVAL = 5.0
+
 
 def is_admin(app: App, user_id: str) -> bool:
     """Kullanıcının admin olup olmadığını kontrol eder."""
@@ -114,10 +119,11 @@ def setup_knowledge_handlers(
     
     @app.command("/cemil-indeksle")
     def handle_reindex_command(ack, body):
-        """Bilgi küpünü yeniden indeksler (Admin)."""
+        """Bilgi küpünü klasörle eşitler; `/cemil-indeksle tam` her şeyi baştan indeksler (Admin)."""
         ack()
         user_id = body["user_id"]
         channel_id = body["channel_id"]
+        force = body.get("text", "").strip().lower() == "tam"
         
         # Kullanıcı bilgisini al
         try:
@@ -138,16 +144,46 @@ def setup_knowledge_handlers(
             )
             return
         
-        chat_manager.post_ephemeral(
-            channel=channel_id,
-            user=user_id,
-            text="⚙️ Bilgi küpü yeniden taranıyor..."
-        )
-        
+        if knowledge_service.is_indexing:
+            chat_manager.post_ephemeral(
+                channel=channel_id,
+                user=user_id,
+                text="⏳ Bilgi küpü zaten indeksleniyor, bitince tekrar deneyebilirsin."
+            )
+            return
+
+        # İlerleme, komutu çalıştıran admine DM'de tek mesaj güncellenerek bildirilir
+        start_text = "⚙️ Bilgi küpü baştan indeksleniyor..." if force else "⚙️ Bilgi küpü taranıyor (yalnızca değişen dökümanlar işlenecek)..."
+        try:
+            status = chat_manager.post_message(channel=user_id, text=start_text)
+        except Exception:
+            status = None
+            chat_manager.post_ephemeral(channel=channel_id, user=user_id, text=start_text)
+        last_update = 0.0
+
+        def report_progress(progress):
+            nonlocal last_update
+            finished = progress.files_done == progress.files_total
+            # Slack hız sınırına takılmamak için en fazla birkaç saniyede bir güncellenir
+            if not status or (not finished and time.monotonic() - last_update < PROGRESS_UPDATE_INTERVAL):
+                return
+            last_update = time.monotonic()
+            try:
+                chat_manager.update_message(
+                    channel=status["channel"],
+                    ts=status["ts"],
+                    text=(
+                        f"{start_text}\n📄 {progress.files_done}/{progress.files_total} döküman işlendi, "
+                        f"{progress.chunks_embedded} parça gömüldü."
+                    )
+                )
+            except Exception as e:
+                logger.warning(f"[!] İndeksleme ilerlemesi bildirilemedi: {e}")
+
         # Async işlemi sync wrapper ile çalıştır
         async def process_reindex():
             try:
-                await knowledge_service.process_knowledge_base()
+                await knowledge_service.process_knowledge_base(force=force, progress=report_progress)
                 logger.info(f"[+] BİLGİ KÜPÜ YENİDEN İNDEKLENDİ | Kullanıcı: {user_name} ({user_id})")
                 chat_manager.post_message(
                     channel=channel_id,
@@ -160,5 +196,6 @@ def setup_knowledge_handlers(
                     user=user_id,
                     text="İndeksleme sırasında bir hata oluştu. Lütfen logları kontrol edin."
                 )
-        
-        asyncio.run(process_reindex())
+
+        # Büyük dökümanlarda dakikalar sürebilir: Bolt işçi thread'ini bloklamamak için ayrı thread
+        threading.Thread(target=lambda: asyncio.run(process_reindex()), name="kb-reindex", daemon=True).start()
@@ -10,11 +10,29 @@ from src.repositories import (
     UserRepository,
     ChallengeHubRepository,
     ChallengeParticipantRepository,
-    ChallengeEvaluationRepository
+    ChallengeEvaluationRepository,
+    HelpRepository,
+    FeedbackRepository,
+    MatchRepository,
+    ChallengeProjectRepository
 )
 from src.clients import DatabaseClient
 from src.core.settings import get_settings
 
+# /admin-basarili-projeler mesajında gösterilen proje sayısı (proje başına 2 blok, Slack sınırı 50)
+SUCCESSFUL_PROJECTS_LIMIT = 20
+
+# /admin-ara: kaynak başına gösterilen sonuç sayısı
+ADMIN_SEARCH_LIMIT = 5
+
+# /admin-ara kaynakları: (başlık, repository sınıfı, sonuç satırındaki başlık alanı)
+ADMIN_SEARCH_SOURCES = (
+    ("🆘 Yardım Talepleri", HelpRepository, "topic"),
+    ("💬 Geri Bildirimler", FeedbackRepository, "category"),
+    ("☕ Eşleşme Özetleri", MatchRepository, "created_at"),
+    ("🧩 Challenge Projeleri", ChallengeProjectRepository, "name"),
+)
+
 
 def is_admin(app: App, user_id: str) -> bool:
     """Kullanıcının admin olup olmadığını kontrol eder."""
@@ -66,8 +84,10 @@ def setup_statistics_handlers(
             # İstatistikleri topla
             stats = statistics_service.get_all_statistics()
             
-            # Formatlanmış rapor oluştur
+            # Formatlanmış rapor oluştur (trendler rollup tablosundan, bucket sayısı kadar satırla)
             report = statistics_service.format_statistics_report(stats)
+            if stats:
+                report += statistics_service.format_trends_report(stats.get("trends", {}))
             
             # Kullanıcıya gönder
             chat_manager.post_ephemeral(
@@ -120,8 +140,12 @@ def setup_statistics_handlers(
             hub_repo = ChallengeHubRepository(db_client)
             participant_repo = ChallengeParticipantRepository(db_client)
             
-            # Başarılı değerlendirmeleri bul
-            successful_evaluations = eval_repo.list(filters={"final_result": "success"})
+            # Başarılı değerlendirmeleri bul (Slack mesajı en fazla 50 blok alır: en yeni sayfa yeterli)
+            success_filter = {"final_result": "success"}
+            total_successful = eval_repo.count_where(success_filter)
+            successful_evaluations = eval_repo.page(
+                success_filter, order_by="completed_at", descending=True, limit=SUCCESSFUL_PROJECTS_LIMIT
+            ).rows
             
             if not successful_evaluations:
                 chat_manager.post_ephemeral(
@@ -137,12 +161,20 @@ def setup_statistics_handlers(
                     "type": "header",
                     "text": {
                         "type": "plain_text",
-                        "text": f"🎉 Başarılı Projeler ({len(successful_evaluations)})",
+                        "text": f"🎉 Başarılı Projeler ({total_successful})",
                         "emoji": True
                     }
                 },
                 {"type": "divider"}
             ]
+            if total_successful > len(successful_evaluations):
+                blocks.append({
+                    "type": "context",
+                    "elements": [{
+                        "type": "mrkdwn",
+                        "text": f"En yeni {len(successful_evaluations)} proje gösteriliyor."
+                    }]
+                })
             
             for eval_data in successful_evaluations:
                 challenge_id = eval_data["challenge_hub_id"]
@@ -209,11 +241,11 @@ def setup_statistics_handlers(
             chat_manager.post_ephemeral(
                 channel=channel_id,
                 user=user_id,
-                text=f"🎉 Başarılı Projeler ({len(successful_evaluations)})",
+                text=f"🎉 Başarılı Projeler ({total_successful})",
                 blocks=blocks
             )
             
-            logger.info(f"[+] Başarılı projeler gösterildi | Kullanıcı: {user_name} ({user_id}) | Toplam: {len(successful_evaluations)}")
+            logger.info(f"[+] Başarılı projeler gösterildi | Kullanıcı: {user_name} ({user_id}) | Toplam: {total_successful}")
             
         except Exception as e:
             logger.error(f"[X] Başarılı projeler hatası: {e}", exc_info=True)
@@ -221,4 +253,58 @@ def setup_statistics_handlers(
                 channel=channel_id,
                 user=user_id,
                 text="❌ Başarılı projeler alınırken bir hata oluştu. Lütfen logları kontrol edin."
-            )
\ No newline at end of file
+            )
+
+    @app.command("/admin-ara")
+    def handle_admin_search(ack, body):
+        """Yardım talepleri, geri bildirimler, eşleşme özetleri ve projelerde tam metin arama (Sadece adminler)."""
+        ack()
+        user_id = body["user_id"]
+        channel_id = body["channel_id"]
+        query = (body.get("text") or "").strip()
+
+        logger.info(f"[>] /admin-ara komutu geldi | Kullanıcı: {user_id} | Sorgu: {query}")
+
+        if not is_admin(app, user_id):
+            chat_manager.post_ephemeral(
+                channel=channel_id,
+                user=user_id,
+                text="🚫 Bu komutu sadece adminler kullanabilir."
+            )
+            logger.warning(f"[!] Yetkisiz erişim denemesi | Kullanıcı: {user_id}")
+            return
+
+        if not query:
+            chat_manager.post_ephemeral(
+                channel=channel_id,
+                user=user_id,
+                text="ℹ️ Kullanım: `/admin-ara <kelimeler>` (örn. `/admin-ara pandas groupby`)"
+            )
+            return
+
+        try:
+            db_client = DatabaseClient(db_path=get_settings().database_path)
+            lines = [f"🔎 *Arama:* `{query}`"]
+            total = 0
+            for title, repo_class, label_column in ADMIN_SEARCH_SOURCES:
+                results = repo_class(db_client).search(query, limit=ADMIN_SEARCH_LIMIT)
+                total += len(results)
+                if not results:
+                    continue
+                lines.append(f"\n*{title}* ({len(results)})")
+                for row in results:
+                    lines.append(f"• _{row.get(label_column) or '-'}_: {row['snippet']}")
+
+            if total == 0:
+                lines.append("\nSonuç bulunamadı.")
+
+            chat_manager.post_ephemeral(channel=channel_id, user=user_id, text="\n".join(lines))
+            logger.info(f"[+] Arama sonuçları gösterildi | Kullanıcı: {user_id} | Sonuç: {total}")
+
+        except Exception as e:
+            logger.error(f"[X] Arama hatası: {e}", exc_info=True)
+            chat_manager.post_ephemeral(
+                channel=channel_id,
+                user=user_id,
+                text="❌ Arama sırasında bir hata oluştu. Lütfen logları kontrol edin."
+            )
@@ -0,0 +1,47 @@
+from typing import List, Dict, Any, Optional, Callable, Iterable
+from src.repositories.base_repository import BaseRepository
+
+
+class AsyncBaseRepository(BaseRepository):
+    """
+    BaseRepository'nin async servisler için awaitable varyantı.
+
+    Senkron CRUD metodları aynen kullanılabilir; `a*` metodları aynı işi
+    DatabaseClient.executor üzerinden event loop'u bloklamadan yapar:
+    okumalar reader thread'lerinde, yazmalar tek writer thread'inde çalışır.
+    Alt sınıfa özel sorgular için `aread` / `awrite` kullanılabilir:
+
+        members = await repo.aread(repo.get_team_members, challenge_id)
+    """
+
+    async def aread(self, func: Callable, *args, **kwargs) -> Any:
+        """Salt-okunur bir repository metodunu reader thread'inde çalıştırır."""
+        return await self.db_client.executor.read(func, *args, **kwargs)
+
+    async def awrite(self, func: Callable, *args, **kwargs) -> Any:
+        """Yazan bir repository metodunu writer thread'inde çalıştırır."""
+        return await self.db_client.executor.write(func, *args, **kwargs)
+
+    async def aget(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """ID ile tek bir kayıt getirir."""
+        return await self.aread(self.get, record_id)
+
+    async def alist(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """Kayıtları listeler, isteğe bağlı filtreleme yapar."""
+        return await self.aread(self.list, filters)
+
+    async def acreate(self, data: Dict[str, Any]) -> str:
+        """Yeni bir kayıt oluşturur."""
+        return await self.awrite(self.create, data)
+
+    async def acreate_many(self, rows: Iterable[Dict[str, Any]], **kwargs) -> List[str]:
+        """Birden fazla kaydı toplu ekler."""
+        return await self.awrite(self.create_many, list(rows), **kwargs)
+
+    async def aupdate(self, record_id: str, data: Dict[str, Any]) -> bool:
+        """Kayıt günceller."""
+        return await self.awrite(self.update, record_id, data)
+
+    async def adelete(self, record_id: str) -> bool:
+        """Kayıt siler."""
+        return await self.awrite(self.delete, record_id)
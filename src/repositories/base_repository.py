@@ -1,35 +1,244 @@
+import re
 import uuid
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterable, Iterator, NamedTuple, Sequence, Tuple, Union
 from src.core.logger import logger
 from src.core.exceptions import DatabaseError
 from src.clients.database_client import DatabaseClient
+from src.clients.row_cache import MISSING
+from src.clients.records import Record, record_row_factory
+
+# Toplu yazmalarda tek transaction'a giren satır sayısı
+BULK_CHUNK_SIZE = 500
+
+# page() / iter_rows() varsayılan sayfa boyutları
+DEFAULT_PAGE_SIZE = 50
+STREAM_BATCH_SIZE = 500
+
+# count_by_period zaman dilimleri (strftime biçimleri, dialect.time_bucket ile çevrilir)
+PERIOD_FORMATS = {
+    "hour": "%Y-%m-%d %H:00",
+    "day": "%Y-%m-%d",
+    "week": "%Y-W%W",
+    "month": "%Y-%m",
+}
+
+
+# search() varsayılanları: sonuç sayısı, snippet uzunluğu (token) ve vurgulama (Slack mrkdwn kalın)
+DEFAULT_SEARCH_LIMIT = 20
+SNIPPET_TOKENS = 12
+SNIPPET_MARKERS = ("*", "*")
+
+_SEARCH_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def build_match_query(text: str) -> str:
+    """
+    Kullanıcı girdisini güvenli bir FTS5 MATCH ifadesine çevirir: her kelime tırnaklanır ve önek
+    araması yapılır ("sql join" -> '"sql"* "join"*', tüm kelimeler eşleşmeli). FTS5 operatörleri
+    (NEAR, OR, kolon filtreleri, tırnaklar) yorumlanmaz; kelime yoksa boş metin döner.
+    """
+    return " ".join(f'"{token}"*' for token in _SEARCH_TOKEN.findall(text or ""))
+
+
+class Page(NamedTuple):
+    """page() sonucu: satırlar ve sonraki sayfa için `after` imleci (son sayfada None)."""
+    rows: List[Dict[str, Any]]
+    next_after: Optional[tuple]
+
 
 class BaseRepository:
     """
     Genel CRUD işlemlerini yürüten temel depo (repository) sınıfı.
     Tüm yeni tablolar için bu sınıftan miras alınabilir.
+
+    Sık okunup seyrek yazılan tablolar `CACHE_TTL` (sn) vererek okuma önbelleğini açar:
+    `get` ve alt sınıfın `_cached` ile sardığı okumalar önbellekten döner, bu repository
+    üzerinden yapılan her yazma tablonun önbelleğini geçersiz kılar.
     """
 
+    # Okuma önbelleği (0 = kapalı) ve tablo başına en fazla kayıt sayısı
+    CACHE_TTL: float = 0
+    CACHE_MAX_ENTRIES: int = 256
+
+    # Tam metin arama: FTS5 tablosu (migrations/006) ve index'teki kolon sırasıyla BM25 ağırlıkları
+    SEARCH_TABLE: Optional[str] = None
+    SEARCH_WEIGHTS: Tuple[float, ...] = ()
+
     def __init__(self, db_client: DatabaseClient, table_name: str):
         self.db_client = db_client
         self.table_name = table_name
 
+    @property
+    def schema(self):
+        """Tablo metadata'sı ve hazır SQL metinleri için paylaşılan önbellek (DatabaseClient.schema)."""
+        return self.db_client.schema
+
+    def _cached(self, key: tuple, loader):
+        """
+        Read-through önbellek: `key` önbellekte yoksa `loader()` çalıştırılıp sonucu saklanır.
+        None sonuçlar saklanmaz (repository dışından eklenen kayıtlar hemen görünür).
+        Transaction içinde önbellek atlanır: commit edilmemiş veri önbelleğe girmez.
+        Dönen satırlar kopyadır; çağıranın değiştirmesi önbelleği bozmaz.
+        """
+        registry = self.db_client.row_cache
+        if self.CACHE_TTL <= 0 or not registry.enabled or self.db_client.pool.transaction_depth() > 0:
+            return loader()
+        cache = registry.for_table(self.table_name, self.CACHE_TTL, self.CACHE_MAX_ENTRIES)
+        value = cache.get(key)
+        if value is MISSING:
+            generation = cache.generation
+            value = loader()
+            if value is not None:
+                cache.set(key, value, generation=generation)
+        # Record'lar değiştirilemez, kopyalanmaları gerekmez
+        if isinstance(value, list):
+            return [dict(row) if isinstance(row, dict) else row for row in value]
+        return dict(value) if isinstance(value, dict) else value
+
+    def _fetch_all(self, cursor, records: bool = False) -> List[Union[Dict[str, Any], Record]]:
+        """
+        Sorgu sonucunu dict listesi, `records=True` ise Record listesi olarak döndürür.
+        Record yolunda sqlite3.Row ve ara dict oluşturulmaz: ham tuple doğrudan kayda çevrilir.
+        """
+        if not records:
+            return [dict(row) for row in cursor.fetchall()]
+        columns = tuple(column[0] for column in cursor.description)
+        cursor.row_factory = record_row_factory(self.schema.record_class(columns, self.table_name))
+        return cursor.fetchall()
+
+    def _invalidate_cache(self) -> None:
+        """Tablonun okuma önbelleğini temizler; transaction içindeyse commit anında tekrarlanır."""
+        if self.CACHE_TTL <= 0:
+            return
+        registry = self.db_client.row_cache
+        registry.invalidate(self.table_name)
+        if self.db_client.pool.transaction_depth() > 0:
+            registry.defer(self.table_name)
+
+    def _insert_sql(self, columns: tuple) -> str:
+        """Kolon seti başına bir kez üretilen INSERT metni."""
+        return self.schema.statement(
+            ("insert", self.table_name, columns),
+            lambda: f"INSERT INTO {self.table_name} ({', '.join(columns)}) VALUES ({', '.join(['?'] * len(columns))})"
+        )
+
+    def _update_sql(self, columns: tuple) -> str:
+        """Kolon seti başına bir kez üretilen UPDATE metni (updated_at varsa otomatik eklenir)."""
+        def build() -> str:
+            set_clause = ", ".join([f"{key} = ?" for key in columns])
+            # Eğer tabloda updated_at varsa onu da otomatik güncelle
+            if self.schema.table(self.table_name).has_updated_at and "updated_at" not in columns:
+                set_clause += ", updated_at = CURRENT_TIMESTAMP"
+            return f"UPDATE {self.table_name} SET {set_clause} WHERE id = ?"
+
+        return self.schema.statement(("update", self.table_name, columns), build)
+
+    def _upsert_sql(self, columns: tuple, conflict_columns: tuple, update_columns: tuple) -> str:
+        """INSERT ... ON CONFLICT DO UPDATE (güncellenecek kolon yoksa DO NOTHING) metni."""
+        def build() -> str:
+            touch_updated_at = self.schema.table(self.table_name).has_updated_at and "updated_at" not in update_columns
+            return self._insert_sql(columns) + self.db_client.dialect.upsert_clause(
+                conflict_columns, update_columns, touch_updated_at
+            )
+
+        return self.schema.statement(
+            ("upsert", self.table_name, columns, conflict_columns, update_columns), build
+        )
+
+    def _write_many(self, rows: Iterable[Dict[str, Any]], sql_for, chunk_size: int, conn, op: str) -> List[str]:
+        """
+        Satırları `chunk_size`'lık parçalar halinde executemany ile yazar.
+        Aynı kolon setine sahip satırlar tek bir executemany'de toplanır.
+        `conn` verilirse transaction çağırana aittir (commit edilmez); verilmezse her parça ayrı commit edilir.
+        """
+        ids: List[str] = []
+        iterator = iter(rows)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+
+            groups: Dict[tuple, List[list]] = {}
+            for data in chunk:
+                # Eğer id verilmemişse UUID oluştur
+                if "id" not in data:
+                    data["id"] = str(uuid.uuid4())
+                ids.append(data["id"])
+                groups.setdefault(tuple(data), []).append(list(data.values()))
+
+            try:
+                if conn is not None:
+                    for columns, values in groups.items():
+                        conn.executemany(sql_for(columns), values)
+                else:
+                    with self.db_client.get_connection() as chunk_conn:
+                        for columns, values in groups.items():
+                            chunk_conn.executemany(sql_for(columns), values)
+                        chunk_conn.commit()
+                self._invalidate_cache()
+            except Exception as e:
+                logger.error(f"[X] {self.table_name}.{op} hatası: {e}")
+                raise DatabaseError(str(e))
+
+        logger.debug(f"[+] {len(ids)} kayıt yazıldı ({self.table_name}.{op}).")
+        return ids
+
+    def create_many(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        chunk_size: int = BULK_CHUNK_SIZE,
+        conn=None,
+    ) -> List[str]:
+        """
+        Birden fazla kaydı executemany ile toplu ekler ve id'lerini (verilen sırayla) döndürür.
+        `conn` verilirse çağıranın transaction'ı içinde çalışır.
+        """
+        return self._write_many(rows, self._insert_sql, chunk_size, conn, "create_many")
+
+    def upsert_many(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        conflict_columns: Sequence[str] = ("id",),
+        update_columns: Optional[Sequence[str]] = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        conn=None,
+    ) -> List[str]:
+        """
+        Kayıtları INSERT ... ON CONFLICT DO UPDATE ile toplu ekler/günceller.
+        update_columns:
+            - None: çakışmada conflict/id dışındaki tüm verilen kolonlar güncellenir.
+            - Boş liste: çakışan kayıt olduğu gibi bırakılır (DO NOTHING).
+        Dönen id'ler gönderilen satırların id'leridir; id dışı bir anahtarda çakışan
+        satırlarda veritabanındaki mevcut id korunur.
+        """
+        conflict = tuple(conflict_columns)
+
+        def sql_for(columns: tuple) -> str:
+            if update_columns is None:
+                updates = tuple(c for c in columns if c not in conflict and c != "id")
+            else:
+                updates = tuple(update_columns)
+            return self._upsert_sql(columns, conflict, updates)
+
+        return self._write_many(rows, sql_for, chunk_size, conn, "upsert_many")
+
     def create(self, data: Dict[str, Any]) -> str:
         """Yeni bir kayıt oluşturur."""
         # Eğer id verilmemişse UUID oluştur
         if "id" not in data:
             data["id"] = str(uuid.uuid4())
         
-        columns = list(data.keys())
-        placeholders = ", ".join(["?"] * len(columns))
+        sql = self._insert_sql(tuple(data))
         values = list(data.values())
 
         try:
             with self.db_client.get_connection() as conn:
                 cursor = conn.cursor()
-                sql = f"INSERT INTO {self.table_name} ({', '.join(columns)}) VALUES ({placeholders})"
                 cursor.execute(sql, values)
                 conn.commit()
+                self._invalidate_cache()
                 logger.debug(f"[+] Kayıt eklendi ({self.table_name}): {data['id']}")
                 return data["id"]
         except Exception as e:
@@ -38,10 +247,15 @@ class BaseRepository:
 
     def get(self, record_id: str) -> Optional[Dict[str, Any]]:
         """ID ile tek bir kayıt getirir."""
+        return self._cached(("id", record_id), lambda: self._get(record_id))
+
+    def _get(self, record_id: str) -> Optional[Dict[str, Any]]:
         try:
             with self.db_client.get_connection() as conn:
                 cursor = conn.cursor()
-                sql = f"SELECT * FROM {self.table_name} WHERE id = ?"
+                sql = self.schema.statement(
+                    ("get", self.table_name), lambda: f"SELECT * FROM {self.table_name} WHERE id = ?"
+                )
                 cursor.execute(sql, (record_id,))
                 row = cursor.fetchone()
                 return dict(row) if row else None
@@ -51,22 +265,15 @@ class BaseRepository:
 
     def update(self, record_id: str, data: Dict[str, Any]) -> bool:
         """Kayıt günceller."""
-        set_clause = ", ".join([f"{key} = ?" for key in data.keys()])
         values = list(data.values()) + [record_id]
 
-        # Eğer tabloda updated_at varsa onu da otomatik güncelle
         try:
+            sql = self._update_sql(tuple(data))
             with self.db_client.get_connection() as conn:
                 cursor = conn.cursor()
-                # Tabloda updated_at kolonu var mı kontrol et
-                cursor.execute(f"PRAGMA table_info({self.table_name})")
-                columns = [col[1] for col in cursor.fetchall()]
-                if 'updated_at' in columns and 'updated_at' not in data:
-                    set_clause += ", updated_at = CURRENT_TIMESTAMP"
-                
-                sql = f"UPDATE {self.table_name} SET {set_clause} WHERE id = ?"
                 cursor.execute(sql, values)
                 conn.commit()
+                self._invalidate_cache()
                 return cursor.rowcount > 0
         except Exception as e:
             logger.error(f"[X] {self.table_name}.update hatası: {e}")
@@ -77,30 +284,277 @@ class BaseRepository:
         try:
             with self.db_client.get_connection() as conn:
                 cursor = conn.cursor()
-                sql = f"DELETE FROM {self.table_name} WHERE id = ?"
+                sql = self.schema.statement(
+                    ("delete", self.table_name), lambda: f"DELETE FROM {self.table_name} WHERE id = ?"
+                )
                 cursor.execute(sql, (record_id,))
                 conn.commit()
+                self._invalidate_cache()
                 return cursor.rowcount > 0
         except Exception as e:
             logger.error(f"[X] {self.table_name}.delete hatası: {e}")
             raise DatabaseError(str(e))
 
-    def list(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
-        """Kayıtları listeler, isteğe bağlı filtreleme yapar."""
-        sql = f"SELECT * FROM {self.table_name}"
-        values = []
+    def list(self, filters: Optional[Dict[str, Any]] = None, records: bool = False) -> List[Dict[str, Any]]:
+        """
+        Kayıtları listeler, isteğe bağlı filtreleme yapar.
+        records=True: dict yerine değiştirilemez Record'lar döner (toplu okumalarda daha az bellek).
+        """
+        keys = tuple(filters) if filters else ()
+        values = list(filters.values()) if filters else []
+
+        def build() -> str:
+            sql = f"SELECT * FROM {self.table_name}"
+            if keys:
+                sql += " WHERE " + " AND ".join([f"{key} = ?" for key in keys])
+            return sql
 
-        if filters:
-            conditions = [f"{key} = ?" for key in filters.keys()]
-            sql += " WHERE " + " AND ".join(conditions)
-            values = list(filters.values())
+        sql = self.schema.statement(("list", self.table_name, keys), build)
 
         try:
             with self.db_client.get_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute(sql, values)
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+                return self._fetch_all(cursor, records)
         except Exception as e:
             logger.error(f"[X] {self.table_name}.list hatası: {e}")
             raise DatabaseError(str(e))
+
+    def _filter_conditions(self, filters: Optional[Dict[str, Any]]) -> tuple:
+        """Filtreleri (kolon = ? / liste ise kolon IN (...)) koşul metinleri ve değerlere çevirir."""
+        conditions, values = [], []
+        for key, value in (filters or {}).items():
+            self._check_column(key)
+            if isinstance(value, (list, tuple, set)):
+                value = list(value)
+                conditions.append(f"{key} IN ({', '.join(['?'] * len(value))})")
+                values.extend(value)
+            else:
+                conditions.append(f"{key} = ?")
+                values.append(value)
+        return conditions, values
+
+    def _keyset_columns(self, order_by: Optional[str]) -> tuple:
+        """Sıralama kolonu + eşitlikleri kıran birincil anahtar (imleç kolonları)."""
+        primary_key = self.schema.table(self.table_name).primary_key
+        if not primary_key:
+            raise ValueError(f"{self.table_name} tablosunda birincil anahtar yok, keyset sayfalama yapılamaz")
+        if order_by is None:
+            return primary_key
+        self._check_column(order_by)
+        return (order_by,) + tuple(c for c in primary_key if c != order_by)
+
+    def page(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        after: Optional[Sequence[Any]] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        records: bool = False,
+    ) -> Page:
+        """
+        Keyset (seek) sayfalama: OFFSET yerine son satırın imlecinden devam edilir, böylece
+        derin sayfalar da ilk sayfa kadar ucuzdur ve araya eklenen kayıtlar sayfaları kaydırmaz.
+
+            first = repo.page({"status": "open"}, order_by="created_at", descending=True, limit=20)
+            second = repo.page({"status": "open"}, order_by="created_at", descending=True,
+                               after=first.next_after, limit=20)
+
+        Filtre değeri liste/tuple ise IN (...) olarak uygulanır. Sıralama kolonu NULL
+        içermemelidir (NULL değerli satırlar imleç karşılaştırmasında atlanır).
+        records=True: satırlar dict yerine Record olarak döner.
+        """
+        keyset = self._keyset_columns(order_by)
+        if after is not None and len(after) != len(keyset):
+            raise ValueError(f"after imleci {len(keyset)} değer içermeli: {keyset}")
+
+        conditions, values = self._filter_conditions(filters)
+        shape = tuple(
+            (key, len(value) if isinstance(value, (list, tuple, set)) else None)
+            for key, value in (filters or {}).items()
+        )
+
+        def build() -> str:
+            where = list(conditions)
+            if after is not None:
+                where.append(
+                    f"({', '.join(keyset)}) {'<' if descending else '>'} ({', '.join(['?'] * len(keyset))})"
+                )
+            direction = " DESC" if descending else ""
+            sql = f"SELECT * FROM {self.table_name}"
+            if where:
+                sql += " WHERE " + " AND ".join(where)
+            return sql + " ORDER BY " + ", ".join(c + direction for c in keyset) + " LIMIT ?"
+
+        sql = self.schema.statement(
+            ("page", self.table_name, shape, order_by, descending, after is not None), build
+        )
+        values = values + list(after or ()) + [limit]
+
+        try:
+            with self.db_client.get_connection() as conn:
+                rows = self._fetch_all(conn.execute(sql, values), records)
+        except Exception as e:
+            logger.error(f"[X] {self.table_name}.page hatası: {e}")
+            raise DatabaseError(str(e))
+
+        next_after = tuple(rows[-1][c] for c in keyset) if len(rows) == limit else None
+        return Page(rows, next_after)
+
+    def iter_rows(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        batch_size: int = STREAM_BATCH_SIZE,
+        records: bool = False,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Kayıtları `batch_size`'lık keyset sayfaları halinde akış olarak döndürür; bellek kullanımı
+        tablo boyutundan bağımsızdır. Sayfalar arasında bağlantı veya okuma transaction'ı tutulmaz
+        (WAL checkpoint'i ve yazıcıları bekletmez).
+        """
+        after = None
+        while True:
+            page = self.page(filters, order_by, descending, after, batch_size, records)
+            yield from page.rows
+            if page.next_after is None:
+                return
+            after = page.next_after
+
+    def search(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+    ) -> List[Dict[str, Any]]:
+        """
+        FTS5 tam metin araması (SEARCH_TABLE tanımlı repository'lerde). Sonuçlar BM25 skoruna göre
+        (SEARCH_WEIGHTS ile kolon ağırlıklı) en alakalıdan başlayarak döner; her satıra `score`
+        (büyük = daha alakalı) ve eşleşen kelimeleri vurgulanmış `snippet` eklenir.
+
+            help_repo.search("pandas groupby", filters={"status": "resolved"})
+        """
+        if not self.SEARCH_TABLE:
+            raise ValueError(f"{self.table_name} için tam metin index'i tanımlı değil")
+        match = build_match_query(query)
+        if not match:
+            return []
+
+        fts = self.SEARCH_TABLE
+        conditions, values = self._filter_conditions(filters)
+        shape = tuple(
+            (key, len(value) if isinstance(value, (list, tuple, set)) else None)
+            for key, value in (filters or {}).items()
+        )
+
+        def build() -> str:
+            weights = "".join(f", {weight}" for weight in self.SEARCH_WEIGHTS)
+            where = [f"{fts} MATCH ?"] + [f"t.{condition}" for condition in conditions]
+            return (
+                f"SELECT t.*, -bm25({fts}{weights}) AS score, "
+                f"snippet({fts}, -1, ?, ?, '…', ?) AS snippet "
+                f"FROM {fts} JOIN {self.table_name} t ON t.rowid = {fts}.rowid "
+                f"WHERE {' AND '.join(where)} ORDER BY bm25({fts}{weights}) LIMIT ?"
+            )
+
+        sql = self.schema.statement(("search", self.table_name, shape), build)
+        params = [*SNIPPET_MARKERS, SNIPPET_TOKENS, match, *values, limit]
+        try:
+            with self.db_client.get_connection() as conn:
+                return [dict(row) for row in conn.execute(sql, params).fetchall()]
+        except Exception as e:
+            logger.error(f"[X] {self.table_name}.search hatası: {e}")
+            raise DatabaseError(str(e))
+
+    def rebuild_search_index(self) -> None:
+        """Tam metin index'ini kaynak tablodan yeniden oluşturur (VACUUM veya toplu onarım sonrası)."""
+        if not self.SEARCH_TABLE:
+            return
+        try:
+            with self.db_client.get_connection() as conn:
+                conn.execute(f"INSERT INTO {self.SEARCH_TABLE}({self.SEARCH_TABLE}) VALUES ('rebuild')")
+                conn.commit()
+            logger.info(f"[+] Tam metin index'i yeniden oluşturuldu: {self.SEARCH_TABLE}")
+        except Exception as e:
+            logger.error(f"[X] {self.table_name}.rebuild_search_index hatası: {e}")
+            raise DatabaseError(str(e))
+
+    def _check_column(self, column: str) -> str:
+        """SQL'e gömülecek kolon adının tabloda gerçekten var olduğunu doğrular."""
+        if column not in self.schema.columns(self.table_name):
+            raise ValueError(f"{self.table_name} tablosunda '{column}' kolonu yok")
+        return column
+
+    @staticmethod
+    def _where_clause(keys: tuple) -> str:
+        return " WHERE " + " AND ".join([f"{key} = ?" for key in keys]) if keys else ""
+
+    def _aggregate(self, op: str, sql: str, values: list) -> List[tuple]:
+        try:
+            with self.db_client.get_connection() as conn:
+                return [tuple(row) for row in conn.execute(sql, values).fetchall()]
+        except Exception as e:
+            logger.error(f"[X] {self.table_name}.{op} hatası: {e}")
+            raise DatabaseError(str(e))
+
+    def count_where(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Filtreye uyan kayıt sayısını satırları okumadan döndürür (SELECT COUNT(*))."""
+        keys = tuple(self._check_column(k) for k in filters) if filters else ()
+        sql = self.schema.statement(
+            ("count_where", self.table_name, keys),
+            lambda: f"SELECT COUNT(*) FROM {self.table_name}" + self._where_clause(keys)
+        )
+        return self._aggregate("count_where", sql, list(filters.values()) if filters else [])[0][0]
+
+    def count_by(self, column: str, filters: Optional[Dict[str, Any]] = None) -> Dict[Any, int]:
+        """
+        Kolonun her değeri için kayıt sayısını tek bir GROUP BY sorgusuyla döndürür:
+            help_repo.count_by("status")  ->  {"open": 3, "resolved": 10}
+        NULL değerler None anahtarıyla sayılır.
+        """
+        column = self._check_column(column)
+        keys = tuple(self._check_column(k) for k in filters) if filters else ()
+        sql = self.schema.statement(
+            ("count_by", self.table_name, column, keys),
+            lambda: f"SELECT {column}, COUNT(*) FROM {self.table_name}"
+                    + self._where_clause(keys) + f" GROUP BY {column}"
+        )
+        return dict(self._aggregate("count_by", sql, list(filters.values()) if filters else []))
+
+    def count_by_period(
+        self,
+        period: str = "day",
+        column: str = "created_at",
+        since: Optional[Union[str, datetime]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, int]:
+        """
+        Kayıtları zaman dilimlerine (hour, day, week, month) göre sayar, dilim sırasıyla döndürür:
+            user_repo.count_by_period("week", since=datetime.now() - timedelta(days=28))
+            ->  {"2024-W10": 4, "2024-W11": 7}
+        since: bu andan (dahil) sonraki kayıtlar; zaman damgaları CURRENT_TIMESTAMP biçimindedir (UTC).
+        """
+        if period not in PERIOD_FORMATS:
+            raise ValueError(f"Geçersiz zaman dilimi: {period}")
+        column = self._check_column(column)
+        keys = tuple(self._check_column(k) for k in filters) if filters else ()
+        values = list(filters.values()) if filters else []
+        if since is not None:
+            values.append(since.strftime("%Y-%m-%d %H:%M:%S") if isinstance(since, datetime) else since)
+
+        def build() -> str:
+            conditions = [f"{key} = ?" for key in keys] + [f"{column} IS NOT NULL"]
+            if since is not None:
+                conditions.append(f"{column} >= ?")
+            bucket = self.db_client.dialect.time_bucket(PERIOD_FORMATS[period], column)
+            return (
+                f"SELECT {bucket} AS bucket, COUNT(*) FROM {self.table_name} "
+                f"WHERE {' AND '.join(conditions)} GROUP BY bucket ORDER BY bucket"
+            )
+
+        sql = self.schema.statement(
+            ("count_by_period", self.table_name, period, column, keys, since is not None), build
+        )
+        return dict(self._aggregate("count_by_period", sql, values))
@@ -48,11 +48,11 @@ class ChallengeEvaluationRepository(BaseRepository):
         try:
             with self.db_client.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
+                cursor.execute(f"""
                     SELECT * FROM challenge_evaluations
                     WHERE status = 'evaluating' 
                     AND deadline_at IS NOT NULL
-                    AND deadline_at <= datetime('now')
+                    AND deadline_at <= {self.db_client.dialect.now()}
                     ORDER BY deadline_at ASC
                 """)
                 rows = cursor.fetchall()
@@ -1,10 +1,28 @@
-from typing import Optional, List, Dict, Any
-from src.repositories.base_repository import BaseRepository
+from typing import Optional, List, Dict, Any, NamedTuple, Sequence
+from src.repositories.async_base_repository import AsyncBaseRepository
 from src.clients.database_client import DatabaseClient
+from src.clients.records import Record
 from src.core.logger import logger
+from src.core.exceptions import DatabaseError
+from src.core.transaction import transaction
 
+# Canvas / kanal denetiminde "aktif" sayılan durumlar
+ACTIVE_STATUSES = ("recruiting", "active", "evaluating")
 
-class ChallengeHubRepository(BaseRepository):
+# Dashboard'da değerlendirmeden okunan kolonlar
+_DASHBOARD_EVALUATION_COLUMNS = ("id", "github_repo_url", "github_repo_public", "final_result")
+
+
+class ChallengeDashboardEntry(NamedTuple):
+    """get_dashboard() satırı: aktif challenge, değerlendirme özeti, oy sayıları ve takım üyeleri."""
+    hub: Record
+    evaluation: Optional[Dict[str, Any]]
+    true_votes: int
+    false_votes: int
+    member_ids: List[str]
+
+
+class ChallengeHubRepository(AsyncBaseRepository):
     """Challenge Hub'lar için veritabanı erişim sınıfı."""
 
     def __init__(self, db_client: DatabaseClient):
@@ -32,8 +50,8 @@ class ChallengeHubRepository(BaseRepository):
         """Tema bazlı challenge'ları getirir."""
         return self.list(filters={"theme": theme})
 
-    def get_all_active(self) -> List[Dict[str, Any]]:
-        """Tüm aktif challenge'ları getirir."""
+    def get_all_active(self) -> List[Record]:
+        """Tüm aktif challenge'ları getirir (salt-okunur Record'lar; canvas ve kanal denetimi için)."""
         try:
             with self.db_client.get_connection() as conn:
                 cursor = conn.cursor()
@@ -43,12 +61,87 @@ class ChallengeHubRepository(BaseRepository):
                     ORDER BY created_at DESC
                 """
                 cursor.execute(sql)
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+                return self._fetch_all(cursor, records=True)
         except Exception as e:
             logger.error(f"[X] get_all_active hatası: {e}")
             return []
 
+    def get_dashboard(self) -> List[ChallengeDashboardEntry]:
+        """
+        Tüm aktif challenge'ları değerlendirme, oy sayıları ve takım üyeleriyle birlikte getirir.
+        Challenge sayısından bağımsız olarak tek bağlantıda iki sorgu çalışır (hub + değerlendirme +
+        oylar JOIN'i, ardından tüm takım üyeleri); ikisi de aynı okuma transaction'ında, tutarlı görüntüden.
+        Challenge başına birden fazla değerlendirme varsa ilk oluşturulan (get_by_challenge ile aynı) alınır.
+        """
+        hub_columns = self.schema.columns(self.table_name)
+        statuses = ", ".join(["?"] * len(ACTIVE_STATUSES))
+        evaluation_select = ", ".join(f"e.{c} AS evaluation_{c}" for c in _DASHBOARD_EVALUATION_COLUMNS)
+        try:
+            with transaction(self.db_client, immediate=False) as conn:
+                hub_rows = conn.execute(f"""
+                    SELECT h.*, {evaluation_select},
+                        (SELECT COUNT(*) FROM challenge_evaluators v
+                         WHERE v.evaluation_id = e.id AND v.vote = 'true') AS true_votes,
+                        (SELECT COUNT(*) FROM challenge_evaluators v
+                         WHERE v.evaluation_id = e.id AND v.vote = 'false') AS false_votes
+                    FROM challenge_hubs h
+                    LEFT JOIN challenge_evaluations e ON e.rowid = (
+                        SELECT MIN(rowid) FROM challenge_evaluations WHERE challenge_hub_id = h.id
+                    )
+                    WHERE h.status IN ({statuses})
+                    ORDER BY h.created_at DESC
+                """, ACTIVE_STATUSES).fetchall()
+                member_rows = conn.execute(f"""
+                    SELECT p.challenge_hub_id, p.user_id
+                    FROM challenge_participants p
+                    JOIN challenge_hubs h ON h.id = p.challenge_hub_id
+                    WHERE h.status IN ({statuses})
+                    ORDER BY p.rowid
+                """, ACTIVE_STATUSES).fetchall()
+        except Exception as e:
+            logger.error(f"[X] get_dashboard hatası: {e}")
+            raise DatabaseError(str(e))
+
+        members: Dict[str, List[str]] = {}
+        for hub_id, user_id in member_rows:
+            members.setdefault(hub_id, []).append(user_id)
+
+        hub_record = self.schema.record_class(hub_columns, self.table_name)
+        width = len(hub_columns)
+        entries = []
+        for row in hub_rows:
+            hub = hub_record._make(tuple(row)[:width])
+            evaluation_values = tuple(row)[width:width + len(_DASHBOARD_EVALUATION_COLUMNS)]
+            evaluation = (
+                dict(zip(_DASHBOARD_EVALUATION_COLUMNS, evaluation_values))
+                if evaluation_values[0] is not None else None
+            )
+            entries.append(ChallengeDashboardEntry(
+                hub, evaluation, row["true_votes"], row["false_votes"], members.get(hub["id"], [])
+            ))
+        return entries
+
+    def set_summary_message(self, hub_ids: Sequence[str], message_ts: str, channel_id: str) -> int:
+        """Özet mesajı / canvas kimliğini verilen challenge'lara tek UPDATE ile yazar."""
+        if not hub_ids:
+            return 0
+        placeholders = ", ".join(["?"] * len(hub_ids))
+        try:
+            with self.db_client.get_connection() as conn:
+                cursor = conn.execute(
+                    f"""
+                    UPDATE {self.table_name}
+                    SET summary_message_ts = ?, summary_message_channel_id = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id IN ({placeholders})
+                    """,
+                    [message_ts, channel_id, *hub_ids],
+                )
+                conn.commit()
+                return cursor.rowcount
+        except Exception as e:
+            logger.error(f"[X] set_summary_message hatası: {e}")
+            raise DatabaseError(str(e))
+
     def get_by_channel_id(self, channel_id: str) -> Optional[Dict[str, Any]]:
         """Kanal ID'sine göre challenge getirir."""
         try:
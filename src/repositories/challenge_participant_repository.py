@@ -1,10 +1,10 @@
 from typing import Optional, List, Dict, Any
-from src.repositories.base_repository import BaseRepository
+from src.repositories.async_base_repository import AsyncBaseRepository
 from src.clients.database_client import DatabaseClient
 from src.core.logger import logger
 
 
-class ChallengeParticipantRepository(BaseRepository):
+class ChallengeParticipantRepository(AsyncBaseRepository):
     """Challenge katılımcıları için veritabanı erişim sınıfı."""
 
     def __init__(self, db_client: DatabaseClient):
@@ -1,19 +1,24 @@
 import random
 from typing import Optional, List, Dict, Any
-from src.repositories.base_repository import BaseRepository
+from src.repositories.async_base_repository import AsyncBaseRepository
 from src.clients.database_client import DatabaseClient
 from src.core.logger import logger
 
 
-class ChallengeProjectRepository(BaseRepository):
-    """Challenge proje şablonları için veritabanı erişim sınıfı."""
+class ChallengeProjectRepository(AsyncBaseRepository):
+    """Challenge proje şablonları için veritabanı erişim sınıfı (seed verisi; önbellekli)."""
+
+    CACHE_TTL = 3600
+    CACHE_MAX_ENTRIES = 256
+    SEARCH_TABLE = "challenge_projects_fts"
+    SEARCH_WEIGHTS = (3.0, 1.0, 2.0)  # name, description, skills_required
 
     def __init__(self, db_client: DatabaseClient):
         super().__init__(db_client, "challenge_projects")
 
     def get_by_theme(self, theme: str) -> List[Dict[str, Any]]:
         """Tema bazlı projeleri getirir."""
-        return self.list(filters={"theme": theme})
+        return self._cached(("theme", theme), lambda: self.list(filters={"theme": theme}))
 
     def get_random_project(self, theme: str) -> Optional[Dict[str, Any]]:
         """Tema bazlı random proje seçer."""
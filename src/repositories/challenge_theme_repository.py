@@ -1,13 +1,16 @@
-from src.repositories.base_repository import BaseRepository
+from src.repositories.async_base_repository import AsyncBaseRepository
 from src.clients.database_client import DatabaseClient
 
 
-class ChallengeThemeRepository(BaseRepository):
-    """Challenge temaları için veritabanı erişim sınıfı."""
+class ChallengeThemeRepository(AsyncBaseRepository):
+    """Challenge temaları için veritabanı erişim sınıfı (seed verisi; önbellekli)."""
+
+    CACHE_TTL = 3600
+    CACHE_MAX_ENTRIES = 64
 
     def __init__(self, db_client: DatabaseClient):
         super().__init__(db_client, "challenge_themes")
 
     def get_active_themes(self):
         """Aktif temaları getirir."""
-        return self.list(filters={"is_active": 1})
+        return self._cached(("active",), lambda: self.list(filters={"is_active": 1}))
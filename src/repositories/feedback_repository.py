@@ -4,7 +4,11 @@ from src.clients.database_client import DatabaseClient
 class FeedbackRepository(BaseRepository):
     """
     Anonim geri bildirimler (Feedbacks) için veritabanı erişim sınıfı.
+    İçerik tam metin aranabilir: search().
     """
 
+    SEARCH_TABLE = "feedbacks_fts"
+    SEARCH_WEIGHTS = (1.0,)
+
     def __init__(self, db_client: DatabaseClient):
         super().__init__(db_client, "feedbacks")
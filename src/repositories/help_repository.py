@@ -10,20 +10,24 @@ from src.core.logger import logger
 class HelpRepository(BaseRepository):
     """
     Yardım istekleri için veritabanı işlemleri.
+    Konu ve açıklama tam metin aranabilir: search() (konudaki eşleşmeler daha ağır basar).
     """
+
+    SEARCH_TABLE = "help_requests_fts"
+    SEARCH_WEIGHTS = (3.0, 1.0)  # topic, description
     
     def __init__(self, db_client):
         super().__init__(db_client, "help_requests")
     
-    def get_open_requests(self, limit: int = 10) -> List[dict]:
-        """Açık yardım isteklerini getirir."""
+    def get_open_requests(self, limit: int = 10, after: Optional[tuple] = None) -> List[dict]:
+        """
+        Açık yardım isteklerini en yeniden eskiye getirir.
+        Sonraki sayfa için son satırın (created_at, id) değerleri `after` olarak verilebilir.
+        """
         try:
-            with self.db_client.get_connection() as conn:
-                cursor = conn.cursor()
-                sql = f"SELECT * FROM {self.table_name} WHERE status = 'open' ORDER BY created_at DESC LIMIT ?"
-                cursor.execute(sql, (limit,))
-                rows = cursor.fetchall()
-                return [dict(row) for row in rows]
+            return self.page(
+                {"status": "open"}, order_by="created_at", descending=True, after=after, limit=limit
+            ).rows
         except Exception as e:
             logger.error(f"[X] {self.table_name}.get_open_requests hatası: {e}")
             return []
@@ -4,7 +4,11 @@ from src.clients.database_client import DatabaseClient
 class MatchRepository(BaseRepository):
     """
     Eşleşme kayıtları için veritabanı erişim sınıfı.
+    LLM eşleşme özetleri tam metin aranabilir: search().
     """
 
+    SEARCH_TABLE = "matches_fts"
+    SEARCH_WEIGHTS = (1.0,)
+
     def __init__(self, db_client: DatabaseClient):
         super().__init__(db_client, "matches")
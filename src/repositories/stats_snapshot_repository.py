@@ -0,0 +1,171 @@
+from datetime import datetime, timedelta
+from typing import Dict, NamedTuple, Optional
+from src.repositories.base_repository import BaseRepository
+from src.clients.database_client import DatabaseClient
+from src.core.logger import logger
+from src.core.exceptions import DatabaseError
+from src.core.transaction import transaction
+
+# Granülerlik -> bucket biçimi (SQLite strftime ve datetime.strftime ile aynı)
+GRANULARITIES = {
+    "hour": "%Y-%m-%d %H:00",
+    "day": "%Y-%m-%d",
+}
+
+# Saatlik bucket'ların saklanma süresi (günlükler kalıcıdır)
+HOURLY_RETENTION_DAYS = 14
+
+# Her güncellemede son işlenen bucket'tan bu kadar geriye gidilir: created_at UTC
+# (CURRENT_TIMESTAMP), resolved_at / completed_at ise yerel saatle (datetime.now()) yazılır.
+LATE_ROWS_WINDOW = timedelta(days=1)
+
+
+class RollupMetric(NamedTuple):
+    """
+    Bir zaman serisi metriği: `source` içindeki satırlar `time_column`'a göre bucket'lanıp sayılır.
+    dimension: ek kırılım ifadesi (örn. cohort); where: ek filtre.
+    """
+    name: str
+    source: str
+    time_column: str
+    dimension: str = "''"
+    where: str = ""
+
+
+_CHALLENGE_PARTICIPANTS = (
+    "challenge_evaluations e "
+    "JOIN challenge_participants p ON p.challenge_hub_id = e.challenge_hub_id "
+    "LEFT JOIN users u ON u.slack_id = p.user_id"
+)
+
+ROLLUP_METRICS = [
+    RollupMetric("users_created", "users t", "t.created_at"),
+    RollupMetric("matches_created", "matches t", "t.created_at"),
+    RollupMetric("help_created", "help_requests t", "t.created_at"),
+    RollupMetric("help_resolved", "help_requests t", "t.resolved_at"),
+    # Katılımcı başına, katılımcının cohort'una göre sonuçlanan challenge sayısı
+    RollupMetric(
+        "challenge_success", _CHALLENGE_PARTICIPANTS, "e.completed_at",
+        "COALESCE(u.cohort, '')", "e.final_result = 'success'",
+    ),
+    RollupMetric(
+        "challenge_failed", _CHALLENGE_PARTICIPANTS, "e.completed_at",
+        "COALESCE(u.cohort, '')", "e.final_result = 'failed'",
+    ),
+]
+
+
+class StatsSnapshotRepository(BaseRepository):
+    """
+    İstatistik rollup tablosu (stats_snapshots) için veritabanı erişim sınıfı.
+
+    `rollup` kaynak tabloları yalnızca son işlenen bucket'tan itibaren tarar ve sayımları
+    INSERT ... SELECT ... GROUP BY ile tek transaction'da yazar; trend okumaları ise
+    birincil anahtar aralığı üzerinden bucket sayısı kadar satır okur.
+    """
+
+    def __init__(self, db_client: DatabaseClient):
+        super().__init__(db_client, "stats_snapshots")
+
+    @staticmethod
+    def bucket_of(granularity: str, moment: datetime) -> str:
+        """Bir anın ait olduğu bucket anahtarı."""
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Geçersiz granülerlik: {granularity}")
+        return moment.strftime(GRANULARITIES[granularity])
+
+    def _rollup_sql(self, granularity: str, metric: RollupMetric) -> str:
+        def build() -> str:
+            bucket = self.db_client.dialect.time_bucket(GRANULARITIES[granularity], metric.time_column)
+            conditions = [f"{metric.time_column} >= ?", f"{bucket} >= ?"]
+            if metric.where:
+                conditions.append(metric.where)
+            return (
+                f"INSERT INTO {self.table_name} (granularity, metric, dimension, bucket, value) "
+                f"SELECT ?, '{metric.name}', {metric.dimension}, {bucket}, COUNT(*) "
+                f"FROM {metric.source} WHERE {' AND '.join(conditions)} GROUP BY 3, 4"
+            )
+
+        return self.schema.statement(("rollup", granularity, metric.name), build)
+
+    def rollup(self, granularity: str, since: Optional[datetime] = None, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        `since`'ten (verilmezse son işlenen bucket'tan) itibaren bucket'ları yeniden hesaplar.
+        Pencere silinip yeniden yazıldığı için tekrar çalıştırmak güvenlidir (idempotent).
+        Yazılan satır sayısını ve pencerenin başlangıcını döndürür.
+        """
+        now = now or datetime.utcnow()
+        with transaction(self.db_client) as conn:
+            if since is not None:
+                start = self.bucket_of(granularity, since)
+            else:
+                row = conn.execute(
+                    "SELECT last_bucket FROM stats_rollup_state WHERE granularity = ?", (granularity,)
+                ).fetchone()
+                # İlk çalıştırmada tüm geçmiş işlenir
+                start = row[0] if row else ""
+
+            if granularity == "hour":
+                start = max(start, self.bucket_of("hour", now - timedelta(days=HOURLY_RETENTION_DAYS)))
+                conn.execute(
+                    f"DELETE FROM {self.table_name} WHERE granularity = 'hour' AND bucket < ?", (start,)
+                )
+
+            conn.execute(
+                f"DELETE FROM {self.table_name} WHERE granularity = ? AND bucket >= ?", (granularity, start)
+            )
+            written = 0
+            for metric in ROLLUP_METRICS:
+                written += conn.execute(self._rollup_sql(granularity, metric), (granularity, start, start)).rowcount
+
+            conn.execute(
+                """
+                INSERT INTO stats_rollup_state (granularity, last_bucket) VALUES (?, ?)
+                ON CONFLICT(granularity) DO UPDATE SET
+                    last_bucket = excluded.last_bucket, updated_at = CURRENT_TIMESTAMP
+                """,
+                (granularity, self.bucket_of(granularity, now - LATE_ROWS_WINDOW)),
+            )
+
+        logger.debug(f"[+] İstatistik rollup ({granularity}): {start or 'başlangıç'} itibarıyla {written} bucket yazıldı")
+        return {"since": start, "buckets": written}
+
+    def backfill(self, since: Optional[datetime] = None) -> Dict[str, Dict[str, int]]:
+        """Tüm granülerlikleri `since`'ten (verilmezse en baştan) yeniden hesaplar."""
+        since = since or datetime(1970, 1, 1)
+        return {granularity: self.rollup(granularity, since=since) for granularity in GRANULARITIES}
+
+    def series(self, granularity: str, metric: str, since: datetime, dimension: str = "") -> Dict[str, int]:
+        """Bir metriğin `since`'ten itibaren bucket -> değer serisi (boş bucket'lar dönmez)."""
+        try:
+            with self.db_client.get_connection() as conn:
+                rows = conn.execute(
+                    f"""
+                    SELECT bucket, value FROM {self.table_name}
+                    WHERE granularity = ? AND metric = ? AND dimension = ? AND bucket >= ?
+                    ORDER BY bucket
+                    """,
+                    (granularity, metric, dimension, self.bucket_of(granularity, since)),
+                ).fetchall()
+                return {row[0]: row[1] for row in rows}
+        except Exception as e:
+            logger.error(f"[X] stats_snapshots.series hatası: {e}")
+            raise DatabaseError(str(e))
+
+    def totals_by_dimension(self, granularity: str, metric: str, since: Optional[datetime] = None) -> Dict[str, int]:
+        """Bir metriğin kırılım (örn. cohort) bazında toplamları."""
+        start = self.bucket_of(granularity, since) if since else ""
+        try:
+            with self.db_client.get_connection() as conn:
+                rows = conn.execute(
+                    f"""
+                    SELECT dimension, SUM(value) FROM {self.table_name}
+                    WHERE granularity = ? AND metric = ? AND bucket >= ?
+                    GROUP BY dimension
+                    """,
+                    (granularity, metric, start),
+                ).fetchall()
+                return {row[0]: row[1] for row in rows}
+        except Exception as e:
+            logger.error(f"[X] stats_snapshots.totals_by_dimension hatası: {e}")
+            raise DatabaseError(str(e))
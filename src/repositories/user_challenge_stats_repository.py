@@ -2,6 +2,17 @@ from typing import Dict, Any
 from src.repositories.base_repository import BaseRepository
 from src.clients.database_client import DatabaseClient
 from src.core.logger import logger
+from src.core.exceptions import DatabaseError
+from src.core.transaction import transaction
+
+# apply_deltas kısaltmalarının tablo kolonlarına karşılığı
+DELTA_COLUMNS = {
+    "total": "total_challenges",
+    "completed": "completed_challenges",
+    "points": "total_points",
+    "creativity": "creativity_points",
+    "teamwork": "teamwork_points",
+}
 
 
 class UserChallengeStatsRepository(BaseRepository):
@@ -57,40 +68,74 @@ class UserChallengeStatsRepository(BaseRepository):
                 "total_points": 0,
             }
 
-    def _update_fields(self, user_id: str, fields: Dict[str, Any]) -> None:
-        """Belirtilen alanları user_id'ye göre günceller."""
-        if not fields:
-            return
-        set_clause = ", ".join([f"{k} = ?" for k in fields.keys()])
-        values = list(fields.values()) + [user_id]
+    def _deltas_sql(self) -> str:
+        """
+        Tüm sayaç kolonlarını tek ifadede artıran upsert metni (executemany ile toplu çalışır).
+        `users` tablosunda olmayan kullanıcı satırı atlanır (FOREIGN KEY hatası tüm partiyi,
+        dolayısıyla dıştaki transaction'ı geri almasın); son parametre yine user_id'dir.
+        """
+        def build() -> str:
+            columns = ", ".join(DELTA_COLUMNS.values())
+            placeholders = ", ".join(["?"] * (len(DELTA_COLUMNS) + 1))
+            increments = ", ".join(f"{c} = {c} + excluded.{c}" for c in DELTA_COLUMNS.values())
+            # INSERT ... SELECT'te WHERE zorunludur, yoksa ON CONFLICT join koşulu sanılır
+            return (
+                f"INSERT INTO {self.table_name} (user_id, {columns}) SELECT {placeholders} "
+                f"WHERE EXISTS (SELECT 1 FROM users WHERE slack_id = ?) "
+                f"ON CONFLICT(user_id) DO UPDATE SET {increments}, updated_at = CURRENT_TIMESTAMP"
+            )
+
+        return self.schema.statement(("deltas", self.table_name), build)
+
+    def apply_deltas(self, deltas: Dict[str, Dict[str, int]]) -> int:
+        """
+        Birden fazla kullanıcının sayaçlarını tek bir upsert ifadesiyle atomik olarak artırır:
+
+            stats_repo.apply_deltas({"U1": {"points": 100, "completed": 1}, "U2": {"total": 1}})
+
+        Anahtarlar DELTA_COLUMNS kısaltmaları veya kolon adlarıdır. Kaydı olmayan kullanıcılar
+        sıfırdan oluşturulur; `users` tablosunda bulunmayanlar uyarıyla atlanır. Artış SQL içinde
+        yapıldığı için eşzamanlı çağrılar birbirini ezmez; dıştaki bir transaction() varsa ona
+        katılır. Güncellenen kullanıcı sayısını döndürür.
+        """
+        rows = []
+        for user_id, changes in deltas.items():
+            values = dict.fromkeys(DELTA_COLUMNS.values(), 0)
+            for key, amount in changes.items():
+                column = DELTA_COLUMNS.get(key, key)
+                if column not in values:
+                    raise ValueError(f"Bilinmeyen istatistik alanı: {key}")
+                values[column] += amount
+            rows.append([user_id, *values.values(), user_id])
+        if not rows:
+            return 0
 
         try:
-            with self.db_client.get_connection() as conn:
-                cursor = conn.cursor()
-                sql = f"""
-                    UPDATE {self.table_name}
-                    SET {set_clause}, updated_at = CURRENT_TIMESTAMP
-                    WHERE user_id = ?
-                """
-                cursor.execute(sql, values)
-                conn.commit()
+            with transaction(self.db_client) as conn:
+                updated = conn.executemany(self._deltas_sql(), rows).rowcount
+                if updated < len(rows):
+                    placeholders = ", ".join(["?"] * len(deltas))
+                    known = {
+                        row[0] for row in conn.execute(
+                            f"SELECT slack_id FROM users WHERE slack_id IN ({placeholders})", list(deltas)
+                        ).fetchall()
+                    }
+                    missing = [user_id for user_id in deltas if user_id not in known]
+                    logger.warning(f"[!] users tablosunda olmayan kullanıcılar atlandı: {', '.join(missing)}")
+            logger.debug(f"[+] {updated} kullanıcının challenge istatistikleri güncellendi.")
+            return updated
         except Exception as e:
-            logger.error(f"[X] user_challenge_stats._update_fields hatası: {e}")
+            logger.error(f"[X] user_challenge_stats.apply_deltas hatası: {e}")
+            raise DatabaseError(str(e)) from e
 
     def add_points(self, user_id: str, points: int):
         """Kullanıcıya puan ekler."""
-        stats = self.get_or_create(user_id)
-        new_total = stats.get("total_points", 0) + points
-        self._update_fields(user_id, {"total_points": new_total})
+        self.apply_deltas({user_id: {"points": points}})
 
     def increment_total(self, user_id: str):
         """Toplam challenge sayısını artırır (katıldığı challenge'lar)."""
-        stats = self.get_or_create(user_id)
-        new_count = stats.get("total_challenges", 0) + 1
-        self._update_fields(user_id, {"total_challenges": new_count})
+        self.apply_deltas({user_id: {"total": 1}})
 
     def increment_completed(self, user_id: str):
         """Tamamlanan challenge sayısını artırır."""
-        stats = self.get_or_create(user_id)
-        new_count = stats.get("completed_challenges", 0) + 1
-        self._update_fields(user_id, {"completed_challenges": new_count})
+        self.apply_deltas({user_id: {"completed": 1}})
@@ -1,20 +1,54 @@
+import re
+import csv
+import time
 import uuid
-from typing import Optional, Dict, Any
+from calendar import monthrange
+from itertools import islice
+from typing import Optional, Dict, Any, Iterator, List
 from src.repositories.base_repository import BaseRepository
 from src.clients.database_client import DatabaseClient
 from src.core.logger import logger
 from src.core.exceptions import DatabaseError
+from src.core.transaction import transaction
+
+# CSV import: her parça ayrı bir transaction'da staging tablosuna yazılır
+IMPORT_BATCH_SIZE = 1000
+IMPORT_STAGING_TABLE = "users_import_staging"
+
+# DD.MM.YYYY veya D.M.YYYY
+_BIRTHDAY_PATTERN = re.compile(r"^(\d{1,2})\.(\d{1,2})\.(\d{4})$")
+
+
+def parse_birthday(raw: str) -> Optional[str]:
+    """DD.MM.YYYY / D.M.YYYY tarihini YYYY-MM-DD'ye çevirir; geçersizse None döner."""
+    match = _BIRTHDAY_PATTERN.match(raw)
+    if not match:
+        return None
+    day, month, year = int(match.group(1)), int(match.group(2)), int(match.group(3))
+    if not (1 <= month <= 12 and 1 <= day <= monthrange(year, month)[1]):
+        return None
+    return f"{year:04d}-{month:02d}-{day:02d}"
+
 
 class UserRepository(BaseRepository):
     """
     Kullanıcılar tablosuna özel veri erişim sınıfı.
+    `get_by_slack_id` neredeyse her slash komutunda çağrıldığı için önbelleklidir.
     """
 
+    CACHE_TTL = 300
+    CACHE_MAX_ENTRIES = 2048
+
     def __init__(self, db_client: DatabaseClient):
         super().__init__(db_client, "users")
+        # Son CSV import'unun özeti (okunan/eklenen/reddedilen satırlar, satır/sn)
+        self.last_import_report: Dict[str, Any] = {}
 
     def get_by_slack_id(self, slack_id: str) -> Optional[Dict[str, Any]]:
         """Slack ID'ye göre kullanıcı getirir."""
+        return self._cached(("slack_id", slack_id), lambda: self._get_by_slack_id(slack_id))
+
+    def _get_by_slack_id(self, slack_id: str) -> Optional[Dict[str, Any]]:
         try:
             with self.db_client.get_connection() as conn:
                 cursor = conn.cursor()
@@ -37,6 +71,7 @@ class UserRepository(BaseRepository):
                 sql = f"UPDATE {self.table_name} SET {set_clause}, updated_at = CURRENT_TIMESTAMP WHERE slack_id = ?"
                 cursor.execute(sql, values)
                 conn.commit()
+                self._invalidate_cache()
                 return cursor.rowcount > 0
         except Exception as e:
             logger.error(f"[X] UserRepository.update_by_slack_id hatası: {e}")
@@ -47,8 +82,12 @@ class UserRepository(BaseRepository):
         try:
             with self.db_client.get_connection() as conn:
                 cursor = conn.cursor()
-                # SQLite'da ay ve gün kontrolü: strftime('%m-%d', birthday)
-                sql = f"SELECT * FROM {self.table_name} WHERE strftime('%m-%d', birthday) = strftime('%m-%d', 'now')"
+                # Ay ve gün kontrolü; sol taraf idx_users_birthday_md ifade index'i ile aynı olmalı
+                dialect = self.db_client.dialect
+                sql = (
+                    f"SELECT * FROM {self.table_name} "
+                    f"WHERE {dialect.time_bucket('%m-%d', 'birthday')} = {dialect.time_bucket('%m-%d', dialect.now())}"
+                )
                 cursor.execute(sql)
                 rows = cursor.fetchall()
                 return [dict(row) for row in rows]
@@ -56,122 +95,166 @@ class UserRepository(BaseRepository):
             logger.error(f"[X] UserRepository.get_users_with_birthday_today hatası: {e}")
 
             
-    def import_from_csv(self, file_path: str) -> int:
+    def _resolve_csv_columns(self, fieldnames: Optional[List[str]]):
+        """İlk kolon ve Cohort kolonunun adını belirler (header bozuk olabilir)."""
+        first_col_name = fieldnames[0] if fieldnames else None
+        cohort_col_name = 'Cohort'
+        if first_col_name and first_col_name.lower() not in ['cohort', 'z']:
+            # İlk kolon Cohort değilse, Cohort kolonunu ara
+            for col in fieldnames:
+                if col and 'cohort' in col.lower():
+                    cohort_col_name = col
+                    break
+        elif first_col_name and first_col_name.lower() == 'z':
+            # İlk kolon "z" ise, bu muhtemelen Cohort
+            cohort_col_name = first_col_name
+        return first_col_name, cohort_col_name
+
+    def _parse_csv_rows(self, reader: csv.DictReader, report: Dict[str, int]) -> Iterator[Dict[str, Any]]:
+        """CSV satırlarını tek tek doğrulayıp staging kaydına çevirir (dosya belleğe alınmaz)."""
+        first_col_name, cohort_col_name = self._resolve_csv_columns(reader.fieldnames)
+
+        # Satır numarası başlık satırı dahil (dosyadaki gerçek satır)
+        for line_no, row in enumerate(reader, start=2):
+            report["read"] += 1
+            try:
+                # CSV'den sadece gerekli alanları al
+                raw_slack_id = (row.get('Slack ID') or '').strip()
+                # Slack ID bazen "U123 (name)" formatında olabiliyor, sadece ID kısmını al
+                slack_id = raw_slack_id.split(' ')[0] if raw_slack_id else ''
+
+                first_name = (row.get('First Name') or '').strip()
+                middle_name = (row.get('Middle Name') or '').strip()
+                surname = (row.get('Surname') or '').strip()
+
+                if not slack_id or not first_name or not surname:
+                    report["rejected_missing"] += 1
+                    logger.warning(f"[!] Eksik veri atlandı (Satır: {line_no}): Slack ID, First Name veya Surname boş")
+                    continue
+
+                # Tam isim oluştur (orta isim varsa dahil et)
+                if middle_name:
+                    full_name = f"{first_name} {middle_name} {surname}".strip()
+                else:
+                    full_name = f"{first_name} {surname}".strip()
+
+                # Cohort - ilk kolondan veya Cohort kolonundan al
+                cohort = (row.get(cohort_col_name) or '').strip()
+                if not cohort and first_col_name and first_col_name != cohort_col_name:
+                    # Eğer cohort boşsa ve ilk kolon varsa, ilk kolondan dene
+                    cohort = (row.get(first_col_name) or '').strip()
+
+                # Tarih formatını düzelt (DD.MM.YYYY veya D.M.YYYY -> YYYY-MM-DD)
+                birthday_raw = (row.get('Birthday') or '').strip()
+                birthday = parse_birthday(birthday_raw) if birthday_raw else None
+                if birthday_raw and birthday is None:
+                    report["invalid_birthday"] += 1
+                    logger.warning(f"[!] Geçersiz tarih formatı: {birthday_raw} (Satır: {line_no})")
+
+                yield {
+                    "slack_id": slack_id,
+                    "id": str(uuid.uuid4()),
+                    "first_name": first_name,
+                    "middle_name": middle_name,
+                    "surname": surname,
+                    "full_name": full_name,
+                    "birthday": birthday,
+                    "cohort": cohort,
+                }
+            except Exception as row_error:
+                report["rejected_error"] += 1
+                logger.warning(f"[!] Satır işlenirken hata (Satır: {line_no}): {row_error}")
+
+    def _swap_from_staging(self) -> None:
         """
-        CSV dosyasından kullanıcıları içe aktarır.
+        Staging tablosunu tek bir kısa transaction'da users tablosuna aktarır.
+        Okuyucular commit'e kadar eski listeyi, sonrasında yenisini görür; tablo hiçbir an boş kalmaz.
+        CSV'de bulunmayan kullanıcılar silinir, mevcut kullanıcıların id'leri korunur.
+        """
+        with transaction(self.db_client) as conn:
+            conn.execute(f"""
+                DELETE FROM {self.table_name}
+                WHERE slack_id IS NULL
+                   OR slack_id NOT IN (SELECT slack_id FROM {IMPORT_STAGING_TABLE})
+            """)
+            # WHERE true: INSERT ... SELECT ... ON CONFLICT ayrıştırma belirsizliği için gerekli
+            conn.execute(f"""
+                INSERT INTO {self.table_name} (id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort)
+                SELECT id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort
+                FROM {IMPORT_STAGING_TABLE} WHERE true
+                ON CONFLICT(slack_id) DO UPDATE SET
+                    first_name = excluded.first_name,
+                    middle_name = excluded.middle_name,
+                    surname = excluded.surname,
+                    full_name = excluded.full_name,
+                    birthday = excluded.birthday,
+                    cohort = excluded.cohort,
+                    updated_at = CURRENT_TIMESTAMP
+            """)
+            conn.execute(f"DELETE FROM {IMPORT_STAGING_TABLE}")
+            self._invalidate_cache()
+
+    def import_from_csv(self, file_path: str, batch_size: int = IMPORT_BATCH_SIZE) -> int:
+        """
+        CSV dosyasından kullanıcıları içe aktarır ve eklenen kullanıcı sayısını döndürür.
         Sadece gerekli alanları alır: Slack ID, First Name, Surname, Birthday, Cohort
         Tarih formatını DD.MM.YYYY veya D.M.YYYY -> YYYY-MM-DD'ye çevirir.
-        Önce mevcut tabloyu temizler.
+
+        Dosya akış halinde okunur: satırlar `batch_size`'lık parçalar halinde doğrulanıp
+        staging tablosuna yazılır, sonra users tablosu atomik olarak yenilenir.
+        Özet (satır/sn, reddedilen satırlar) `last_import_report` içinde tutulur.
         """
-        import csv
-        from datetime import datetime
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8-sig') as f:  # BOM'u temizlemek için utf-8-sig
-                reader = csv.DictReader(f)
-                fieldnames = reader.fieldnames
-                
-                # İlk kolonun adını kontrol et (Cohort olabilir ama header bozuk olabilir)
-                first_col_name = fieldnames[0] if fieldnames else None
-                cohort_col_name = 'Cohort'
-                if first_col_name and first_col_name.lower() not in ['cohort', 'z']:
-                    # İlk kolon Cohort değilse, Cohort kolonunu ara
-                    for col in fieldnames:
-                        if col and 'cohort' in col.lower():
-                            cohort_col_name = col
-                            break
-                elif first_col_name and first_col_name.lower() == 'z':
-                    # İlk kolon "z" ise, bu muhtemelen Cohort
-                    cohort_col_name = first_col_name
-                
-                rows = list(reader)
-            
-            if not rows:
-                return 0
+        report = {
+            "read": 0,
+            "imported": 0,
+            "rejected_missing": 0,
+            "rejected_duplicate": 0,
+            "rejected_error": 0,
+            "invalid_birthday": 0,
+        }
+        staging = BaseRepository(self.db_client, IMPORT_STAGING_TABLE)
+        started = time.perf_counter()
 
+        try:
             with self.db_client.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # 1. Tabloyu temizle
-                cursor.execute(f"DELETE FROM {self.table_name}")
-                
-                # 2. Yeni kayıtları ekle
-                count = 0
-                for row in rows:
-                    try:
-                        # CSV'den sadece gerekli alanları al
-                        raw_slack_id = row.get('Slack ID', '').strip()
-                        # Slack ID bazen "U123 (name)" formatında olabiliyor, sadece ID kısmını al
-                        slack_id = raw_slack_id.split(' ')[0] if raw_slack_id else ''
-                        
-                        first_name = row.get('First Name', '').strip()
-                        middle_name = row.get('Middle Name', '').strip()
-                        surname = row.get('Surname', '').strip()
-                        
-                        # Tam isim oluştur (orta isim varsa dahil et)
-                        if middle_name:
-                            full_name = f"{first_name} {middle_name} {surname}".strip()
-                        else:
-                            full_name = f"{first_name} {surname}".strip()
-                        
-                        # Cohort - ilk kolondan veya Cohort kolonundan al
-                        cohort = row.get(cohort_col_name, '').strip()
-                        if not cohort and first_col_name and first_col_name != cohort_col_name:
-                            # Eğer cohort boşsa ve ilk kolon varsa, ilk kolondan dene
-                            cohort = row.get(first_col_name, '').strip()
-                        
-                        # Debug için log (sadece ilk birkaç satır için)
-                        if count < 3:
-                            logger.debug(f"[i] CSV Satır {count+2}: Cohort='{cohort}', Slack ID='{slack_id}'")
-                        
-                        # Tarih formatını düzelt (DD.MM.YYYY veya D.M.YYYY -> YYYY-MM-DD)
-                        birthday_raw = row.get('Birthday', '').strip()
-                        birthday = None
-                        if birthday_raw:
-                            try:
-                                # Önce standart formatı dene (DD.MM.YYYY)
-                                dt = datetime.strptime(birthday_raw, '%d.%m.%Y')
-                                birthday = dt.strftime('%Y-%m-%d')
-                            except ValueError:
-                                try:
-                                    # Tek haneli gün/ay formatını dene (D.M.YYYY)
-                                    parts = birthday_raw.split('.')
-                                    if len(parts) == 3:
-                                        day = parts[0].zfill(2)  # Tek haneli günü iki haneli yap
-                                        month = parts[1].zfill(2)  # Tek haneli ayı iki haneli yap
-                                        year = parts[2]
-                                        normalized_date = f"{day}.{month}.{year}"
-                                        dt = datetime.strptime(normalized_date, '%d.%m.%Y')
-                                        birthday = dt.strftime('%Y-%m-%d')
-                                    else:
-                                        raise ValueError("Tarih formatı geçersiz")
-                                except ValueError:
-                                    # Tarih formatı uymuyorsa None bırak veya logla
-                                    logger.warning(f"[!] Geçersiz tarih formatı: {birthday_raw} (Satır: {count+2})")
-                        
-                        if not slack_id or not first_name or not surname:
-                            logger.warning(f"[!] Eksik veri atlandı (Satır: {count+2}): Slack ID, First Name veya Surname boş")
-                            continue
-
-                        # ID oluştur (UUID)
-                        user_id = str(uuid.uuid4())
-
-                        sql = f"""
-                            INSERT INTO {self.table_name} 
-                            (id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort) 
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                        """
-                        cursor.execute(sql, (user_id, slack_id, first_name, middle_name, surname, full_name, birthday, cohort))
-                        count += 1
-                        
-                    except Exception as row_error:
-                        logger.warning(f"[!] Satır işlenirken hata (Satır: {count+2}): {row_error}")
-                        continue
-                
+                conn.execute(f"DELETE FROM {IMPORT_STAGING_TABLE}")
                 conn.commit()
-                logger.info(f"[+] CSV import tamamlandı. {count} kullanıcı eklendi.")
-                return count
-                
+
+            accepted = 0
+            with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:  # BOM'u temizlemek için utf-8-sig
+                records = self._parse_csv_rows(csv.DictReader(f), report)
+                while True:
+                    batch = list(islice(records, batch_size))
+                    if not batch:
+                        break
+                    # Aynı Slack ID ikinci kez gelirse ilk kayıt korunur (staging PK = slack_id)
+                    staging.upsert_many(batch, conflict_columns=("slack_id",), update_columns=(), chunk_size=batch_size)
+                    accepted += len(batch)
+
+            with self.db_client.get_connection() as conn:
+                staged = conn.execute(f"SELECT COUNT(*) FROM {IMPORT_STAGING_TABLE}").fetchone()[0]
+            report["rejected_duplicate"] = accepted - staged
+
+            if staged == 0:
+                logger.warning("[!] CSV'de geçerli kullanıcı bulunamadı, users tablosu değiştirilmedi.")
+            else:
+                self._swap_from_staging()
+            report["imported"] = staged
+
+            elapsed = time.perf_counter() - started
+            report["rows_per_sec"] = round(report["read"] / elapsed) if elapsed > 0 else 0
+            self.last_import_report = report
+
+            rejected = report["rejected_missing"] + report["rejected_duplicate"] + report["rejected_error"]
+            logger.info(
+                f"[+] CSV import tamamlandı. {staged} kullanıcı eklendi "
+                f"({report['read']} satır, {report['rows_per_sec']} satır/sn, {elapsed:.2f} sn). "
+                f"Reddedilen: {rejected} (eksik: {report['rejected_missing']}, "
+                f"tekrar: {report['rejected_duplicate']}, hata: {report['rejected_error']}), "
+                f"geçersiz tarih: {report['invalid_birthday']}"
+            )
+            return staged
+
         except Exception as e:
             logger.error(f"[X] UserRepository.import_from_csv hatası: {e}")
             raise DatabaseError(str(e))
@@ -6,7 +6,7 @@ import uuid
 import re
 import requests
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from src.core.logger import logger
 from src.commands import ChatManager, ConversationManager, CanvasManager, UserManager
 from src.repositories import (
@@ -16,8 +16,85 @@ from src.repositories import (
     ChallengeParticipantRepository,
     UserChallengeStatsRepository
 )
+from src.repositories.challenge_hub_repository import ChallengeDashboardEntry
 from src.clients import CronClient
 from src.core.settings import get_settings
+from src.core.transaction import transaction
+
+# Başarılı challenge başına takımdaki her kullanıcıya verilen puan
+POINTS_PER_SUCCESS = 100
+
+# Canvas tablosunda durum etiketleri
+_STATUS_LABELS = {
+    "recruiting": "📋 Toplanıyor",
+    "active": "🚀 Geliştirme",
+    "evaluating": "⚖️ Değerlendirme",
+}
+
+
+def _format_team(participant_ids: List[str], team_size: int) -> str:
+    """
+    Takım kolonunu Slack profilleriyle oluşturur (Canvas mention formatı: ![](@USER_ID)).
+    7 kişiye kadar tüm üyeler, daha fazlasında ilk 3 kişi + "+N" gösterilir.
+    """
+    participant_count = len(participant_ids)
+    # team_size creator hariç sayı, toplam = team_size + 1 (creator dahil)
+    total_team_size = (team_size or 0) + 1
+    if not participant_ids:
+        return f"0/{total_team_size}"
+    if participant_count <= 7:
+        user_mentions = ", ".join(f"![](@{uid})" for uid in participant_ids)
+        return f"{user_mentions} ({participant_count}/{total_team_size})"
+    shown_users = participant_ids[:3]
+    user_mentions = ", ".join(f"![](@{uid})" for uid in shown_users)
+    return f"{user_mentions} +{participant_count - len(shown_users)} ({participant_count}/{total_team_size})"
+
+
+def build_canvas_rows(dashboard: List[ChallengeDashboardEntry]) -> List[Dict[str, str]]:
+    """
+    Canvas / fallback tablo için satır view model'i: veritabanına erişmeden, yalnızca
+    ChallengeHubRepository.get_dashboard() sonucundan hesaplanır.
+    """
+    rows = []
+    for entry in dashboard:
+        ch, evaluation = entry.hub, entry.evaluation
+        status = ch.get("status", "unknown")
+        if status == "completed":
+            final_result = evaluation.get("final_result") if evaluation else None
+            status_label = "✅ Başarılı" if final_result == "success" else "❌ Başarısız"
+        else:
+            status_label = _STATUS_LABELS.get(status, "❓ Bilinmiyor")
+
+        deadline = ch.get("deadline")
+        deadline_text = (
+            datetime.fromisoformat(deadline).strftime("%d.%m %H:%M")
+            if deadline else "Belirlenmedi"
+        )
+
+        participant_ids = list(entry.member_ids)
+        creator_id = ch.get("creator_id")
+        if creator_id and creator_id not in participant_ids:
+            participant_ids.insert(0, creator_id)
+
+        github_info = "❌ Yok"
+        if evaluation and evaluation.get("github_repo_url"):
+            github_public = evaluation.get("github_repo_public", 0) == 1
+            github_info = "✅ Public" if github_public else "⚠️ Private"
+
+        votes_info = "-"
+        if entry.true_votes > 0 or entry.false_votes > 0:
+            votes_info = f"✅{entry.true_votes} ❌{entry.false_votes}"
+
+        rows.append({
+            "theme": (ch.get("theme") or "N/A")[:20],
+            "project": (ch.get("project_name") or "Belirlenmedi")[:25],
+            "status": status_label,
+            "deadline": deadline_text,
+            "team": _format_team(participant_ids, ch.get("team_size", 0)),
+            "github": github_info,
+            "votes": votes_info,
+        })
+    return rows
 
 
 class ChallengeEvaluationService:
@@ -57,127 +134,33 @@ class ChallengeEvaluationService:
             challenge_id: Belirli bir challenge için güncelleme (opsiyonel, None ise tüm aktif challenge'lar)
         """
         try:
-            # Tüm aktif challenge'ları al
-            all_active_challenges = self.hub_repo.get_all_active()
+            # Tüm aktif challenge'lar: değerlendirme, oylar ve takım üyeleriyle tek seferde
+            dashboard = self.hub_repo.get_dashboard()
             
-            if not all_active_challenges:
+            if not dashboard:
                 logger.debug("[i] Aktif challenge yok, canvas güncellenmeyecek")
                 return
             
             # İlk challenge'dan hub_channel_id'yi al (tüm challenge'lar aynı kanalda olmalı)
-            first_challenge = all_active_challenges[0]
+            first_challenge = dashboard[0].hub
             hub_channel_id = first_challenge.get("hub_channel_id")
             
             if not hub_channel_id:
                 logger.warning(
                     f"[!] Canvas güncelleme: hub_channel_id YOK | "
-                    f"Toplam aktif challenge: {len(all_active_challenges)}"
+                    f"Toplam aktif challenge: {len(dashboard)}"
                 )
                 return
             
             logger.info(
                 f"[>] Canvas güncelleme başlıyor | "
-                f"Toplam aktif challenge: {len(all_active_challenges)} | "
+                f"Toplam aktif challenge: {len(dashboard)} | "
                 f"Kanal: {hub_channel_id}"
             )
 
-            # Tüm aktif challenge'lar için veri topla
-            table_rows = []
-            
-            for ch in all_active_challenges:
-                ch_id = ch.get("id")
-                evaluation = self.evaluation_repo.get_by_challenge(ch_id)
-                
-                # Challenge bilgileri
-                theme = ch.get("theme", "N/A")
-                project_name = ch.get("project_name") or "Belirlenmedi"
-                status = ch.get("status", "unknown")
-                
-                # Durum etiketi
-                if status == "recruiting":
-                    status_label = "📋 Toplanıyor"
-                elif status == "active":
-                    status_label = "🚀 Geliştirme"
-                elif status == "evaluating":
-                    status_label = "⚖️ Değerlendirme"
-                elif status == "completed":
-                    final_result = evaluation.get("final_result") if evaluation else None
-                    status_label = "✅ Başarılı" if final_result == "success" else "❌ Başarısız"
-                else:
-                    status_label = "❓ Bilinmiyor"
-                
-                # Bitiş tarihi
-                deadline = ch.get("deadline")
-                deadline_text = (
-                    datetime.fromisoformat(deadline).strftime("%d.%m %H:%M")
-                    if deadline else "Belirlenmedi"
-                )
-                
-                # Katılımcı bilgisi (Slack profilleri ile)
-                participants = self.participant_repo.get_team_members(ch_id)
-                participant_ids = [p["user_id"] for p in participants]
-                creator_id = ch.get("creator_id")
-                if creator_id and creator_id not in participant_ids:
-                    participant_ids.insert(0, creator_id)
-                
-                participant_count = len(participant_ids)
-                team_size = ch.get("team_size", 0)
-                # team_size creator hariç sayı, toplam = team_size + 1 (creator dahil)
-                total_team_size = team_size + 1
-                
-                # Slack profillerini linkle
-                # Kural:
-                # - 7 kişiye kadar: TÜM üyeleri tek tek göster
-                # - 7'den fazla: İlk 3 kişi + "+N" formatı
-                if participant_ids:
-                    # Slack Canvas'ta mention formatı: ![](@USER_ID)
-                    # Canvas markdown'ta mention'lar için özel format kullanılır
-                    if participant_count <= 7:
-                        # Tüm ekibi göster
-                        user_mentions = ", ".join(f"![](@{uid})" for uid in participant_ids)
-                        team_info = f"{user_mentions} ({participant_count}/{total_team_size})"
-                    else:
-                        # İlk 3 kişiyi göster + kalan sayısı
-                        shown_users = participant_ids[:3]
-                        user_mentions = ", ".join(f"![](@{uid})" for uid in shown_users)
-                        remaining = participant_count - len(shown_users)
-                        if remaining > 0:
-                            team_info = f"{user_mentions} +{remaining} ({participant_count}/{total_team_size})"
-                        else:
-                            team_info = f"{user_mentions} ({participant_count}/{total_team_size})"
-                else:
-                    team_info = f"0/{total_team_size}"
-                
-                # GitHub durumu
-                github_info = "❌ Yok"
-                if evaluation:
-                    github_url = evaluation.get("github_repo_url")
-                    if github_url:
-                        github_public = evaluation.get("github_repo_public", 0) == 1
-                        github_info = "✅ Public" if github_public else "⚠️ Private"
-                
-                # Oylar
-                votes_info = "-"
-                if evaluation:
-                    try:
-                        votes = self.evaluator_repo.get_votes(evaluation["id"])
-                        true_votes = votes.get("true", 0)
-                        false_votes = votes.get("false", 0)
-                        if true_votes > 0 or false_votes > 0:
-                            votes_info = f"✅{true_votes} ❌{false_votes}"
-                    except:
-                        pass
-                
-                # Tablo satırı ekle
-                table_rows.append({
-                    "theme": theme[:20],
-                    "project": project_name[:25],
-                    "status": status_label,
-                    "deadline": deadline_text,
-                    "team": team_info,
-                    "github": github_info,
-                    "votes": votes_info
-                })
+            # Tablo satırları (view model) önceden hesaplanır; aşağıdaki çıktılar yalnızca biçimlendirir
+            table_rows = build_canvas_rows(dashboard)
+            hub_ids = [entry.hub["id"] for entry in dashboard]
             
             # Slack Canvas için markdown tablo içeriği oluştur
             # Canvas içinde markdown table kullan
@@ -219,7 +202,7 @@ class ChallengeEvaluationService:
                                 f"[+] Canvas GÜNCELLENDI | "
                                 f"Kanal: {hub_channel_id} | "
                                 f"Canvas ID: {canvas_id[:20]}... | "
-                                f"Toplam challenge: {len(all_active_challenges)}"
+                                f"Toplam challenge: {len(dashboard)}"
                             )
                             return
                         except Exception as e:
@@ -241,20 +224,13 @@ class ChallengeEvaluationService:
                                 logger.info(f"[DEBUG] Canvas oluşturuldu | Canvas ID: {canvas_id}")
                                 
                                 # Tüm aktif challenge'lara canvas_id'yi kaydet
-                                for ch in all_active_challenges:
-                                    self.hub_repo.update(
-                                        ch.get("id"),
-                                        {
-                                            "summary_message_ts": canvas_id,
-                                            "summary_message_channel_id": hub_channel_id,
-                                        },
-                                    )
+                                self.hub_repo.set_summary_message(hub_ids, canvas_id, hub_channel_id)
                                 
                                 logger.info(
                                     f"[+] YENİ Canvas OLUŞTURULDU | "
                                     f"Kanal: {hub_channel_id} | "
                                     f"Canvas ID: {canvas_id[:20]}... | "
-                                    f"Toplam challenge: {len(all_active_challenges)}"
+                                    f"Toplam challenge: {len(dashboard)}"
                                 )
                                 return
                         except Exception as e:
@@ -303,7 +279,7 @@ class ChallengeEvaluationService:
             ]
             
             summary_ts = first_challenge.get("summary_message_ts")
-            canvas_text = f"📊 Aktif Challenge'lar ({len(all_active_challenges)} adet)\n\n{table_text_plain}"
+            canvas_text = f"📊 Aktif Challenge'lar ({len(dashboard)} adet)\n\n{table_text_plain}"
             
             # Mevcut fallback mesajı güncelle veya yeni mesaj oluştur
             if summary_ts and not summary_ts.startswith("F"):  # Canvas ID "F" ile başlar
@@ -318,7 +294,7 @@ class ChallengeEvaluationService:
                         f"[+] Canvas tablo (fallback) GÜNCELLENDİ | "
                         f"Kanal: {hub_channel_id} | "
                         f"TS: {summary_ts} | "
-                        f"Toplam challenge: {len(all_active_challenges)}"
+                        f"Toplam challenge: {len(dashboard)}"
                     )
                     return
                 except Exception as e:
@@ -329,7 +305,7 @@ class ChallengeEvaluationService:
                 logger.debug(
                     f"[DEBUG] Canvas tablo (fallback) mesajı gönderiliyor | "
                     f"Kanal: {hub_channel_id} | "
-                    f"Toplam challenge: {len(all_active_challenges)}"
+                    f"Toplam challenge: {len(dashboard)}"
                 )
                 
                 resp = self.chat.post_message(
@@ -346,19 +322,12 @@ class ChallengeEvaluationService:
                 
                 if ts:
                     # Tüm aktif challenge'lara aynı summary_ts'yi kaydet
-                    for ch in all_active_challenges:
-                        self.hub_repo.update(
-                            ch.get("id"),
-                            {
-                                "summary_message_ts": ts,
-                                "summary_message_channel_id": hub_channel_id,
-                            },
-                        )
+                    self.hub_repo.set_summary_message(hub_ids, ts, hub_channel_id)
                     logger.info(
                         f"[+] YENİ canvas tablo mesajı OLUŞTURULDU | "
                         f"Kanal: {hub_channel_id} | "
                         f"TS: {ts} | "
-                        f"Toplam challenge: {len(all_active_challenges)} | "
+                        f"Toplam challenge: {len(dashboard)} | "
                         f"Message Type: {message_data.get('type', 'N/A')}"
                     )
                     
@@ -380,7 +349,7 @@ class ChallengeEvaluationService:
                     logger.error(
                         f"[X] Canvas mesajı gönderildi ama TS alınamadı! | "
                         f"Kanal: {hub_channel_id} | "
-                        f"Toplam challenge: {len(all_active_challenges)} | "
+                        f"Toplam challenge: {len(dashboard)} | "
                         f"Response OK: {resp.get('ok', False)} | "
                         f"Response: {str(resp)[:300]}"
                     )
@@ -1339,49 +1308,30 @@ class ChallengeEvaluationService:
                     reasons.append("GitHub repo public değil")
                 result_message = f"❌ *Challenge Başarısız*\n\n*Nedenler:*\n" + "\n".join(f"• {r}" for r in reasons)
 
-            # Değerlendirmeyi güncelle
-            self.evaluation_repo.update(evaluation_id, {
-                "status": "completed",
-                "final_result": final_result,
-                "completed_at": datetime.now().isoformat()
-            })
-
-            # Challenge'ı güncelle
+            # Değerlendirme, challenge durumu ve takım puanları tek transaction'da yazılır:
+            # puanlama başarısız olursa değerlendirme "evaluating" kalır ve tekrar finalize edilebilir.
             challenge_id = evaluation["challenge_hub_id"]
-            challenge = self.hub_repo.get(challenge_id)
-            if challenge:
-                # Challenge'ın status'unu güncelle (değerlendirme tamamlandı)
-                self.hub_repo.update(challenge_id, {
+            with transaction(self.evaluation_repo.db_client):
+                self.evaluation_repo.update(evaluation_id, {
                     "status": "completed",
+                    "final_result": final_result,
                     "completed_at": datetime.now().isoformat()
                 })
+
+                challenge = self.hub_repo.get(challenge_id)
+                if challenge:
+                    # Challenge'ın status'unu güncelle (değerlendirme tamamlandı)
+                    self.hub_repo.update(challenge_id, {
+                        "status": "completed",
+                        "completed_at": datetime.now().isoformat()
+                    })
+
+                    # Başarı durumunda tüm takıma puan ve başarı sayısı tek upsert ile eklenir
+                    if final_result == "success":
+                        self._credit_team(challenge)
+
+            if challenge:
                 logger.info(f"[+] Challenge status güncellendi: {challenge_id} | Status: completed")
-                
-                logger.info(f"[+] Challenge status güncellendi: {challenge_id} | Status: completed")
-                
-                # Başarı durumunda istatistikleri ve puanları güncelle
-                if final_result == "success":
-                    try:
-                        # Puan miktarı (varsayılan: 100)
-                        POINTS_PER_SUCCESS = 100
-                        
-                        # Katılımcıları al
-                        participants = self.participant_repo.get_team_members(challenge_id)
-                        participant_ids = [p["user_id"] for p in participants]
-                        
-                        # Owner'ı al (eğer katılımcılar arasında değilse ekle)
-                        creator_id = challenge.get("creator_id")
-                        if creator_id and creator_id not in participant_ids:
-                            participant_ids.append(creator_id)
-                        
-                        # Herkese puan ver ve başarı sayısını artır
-                        for user_id in participant_ids:
-                            self.stats_repo.add_points(user_id, POINTS_PER_SUCCESS)
-                            self.stats_repo.increment_completed(user_id)
-                            logger.info(f"[+] Puan ve başarı güncellendi: {user_id} | Challenge: {challenge_id}")
-                            
-                    except Exception as e:
-                        logger.error(f"[X] Başarı istatistikleri güncellenirken hata: {e}", exc_info=True)
 
                 # Sonuç mesajını hem challenge kanalına hem ana kanala gönder
                 result_blocks = [
@@ -1508,6 +1458,20 @@ class ChallengeEvaluationService:
         except Exception as e:
             logger.error(f"[X] Değerlendirme finalize hatası: {e}", exc_info=True)
 
+    def _credit_team(self, challenge: Dict[str, Any]) -> None:
+        """Başarılı challenge'ın katılımcılarına ve sahibine puan ile başarı sayısını tek seferde ekler."""
+        participant_ids = [p["user_id"] for p in self.participant_repo.get_team_members(challenge["id"])]
+
+        # Owner'ı al (eğer katılımcılar arasında değilse ekle)
+        creator_id = challenge.get("creator_id")
+        if creator_id and creator_id not in participant_ids:
+            participant_ids.append(creator_id)
+
+        credited = self.stats_repo.apply_deltas({
+            user_id: {"points": POINTS_PER_SUCCESS, "completed": 1} for user_id in participant_ids
+        })
+        logger.info(f"[+] Puan ve başarı güncellendi: {credited} kullanıcı | Challenge: {challenge['id']}")
+
     def _archive_channel_delayed(self, evaluation_id: str, channel_id: str):
         """Kanalı gecikmeli olarak arşivler (Cron tarafından çağrılır)."""
         try:
@@ -1546,38 +1510,27 @@ class ChallengeEvaluationService:
             else:
                 result_message = "❌ *Challenge Başarısız* (Yönetici Kararı)"
 
-            # DB güncelle
-            self.evaluation_repo.update(evaluation_id, {
-                "status": "completed",
-                "final_result": final_result,
-                "completed_at": datetime.now().isoformat()
-            })
-
-            self.hub_repo.update(
-                challenge_id,
-                {
+            # DB güncelle (değerlendirme, challenge ve takım puanları tek transaction'da)
+            with transaction(self.evaluation_repo.db_client):
+                self.evaluation_repo.update(evaluation_id, {
                     "status": "completed",
-                    "completed_at": datetime.now().isoformat(),
-                },
-            )
+                    "final_result": final_result,
+                    "completed_at": datetime.now().isoformat()
+                })
 
-            # Başarı durumunda istatistikleri ve puanları güncelle (Force Complete için de)
-            if final_result == "success":
-                try:
-                    POINTS_PER_SUCCESS = 100
+                self.hub_repo.update(
+                    challenge_id,
+                    {
+                        "status": "completed",
+                        "completed_at": datetime.now().isoformat(),
+                    },
+                )
+
+                # Başarı durumunda istatistikleri ve puanları güncelle (Force Complete için de)
+                if final_result == "success":
                     challenge = self.hub_repo.get(challenge_id)
-                    participants = self.participant_repo.get_team_members(challenge_id)
-                    participant_ids = [p["user_id"] for p in participants]
-                    creator_id = challenge.get("creator_id") if challenge else None
-                    if creator_id and creator_id not in participant_ids:
-                        participant_ids.append(creator_id)
-
-                    for user_id in participant_ids:
-                        self.stats_repo.add_points(user_id, POINTS_PER_SUCCESS)
-                        self.stats_repo.increment_completed(user_id)
-                        logger.info(f"[+] Force success: Puan ve başarı güncellendi: {user_id}")
-                except Exception as e:
-                    logger.error(f"[X] Force success istatistikleri güncellenirken hata: {e}")
+                    if challenge:
+                        self._credit_team(challenge)
 
             # Bildirim gönder (hem evaluation hem challenge kanallarına)
             eval_channel_id = evaluation.get("evaluation_channel_id")
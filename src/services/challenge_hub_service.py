@@ -4,6 +4,7 @@ Challenge Hub yönetim servisi.
 
 import json
 import uuid
+import asyncio
 import random
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
@@ -671,9 +672,10 @@ class ChallengeHubService:
 
             # 4.5. İstatistikleri güncelle (creator + takım üyeleri)
             try:
-                self.stats_repo.increment_total(creator_id)
+                deltas = {creator_id: {"total": 1}}
                 for uid in team_member_ids:
-                    self.stats_repo.increment_total(uid)
+                    deltas.setdefault(uid, {"total": 0})["total"] += 1
+                self.stats_repo.apply_deltas(deltas)
                 logger.debug(
                     f"[i] register_existing_channel: total_challenges güncellendi | "
                     f"Creator: {creator_id} | Members: {len(team_member_ids)}"
@@ -731,12 +733,13 @@ class ChallengeHubService:
         """
         Challenge'ı başlatır (takım dolduğunda).
         Random tema ve proje seçer, süreyi DB'den alır.
+        DB çağrıları async repository yolundan (executor thread'leri) yapılır; event loop bloklanmaz.
         """
         try:
             import random
             from src.repositories import ChallengeThemeRepository
             
-            challenge = self.hub_repo.get(challenge_id)
+            challenge = await self.hub_repo.aget(challenge_id)
             if not challenge:
                 logger.error(f"[X] Challenge bulunamadı: {challenge_id}")
                 raise ValueError(f"Challenge bulunamadı: {challenge_id}")
@@ -756,10 +759,10 @@ class ChallengeHubService:
             else:
                 # Random tema seç
                 if not self.db_client:
-                    active_themes = self.theme_repo.get_active_themes()
+                    theme_repo = self.theme_repo
                 else:
                     theme_repo = ChallengeThemeRepository(self.db_client)
-                    active_themes = theme_repo.get_active_themes()
+                active_themes = await theme_repo.aread(theme_repo.get_active_themes)
                 
                 if not active_themes:
                     logger.error("[X] Aktif tema bulunamadı")
@@ -770,7 +773,7 @@ class ChallengeHubService:
                 logger.info(f"[i] Random tema seçildi: {theme_name}")
             
             # 2. Random proje seç (tema bazlı)
-            project = self.project_repo.get_random_project(theme_name)
+            project = await self.project_repo.aread(self.project_repo.get_random_project, theme_name)
             if not project:
                 logger.error(f"[X] Tema için proje bulunamadı: {theme_name}")
                 raise ValueError(f"Tema için proje bulunamadı: {theme_name}")
@@ -815,7 +818,7 @@ class ChallengeHubService:
                 raise
 
             # 5. Katılımcıları ve owner'ı kanala ekle (önce kullanıcıları ekle, sonra topic ayarla)
-            participants = self.participant_repo.get_team_members(challenge_id)
+            participants = await self.participant_repo.aread(self.participant_repo.get_team_members, challenge_id)
             user_ids = [p["user_id"] for p in participants]
             
             # Owner'ı ekle (creator_id)
@@ -834,9 +837,8 @@ class ChallengeHubService:
 
             # 6. Kanal topic ve purpose'unu ayarla (kullanıcılar davet edildikten sonra - kanal hazır olacak)
             try:
-                import time
                 # Kısa bir gecikme ekle (kanalın tam olarak hazır olması için)
-                time.sleep(1)
+                await asyncio.sleep(1)
                 
                 topic_text = f"Challenge: {project.get('name', 'Proje')} | Süre: {deadline_hours} saat | ⚠️ Lütfen kanala başka kişileri davet etmeyin"
                 purpose_text = f"Challenge kanalı - {theme_name} teması | Takım: {challenge['team_size'] + 1} kişi | Bu kanal sadece challenge takımı için oluşturulmuştur. Lütfen kanala başka kişileri davet etmeyin."
@@ -869,7 +871,7 @@ class ChallengeHubService:
                 "deadline": deadline.isoformat()
             }
             
-            self.hub_repo.update(challenge_id, update_data)
+            await self.hub_repo.aupdate(challenge_id, update_data)
             logger.info(f"[+] Challenge güncellendi: {challenge_id}")
 
             # 7.1. Duyuru kanalında challenge özeti/canvas mesajını oluştur veya güncelle
@@ -903,8 +905,7 @@ class ChallengeHubService:
 
             # 10. Challenge başlatıldıktan sonra hemen yetkisiz kullanıcı kontrolü yap
             try:
-                import time
-                time.sleep(5)  # Kullanıcıların kanala eklenmesi ve Slack'in senkronize olması için bekleme
+                await asyncio.sleep(5)  # Kullanıcıların kanala eklenmesi ve Slack'in senkronize olması için bekleme
                 self.monitor_challenge_channels()
                 logger.info(f"[+] Challenge kanalı kontrol edildi: {challenge_channel_id}")
             except Exception as e:
@@ -916,7 +917,7 @@ class ChallengeHubService:
             logger.error(f"[X] ChallengeHubService._start_challenge hatası: {e}", exc_info=True)
             # Hata durumunda challenge durumunu "failed" olarak işaretle
             try:
-                self.hub_repo.update(challenge_id, {"status": "failed"})
+                await self.hub_repo.aupdate(challenge_id, {"status": "failed"})
             except:
                 pass
             raise
@@ -1105,20 +1106,21 @@ class ChallengeHubService:
             
             # Tüm katılımcıların istatistiklerini güncelle (creator + participants)
             try:
+                deltas = {}
                 # Creator'ı ekle
                 creator_id = challenge.get("creator_id")
                 if creator_id:
-                    self.stats_repo.increment_completed(creator_id)
-                    logger.debug(f"[i] Creator istatistiği güncellendi: {creator_id}")
+                    deltas[creator_id] = {"completed": 1}
                 
                 # Tüm katılımcıları ekle
                 participants = self.participant_repo.get_team_members(challenge_id)
                 for participant in participants:
                     user_id = participant.get("user_id")
                     if user_id:
-                        self.stats_repo.increment_completed(user_id)
-                        logger.debug(f"[i] Katılımcı istatistiği güncellendi: {user_id}")
+                        deltas.setdefault(user_id, {"completed": 0})["completed"] += 1
                 
+                # Tek upsert ifadesiyle toplu güncelle
+                self.stats_repo.apply_deltas(deltas)
                 logger.info(f"[+] {len(participants) + (1 if creator_id else 0)} kullanıcının istatistiği güncellendi | Challenge: {challenge_id}")
             except Exception as e:
                 logger.warning(f"[!] İstatistik güncelleme hatası: {e}")
@@ -1,11 +1,72 @@
 import os
+import asyncio
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import pandas as pd
 from docx import Document
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, NamedTuple, Optional
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from pypdf import PdfReader
 from src.core.logger import logger
 from src.clients import VectorClient, GroqClient
+from src.clients.kb_manifest import KnowledgeManifest
+
+SUPPORTED_EXTENSIONS = (".pdf", ".txt", ".md", ".docx", ".csv", ".xlsx", ".xls")
+CHUNK_SIZE = 1200  # Daha büyük chunk'lar için artırıldı
+CHUNK_OVERLAP = 200  # Overlap de artırıldı
+
+
+def extract_text(file_path: str) -> str:
+    """Desteklenen bir dökümanın düz metnini çıkarır (tablolarda her satır bir metin satırı olur)."""
+    # PDF İşleme
+    if file_path.endswith(".pdf"):
+        reader = PdfReader(file_path)
+        return "".join(page.extract_text() + "\n" for page in reader.pages)
+
+    # TXT ve Markdown İşleme
+    if file_path.endswith((".txt", ".md")):
+        with open(file_path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    # DOCX (Word) İşleme
+    if file_path.endswith(".docx"):
+        doc = Document(file_path)
+        return "\n".join([para.text for para in doc.paragraphs])
+
+    # Excel ve CSV İşleme (Tablosal)
+    if file_path.endswith((".csv", ".xlsx", ".xls")):
+        df = pd.read_csv(file_path) if file_path.endswith(".csv") else pd.read_excel(file_path)
+        # Her satırı bir metin parçasına dönüştür
+        rows_text = []
+        for idx, row in df.iterrows():
+            row_str = ", ".join([f"{col}: {row[col]}" for col in df.columns])
+            rows_text.append(row_str)
+        return "\n".join(rows_text)
+
+    return ""
+
+
+class IngestProgress(NamedTuple):
+    """İndeksleme ilerlemesi (progress callback'ine verilir)."""
+    files_done: int
+    files_total: int
+    chunks_embedded: int
+
+
+def parse_and_split(file_path: str, chunk_size: int = CHUNK_SIZE, chunk_overlap: int = CHUNK_OVERLAP) -> List[str]:
+    """Dökümanı ayrıştırıp parçalara böler; ProcessPoolExecutor işçisinde çalışır."""
+    text = extract_text(file_path)
+    if not text.strip():
+        return []
+    return _splitter(chunk_size, chunk_overlap).split_text(text)
+
+
+@lru_cache(maxsize=4)
+def _splitter(chunk_size: int, chunk_overlap: int) -> RecursiveCharacterTextSplitter:
+    # İşçi süreç başına bir kez kurulur
+    return RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+
 
 class KnowledgeService:
     """
@@ -13,71 +74,152 @@ class KnowledgeService:
     Tamamen ücretsiz ve limit-free yapıdadır.
     """
 
-    def __init__(self, vector_client: VectorClient, groq_client: GroqClient):
+    def __init__(
+        self,
+        vector_client: VectorClient,
+        groq_client: GroqClient,
+        parse_workers: int = 0,
+        embed_batch_size: int = 256,
+        queue_size: int = 8,
+    ):
         self.vector = vector_client
         self.groq = groq_client
-        self.splitter = RecursiveCharacterTextSplitter(
-            chunk_size=1200,  # Daha büyük chunk'lar için artırıldı
-            chunk_overlap=200  # Overlap de artırıldı
-        )
+        # 0 = CPU sayısı kadar ayrıştırma süreci
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.embed_batch_size = embed_batch_size
+        self.queue_size = queue_size
+        # Aynı anda tek indeksleme (manifest ve parça deposu tek yazıcı varsayar)
+        self._ingest_lock = threading.Lock()
+
+    @property
+    def is_indexing(self) -> bool:
+        return self._ingest_lock.locked()
+
+    async def process_knowledge_base(
+        self,
+        folder_path: str = "knowledge_base",
+        force: bool = False,
+        progress: Optional[Callable[[IngestProgress], None]] = None,
+    ):
+        """
+        Klasördeki dökümanları indeksle eşitler. Manifest sayesinde yalnızca yeni veya içeriği
+        değişmiş dosyalar okunup gömülür, silinen dosyaların parçaları indeksten çıkarılır;
+        değişmeyen dosyalar hiç okunmaz. `force=True` indeksi boşaltıp her şeyi yeniden işler.
 
-    async def process_knowledge_base(self, folder_path: str = "knowledge_base"):
-        """Belirtilen klasördeki dökümanları okur ve indekse ekler."""
+        Değişen dosyalar ProcessPoolExecutor'da ayrıştırılıp parçalanır ve sınırlı bir kuyruğa
+        konur; gömmeler kuyruktan gelen parçalar `embed_batch_size`'lık partiler hâlinde
+        ayrıştırmayla eş zamanlı hesaplanır. Her dosya bittiğinde `progress` çağrılır.
+        """
         if not os.path.exists(folder_path):
             os.makedirs(folder_path)
             logger.warning(f"[!] {folder_path} bulunamadı, boş bir tane oluşturuldu.")
             return
 
-        all_texts = []
-        all_metadata = []
+        with self._ingest_lock:
+            await self._sync_knowledge_base(folder_path, force, progress)
 
-        for filename in os.listdir(folder_path):
-            file_path = os.path.join(folder_path, filename)
-            text = ""
-            
-            try:
-                # PDF İşleme
-                if filename.endswith(".pdf"):
-                    reader = PdfReader(file_path)
-                    for page in reader.pages:
-                        text += page.extract_text() + "\n"
-                
-                # TXT ve Markdown İşleme
-                elif filename.endswith((".txt", ".md")):
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        text = f.read()
-
-                # DOCX (Word) İşleme
-                elif filename.endswith(".docx"):
-                    doc = Document(file_path)
-                    text = "\n".join([para.text for para in doc.paragraphs])
-
-                # Excel ve CSV İşleme (Tablosal)
-                elif filename.endswith((".csv", ".xlsx", ".xls")):
-                    if filename.endswith(".csv"):
-                        df = pd.read_csv(file_path)
-                    else:
-                        df = pd.read_excel(file_path)
-                    
-                    # Her satırı bir metin parçasına dönüştür
-                    rows_text = []
-                    for idx, row in df.iterrows():
-                        row_str = ", ".join([f"{col}: {row[col]}" for col in df.columns])
-                        rows_text.append(row_str)
-                    text = "\n".join(rows_text)
-                
-                if text.strip():
-                    chunks = self.splitter.split_text(text)
-                    all_texts.extend(chunks)
-                    all_metadata.extend([{"source": filename}] * len(chunks))
+    async def _sync_knowledge_base(
+        self,
+        folder_path: str,
+        force: bool,
+        progress: Optional[Callable[[IngestProgress], None]],
+    ):
+        manifest = KnowledgeManifest(f"{self.vector.index_path}.manifest.json")
+        manifest.load()
+        if force:
+            self.vector.clear()
+            manifest.files = {}
+
+        filenames = sorted(
+            filename for filename in os.listdir(folder_path)
+            if filename.endswith(SUPPORTED_EXTENSIONS) and os.path.isfile(os.path.join(folder_path, filename))
+        )
+        plan = manifest.plan(folder_path, filenames)
+
+        stale_ids = manifest.orphans(self.vector.documents.live_ids())
+        for filename in plan.removed:
+            stale_ids.extend(manifest.forget(filename))
+            logger.info(f"[-] Kaldırıldı: {filename}")
+
+        parsed = {}  # dosya -> (durum, eklenen parça id'leri)
+        pending = []  # gömülmeyi bekleyen (dosya, parça) çiftleri
+        files_done = 0
+        chunks_embedded = 0
+
+        async def embed(batch):
+            nonlocal chunks_embedded
+            texts = [chunk for _, chunk in batch]
+            # Model çağrısı thread'de: bu sırada kuyruk ayrıştırılan dosyalarla dolmaya devam eder
+            embeddings = await asyncio.to_thread(self.vector.encode, texts)
+            ids = self.vector.add_embeddings(texts, [{"source": filename} for filename, _ in batch], embeddings, save=False)
+            for (filename, _), chunk_id in zip(batch, ids):
+                parsed[filename][1].append(chunk_id)
+            chunks_embedded += len(batch)
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        producer = asyncio.create_task(self._parse_files(folder_path, plan.changed, queue))
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    break
+                filename, state, chunks = item
+                files_done += 1
+                if chunks is not None:
+                    stale_ids.extend(manifest.forget(filename))
+                    parsed[filename] = (state, [])
+                    pending.extend((filename, chunk) for chunk in chunks)
                     logger.info(f"[+] İşlendi: {filename} ({len(chunks)} parça)")
 
-            except Exception as e:
-                logger.error(f"[X] {filename} işlenirken hata: {e}")
+                while len(pending) >= self.embed_batch_size:
+                    batch, pending = pending[:self.embed_batch_size], pending[self.embed_batch_size:]
+                    await embed(batch)
+                if progress:
+                    progress(IngestProgress(files_done, len(plan.changed), chunks_embedded))
+            if pending:
+                await embed(pending)
+        finally:
+            producer.cancel()
+
+        self.vector.remove_ids(stale_ids)
+        self.vector.save_index()
+        for filename, (state, chunk_ids) in parsed.items():
+            manifest.record(filename, state, chunk_ids)
+        manifest.save()
+
+        if progress and plan.changed:
+            progress(IngestProgress(files_done, len(plan.changed), chunks_embedded))
+        logger.info(
+            f"[!] Bilgi Küpü güncellendi: {len(parsed)} dosya işlendi ({chunks_embedded} parça), "
+            f"{len(plan.removed)} dosya kaldırıldı, {plan.unchanged} dosya değişmedi."
+        )
+
+    async def _parse_files(self, folder_path: str, changed: Dict[str, Any], queue: asyncio.Queue):
+        """
+        Dosyaları süreç havuzunda ayrıştırıp (dosya, durum, parçalar) olarak kuyruğa koyar; hata
+        alan dosya için parçalar None'dır. En fazla `parse_workers` dosya aynı anda ayrıştırılır
+        ve kuyruk doluyken yeni dosyaya geçilmez, böylece bellekte bekleyen parça sayısı sınırlı kalır.
+        """
+        if not changed:
+            await queue.put(None)
+            return
+
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(self.parse_workers)
+
+        async def parse(filename, state):
+            async with slots:
+                try:
+                    chunks = await loop.run_in_executor(pool, parse_and_split, os.path.join(folder_path, filename))
+                except Exception as e:
+                    # Eski parçalar korunur; dosya bir sonraki taramada yeniden denenir
+                    logger.error(f"[X] {filename} işlenirken hata: {e}")
+                    chunks = None
+                await queue.put((filename, state, chunks))
 
-        if all_texts:
-            self.vector.add_texts(all_texts, all_metadata)
-            logger.info(f"[!] {len(all_texts)} parça ile Bilgi Küpü güncellendi.")
+        with ProcessPoolExecutor(max_workers=min(self.parse_workers, len(changed))) as pool:
+            await asyncio.gather(*(parse(filename, state) for filename, state in changed.items()))
+        await queue.put(None)
 
     async def ask_question(self, question: str, user_id: str = "unknown") -> str:
         """Kullanıcının sorusunu dökümanlara göre yanıtlar."""
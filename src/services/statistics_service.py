@@ -2,17 +2,32 @@
 Admin istatistik servisi.
 """
 
+from datetime import datetime, timedelta
 from typing import Dict, Any
 from src.core.logger import logger
+from src.core.transaction import transaction
 from src.repositories import (
     UserRepository,
     MatchRepository,
     HelpRepository,
     FeedbackRepository,
     PollRepository,
-    VoteRepository
+    VoteRepository,
+    StatsSnapshotRepository
 )
 
+# Haftalık trendlerde geriye dönük bakılan hafta sayısı
+TREND_WEEKS = 4
+# Rollup tablosundan çizilen trendlerin uzunlukları
+TREND_DAYS = 14
+RESOLVED_TREND_WEEKS = 8
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+def _trend_start() -> datetime:
+    """Haftalık trendlerin başlangıcı (UTC; created_at CURRENT_TIMESTAMP ile yazılır)."""
+    return datetime.utcnow() - timedelta(weeks=TREND_WEEKS)
+
 
 class StatisticsService:
     """
@@ -26,7 +41,8 @@ class StatisticsService:
         help_repo: HelpRepository,
         feedback_repo: FeedbackRepository,
         poll_repo: PollRepository,
-        vote_repo: VoteRepository
+        vote_repo: VoteRepository,
+        snapshot_repo: StatsSnapshotRepository = None
     ):
         self.user_repo = user_repo
         self.match_repo = match_repo
@@ -34,22 +50,27 @@ class StatisticsService:
         self.feedback_repo = feedback_repo
         self.poll_repo = poll_repo
         self.vote_repo = vote_repo
+        self.snapshot_repo = snapshot_repo
     
     def get_all_statistics(self) -> Dict[str, Any]:
         """
         Tüm istatistikleri toplar ve döndürür.
+        Sayımlar veritabanında GROUP BY ile yapılır (tablolar belleğe okunmaz); tüm sorgular
+        tek bağlantıda, tutarlı bir okuma anlık görüntüsü (snapshot) üzerinde çalışır.
         
         Returns:
             Dict with all statistics
         """
         try:
-            stats = {
-                "users": self._get_user_statistics(),
-                "matches": self._get_match_statistics(),
-                "help_requests": self._get_help_statistics(),
-                "feedbacks": self._get_feedback_statistics(),
-                "polls": self._get_poll_statistics()
-            }
+            with transaction(self.user_repo.db_client, immediate=False):
+                stats = {
+                    "users": self._get_user_statistics(),
+                    "matches": self._get_match_statistics(),
+                    "help_requests": self._get_help_statistics(),
+                    "feedbacks": self._get_feedback_statistics(),
+                    "polls": self._get_poll_statistics(),
+                    "trends": self._get_trends()
+                }
             logger.info("[+] İstatistikler toplandı")
             return stats
         except Exception as e:
@@ -59,36 +80,27 @@ class StatisticsService:
     def _get_user_statistics(self) -> Dict[str, Any]:
         """Kullanıcı istatistiklerini getirir."""
         try:
-            all_users = self.user_repo.list()
-            total_users = len(all_users)
-            
             # Cohort bazlı dağılım
-            cohort_distribution = {}
-            for user in all_users:
-                cohort = user.get("cohort", "Belirtilmemiş")
-                cohort_distribution[cohort] = cohort_distribution.get(cohort, 0) + 1
+            cohort_distribution = self.user_repo.count_by("cohort")
             
             return {
-                "total": total_users,
-                "cohort_distribution": cohort_distribution
+                "total": sum(cohort_distribution.values()),
+                "cohort_distribution": cohort_distribution,
+                "weekly_new": self.user_repo.count_by_period("week", since=_trend_start())
             }
         except Exception as e:
             logger.error(f"[X] User statistics hatası: {e}")
-            return {"total": 0, "cohort_distribution": {}}
+            return {"total": 0, "cohort_distribution": {}, "weekly_new": {}}
     
     def _get_match_statistics(self) -> Dict[str, Any]:
         """Kahve eşleşme istatistiklerini getirir."""
         try:
-            all_matches = self.match_repo.list()
-            total_matches = len(all_matches)
-            
-            active_matches = len([m for m in all_matches if m.get("status") == "active"])
-            closed_matches = len([m for m in all_matches if m.get("status") == "closed"])
+            by_status = self.match_repo.count_by("status")
             
             return {
-                "total": total_matches,
-                "active": active_matches,
-                "closed": closed_matches
+                "total": sum(by_status.values()),
+                "active": by_status.get("active", 0),
+                "closed": by_status.get("closed", 0)
             }
         except Exception as e:
             logger.error(f"[X] Match statistics hatası: {e}")
@@ -97,39 +109,28 @@ class StatisticsService:
     def _get_help_statistics(self) -> Dict[str, Any]:
         """Yardım isteği istatistiklerini getirir."""
         try:
-            all_help = self.help_repo.list()
-            total_help = len(all_help)
-            
-            open_help = len([h for h in all_help if h.get("status") == "open"])
-            in_progress_help = len([h for h in all_help if h.get("status") == "in_progress"])
-            resolved_help = len([h for h in all_help if h.get("status") == "resolved"])
-            closed_help = len([h for h in all_help if h.get("status") == "closed"])
+            by_status = self.help_repo.count_by("status")
             
             return {
-                "total": total_help,
-                "open": open_help,
-                "in_progress": in_progress_help,
-                "resolved": resolved_help,
-                "closed": closed_help
+                "total": sum(by_status.values()),
+                "open": by_status.get("open", 0),
+                "in_progress": by_status.get("in_progress", 0),
+                "resolved": by_status.get("resolved", 0),
+                "closed": by_status.get("closed", 0),
+                "weekly_new": self.help_repo.count_by_period("week", since=_trend_start())
             }
         except Exception as e:
             logger.error(f"[X] Help statistics hatası: {e}")
-            return {"total": 0, "open": 0, "in_progress": 0, "resolved": 0, "closed": 0}
+            return {"total": 0, "open": 0, "in_progress": 0, "resolved": 0, "closed": 0, "weekly_new": {}}
     
     def _get_feedback_statistics(self) -> Dict[str, Any]:
         """Geri bildirim istatistiklerini getirir."""
         try:
-            all_feedbacks = self.feedback_repo.list()
-            total_feedbacks = len(all_feedbacks)
-            
             # Kategori bazlı dağılım
-            category_distribution = {}
-            for feedback in all_feedbacks:
-                category = feedback.get("category", "general")
-                category_distribution[category] = category_distribution.get(category, 0) + 1
+            category_distribution = self.feedback_repo.count_by("category")
             
             return {
-                "total": total_feedbacks,
+                "total": sum(category_distribution.values()),
                 "category_distribution": category_distribution
             }
         except Exception as e:
@@ -139,26 +140,75 @@ class StatisticsService:
     def _get_poll_statistics(self) -> Dict[str, Any]:
         """Oylama istatistiklerini getirir."""
         try:
-            all_polls = self.poll_repo.list()
-            total_polls = len(all_polls)
-            
-            open_polls = len([p for p in all_polls if p.get("is_closed", 0) == 0])
-            closed_polls = len([p for p in all_polls if p.get("is_closed", 0) == 1])
-            
-            # Toplam oy sayısı
-            all_votes = self.vote_repo.list()
-            total_votes = len(all_votes)
+            by_closed = self.poll_repo.count_by("is_closed")
             
             return {
-                "total": total_polls,
-                "open": open_polls,
-                "closed": closed_polls,
-                "total_votes": total_votes
+                "total": sum(by_closed.values()),
+                "open": by_closed.get(0, 0),
+                "closed": by_closed.get(1, 0),
+                "total_votes": self.vote_repo.count_where()
             }
         except Exception as e:
             logger.error(f"[X] Poll statistics hatası: {e}")
             return {"total": 0, "open": 0, "closed": 0, "total_votes": 0}
     
+    def refresh_snapshots(self, granularities: tuple = ("hour", "day")) -> Dict[str, Any]:
+        """
+        Rollup tablosunu artımlı olarak günceller (saatlik cron görevi).
+        Her çalıştırma yalnızca son işlenen bucket'tan itibaren yeni satırları tarar.
+        """
+        if not self.snapshot_repo:
+            return {}
+        result = {}
+        for granularity in granularities:
+            try:
+                result[granularity] = self.snapshot_repo.rollup(granularity)
+            except Exception as e:
+                logger.error(f"[X] İstatistik rollup hatası ({granularity}): {e}", exc_info=True)
+        logger.info(f"[+] İstatistik rollup güncellendi: {result}")
+        return result
+
+    def _get_trends(self) -> Dict[str, Any]:
+        """
+        Trendleri rollup tablosundan okur (geçmiş tablolar taranmaz, bucket sayısı kadar satır):
+        günlük yeni eşleşmeler, haftalık çözülen yardım istekleri ve cohort bazında challenge başarı oranı.
+        """
+        if not self.snapshot_repo:
+            return {}
+        try:
+            now = datetime.utcnow()
+            days = [now - timedelta(days=i) for i in range(TREND_DAYS - 1, -1, -1)]
+            matches = self.snapshot_repo.series("day", "matches_created", days[0])
+            daily_matches = {
+                day.strftime("%Y-%m-%d"): matches.get(day.strftime("%Y-%m-%d"), 0) for day in days
+            }
+
+            weekly_resolved: Dict[str, int] = {}
+            resolved = self.snapshot_repo.series("day", "help_resolved", now - timedelta(weeks=RESOLVED_TREND_WEEKS))
+            for bucket, value in resolved.items():
+                week = datetime.strptime(bucket, "%Y-%m-%d").strftime("%Y-W%W")
+                weekly_resolved[week] = weekly_resolved.get(week, 0) + value
+
+            success = self.snapshot_repo.totals_by_dimension("day", "challenge_success")
+            failed = self.snapshot_repo.totals_by_dimension("day", "challenge_failed")
+            completion_by_cohort = {}
+            for cohort in sorted(set(success) | set(failed)):
+                total = success.get(cohort, 0) + failed.get(cohort, 0)
+                completion_by_cohort[cohort or "Belirtilmemiş"] = {
+                    "success": success.get(cohort, 0),
+                    "total": total,
+                    "rate": round(success.get(cohort, 0) / total, 3) if total else 0.0,
+                }
+
+            return {
+                "daily_matches": daily_matches,
+                "weekly_help_resolved": weekly_resolved,
+                "completion_by_cohort": completion_by_cohort,
+            }
+        except Exception as e:
+            logger.error(f"[X] Trend statistics hatası: {e}")
+            return {}
+
     def format_statistics_report(self, stats: Dict[str, Any]) -> str:
         """
         İstatistikleri formatlanmış bir rapor olarak döndürür.
@@ -183,6 +233,7 @@ class StatisticsService:
             report += f"   • Cohort Dağılımı:\n"
             for cohort, count in sorted(cohort_dist.items(), key=lambda x: x[1], reverse=True):
                 report += f"     - {cohort}: {count} kişi\n"
+        report += _format_weekly(users.get("weekly_new", {}), "yeni kullanıcı")
         report += "\n"
         
         # Eşleşme İstatistikleri
@@ -201,6 +252,7 @@ class StatisticsService:
         report += f"   • Devam Eden: {help_req.get('in_progress', 0)} istek\n"
         report += f"   • Çözülen: {help_req.get('resolved', 0)} istek\n"
         report += f"   • Kapatılan: {help_req.get('closed', 0)} istek\n"
+        report += _format_weekly(help_req.get("weekly_new", {}), "yeni istek")
         report += "\n"
         
         # Geri Bildirimler
@@ -223,3 +275,48 @@ class StatisticsService:
         report += f"   • Toplam Oy: {polls.get('total_votes', 0)} oy\n"
         
         return report
+
+    def format_trends_report(self, trends: Dict[str, Any]) -> str:
+        """
+        Rollup tablosundan gelen trendleri rapor bölümü olarak döndürür (trend yoksa boş).
+        
+        Args:
+            trends: get_all_statistics()["trends"]
+        """
+        if not trends:
+            return ""
+        
+        report = "\n📈 *Trendler:*\n"
+        daily = trends.get("daily_matches", {})
+        if daily:
+            values = list(daily.values())
+            report += (
+                f"   • Günlük Yeni Eşleşme (son {len(values)} gün): "
+                f"`{_sparkline(values)}` toplam {sum(values)}, bugün {values[-1]}\n"
+            )
+        weekly = trends.get("weekly_help_resolved", {})
+        if weekly:
+            weeks = ", ".join(f"{week}: {count}" for week, count in weekly.items())
+            report += f"   • Haftalık Çözülen Yardım İsteği: {weeks}\n"
+        completion = trends.get("completion_by_cohort", {})
+        if completion:
+            report += f"   • Cohort Bazında Challenge Başarı Oranı:\n"
+            for cohort, c in sorted(completion.items(), key=lambda x: x[1]["rate"], reverse=True):
+                report += f"     - {cohort}: %{round(c['rate'] * 100)} ({c['success']}/{c['total']})\n"
+        return report
+
+
+def _format_weekly(weekly: Dict[str, int], unit: str) -> str:
+    """Haftalık sayımları rapor satırına çevirir (boşsa satır eklenmez)."""
+    if not weekly:
+        return ""
+    weeks = ", ".join(f"{week}: {count}" for week, count in weekly.items())
+    return f"   • Son {TREND_WEEKS} Hafta ({unit}): {weeks}\n"
+
+
+def _sparkline(values) -> str:
+    """Sayı dizisini tek satırlık blok grafiğe çevirir."""
+    peak = max(values) if values else 0
+    if peak <= 0:
+        return SPARK_CHARS[0] * len(values)
+    return "".join(SPARK_CHARS[round(v / peak * (len(SPARK_CHARS) - 1))] for v in values)
@@ -2,6 +2,7 @@ import json
 from typing import List, Dict, Any, Optional
 from src.core.logger import logger
 from src.core.exceptions import CemilBotError
+from src.core.transaction import transaction
 from src.commands import ChatManager
 from src.repositories import PollRepository, VoteRepository
 from src.clients import CronClient
@@ -77,42 +78,28 @@ class VotingService:
     def cast_vote(self, poll_id: str, user_id: str, option_index: int) -> Dict[str, Any]:
         """
         Kullanıcının oyunu işler. Toggle (Aç/Kapa) ve Switch (Değiştir) mantığı içerir.
-        Transaction kullanarak race condition'ları önler.
+        Okuma ve yazmalar tek bir BEGIN IMMEDIATE transaction'ında yapılır (race condition önleme):
+        repository çağrıları aynı bağlantıyı paylaşır, sonuç tek commit ile yazılır.
         """
         try:
-            poll = self.poll_repo.get(poll_id)
-            if not poll:
-                logger.warning(f"[!] Oylama bulunamadı | Oylama: {poll_id} | Kullanıcı: {user_id}")
-                return {"success": False, "message": "❌ Bu oylama bulunamadı. Lütfen geçerli bir oylama seçin."}
-            
-            if poll["is_closed"]:
-                logger.warning(f"[!] Kapalı oylamaya oy verme denemesi | Oylama: {poll_id} | Kullanıcı: {user_id}")
-                return {"success": False, "message": "⏰ Bu oylama sona ermiştir. Artık oy veremezsiniz. Sonuçları görmek için oylama mesajını kontrol edin."}
+            with transaction(self.vote_repo.db_client):
+                poll = self.poll_repo.get(poll_id)
+                if not poll:
+                    logger.warning(f"[!] Oylama bulunamadı | Oylama: {poll_id} | Kullanıcı: {user_id}")
+                    return {"success": False, "message": "❌ Bu oylama bulunamadı. Lütfen geçerli bir oylama seçin."}
+
+                if poll["is_closed"]:
+                    logger.warning(f"[!] Kapalı oylamaya oy verme denemesi | Oylama: {poll_id} | Kullanıcı: {user_id}")
+                    return {"success": False, "message": "⏰ Bu oylama sona ermiştir. Artık oy veremezsiniz. Sonuçları görmek için oylama mesajını kontrol edin."}
 
-            # Transaction içinde tüm işlemleri yap (race condition önleme)
-            with self.vote_repo.db_client.get_connection() as conn:
-                cursor = conn.cursor()
-                
                 # 1. Kullanıcı bu seçeneğe daha önce oy vermiş mi? (Toggle Mantığı)
-                cursor.execute(
-                    "SELECT COUNT(*) as count FROM votes WHERE poll_id = ? AND user_id = ? AND option_index = ?",
-                    (poll_id, user_id, option_index)
-                )
-                row = cursor.fetchone()
-                has_voted = row["count"] > 0 if row else False
-                
+                has_voted = self.vote_repo.has_user_voted(poll_id, user_id, option_index)
+
                 logger.info(f"[>] OY VERİLDİ | Kullanıcı: {user_id} | Oylama: {poll_id} | Seçenek: {option_index} | Daha önce oy vermiş: {has_voted}")
-                
+
                 if has_voted:
                     # Oyu geri al (Sil)
-                    cursor.execute(
-                        "DELETE FROM votes WHERE poll_id = ? AND user_id = ? AND option_index = ?",
-                        (poll_id, user_id, option_index)
-                    )
-                    deleted_count = cursor.rowcount
-                    conn.commit()
-                    
-                    if deleted_count > 0:
+                    if self.vote_repo.delete_vote(poll_id, user_id, option_index):
                         logger.info(f"[+] OY GERİ ALINDI | Kullanıcı: {user_id} | Oylama: {poll_id} | Seçenek: {option_index}")
                         return {"success": True, "message": "Oyunuz geri alındı."}
                     else:
@@ -121,26 +108,18 @@ class VotingService:
 
                 # 2. Çoklu oy kapalıysa, diğer oyları temizle (Switch Mantığı)
                 if not poll["allow_multiple"]:
-                    # Kullanıcının önceki tüm oylarını sil
-                    cursor.execute(
-                        "DELETE FROM votes WHERE poll_id = ? AND user_id = ?",
-                        (poll_id, user_id)
-                    )
-                    deleted_count = cursor.rowcount
-                    if deleted_count > 0:
-                        logger.info(f"[i] ÖNCEKİ OYLAR TEMİZLENDİ | Kullanıcı: {user_id} | Oylama: {poll_id} | Silinen: {deleted_count} oy")
+                    if self.vote_repo.delete_all_user_votes(poll_id, user_id):
+                        logger.info(f"[i] ÖNCEKİ OYLAR TEMİZLENDİ | Kullanıcı: {user_id} | Oylama: {poll_id}")
 
                 # 3. Yeni oyu kaydet
-                import uuid
-                vote_id = str(uuid.uuid4())
-                cursor.execute(
-                    "INSERT INTO votes (id, poll_id, user_id, option_index) VALUES (?, ?, ?, ?)",
-                    (vote_id, poll_id, user_id, option_index)
-                )
-                conn.commit()
-                
-                logger.info(f"[+] OY KAYDEDİLDİ | Kullanıcı: {user_id} | Oylama: {poll_id} | Seçenek: {option_index}")
-                return {"success": True, "message": "Oyunuz kaydedildi!"}
+                self.vote_repo.create({
+                    "poll_id": poll_id,
+                    "user_id": user_id,
+                    "option_index": option_index
+                })
+
+            logger.info(f"[+] OY KAYDEDİLDİ | Kullanıcı: {user_id} | Oylama: {poll_id} | Seçenek: {option_index}")
+            return {"success": True, "message": "Oyunuz kaydedildi!"}
 
         except Exception as e:
             logger.error(f"[X] VotingService.cast_vote hatası: {e}", exc_info=True)
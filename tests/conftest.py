@@ -7,6 +7,15 @@ import os
 import tempfile
 import shutil
 from pathlib import Path
+from src.core.logger import setup_logger
+
+# Testler çalışma ağacındaki logs/cemil_detailed.log dosyasına yazmasın
+TEST_LOG_DIR = tempfile.mkdtemp(prefix="cemil_test_logs_")
+setup_logger(log_file=os.path.join(TEST_LOG_DIR, "cemil_detailed.log"))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    shutil.rmtree(TEST_LOG_DIR, ignore_errors=True)
 
 # Test için geçici veritabanı
 @pytest.fixture
@@ -38,3 +47,22 @@ def mock_env_vars(monkeypatch):
     monkeypatch.setenv("GROQ_API_KEY", "test-groq-key")
     monkeypatch.setenv("ADMIN_CHANNEL_ID", "C123456")
     monkeypatch.setenv("SLACK_STARTUP_CHANNEL", "C123456")
+
+
+@pytest.fixture(params=["sqlite", "sqlite-format"])
+def db_driver(request):
+    """Repository testleri her sürücü için ayrı ayrı çalışır (db_driver.DRIVERS)."""
+    return request.param
+
+
+@pytest.fixture
+def db_client(temp_db, db_driver):
+    """Geçici veritabanı üzerinde taze bir DatabaseClient oluşturur (singleton sıfırlanır)."""
+    from src.core.singleton import SingletonMeta
+    from src.clients.database_client import DatabaseClient
+
+    SingletonMeta._instances.pop(DatabaseClient, None)
+    client = DatabaseClient(db_path=temp_db, pool_size=4, pool_timeout=1.0, driver=db_driver)
+    yield client
+    client.close()
+    SingletonMeta._instances.pop(DatabaseClient, None)
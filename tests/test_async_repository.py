@@ -0,0 +1,52 @@
+"""
+Async repository katmanı (AsyncBaseRepository + DatabaseExecutor) testleri.
+"""
+
+import asyncio
+import threading
+from src.repositories import ChallengeThemeRepository
+
+
+class TestAsyncBaseRepository:
+    """aget / alist / acreate / aupdate testleri."""
+
+    def test_crud_roundtrip(self, db_client):
+        """Async CRUD metodları senkron karşılıklarıyla aynı sonucu vermeli."""
+        repo = ChallengeThemeRepository(db_client)
+
+        async def scenario():
+            theme_id = await repo.acreate({"name": "Async Tema", "is_active": 1})
+            assert await repo.aupdate(theme_id, {"description": "güncel"})
+            record = await repo.aget(theme_id)
+            active = await repo.aread(repo.get_active_themes)
+            return record, active
+
+        record, active = asyncio.run(scenario())
+        assert record["description"] == "güncel"
+        assert any(t["name"] == "Async Tema" for t in active)
+
+    def test_writes_run_on_single_writer_thread(self, db_client):
+        """Yazmalar tek writer thread'inde, okumalar reader thread'lerinde çalışmalı."""
+        repo = ChallengeThemeRepository(db_client)
+        write_threads, read_threads = set(), set()
+
+        def create(i):
+            write_threads.add(threading.current_thread().name)
+            return repo.create({"name": f"Tema {i}"})
+
+        def read():
+            read_threads.add(threading.current_thread().name)
+            return repo.list()
+
+        async def scenario():
+            await asyncio.gather(
+                *(repo.awrite(create, i) for i in range(10)),
+                *(repo.aread(read) for _ in range(10)),
+            )
+
+        asyncio.run(scenario())
+        assert len(write_threads) == 1
+        assert all(name.startswith("cemil-db-writer") for name in write_threads)
+        assert all(name.startswith("cemil-db-reader") for name in read_threads)
+        assert threading.current_thread().name not in write_threads | read_threads
+        assert db_client.executor.stats()["writes"] == 10
@@ -0,0 +1,112 @@
+"""
+Çevrimiçi yedekleme, yedek rotasyonu ve geri yükleme testleri.
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+import pytest
+from src.clients.db_backup import backup_filename, list_backups, restore_backup, rotate_backups
+from src.core.exceptions import DatabaseError
+from src.repositories import UserRepository
+
+
+def _count(path: str, table: str) -> int:
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestOnlineBackup:
+    """DatabaseClient.backup"""
+
+    def test_backup_is_consistent_copy(self, db_client, tmp_path):
+        """Yedek bütünlük kontrolünden geçer ve alındığı andaki satırları içerir."""
+        repo = UserRepository(db_client)
+        repo.create_many([{"slack_id": f"U{i}", "full_name": f"Kullanıcı {i}"} for i in range(300)])
+        dest = str(tmp_path / "backups" / "copy.db")
+
+        result = db_client.backup(dest, pages_per_step=4)
+
+        assert result["steps"] > 1
+        assert not os.path.exists(dest + ".part")
+        conn = sqlite3.connect(dest)
+        assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+        conn.close()
+        assert _count(dest, "users") == repo.count_where()
+
+    def test_writes_continue_during_backup(self, db_client, tmp_path):
+        """Yedekleme sürerken yapılan yazmalar hata almaz, yedek yine tamamlanır."""
+        if db_client.driver.name != "sqlite":
+            pytest.skip("Yazmaları bloklamayan snapshot yalnızca WAL modunda (dosya tabanlı sürücü)")
+        repo = UserRepository(db_client)
+        repo.create_many([{"slack_id": f"U{i}", "full_name": "x" * 200} for i in range(500)])
+        before = repo.count_where()
+        errors = []
+        done = threading.Event()
+
+        def writer():
+            i = 0
+            while not done.is_set():
+                try:
+                    repo.create({"slack_id": f"W{i}", "full_name": "Yazıcı"})
+                except Exception as e:
+                    errors.append(e)
+                i += 1
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            dest = str(tmp_path / "live.db")
+            result = db_client.backup(dest, pages_per_step=1, step_delay=0.001)
+        finally:
+            done.set()
+            thread.join()
+
+        # WAL snapshot sayesinde araya giren commit'ler kopyayı baştan başlatmaz
+        assert errors == []
+        assert result["restarts"] == 0
+        assert _count(dest, "users") >= before
+
+
+class TestRotationAndRestore:
+    """Yedek rotasyonu ve geri yükleme"""
+
+    def test_rotate_keeps_newest(self, tmp_path):
+        """En yeni `keep` yedek kalır; başka veritabanlarının yedeklerine dokunulmaz."""
+        start = datetime(2024, 1, 1, 4, 30)
+        for day in range(5):
+            (tmp_path / backup_filename("data/cemil_bot.db", start + timedelta(days=day))).write_bytes(b"")
+        (tmp_path / "other-20240101-043000.db").write_bytes(b"")
+
+        removed = rotate_backups(str(tmp_path), "data/cemil_bot.db", keep=2)
+
+        kept = [os.path.basename(p) for p in list_backups(str(tmp_path), "data/cemil_bot.db")]
+        assert kept == ["cemil_bot-20240105-043000.db", "cemil_bot-20240104-043000.db"]
+        assert len(removed) == 3
+        assert (tmp_path / "other-20240101-043000.db").exists()
+
+    def test_restore_replaces_database(self, tmp_path):
+        """Geri yükleme yedeği hedefe yazar ve eski veritabanını kopya olarak saklar."""
+        backup_path, db_path = str(tmp_path / "backup.db"), str(tmp_path / "live.db")
+        for path, rows in ((backup_path, 3), (db_path, 1)):
+            conn = sqlite3.connect(path)
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.executemany("INSERT INTO t VALUES (?)", [(i,) for i in range(rows)])
+            conn.commit()
+            conn.close()
+
+        result = restore_backup(backup_path, db_path)
+
+        assert _count(db_path, "t") == 3
+        assert _count(result["safety_copy"], "t") == 1
+
+    def test_restore_rejects_invalid_backup(self, tmp_path):
+        """Veritabanı olmayan dosya geri yüklenmez."""
+        bogus = tmp_path / "bogus.db"
+        bogus.write_bytes(b"bu bir sqlite dosyasi degil" * 100)
+        with pytest.raises(DatabaseError):
+            restore_backup(str(bogus), str(tmp_path / "live.db"))
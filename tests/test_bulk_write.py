@@ -0,0 +1,167 @@
+"""
+BaseRepository toplu yazma (create_many / upsert_many) ve istatistik sayaç testleri.
+"""
+
+import csv
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from src.repositories import UserRepository, ChallengeThemeRepository, UserChallengeStatsRepository
+from src.repositories.user_repository import parse_birthday
+from src.core.transaction import transaction
+
+
+class TestBulkWrite:
+    """create_many, upsert_many ve CSV import testleri."""
+
+    def test_create_many_returns_ids_in_order(self, db_client):
+        """Parçalar halinde eklenen tüm kayıtların id'leri sırayla dönmeli."""
+        repo = UserRepository(db_client)
+        rows = [{"slack_id": f"UB{i:04d}", "full_name": f"Kişi {i}"} for i in range(25)]
+
+        ids = repo.create_many(rows, chunk_size=10)
+
+        assert len(ids) == 25
+        assert repo.get(ids[7])["slack_id"] == "UB0007"
+
+    def test_upsert_many_updates_and_ignores(self, db_client):
+        """Çakışmada kolonlar güncellenmeli; update_columns boşsa kayıt korunmalı."""
+        repo = ChallengeThemeRepository(db_client)
+        repo.upsert_many([{"id": "theme_web_app", "name": "Web App", "description": "yeni"}])
+        assert repo.get("theme_web_app")["description"] == "yeni"
+
+        repo.upsert_many(
+            [{"id": "theme_web_app", "name": "Web App", "description": "değişmemeli"}],
+            update_columns=(),
+        )
+        assert repo.get("theme_web_app")["description"] == "yeni"
+
+    def test_seed_reports_inserted_rows(self, db_client, caplog):
+        """Seed logu yalnızca eklenen projeleri sayar (FTS trigger yazmaları sayılmaz)."""
+        with db_client.get_connection() as conn:
+            conn.execute("DELETE FROM challenge_projects WHERE id IN (SELECT id FROM challenge_projects LIMIT 2)")
+            conn.commit()
+
+        with caplog.at_level(logging.INFO, logger="CemilBot"), db_client.get_connection() as conn:
+            db_client._seed_challenge_data(conn.cursor())
+
+        assert "[+] 2 yeni proje eklendi." in caplog.messages
+
+    def test_import_from_csv_bulk(self, db_client, tmp_path):
+        """CSV import toplu eklemeli, tekrarlanan Slack ID'leri atlamalı."""
+        path = tmp_path / "users.csv"
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Cohort", "Slack ID", "First Name", "Surname", "Birthday"])
+            for i in range(1200):
+                writer.writerow(["Yapay Zeka", f"U{i:05d}", "Ad", f"Soyad{i}", "5.3.1999"])
+            writer.writerow(["Yapay Zeka", "U00001", "Tekrar", "Kayıt", ""])
+            writer.writerow(["Yapay Zeka", "", "Eksik", "Satır", ""])
+
+        repo = UserRepository(db_client)
+        assert repo.import_from_csv(str(path)) == 1200
+
+        user = repo.get_by_slack_id("U00001")
+        assert user["first_name"] == "Ad"
+        assert user["birthday"] == "1999-03-05"
+        assert len(repo.list()) == 1200
+
+        report = repo.last_import_report
+        assert report["read"] == 1202
+        assert report["rejected_duplicate"] == 1
+        assert report["rejected_missing"] == 1
+
+    def test_reimport_keeps_existing_ids(self, db_client, tmp_path):
+        """Yeniden import mevcut kullanıcıların id'lerini korumalı, CSV'de olmayanları silmeli."""
+        repo = UserRepository(db_client)
+
+        def write(rows):
+            path = tmp_path / "users.csv"
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["Cohort", "Slack ID", "First Name", "Surname", "Birthday"])
+                writer.writerows(rows)
+            return str(path)
+
+        repo.import_from_csv(write([["A", "U1", "Ada", "Bir", ""], ["A", "U2", "Can", "İki", ""]]))
+        original_id = repo.get_by_slack_id("U1")["id"]
+
+        repo.import_from_csv(write([["B", "U1", "Ada", "Bir", "31.12.2000"]]), batch_size=1)
+
+        user = repo.get_by_slack_id("U1")
+        assert user["id"] == original_id
+        assert user["cohort"] == "B"
+        assert repo.get_by_slack_id("U2") is None
+
+    def test_parse_birthday(self):
+        """DD.MM.YYYY ve D.M.YYYY kabul edilmeli, geçersiz tarihler reddedilmeli."""
+        assert parse_birthday("05.03.1999") == "1999-03-05"
+        assert parse_birthday("5.3.1999") == "1999-03-05"
+        assert parse_birthday("29.02.2001") is None
+        assert parse_birthday("1999-03-05") is None
+
+
+class TestStatsDeltas:
+    """UserChallengeStatsRepository.apply_deltas atomik sayaç testleri."""
+
+    def test_apply_deltas_creates_and_increments(self, db_client):
+        """Kaydı olmayanlar oluşturulmalı, olanlar tek ifadede artırılmalı."""
+        UserRepository(db_client).create_many([{"slack_id": f"U{i}", "full_name": "X"} for i in range(3)])
+        stats = UserChallengeStatsRepository(db_client)
+        stats.increment_total("U0")
+
+        statements = []
+        with db_client.get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+            try:
+                assert stats.apply_deltas({
+                    f"U{i}": {"points": 100, "completed": 1} for i in range(3)
+                }) == 3
+            finally:
+                conn.set_trace_callback(None)
+
+        assert sum(s.startswith("INSERT INTO user_challenge_stats") for s in statements) == 3
+        assert not any(s.startswith("SELECT") for s in statements)
+        row = stats.get_or_create("U0")
+        assert (row["total_challenges"], row["completed_challenges"], row["total_points"]) == (1, 1, 100)
+
+    def test_unknown_user_is_skipped(self, db_client):
+        """users'ta olmayan kullanıcı atlanır; diğerleri ve dıştaki transaction etkilenmez."""
+        UserRepository(db_client).create_many([{"slack_id": f"U{i}", "full_name": "X"} for i in range(2)])
+        stats = UserChallengeStatsRepository(db_client)
+
+        with transaction(db_client):
+            assert stats.apply_deltas({
+                user_id: {"points": 100, "completed": 1} for user_id in ("U0", "YOK", "U1")
+            }) == 2
+
+        assert stats.get_or_create("U1")["total_points"] == 100
+        with db_client.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM user_challenge_stats WHERE user_id = 'YOK'").fetchone()[0] == 0
+
+    def test_credit_team_with_member_missing_from_users(self, db_client):
+        """Takımdan biri users'ta yoksa diğerleri puanlanır, değerlendirme transaction'ı geri alınmaz."""
+        from src.services.challenge_evaluation_service import ChallengeEvaluationService, POINTS_PER_SUCCESS
+
+        class FakeParticipants:
+            def get_team_members(self, challenge_hub_id):
+                return [{"user_id": "U0"}, {"user_id": "U1"}]
+
+        UserRepository(db_client).create_many([{"slack_id": f"U{i}", "full_name": "X"} for i in range(2)])
+        stats = UserChallengeStatsRepository(db_client)
+        service = ChallengeEvaluationService(None, None, None, None, None, FakeParticipants(), stats, None)
+
+        with transaction(db_client):
+            service._credit_team({"id": "c1", "creator_id": "SILINMIS"})
+
+        assert stats.get_or_create("U0")["total_points"] == POINTS_PER_SUCCESS
+        assert stats.get_or_create("U1")["completed_challenges"] == 1
+
+    def test_concurrent_increments_are_not_lost(self, db_client):
+        """Eşzamanlı artışlar birbirini ezmemeli."""
+        UserRepository(db_client).create({"slack_id": "U1", "full_name": "X"})
+        stats = UserChallengeStatsRepository(db_client)
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            list(pool.map(lambda _: stats.add_points("U1", 5), range(30)))
+
+        assert stats.get_or_create("U1")["total_points"] == 150
@@ -0,0 +1,79 @@
+"""
+ChallengeHubRepository.get_dashboard ve canvas view model testleri.
+"""
+
+import pytest
+from src.repositories import (
+    UserRepository, ChallengeHubRepository, ChallengeParticipantRepository,
+    ChallengeEvaluationRepository, ChallengeEvaluatorRepository,
+)
+from src.services.challenge_evaluation_service import build_canvas_rows
+
+
+def _seed(db_client, hub_count: int):
+    users = UserRepository(db_client)
+    users.create_many([{"slack_id": f"U{i}", "full_name": f"Kişi {i}"} for i in range(12)])
+    hubs = ChallengeHubRepository(db_client)
+    participants = ChallengeParticipantRepository(db_client)
+    evaluations = ChallengeEvaluationRepository(db_client)
+    evaluators = ChallengeEvaluatorRepository(db_client)
+
+    for h in range(hub_count):
+        hub_id = hubs.create({
+            "id": f"H{h}", "creator_id": "U0", "theme": "AI", "team_size": 3,
+            "status": "evaluating" if h == 0 else "active", "hub_channel_id": "CHUB",
+        })
+        participants.create_many([
+            {"challenge_hub_id": hub_id, "user_id": f"U{i}"} for i in range(1, 4)
+        ])
+        if h == 0:
+            eval_id = evaluations.create({
+                "challenge_hub_id": hub_id, "status": "evaluating",
+                "github_repo_url": "https://github.com/x/y", "github_repo_public": 1,
+            })
+            evaluators.create_many([
+                {"evaluation_id": eval_id, "user_id": f"U{i}", "vote": vote}
+                for i, vote in ((5, "true"), (6, "true"), (7, "false"), (8, None))
+            ])
+    hubs.create({"id": "HDONE", "creator_id": "U0", "theme": "AI", "team_size": 3, "status": "completed"})
+    return hubs
+
+
+class TestChallengeDashboard:
+    """Dashboard, challenge sayısından bağımsız sabit sayıda sorguyla oluşmalı."""
+
+    def _select_count(self, db_client, hubs):
+        statements = []
+        with db_client.get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+            try:
+                dashboard = hubs.get_dashboard()
+            finally:
+                conn.set_trace_callback(None)
+        return dashboard, sum(1 for sql in statements if sql.lstrip().upper().startswith("SELECT"))
+
+    @pytest.mark.parametrize("hub_count", [1, 6])
+    def test_constant_query_count(self, db_client, hub_count):
+        dashboard, selects = self._select_count(db_client, _seed(db_client, hub_count))
+        assert len(dashboard) == hub_count
+        assert selects == 2
+
+    def test_entries_and_view_model(self, db_client):
+        dashboard = _seed(db_client, 2).get_dashboard()
+        by_id = {entry.hub["id"]: entry for entry in dashboard}
+        evaluated = by_id["H0"]
+        assert evaluated.member_ids == ["U1", "U2", "U3"]
+        assert (evaluated.true_votes, evaluated.false_votes) == (2, 1)
+        assert evaluated.evaluation["github_repo_public"] == 1
+        assert by_id["H1"].evaluation is None
+
+        rows = {row["status"]: row for row in build_canvas_rows(dashboard)}
+        assert rows["⚖️ Değerlendirme"]["votes"] == "✅2 ❌1"
+        assert rows["⚖️ Değerlendirme"]["github"] == "✅ Public"
+        assert rows["🚀 Geliştirme"]["team"].endswith("(4/4)")
+
+    def test_set_summary_message(self, db_client):
+        hubs = _seed(db_client, 3)
+        ids = [entry.hub["id"] for entry in hubs.get_dashboard()]
+        assert hubs.set_summary_message(ids, "F123", "CHUB") == 3
+        assert {hub["summary_message_ts"] for hub in hubs.get_all_active()} == {"F123"}
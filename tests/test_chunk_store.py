@@ -0,0 +1,92 @@
+"""
+Vektör parça deposu (ChunkStore) testleri.
+"""
+
+import os
+import pickle
+import threading
+from src.clients.chunk_store import ChunkStore
+
+
+class TestChunkStore:
+    """mmap'li parça deposu"""
+
+    def test_append_and_reload(self, tmp_path):
+        """Eklenen parçalar diskten yeniden açıldığında aynı sırayla okunur."""
+        store = ChunkStore(str(tmp_path / "store.chunks"))
+        store.append(["İlk parça", "Çok baytlı metin: ğüşöç 🚀"], [{"source": "a.md"}, {"source": "b.pdf"}])
+        store.append(["Üçüncü"], [{"source": "a.md"}])
+        store.close()
+
+        reopened = ChunkStore(str(tmp_path / "store.chunks"))
+        reopened.load()
+
+        assert len(reopened) == 3
+        assert reopened[1] == {"text": "Çok baytlı metin: ğüşöç 🚀", "metadata": {"source": "b.pdf"}}
+        assert reopened[2]["metadata"] == {"source": "a.md"}
+        # Aynı metadata tek kayıt olarak saklanır
+        assert len(reopened.metadata) == 2
+
+    def test_returned_documents_are_independent(self, tmp_path):
+        """Dönen sözlüğü değiştirmek depodaki metadata'yı değiştirmez."""
+        store = ChunkStore(str(tmp_path / "store.chunks"))
+        store.append(["metin"], [{"source": "a.md"}])
+
+        doc = store[0]
+        doc["metadata"]["source"] = "değişti"
+        doc["score"] = 0.1
+
+        assert store[0] == {"text": "metin", "metadata": {"source": "a.md"}}
+
+    def test_remove_keeps_ids_stable(self, tmp_path):
+        """Silinen parçalar canlı sayılmaz; diğer parçaların id'leri değişmez."""
+        store = ChunkStore(str(tmp_path / "store.chunks"))
+        store.append(["a", "b", "c"])
+        store.remove([1])
+        store.append(["d"])
+
+        assert len(store) == 4
+        assert store.live_count == 3
+        assert store.live_ids().tolist() == [0, 2, 3]
+        assert store[3]["text"] == "d"
+
+    def test_reads_during_writes(self, tmp_path):
+        """Başka thread'de ekleme/silme sürerken okumalar kapanmış eşlemeye denk gelmez."""
+        store = ChunkStore(str(tmp_path / "store.chunks"))
+        store.append(["ilk"])
+        errors = []
+        done = threading.Event()
+
+        def read():
+            while not done.is_set():
+                try:
+                    assert store[0]["text"] == "ilk"
+                except Exception as e:
+                    errors.append(e)
+
+        reader = threading.Thread(target=read)
+        reader.start()
+        try:
+            for i in range(100):
+                store.append([f"parça {i}"], [{"source": f"{i % 3}.md"}])
+                if i % 10 == 0:
+                    store.remove([len(store) - 1])
+        finally:
+            done.set()
+            reader.join()
+
+        assert errors == []
+        assert store.live_count == 91
+
+    def test_import_pickle(self, tmp_path):
+        """Eski pickle döküman listesi bir kez içe aktarılır ve pickle dosyası silinir."""
+        pkl_path = str(tmp_path / "vector_store.pkl")
+        with open(pkl_path, "wb") as f:
+            pickle.dump([{"text": "eski", "metadata": {"source": "x.txt"}}, {"text": "metadatasız", "metadata": {}}], f)
+
+        store = ChunkStore(str(tmp_path / "vector_store.chunks"))
+        assert store.import_pickle(pkl_path) == 2
+
+        assert not os.path.exists(pkl_path)
+        assert [store[i]["text"] for i in range(len(store))] == ["eski", "metadatasız"]
+        assert store[1]["metadata"] == {}
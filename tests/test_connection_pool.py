@@ -0,0 +1,171 @@
+"""
+Veritabanı bağlantı havuzu testleri.
+"""
+
+import sqlite3
+import threading
+import time
+import pytest
+from src.clients.connection_pool import ConnectionPool
+from src.core.exceptions import DatabaseError
+
+
+@pytest.fixture
+def pool(temp_db):
+    """Geçici veritabanına bağlanan küçük bir havuz."""
+    p = ConnectionPool(
+        lambda: sqlite3.connect(temp_db, check_same_thread=False),
+        max_size=2,
+        timeout=0.2,
+    )
+    yield p
+    p.close_all()
+
+
+class TestConnectionPool:
+    """ConnectionPool testleri."""
+
+    def test_connection_is_reused(self, pool):
+        """Aynı fiziksel bağlantı tekrar kullanılmalı."""
+        with pool.connection() as conn:
+            first = conn.raw
+        with pool.connection() as conn:
+            second = conn.raw
+
+        assert first is second
+        stats = pool.stats()
+        assert stats["created"] == 1
+        assert stats["reuses"] == 1
+        assert stats["idle"] == 1
+
+    def test_nested_checkout_shares_connection(self, pool):
+        """Aynı thread içinde iç içe kullanım aynı bağlantıyı paylaşmalı."""
+        with pool.connection() as outer:
+            with pool.connection() as inner:
+                assert inner.raw is outer.raw
+            assert pool.stats()["in_use"] == 1
+        assert pool.stats()["in_use"] == 0
+
+    def test_nested_exit_leaves_outer_work_to_outer_block(self, pool):
+        """İçteki blok çıkışta commit etmemeli; dıştaki blok hata alırsa dış işlem geri alınmalı."""
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+            conn.commit()
+
+        with pytest.raises(RuntimeError):
+            with pool.connection() as outer:
+                outer.execute("INSERT INTO t VALUES (1)")
+                with pool.connection() as inner:
+                    inner.execute("SELECT 1").fetchone()
+                    inner.commit()  # iç kirada etkisiz
+                raise RuntimeError("dış blokta hata")
+
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_close_returns_connection_to_pool(self, pool):
+        """close() bağlantıyı kapatmak yerine havuza iade etmeli."""
+        conn = pool.connection()
+        raw = conn.raw
+        conn.close()
+        conn.close()  # İkinci çağrı güvenli olmalı
+
+        raw.execute("SELECT 1")  # Fiziksel bağlantı hâlâ açık
+        assert pool.stats()["idle"] == 1
+
+    def test_uncommitted_work_is_rolled_back_on_release(self, pool):
+        """Commit edilmeyen işlem havuza dönerken geri alınmalı."""
+        with pool.connection() as conn:
+            conn.execute("CREATE TABLE t (x INTEGER)")
+
+        conn = pool.connection()
+        conn.execute("INSERT INTO t VALUES (1)")
+        conn.close()
+
+        with pool.connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+
+    def test_exhausted_pool_times_out(self, pool):
+        """Havuz doluyken bekleme süresi aşılırsa DatabaseError fırlatılmalı."""
+        holders_ready = threading.Barrier(3)
+        release = threading.Event()
+
+        def hold():
+            with pool.connection():
+                holders_ready.wait()
+                release.wait()
+
+        threads = [threading.Thread(target=hold) for _ in range(2)]
+        for t in threads:
+            t.start()
+        holders_ready.wait()
+
+        with pytest.raises(DatabaseError):
+            pool.connection()
+
+        release.set()
+        for t in threads:
+            t.join()
+
+        stats = pool.stats()
+        assert stats["timeouts"] == 1
+        assert stats["waits"] == 1
+
+    def test_waiter_gets_released_connection(self, pool):
+        """Bekleyen thread, iade edilen bağlantıyı almalı."""
+        pool.timeout = 2.0
+        holders_ready = threading.Barrier(3)
+
+        def hold():
+            with pool.connection():
+                holders_ready.wait()
+                time.sleep(0.05)
+
+        threads = [threading.Thread(target=hold) for _ in range(2)]
+        for t in threads:
+            t.start()
+        holders_ready.wait()
+
+        with pool.connection() as conn:
+            conn.execute("SELECT 1")
+
+        for t in threads:
+            t.join()
+        stats = pool.stats()
+        assert stats["created"] == 2
+        assert stats["waits"] == 1
+        assert stats["wait_time_max_ms"] > 0
+
+    def test_idle_connections_are_evicted(self, pool):
+        """Uzun süre boşta kalan bağlantılar kapatılmalı."""
+        pool.max_idle_seconds = 0.01
+        with pool.connection():
+            pass
+        time.sleep(0.05)
+
+        with pool.connection():
+            pass
+
+        stats = pool.stats()
+        assert stats["evicted"] == 1
+        assert stats["created"] == 2
+
+
+class TestDatabaseClientPool:
+    """DatabaseClient'ın havuz entegrasyonu."""
+
+    def test_pragmas_applied_per_physical_connection(self, db_client):
+        """Havuzdan gelen bağlantıda foreign key'ler açık olmalı."""
+        with db_client.get_connection() as conn:
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_repository_calls_reuse_connections(self, db_client):
+        """Ardışık repository çağrıları yeni bağlantı açmamalı."""
+        from src.repositories import FeedbackRepository
+
+        repo = FeedbackRepository(db_client)
+        created_before = db_client.get_pool_stats()["created"]
+        for i in range(20):
+            repo.create({"content": f"geri bildirim {i}"})
+        assert len(repo.list()) == 20
+        assert db_client.get_pool_stats()["created"] == created_before
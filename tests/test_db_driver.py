@@ -0,0 +1,83 @@
+"""
+Veritabanı sürücüsü ve SQL dialect testleri.
+"""
+
+import os
+import pytest
+from src.clients.connection_pool import ConnectionPool
+from src.clients.db_driver import (
+    PostgresDialect,
+    SQLiteDialect,
+    SQLiteFormatDriver,
+    create_driver,
+)
+
+
+class TestDialect:
+    """Dialect'lerin ürettiği SQL parçaları."""
+
+    def test_sqlite_sql_unchanged(self):
+        """SQLite dialect'i `?` yer tutucularına ve strftime'a dokunmaz."""
+        dialect = SQLiteDialect()
+        assert dialect.render("SELECT * FROM users WHERE id = ?") == "SELECT * FROM users WHERE id = ?"
+        assert dialect.time_bucket("%Y-%m-%d", "created_at") == "strftime('%Y-%m-%d', created_at)"
+
+    def test_postgres_placeholders(self):
+        """`?` -> %s; metin içindeki `?` ve `%` karakterleri korunur."""
+        sql = "SELECT * FROM t WHERE a = ? AND b LIKE '%?%' AND c = ?"
+        assert PostgresDialect().render(sql) == "SELECT * FROM t WHERE a = %s AND b LIKE '%%?%%' AND c = %s"
+
+    def test_postgres_time_bucket(self):
+        """strftime biçimi to_char'a çevrilir, sabit harfler tırnaklanır."""
+        dialect = PostgresDialect()
+        assert dialect.time_bucket("%Y-W%W", "created_at") == "to_char((created_at)::timestamp, 'YYYY-\"W\"IW')"
+        assert dialect.time_bucket("%Y-%m-%d %H:00", "t.created_at") == (
+            "to_char((t.created_at)::timestamp, 'YYYY-MM-DD HH24:00')"
+        )
+
+    def test_upsert_clause(self):
+        """Güncellenecek kolon yoksa DO NOTHING, varsa excluded değerleri yazılır."""
+        dialect = SQLiteDialect()
+        assert dialect.upsert_clause(("slack_id",), ()) == " ON CONFLICT(slack_id) DO NOTHING"
+        assert dialect.upsert_clause(("slack_id",), ("cohort",), touch_updated_at=True) == (
+            " ON CONFLICT(slack_id) DO UPDATE SET cohort = excluded.cohort, updated_at = CURRENT_TIMESTAMP"
+        )
+
+
+class TestDrivers:
+    """Sürücü oluşturma ve `format` stilli ikinci sürücü."""
+
+    def test_unknown_driver(self):
+        """Bilinmeyen sürücü adı ValueError verir."""
+        with pytest.raises(ValueError):
+            create_driver("oracle", "x.db")
+
+    def test_format_driver_is_a_file_database(self, temp_db):
+        """sqlite-format ayrı bir veritabanı dosyası kullanır; WAL ve PRAGMA profili aynıdır."""
+        driver = create_driver("sqlite-format", temp_db)
+        assert isinstance(driver, SQLiteFormatDriver) and driver.dialect.paramstyle == "format"
+        conn = driver.connect()
+        try:
+            driver.setup(conn)
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal"
+            assert conn.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        finally:
+            conn.close()
+        assert os.path.exists(temp_db)
+
+    def test_format_driver_renders_through_format_dialect(self, temp_db):
+        """Havuz SQL'i `%s` stiline çevirir, sürücünün bağlantısı sqlite3'e `?` olarak geri verir."""
+        driver = SQLiteFormatDriver(temp_db)
+        pool = ConnectionPool(driver.connect, max_size=1, render=driver.dialect.render)
+        try:
+            with pool.connection() as conn:
+                conn.execute("CREATE TABLE t (x TEXT)")
+                conn.executemany("INSERT INTO t VALUES (?)", [("%50 indirim",), ("?",)])
+                cursor = conn.cursor()
+                rows = cursor.execute("SELECT x FROM t WHERE x LIKE '%' || ? || '%' OR x = '?'", ("indirim",)).fetchall()
+                # Çeviri iki yönde de yapılmazsa '%%' tek % olarak okunurdu
+                literal = conn.execute("SELECT '%%'").fetchone()[0]
+            assert sorted(row[0] for row in rows) == ["%50 indirim", "?"]
+            assert literal == "%%"
+        finally:
+            pool.close_all()
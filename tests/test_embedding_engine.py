@@ -0,0 +1,45 @@
+"""
+Gömme motoru (uzunluğa göre kovalama + tek seferde normalizasyon) testleri.
+"""
+
+import numpy as np
+from src.clients.embedding_engine import EmbeddingEngine
+
+
+class FakeModel:
+    """Metin uzunluğunu ve ilk harfini kodlayan 2 boyutlu, normalize etmeyen model."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __iter__(self):
+        return iter([])  # modül listesi: Normalize katmanı yok
+
+    def get_sentence_embedding_dimension(self):
+        return 2
+
+    def encode(self, texts, batch_size, **kwargs):
+        self.calls.append([len(text) for text in texts])
+        return np.array([[len(text), ord(text[0])] for text in texts], dtype="float64")
+
+
+class TestEmbeddingEngine:
+    """EmbeddingEngine.encode"""
+
+    def test_buckets_by_length_and_keeps_input_order(self):
+        """Model kısa-uzun sıralı kovalarla çağrılır; çıktı girdi sırasında, birim uzunlukta float32'dir."""
+        model = FakeModel()
+        engine = EmbeddingEngine(model, batch_size=2)
+        texts = ["uzun bir metin parçası", "kısa", "orta uzunlukta", "a", "en uzun metin parçası burada"]
+
+        embeddings = engine.encode(texts)
+
+        assert model.calls == [[1, 4], [14, 22], [28]]
+        assert embeddings.dtype == np.float32 and embeddings.flags["C_CONTIGUOUS"]
+        assert np.allclose(np.linalg.norm(embeddings, axis=1), 1.0)
+        expected = np.array([[len(t), ord(t[0])] for t in texts], dtype="float32")
+        expected /= np.linalg.norm(expected, axis=1, keepdims=True)
+        assert np.allclose(embeddings, expected)
+
+    def test_empty_input(self):
+        assert EmbeddingEngine(FakeModel()).encode([]).shape == (0, 2)
@@ -0,0 +1,98 @@
+"""
+Index kaydı (index_registry) ve repository sorgu planı testleri.
+"""
+
+import re
+import pytest
+from src.core.singleton import SingletonMeta
+from src.clients.database_client import DatabaseClient
+from src.clients.index_registry import INDEXES, sync_indexes
+from src.clients.query_instrumentation import QueryInstrumentation
+from src.repositories import (
+    UserRepository, VoteRepository, HelpRepository,
+    ChallengeHubRepository, ChallengeParticipantRepository, ChallengeProjectRepository,
+    ChallengeThemeRepository, ChallengeSubmissionRepository,
+    ChallengeEvaluationRepository, ChallengeEvaluatorRepository,
+)
+
+# "SCAN users" tablo taraması; "SCAN users USING INDEX ..." ise index üzerinden taramadır
+_TABLE_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+@pytest.fixture
+def planned_db(temp_db):
+    """Her sorgunun planını kaydeden DatabaseClient."""
+    SingletonMeta._instances.pop(DatabaseClient, None)
+    client = DatabaseClient(
+        db_path=temp_db, pool_size=2,
+        instrumentation=QueryInstrumentation(slow_query_ms=0, max_slow_queries=1000),
+    )
+    client.instrumentation.reset()
+    yield client
+    client.close()
+    SingletonMeta._instances.pop(DatabaseClient, None)
+
+
+class TestIndexRegistry:
+    """Index eşitleme ve sorgu planı testleri."""
+
+    def test_sync_is_idempotent(self, db_client):
+        """Güncel veritabanında ikinci eşitleme hiçbir şey yapmamalı."""
+        with db_client.get_connection() as conn:
+            assert sync_indexes(conn) == {"created": [], "dropped": []}
+            names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {index.name for index in INDEXES} <= names
+
+    def test_obsolete_and_changed_indexes_are_replaced(self, db_client):
+        """Eskimiş index'ler kaldırılmalı, tanımı değişen index yeniden oluşturulmalı."""
+        with db_client.get_connection() as conn:
+            conn.execute("CREATE INDEX idx_votes_poll ON votes(poll_id)")
+            conn.execute("DROP INDEX idx_help_requests_status_created")
+            conn.execute("CREATE INDEX idx_help_requests_status_created ON help_requests(status)")
+            result = sync_indexes(conn)
+
+        assert "idx_votes_poll" in result["dropped"]
+        assert result["created"] == ["idx_help_requests_status_created"]
+
+    def test_repository_queries_use_indexes(self, planned_db):
+        """Sıcak repository sorgularının hiçbiri tablo taraması yapmamalı."""
+        db = planned_db
+        UserRepository(db).get_by_slack_id("U1")
+        UserRepository(db).get_users_with_birthday_today()
+        VoteRepository(db).has_user_voted("P1", "U1")
+        VoteRepository(db).has_user_voted("P1", "U1", option_index=0)
+        VoteRepository(db).delete_vote("P1", "U1", 0)
+        HelpRepository(db).get_open_requests()
+        HelpRepository(db).get_user_requests("U1")
+        HelpRepository(db).get_user_help_offers("U1")
+
+        hubs = ChallengeHubRepository(db)
+        hubs.get_active_challenge()
+        hubs.get_all_active()
+        hubs.get_dashboard()
+        hubs.get_by_channel_id("C1")
+        hubs.get_by_theme("AI")
+        participants = ChallengeParticipantRepository(db)
+        participants.get_by_challenge_and_user("H1", "U1")
+        participants.get_team_members("H1")
+        participants.get_user_active_challenges("U1")
+        ChallengeProjectRepository(db).get_by_theme("AI")
+        ChallengeThemeRepository(db).get_active_themes()
+        ChallengeSubmissionRepository(db).get_by_challenge("H1")
+
+        evaluations = ChallengeEvaluationRepository(db)
+        evaluations.get_by_challenge("H1")
+        evaluations.get_by_channel_id("C1")
+        evaluations.get_pending_evaluations()
+        evaluators = ChallengeEvaluatorRepository(db)
+        evaluators.get_by_evaluation("E1")
+        evaluators.get_by_evaluation_and_user("E1", "U1")
+
+        plans = [q for q in db.get_query_stats()["slow"] if "Repository." in q["caller"]]
+        assert len({q["caller"] for q in plans}) >= 20
+        scans = [
+            (q["caller"], step)
+            for q in plans for step in q["plan"]
+            if _TABLE_SCAN.match(step.strip())
+        ]
+        assert scans == []
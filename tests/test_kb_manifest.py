@@ -0,0 +1,50 @@
+"""
+Bilgi küpü manifesti (artımlı indeksleme planı) testleri.
+"""
+
+import os
+from src.clients.kb_manifest import KnowledgeManifest
+
+
+def _write(folder: str, name: str, content: str) -> None:
+    with open(os.path.join(folder, name), "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+class TestKnowledgeManifest:
+    """Dosya değişikliklerinin tespiti"""
+
+    def test_plan_detects_changes(self, temp_knowledge_base, tmp_path):
+        """Yeni/değişen dosyalar işlenir, dokunulmuş ama aynı içerikli dosya ve değişmeyenler atlanır."""
+        folder = temp_knowledge_base
+        for name in ("kurallar.md", "takvim.txt", "eski.txt", "sss.md"):
+            _write(folder, name, f"{name} içeriği")
+
+        manifest = KnowledgeManifest(str(tmp_path / "manifest.json"))
+        first = manifest.plan(folder, sorted(os.listdir(folder)))
+        assert sorted(first.changed) == ["eski.txt", "kurallar.md", "sss.md", "takvim.txt"]
+        for chunk_id, (name, state) in enumerate(first.changed.items()):
+            manifest.record(name, state, [chunk_id])
+        manifest.save()
+
+        _write(folder, "takvim.txt", "güncellenmiş takvim")
+        os.utime(os.path.join(folder, "sss.md"), ns=(0, 10 ** 9))  # içerik aynı, mtime farklı
+        os.remove(os.path.join(folder, "eski.txt"))
+        _write(folder, "yeni.md", "yeni döküman")
+
+        reloaded = KnowledgeManifest(str(tmp_path / "manifest.json"))
+        reloaded.load()
+        plan = reloaded.plan(folder, sorted(os.listdir(folder)))
+
+        assert sorted(plan.changed) == ["takvim.txt", "yeni.md"]
+        assert plan.removed == ["eski.txt"]
+        assert plan.unchanged == 2
+
+    def test_orphans(self, tmp_path):
+        """Hiçbir dosyaya ait olmayan canlı parçalar yeniden indekslenmek üzere döner."""
+        manifest = KnowledgeManifest(str(tmp_path / "manifest.json"))
+        manifest.files = {"a.md": {"size": 1, "mtime_ns": 1, "sha256": "x", "chunk_ids": [0, 1]}}
+
+        assert manifest.orphans([0, 1, 4, 5]) == [4, 5]
+        assert manifest.forget("a.md") == [0, 1]
+        assert manifest.forget("a.md") == []
@@ -0,0 +1,80 @@
+"""
+Bilgi küpü indeksleme hattı (süreç havuzunda ayrıştırma + partili gömme) testleri.
+"""
+
+import asyncio
+import os
+import numpy as np
+from src.clients.chunk_store import ChunkStore
+from src.services.knowledge_service import KnowledgeService, parse_and_split
+
+
+class FakeVectorClient:
+    """Gömme modeli olmadan hattı sürmek için: parçalar gerçek ChunkStore'a yazılır, vektörler sıfırdır."""
+
+    def __init__(self, index_path: str):
+        self.index_path = index_path
+        self.documents = ChunkStore(f"{index_path}.chunks")
+        self.batches = []
+
+    def encode(self, texts):
+        self.batches.append(len(texts))
+        return np.zeros((len(texts), 2), dtype="float32")
+
+    def add_embeddings(self, texts, metadata, embeddings, save=True):
+        start = len(self.documents)
+        self.documents.append(texts, metadata)
+        return list(range(start, start + len(texts)))
+
+    def remove_ids(self, ids):
+        self.documents.remove(ids)
+
+    def save_index(self):
+        pass
+
+    def clear(self):
+        self.documents.clear()
+
+
+class TestKnowledgeIngest:
+    """KnowledgeService.process_knowledge_base"""
+
+    def test_parse_and_split(self, temp_knowledge_base):
+        """Uzun döküman örtüşen parçalara bölünür; boş döküman parça üretmez."""
+        path = os.path.join(temp_knowledge_base, "uzun.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("Eğitim takvimi kuralları. " * 200)
+        open(os.path.join(temp_knowledge_base, "bos.md"), "w").close()
+
+        chunks = parse_and_split(path, chunk_size=500, chunk_overlap=50)
+        assert len(chunks) > 5
+        assert all(len(chunk) <= 500 for chunk in chunks)
+        assert parse_and_split(os.path.join(temp_knowledge_base, "bos.md")) == []
+
+    def test_pipeline_batches_and_reports_progress(self, temp_knowledge_base, tmp_path):
+        """Parçalar partiler hâlinde gömülür, her dosyada ilerleme bildirilir; ikinci tarama bir şey yapmaz."""
+        for n in range(3):
+            with open(os.path.join(temp_knowledge_base, f"doc{n}.md"), "w", encoding="utf-8") as f:
+                f.write(f"Döküman {n}. " + "Topluluk kuralları ve proje takvimi. " * 150)
+        with open(os.path.join(temp_knowledge_base, "bozuk.pdf"), "wb") as f:
+            f.write(b"pdf degil")
+
+        vector = FakeVectorClient(str(tmp_path / "vector_store"))
+        service = KnowledgeService(vector, None, parse_workers=2, embed_batch_size=4, queue_size=1)
+        reports = []
+
+        asyncio.run(service.process_knowledge_base(temp_knowledge_base, progress=reports.append))
+
+        total = vector.documents.live_count
+        assert total > 4
+        assert max(vector.batches) == 4 and sum(vector.batches) == total
+        assert reports[-1].files_done == reports[-1].files_total == 4
+        assert reports[-1].chunks_embedded == total
+        sources = {vector.documents[i]["metadata"]["source"] for i in range(total)}
+        assert sources == {"doc0.md", "doc1.md", "doc2.md"}
+
+        # Hatalı dosya manifeste yazılmaz, yalnızca o yeniden denenir
+        vector.batches.clear()
+        asyncio.run(service.process_knowledge_base(temp_knowledge_base))
+        assert vector.batches == []
+        assert vector.documents.live_count == total
@@ -0,0 +1,124 @@
+"""
+Sürümlü migration motoru testleri.
+"""
+
+import sqlite3
+import pytest
+from src.clients.migration_runner import MigrationRunner, split_sql_statements
+from src.core.exceptions import DatabaseError
+
+
+def _legacy_database(path: str):
+    """Migration motorundan önceki (department kolonlu, canvas_id'li) bir veritabanı oluşturur."""
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE users (
+            id TEXT PRIMARY KEY, slack_id TEXT UNIQUE, first_name TEXT, surname TEXT,
+            full_name TEXT, birthday TEXT, department TEXT,
+            created_at TIMESTAMP, updated_at TIMESTAMP
+        );
+        INSERT INTO users VALUES ('u1', 'U1', 'Ada', 'Lovelace', 'Ada Lovelace', '10-12', 'Yapay Zeka', NULL, NULL);
+        CREATE TABLE challenge_hubs (
+            id TEXT PRIMARY KEY, creator_id TEXT NOT NULL, theme TEXT NOT NULL,
+            team_size INTEGER NOT NULL, status TEXT DEFAULT 'recruiting', canvas_id TEXT
+        );
+        INSERT INTO challenge_hubs (id, creator_id, theme, team_size, canvas_id) VALUES ('h1', 'U1', 'Web App', 3, 'F1');
+        CREATE TABLE help_requests (
+            id TEXT PRIMARY KEY, requester_id TEXT NOT NULL, topic TEXT NOT NULL,
+            description TEXT NOT NULL, status TEXT DEFAULT 'open'
+        );
+        INSERT INTO help_requests (id, requester_id, topic, description) VALUES ('r1', 'U1', 'SQL', 'Yardım');
+    """)
+    conn.close()
+
+
+class TestMigrationRunner:
+    """MigrationRunner testleri."""
+
+    def test_fresh_database_is_at_latest_version(self, db_client):
+        """Yeni veritabanında tüm migration'lar uygulanmış olmalı."""
+        runner = MigrationRunner(db_client)
+        latest = runner.discover()[-1].version
+
+        assert runner.current_version() == latest
+        assert runner.pending() == []
+
+    def test_warm_start_runs_no_ddl(self, db_client):
+        """Güncel veritabanında run() hiçbir ifade yazmamalı."""
+        statements = []
+        with db_client.get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+            try:
+                assert MigrationRunner(db_client).run() == []
+            finally:
+                conn.set_trace_callback(None)
+
+        assert statements
+        assert all(s.lstrip().upper().startswith("SELECT") for s in statements)
+
+    def test_legacy_database_keeps_data(self, temp_db):
+        """Eski şemalı veritabanı veri kaybetmeden yükseltilmeli (eski init_db tabloları siliyordu)."""
+        from src.core.singleton import SingletonMeta
+        from src.clients.database_client import DatabaseClient
+
+        _legacy_database(temp_db)
+        SingletonMeta._instances.pop(DatabaseClient, None)
+        client = DatabaseClient(db_path=temp_db, pool_size=2)
+        try:
+            with client.get_connection() as conn:
+                user = conn.execute("SELECT cohort, middle_name FROM users WHERE slack_id = 'U1'").fetchone()
+                hub_cols = [r[1] for r in conn.execute("PRAGMA table_info(challenge_hubs)").fetchall()]
+                help_count = conn.execute("SELECT COUNT(*) FROM help_requests").fetchone()[0]
+
+            assert user["cohort"] == "Yapay Zeka"
+            assert user["middle_name"] == ""
+            assert "canvas_id" not in hub_cols
+            assert "summary_message_ts" in hub_cols
+            assert help_count == 1
+        finally:
+            client.close()
+            SingletonMeta._instances.pop(DatabaseClient, None)
+
+    def test_new_migration_applied_once(self, db_client, tmp_path):
+        """Yeni migration yalnızca bir kez uygulanmalı."""
+        (tmp_path / "001_add_table.sql").write_text(
+            "-- test\nCREATE TABLE extra (id INTEGER);\nINSERT INTO extra VALUES (1);\n"
+        )
+        runner = MigrationRunner(db_client, migrations_dir=str(tmp_path))
+
+        with db_client.get_connection() as conn:
+            conn.execute("DELETE FROM schema_version")
+            conn.commit()
+
+        assert runner.run() == [1]
+        assert runner.run() == []
+        with db_client.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM extra").fetchone()[0] == 1
+
+    def test_failed_migration_rolls_back(self, db_client, tmp_path):
+        """Hatalı migration'da hiçbir değişiklik kalıcı olmamalı."""
+        (tmp_path / "001_ok.sql").write_text("CREATE TABLE ok_table (id INTEGER);")
+        (tmp_path / "002_broken.sql").write_text("CREATE TABLE broken (;")
+        runner = MigrationRunner(db_client, migrations_dir=str(tmp_path))
+
+        with db_client.get_connection() as conn:
+            conn.execute("DELETE FROM schema_version")
+            conn.commit()
+
+        with pytest.raises(DatabaseError):
+            runner.run()
+
+        with db_client.get_connection() as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'ok_table'"
+            ).fetchone()
+            assert exists is None
+            assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_split_sql_statements(self):
+        """Yorumlar atlanmalı, çok satırlı ifadeler tek parça kalmalı."""
+        script = "-- yorum\nALTER TABLE a\nADD COLUMN b TEXT;\n\nUPDATE a SET b = 'x;y';\n"
+        assert split_sql_statements(script) == [
+            "ALTER TABLE a\nADD COLUMN b TEXT;",
+            "UPDATE a SET b = 'x;y';",
+        ]
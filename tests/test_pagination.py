@@ -0,0 +1,68 @@
+"""
+BaseRepository keyset sayfalama (page) ve akış (iter_rows) testleri.
+"""
+
+import pytest
+from src.repositories import HelpRepository, UserRepository
+
+
+@pytest.fixture
+def help_repo(db_client):
+    UserRepository(db_client).create({"slack_id": "U1", "full_name": "Kişi"})
+    repo = HelpRepository(db_client)
+    with db_client.get_connection() as conn:
+        # Aynı created_at değerleri: imleç birincil anahtarla ayrışmalı
+        conn.executemany(
+            """
+            INSERT INTO help_requests (id, requester_id, topic, description, status, created_at)
+            VALUES (?, 'U1', 'SQL', '?', ?, ?)
+            """,
+            [
+                (f"h{i:02d}", "open" if i % 3 else "resolved", f"2024-01-0{1 + i % 4} 10:00:00")
+                for i in range(23)
+            ],
+        )
+        conn.commit()
+    return repo
+
+
+class TestKeysetPagination:
+    """Sayfalar eksiksiz, tekrarsız ve sıralı olmalı."""
+
+    def _walk(self, repo, **kwargs):
+        ids, after = [], None
+        while True:
+            page = repo.page(after=after, limit=5, **kwargs)
+            assert len(page.rows) <= 5
+            ids.extend(row["id"] for row in page.rows)
+            if page.next_after is None:
+                return ids
+            after = page.next_after
+
+    @pytest.mark.parametrize("descending", [False, True])
+    def test_walks_all_rows_with_ties(self, help_repo, descending):
+        ids = self._walk(help_repo, order_by="created_at", descending=descending)
+        expected = sorted(
+            help_repo.list(), key=lambda row: (row["created_at"], row["id"]), reverse=descending
+        )
+        assert ids == [row["id"] for row in expected]
+
+    def test_filters_and_in_lists(self, help_repo):
+        assert len(self._walk(help_repo, filters={"status": "open"})) == 15
+        assert len(self._walk(help_repo, filters={"status": ["open", "resolved"]})) == 23
+
+    def test_iter_rows_streams_in_batches(self, help_repo):
+        rows = list(help_repo.iter_rows(order_by="created_at", batch_size=4))
+        assert len({row["id"] for row in rows}) == 23
+
+    def test_get_open_requests_pages(self, help_repo):
+        first = help_repo.get_open_requests(limit=10)
+        assert [row["created_at"] for row in first] == sorted((row["created_at"] for row in first), reverse=True)
+        last = first[-1]
+        rest = help_repo.get_open_requests(limit=10, after=(last["created_at"], last["id"]))
+        assert len(first) + len(rest) == 15
+        assert not {row["id"] for row in first} & {row["id"] for row in rest}
+
+    def test_rejects_unknown_order_column(self, help_repo):
+        with pytest.raises(ValueError):
+            help_repo.page(order_by="id; DROP TABLE users")
@@ -0,0 +1,75 @@
+"""
+Sorgu ölçümü (QueryInstrumentation) testleri.
+"""
+
+import pytest
+from src.core.singleton import SingletonMeta
+from src.clients.database_client import DatabaseClient
+from src.clients.query_instrumentation import QueryInstrumentation
+from src.repositories import ChallengeHubRepository, UserRepository
+
+
+@pytest.fixture
+def instrumented_db(temp_db):
+    """Sorgu ölçümü açık bir DatabaseClient (her sorgu 'yavaş' sayılır)."""
+    SingletonMeta._instances.pop(DatabaseClient, None)
+    client = DatabaseClient(
+        db_path=temp_db, pool_size=2, instrumentation=QueryInstrumentation(slow_query_ms=0)
+    )
+    client.instrumentation.reset()
+    yield client
+    client.close()
+    SingletonMeta._instances.pop(DatabaseClient, None)
+
+
+class TestQueryInstrumentation:
+    """Süre, satır, çağıran ve yavaş sorgu planı testleri."""
+
+    def test_records_caller_and_rows(self, instrumented_db):
+        """İstatistikler çağıran repository metodunu ve okunan satırları içermeli."""
+        users = UserRepository(instrumented_db)
+        for i in range(3):
+            users.create({"slack_id": f"UQ{i}", "full_name": "Test"})
+        ChallengeHubRepository(instrumented_db).get_all_active()
+        assert len(users.list()) == 3
+
+        top = {e["sql"]: e for e in instrumented_db.get_query_stats(limit=50)["top"]}
+        select_users = top["SELECT * FROM users"]
+        assert select_users["rows"] == 3
+        assert "UserRepository.list" in select_users["callers"]
+
+        insert = next(e for sql, e in top.items() if sql.startswith("INSERT INTO users"))
+        assert insert["count"] == 3
+        assert "UserRepository.create" in insert["callers"]
+        assert any(
+            caller.startswith("ChallengeHubRepository.get_all_active")
+            for e in top.values() for caller in e["callers"]
+        )
+
+    def test_slow_queries_include_query_plan(self, instrumented_db):
+        """Eşik üstü sorgular EXPLAIN QUERY PLAN çıktısıyla saklanmalı."""
+        UserRepository(instrumented_db).get_by_slack_id("U1")
+
+        slow = [q for q in instrumented_db.get_query_stats()["slow"] if "WHERE slack_id" in q["sql"]]
+        assert slow
+        assert any("INDEX" in step for step in slow[0]["plan"])
+
+    def test_executemany_plan_uses_first_parameter_set(self, instrumented_db):
+        """executemany planı partinin ilk parametre setiyle alınır; üreteç tüketilmeden çalışır."""
+        users = UserRepository(instrumented_db)
+        users.create_many([{"slack_id": f"UM{i}", "full_name": "Eski"} for i in range(3)])
+
+        with instrumented_db.get_connection() as conn:
+            conn.executemany(
+                "UPDATE users SET full_name = ? WHERE slack_id = ?",
+                (("Yeni", f"UM{i}") for i in range(3)),
+            )
+
+        assert {user["full_name"] for user in users.list()} == {"Yeni"}
+        slow = [q for q in instrumented_db.get_query_stats()["slow"] if q["sql"].startswith("UPDATE users")]
+        assert slow
+        assert any("INDEX" in step for step in slow[0]["plan"])
+
+    def test_disabled_by_default(self, db_client):
+        """Ölçüm opsiyonel olmalı."""
+        assert db_client.get_query_stats() is None
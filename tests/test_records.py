@@ -0,0 +1,48 @@
+"""
+Record satır tipi ve repository records=True okuma testleri.
+"""
+
+from src.clients.records import make_record_class
+from src.repositories import UserRepository, ChallengeHubRepository
+
+
+class TestRecord:
+    """Record, dict okuma arayüzüyle uyumlu olmalı."""
+
+    def test_dict_compatible_access(self):
+        UserRecord = make_record_class("UserRecord", ("id", "slack_id", "COUNT(*)"))
+        row = UserRecord._make(("1", "U1", 3))
+        assert row["slack_id"] == row.slack_id == "U1"
+        assert row["COUNT(*)"] == 3 and row[0] == "1"
+        assert row.get("cohort", "yok") == "yok" and "slack_id" in row
+        assert dict(row) == row.to_dict() == {"id": "1", "slack_id": "U1", "COUNT(*)": 3}
+        assert row == {"id": "1", "slack_id": "U1", "COUNT(*)": 3}
+        assert not hasattr(row, "__dict__")
+
+    def test_duplicate_columns_return_first(self):
+        JoinRecord = make_record_class("JoinRecord", ("id", "name", "id"))
+        assert JoinRecord._make(("a", "x", "b"))["id"] == "a"
+
+
+class TestRepositoryRecords:
+    """records=True aynı veriyi Record olarak döndürmeli."""
+
+    def test_list_page_and_stream(self, db_client):
+        users = UserRepository(db_client)
+        users.create_many([{"slack_id": f"U{i}", "full_name": f"Kişi {i}"} for i in range(7)])
+
+        as_dicts = users.list()
+        as_records = users.list(records=True)
+        assert as_records == as_dicts
+        assert type(as_records[0]).__name__ == "UsersRecord"
+
+        page = users.page(order_by="slack_id", limit=3, records=True)
+        assert page.next_after == (page.rows[-1].slack_id, page.rows[-1].id)
+        assert len(list(users.iter_rows(batch_size=2, records=True))) == 7
+
+    def test_get_all_active_returns_records(self, db_client):
+        UserRepository(db_client).create({"slack_id": "U1", "full_name": "Ada"})
+        hubs = ChallengeHubRepository(db_client)
+        hubs.create({"creator_id": "U1", "theme": "AI", "team_size": 2, "status": "active"})
+        (hub,) = hubs.get_all_active()
+        assert hub.get("status") == "active" and hub["creator_id"] == "U1"
@@ -0,0 +1,103 @@
+"""
+TTLCache ve repository okuma önbelleği testleri.
+"""
+
+import pytest
+from src.clients.row_cache import TTLCache, MISSING
+from src.core.transaction import transaction
+from src.repositories import UserRepository, ChallengeThemeRepository, ChallengeProjectRepository
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Süre dolumu, LRU tahliyesi ve generation kontrolü."""
+
+    def test_ttl_and_lru(self):
+        clock = FakeClock()
+        cache = TTLCache(ttl=10, max_entries=2, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1          # a en son kullanılan olur
+        cache.set("c", 3)                   # b tahliye edilir
+        assert cache.get("b") is MISSING
+        clock.now = 11
+        assert cache.get("a") is MISSING
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["evictions"], stats["expirations"]) == (1, 2, 1, 1)
+
+    def test_stale_read_is_not_stored_after_invalidation(self):
+        cache = TTLCache(ttl=10)
+        generation = cache.generation
+        cache.invalidate()                  # okuma sürerken bir yazma oldu
+        assert not cache.set("a", "eski", generation=generation)
+        assert cache.get("a") is MISSING
+
+
+class TestRepositoryCache:
+    """Sıcak okumalar SQLite'a gitmemeli, yazmalar önbelleği geçersiz kılmalı."""
+
+    def _count_selects(self, db_client, func):
+        statements = []
+        with db_client.get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+            try:
+                func()
+            finally:
+                conn.set_trace_callback(None)
+        return sum(1 for sql in statements if sql.lstrip().upper().startswith("SELECT"))
+
+    def test_get_by_slack_id_hits_cache(self, db_client):
+        users = UserRepository(db_client)
+        users.create({"slack_id": "U1", "full_name": "Ada"})
+        assert users.get_by_slack_id("U1")["full_name"] == "Ada"
+        assert self._count_selects(db_client, lambda: [users.get_by_slack_id("U1") for _ in range(5)]) == 0
+        stats = db_client.get_cache_stats()["users"]
+        assert stats["hits"] >= 5 and stats["misses"] == 1
+
+        # Dönen kopyayı değiştirmek önbelleği bozmaz
+        users.get_by_slack_id("U1")["full_name"] = "Bozuk"
+        assert users.get_by_slack_id("U1")["full_name"] == "Ada"
+
+    def test_writes_invalidate_across_instances(self, db_client):
+        UserRepository(db_client).create({"slack_id": "U1", "full_name": "Ada"})
+        reader, writer = UserRepository(db_client), UserRepository(db_client)
+        assert reader.get_by_slack_id("U1")["full_name"] == "Ada"
+        writer.update_by_slack_id("U1", {"full_name": "Ada Lovelace"})
+        assert reader.get_by_slack_id("U1")["full_name"] == "Ada Lovelace"
+
+        with pytest.raises(RuntimeError):
+            with transaction(db_client):
+                writer.update_by_slack_id("U1", {"full_name": "Geri alınacak"})
+                # Transaction içinde önbellek atlanır, kendi yazdığını görür
+                assert reader.get_by_slack_id("U1")["full_name"] == "Geri alınacak"
+                raise RuntimeError("rollback")
+        assert reader.get_by_slack_id("U1")["full_name"] == "Ada Lovelace"
+
+    def test_missing_rows_are_not_cached(self, db_client):
+        users = UserRepository(db_client)
+        assert users.get_by_slack_id("U404") is None
+        with db_client.get_connection() as conn:
+            conn.execute("INSERT INTO users (id, slack_id, full_name) VALUES ('x', 'U404', 'Yeni')")
+            conn.commit()
+        assert users.get_by_slack_id("U404")["full_name"] == "Yeni"
+
+    def test_seed_lookups_are_cached(self, db_client):
+        themes, projects = ChallengeThemeRepository(db_client), ChallengeProjectRepository(db_client)
+        theme = themes.get_active_themes()[0]["name"]
+        projects.get_by_theme(theme)
+        assert self._count_selects(
+            db_client, lambda: (themes.get_active_themes(), projects.get_random_project(theme))
+        ) == 0
+
+    def test_can_be_disabled(self, db_client):
+        db_client.row_cache.enabled = False
+        users = UserRepository(db_client)
+        users.create({"slack_id": "U1", "full_name": "Ada"})
+        assert self._count_selects(db_client, lambda: users.get_by_slack_id("U1")) == 1
@@ -0,0 +1,53 @@
+"""
+Şema metadata önbelleği testleri.
+"""
+
+from src.clients.migration_runner import MigrationRunner
+from src.repositories import HelpRepository, FeedbackRepository, UserRepository
+
+
+class TestSchemaCache:
+    """SchemaCache ve BaseRepository entegrasyonu."""
+
+    def test_metadata_loaded_at_startup(self, db_client):
+        """Açılışta tüm tablolar önbelleğe alınmalı."""
+        info = db_client.schema.table("help_requests")
+        assert "helper_id" in info.columns
+        assert info.primary_key == ("id",)
+        assert info.has_updated_at
+        assert not db_client.schema.table("feedbacks").has_updated_at
+
+    def test_update_does_not_query_table_info(self, db_client):
+        """update() her çağrıda PRAGMA table_info çalıştırmamalı; SQL metni tekrar kullanılmalı."""
+        repo = HelpRepository(db_client)
+        UserRepository(db_client).create({"slack_id": "U1", "full_name": "Test"})
+        record_id = repo.create({
+            "requester_id": "U1", "topic": "SQL", "description": "Yardım"
+        })
+
+        statements = []
+        with db_client.get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+            try:
+                for status in ("in_progress", "resolved"):
+                    assert repo.update(record_id, {"status": status})
+            finally:
+                conn.set_trace_callback(None)
+
+        assert not any("table_info" in s for s in statements)
+        assert sum("updated_at = CURRENT_TIMESTAMP" in s for s in statements) == 2
+        assert repo.get(record_id)["status"] == "resolved"
+
+    def test_migration_invalidates_cache(self, db_client, tmp_path):
+        """Migration sonrası yeni kolonlar önbellekte görünmeli."""
+        repo = FeedbackRepository(db_client)
+        repo.create({"content": "ilk"})
+        assert db_client.schema.stats()["statements"] > 0
+
+        (tmp_path / "900_feedback_updated_at.sql").write_text(
+            "ALTER TABLE feedbacks ADD COLUMN updated_at TIMESTAMP;"
+        )
+        MigrationRunner(db_client, migrations_dir=str(tmp_path)).run()
+
+        assert db_client.schema.stats() == {"tables": 0, "statements": 0}
+        assert db_client.schema.table("feedbacks").has_updated_at
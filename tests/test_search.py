@@ -0,0 +1,68 @@
+"""
+FTS5 tam metin arama (search) testleri.
+"""
+
+import pytest
+from src.repositories import UserRepository, HelpRepository, FeedbackRepository, MatchRepository, VoteRepository
+from src.repositories.base_repository import build_match_query
+
+
+@pytest.fixture
+def help_repo(db_client):
+    UserRepository(db_client).create({"slack_id": "U1", "full_name": "Ada"})
+    repo = HelpRepository(db_client)
+    repo.create({"id": "h1", "requester_id": "U1", "topic": "Pandas groupby",
+                 "description": "Gruplama sonrası sütunlar kayboluyor", "status": "open"})
+    repo.create({"id": "h2", "requester_id": "U1", "topic": "Docker ağ ayarı",
+                 "description": "Container içinden pandas ile veritabanına bağlanamıyorum", "status": "resolved"})
+    repo.create({"id": "h3", "requester_id": "U1", "topic": "Git çakışması",
+                 "description": "Merge sırasında conflict", "status": "open"})
+    return repo
+
+
+class TestSearch:
+    """Index trigger'larla senkron kalmalı, sonuçlar BM25 ile sıralanmalı."""
+
+    def test_ranking_and_snippet(self, help_repo):
+        results = help_repo.search("pandas")
+        # Konu (topic) kolonu açıklamadan daha ağır basar
+        assert [row["id"] for row in results] == ["h1", "h2"]
+        assert results[0]["score"] > results[1]["score"]
+        assert "*Pandas*" in results[0]["snippet"]
+
+    def test_prefix_diacritics_and_filters(self, help_repo):
+        assert [row["id"] for row in help_repo.search("grup")] == ["h1"]
+        assert [row["id"] for row in help_repo.search("cakış")] == ["h3"]
+        assert [row["id"] for row in help_repo.search("pandas", filters={"status": "resolved"})] == ["h2"]
+
+    def test_triggers_keep_index_in_sync(self, help_repo):
+        help_repo.update("h3", {"topic": "Rebase sorunu"})
+        assert help_repo.search("çakışması") == []
+        assert [row["id"] for row in help_repo.search("rebase")] == ["h3"]
+        help_repo.delete("h3")
+        assert help_repo.search("rebase") == []
+
+    def test_user_input_is_not_fts_syntax(self, help_repo):
+        assert build_match_query('pandas OR "docker" -x') == '"pandas"* "OR"* "docker"* "x"*'
+        assert help_repo.search('"; DROP TABLE help_requests; --') == []
+        assert help_repo.search("   ") == []
+
+    def test_repository_without_search_table(self, db_client):
+        """Tam metin index'i olmayan tabloda arama, geçersiz kolon gibi ValueError verir."""
+        with pytest.raises(ValueError):
+            VoteRepository(db_client).search("kahve")
+
+    def test_other_sources_and_rebuild(self, db_client):
+        feedbacks = FeedbackRepository(db_client)
+        feedbacks.create({"content": "Kahve eşleşmeleri harika", "category": "general"})
+        matches = MatchRepository(db_client)
+        matches.create({"summary": "İki kişi makine öğrenmesi projelerini konuştu"})
+        assert len(feedbacks.search("kahve")) == 1
+        assert len(matches.search("makine öğrenmesi")) == 1
+
+        with db_client.get_connection() as conn:
+            conn.execute("INSERT INTO feedbacks_fts(feedbacks_fts) VALUES ('delete-all')")
+            conn.commit()
+        assert feedbacks.search("kahve") == []
+        feedbacks.rebuild_search_index()
+        assert len(feedbacks.search("kahve")) == 1
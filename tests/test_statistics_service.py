@@ -0,0 +1,71 @@
+"""
+Repository sayım metodları ve StatisticsService testleri.
+"""
+
+from datetime import datetime, timedelta
+import pytest
+from src.repositories import (
+    UserRepository, MatchRepository, HelpRepository, FeedbackRepository, PollRepository, VoteRepository
+)
+from src.services.statistics_service import StatisticsService
+
+
+@pytest.fixture
+def statistics(db_client):
+    users = UserRepository(db_client)
+    users.create_many([
+        {"slack_id": f"U{i}", "full_name": f"Kişi {i}", "cohort": "Yapay Zeka" if i % 2 else None}
+        for i in range(5)
+    ])
+    help_repo = HelpRepository(db_client)
+    for status in ("open", "open", "resolved"):
+        help_repo.create({"requester_id": "U1", "topic": "SQL", "description": "?", "status": status})
+    FeedbackRepository(db_client).create({"content": "Güzel", "category": "general"})
+    return StatisticsService(
+        users, MatchRepository(db_client), help_repo,
+        FeedbackRepository(db_client), PollRepository(db_client), VoteRepository(db_client)
+    )
+
+
+class TestAggregateQueries:
+    """count_where, count_by ve count_by_period testleri."""
+
+    def test_count_by_and_count_where(self, statistics):
+        help_repo = statistics.help_repo
+        assert help_repo.count_by("status") == {"open": 2, "resolved": 1}
+        assert help_repo.count_where({"status": "open"}) == 2
+        assert statistics.user_repo.count_by("cohort") == {None: 3, "Yapay Zeka": 2}
+
+    def test_count_by_period(self, statistics):
+        today = datetime.utcnow().strftime("%Y-%m-%d")
+        assert statistics.help_repo.count_by_period("day") == {today: 3}
+        assert statistics.help_repo.count_by_period("day", since=datetime.utcnow() + timedelta(days=1)) == {}
+
+    def test_rejects_unknown_columns(self, statistics):
+        """Kolon adları SQL'e gömüldüğü için şemada olmayan kolonlar reddedilmeli."""
+        with pytest.raises(ValueError):
+            statistics.help_repo.count_by("status; DROP TABLE users")
+        with pytest.raises(ValueError):
+            statistics.help_repo.count_by_period("year")
+
+
+class TestStatisticsService:
+    """Rapor tabloları belleğe okumadan GROUP BY ile hesaplanmalı."""
+
+    def test_report_uses_aggregates(self, statistics, db_client):
+        statements = []
+        with db_client.get_connection() as conn:
+            conn.set_trace_callback(statements.append)
+            try:
+                stats = statistics.get_all_statistics()
+            finally:
+                conn.set_trace_callback(None)
+
+        assert stats["users"]["total"] == 5
+        assert stats["help_requests"]["open"] == 2
+        assert stats["help_requests"]["resolved"] == 1
+        assert sum(stats["help_requests"]["weekly_new"].values()) == 3
+        assert stats["feedbacks"]["category_distribution"] == {"general": 1}
+        assert stats["polls"] == {"total": 0, "open": 0, "closed": 0, "total_votes": 0}
+        assert not any(s.startswith("SELECT *") for s in statements)
+        assert "Son 4 Hafta" in statistics.format_statistics_report(stats)
@@ -0,0 +1,93 @@
+"""
+İstatistik rollup tablosu (stats_snapshots) ve trend testleri.
+"""
+
+from datetime import datetime, timedelta
+import pytest
+from src.repositories import (
+    UserRepository, MatchRepository, HelpRepository, FeedbackRepository, PollRepository, VoteRepository,
+    ChallengeHubRepository, ChallengeParticipantRepository, ChallengeEvaluationRepository,
+    StatsSnapshotRepository,
+)
+from src.services.statistics_service import StatisticsService
+
+NOW = datetime.utcnow()
+
+
+def _ts(days_ago: int) -> str:
+    return (NOW - timedelta(days=days_ago)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+@pytest.fixture
+def history(db_client):
+    """Son günlere yayılmış eşleşme, yardım ve challenge geçmişi."""
+    UserRepository(db_client).create_many([
+        {"slack_id": "U1", "full_name": "A", "cohort": "Yapay Zeka"},
+        {"slack_id": "U2", "full_name": "B", "cohort": "Yapay Zeka"},
+        {"slack_id": "U3", "full_name": "C", "cohort": "Veri Bilimi"},
+    ])
+    MatchRepository(db_client).create_many(
+        [{"user1_id": "U1", "user2_id": "U2", "created_at": _ts(d)} for d in (0, 0, 1, 3)]
+    )
+    HelpRepository(db_client).create_many([
+        {"requester_id": "U1", "topic": "SQL", "description": "?", "status": "resolved", "resolved_at": _ts(d)}
+        for d in (0, 8)
+    ])
+
+    hubs, participants = ChallengeHubRepository(db_client), ChallengeParticipantRepository(db_client)
+    evaluations = ChallengeEvaluationRepository(db_client)
+    for hub_id, members, result in (("H1", ("U1", "U2"), "success"), ("H2", ("U1", "U3"), "failed")):
+        hubs.create({"id": hub_id, "creator_id": "U1", "theme": "AI", "team_size": 2})
+        participants.create_many([{"challenge_hub_id": hub_id, "user_id": u} for u in members])
+        evaluations.create({"challenge_hub_id": hub_id, "status": "completed", "final_result": result, "completed_at": _ts(2)})
+    return StatsSnapshotRepository(db_client)
+
+
+class TestStatsSnapshots:
+    """Rollup hesaplama, artımlı güncelleme ve trend okuma testleri."""
+
+    def test_rollup_counts_daily_buckets(self, history):
+        history.rollup("day")
+        day = lambda d: (NOW - timedelta(days=d)).strftime("%Y-%m-%d")
+
+        assert history.series("day", "matches_created", NOW - timedelta(days=7)) == {day(3): 1, day(1): 1, day(0): 2}
+        assert history.series("day", "help_resolved", NOW - timedelta(days=30)) == {day(8): 1, day(0): 1}
+        assert history.totals_by_dimension("day", "challenge_success") == {"Yapay Zeka": 2}
+        assert history.totals_by_dimension("day", "challenge_failed") == {"Yapay Zeka": 1, "Veri Bilimi": 1}
+
+    def test_incremental_rollup_only_rescans_recent_buckets(self, history, db_client):
+        """İkinci çalıştırma yalnızca son bucket'lardan başlamalı ve eski bucket'lara dokunmamalı."""
+        first = history.rollup("day")
+        assert first["since"] == ""
+
+        MatchRepository(db_client).create({"user1_id": "U1", "user2_id": "U3"})
+        second = history.rollup("day")
+        assert second["since"] == (NOW - timedelta(days=1)).strftime("%Y-%m-%d")
+
+        series = history.series("day", "matches_created", NOW - timedelta(days=7))
+        assert series[NOW.strftime("%Y-%m-%d")] == 3
+        assert sum(series.values()) == 5
+
+    def test_hourly_buckets_respect_retention(self, history):
+        history.backfill()
+        hourly = history.series("hour", "help_resolved", NOW - timedelta(days=30))
+        # 8 gün önceki kayıt saklama süresi (14 gün) içinde, bugünkü de
+        assert sum(hourly.values()) == 2
+        assert all(len(bucket) == len("2024-01-01 00:00") for bucket in hourly)
+
+    def test_trends_rendered_from_rollup(self, history, db_client):
+        service = StatisticsService(
+            UserRepository(db_client), MatchRepository(db_client), HelpRepository(db_client),
+            FeedbackRepository(db_client), PollRepository(db_client), VoteRepository(db_client), history
+        )
+        service.refresh_snapshots()
+        trends = service.get_all_statistics()["trends"]
+
+        assert len(trends["daily_matches"]) == 14
+        assert sum(trends["daily_matches"].values()) == 4
+        assert sum(trends["weekly_help_resolved"].values()) == 2
+        assert trends["completion_by_cohort"]["Yapay Zeka"] == {"success": 2, "total": 3, "rate": 0.667}
+
+        report = service.format_trends_report(trends)
+        assert "Yapay Zeka: %67 (2/3)" in report
+        assert "Veri Bilimi: %0 (0/1)" in report
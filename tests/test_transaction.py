@@ -0,0 +1,130 @@
+"""
+Transaction yöneticisi (SAVEPOINT, ambient transaction, kilit tekrarı) testleri.
+"""
+
+import sqlite3
+import threading
+import pytest
+from src.core.singleton import SingletonMeta
+from src.core.exceptions import DatabaseError
+from src.core.transaction import transaction, run_in_transaction, is_busy_error
+from src.clients.database_client import DatabaseClient
+from src.repositories import UserRepository, PollRepository, VoteRepository, UserChallengeStatsRepository
+from src.services.voting_service import VotingService
+
+
+@pytest.fixture
+def fast_busy_db(temp_db):
+    """Kilit beklemesi kısa tutulmuş DatabaseClient (tekrar denemeleri hızlı gözlemlemek için)."""
+    SingletonMeta._instances.pop(DatabaseClient, None)
+    client = DatabaseClient(db_path=temp_db, pool_size=2, pragmas={"busy_timeout": 20})
+    yield client
+    client.close()
+    SingletonMeta._instances.pop(DatabaseClient, None)
+
+
+class TestTransaction:
+    """İç içe transaction ve repository katılımı testleri."""
+
+    def test_nested_savepoint_rolls_back_only_inner(self, db_client):
+        """İçteki blok hata verirse yalnızca kendi değişiklikleri geri alınmalı."""
+        users = UserRepository(db_client)
+        with transaction(db_client):
+            users.create({"slack_id": "U1", "full_name": "Dış"})
+            with pytest.raises(ValueError):
+                with transaction(db_client):
+                    users.create({"slack_id": "U2", "full_name": "İç"})
+                    raise ValueError("iptal")
+
+        assert users.get_by_slack_id("U1") is not None
+        assert users.get_by_slack_id("U2") is None
+
+    def test_repositories_join_ambient_transaction(self, db_client):
+        """Blok içindeki repository yazmaları tek commit'le yazılmalı, hata olursa hepsi geri alınmalı."""
+        users = UserRepository(db_client)
+        with pytest.raises(RuntimeError):
+            with transaction(db_client):
+                users.create({"slack_id": "U1", "full_name": "A"})
+                users.create({"slack_id": "U2", "full_name": "B"})
+                raise RuntimeError("vazgeç")
+        assert users.list() == []
+
+        statements = []
+        checkouts_before = db_client.get_pool_stats()["checkouts"]
+        with transaction(db_client) as conn:
+            conn.set_trace_callback(statements.append)
+            users.create({"slack_id": "U1", "full_name": "A"})
+            users.create({"slack_id": "U2", "full_name": "B"})
+        conn.raw.set_trace_callback(None)
+        checkouts = db_client.get_pool_stats()["checkouts"] - checkouts_before
+
+        assert len(users.list()) == 2
+        assert sum(s.strip().upper() == "COMMIT" for s in statements) == 1
+        # İç repository çağrıları havuzdan yeni bağlantı kiralamamalı
+        assert checkouts == 1
+
+    def test_sqlite_errors_are_wrapped(self, db_client):
+        """sqlite3 hataları DatabaseError'a çevrilmeli."""
+        with pytest.raises(DatabaseError):
+            with transaction(db_client) as conn:
+                conn.execute("INSERT INTO olmayan_tablo VALUES (1)")
+
+    def test_stats_increment_in_single_transaction(self, db_client):
+        """İstatistik artışları doğru birikmeli."""
+        UserRepository(db_client).create({"slack_id": "U1", "full_name": "A"})
+        stats = UserChallengeStatsRepository(db_client)
+        stats.add_points("U1", 10)
+        stats.add_points("U1", 5)
+        stats.increment_completed("U1")
+        row = stats.get_or_create("U1")
+        assert (row["total_points"], row["completed_challenges"]) == (15, 1)
+
+
+class TestBusyRetry:
+    """"database is locked" durumunda tekrar deneme testleri."""
+
+    def _hold_write_lock(self, path: str, seconds: float) -> threading.Thread:
+        locker = sqlite3.connect(path, check_same_thread=False)
+        locker.execute("BEGIN IMMEDIATE")
+        timer = threading.Timer(seconds, lambda: (locker.rollback(), locker.close()))
+        timer.start()
+        return timer
+
+    def test_begin_retries_until_lock_released(self, fast_busy_db):
+        """Kilit kısa süre sonra bırakılırsa transaction tekrar deneyerek başarılı olmalı."""
+        timer = self._hold_write_lock(fast_busy_db.db_path, 0.2)
+        with transaction(fast_busy_db, retries=10, backoff=0.02, max_backoff=0.1) as conn:
+            conn.execute("INSERT INTO feedbacks (id, content) VALUES ('F1', 'x')")
+        timer.join()
+        with fast_busy_db.get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM feedbacks").fetchone()[0] == 1
+
+    def test_gives_up_after_retries(self, fast_busy_db):
+        """Tekrarlar tükenince kilit hatası DatabaseError olarak yükseltilmeli."""
+        timer = self._hold_write_lock(fast_busy_db.db_path, 1.0)
+        try:
+            with pytest.raises(DatabaseError) as excinfo:
+                run_in_transaction(fast_busy_db, lambda: None, retries=1, backoff=0.01)
+            assert is_busy_error(excinfo.value)
+        finally:
+            timer.join()
+
+
+class TestCastVote:
+    """VotingService.cast_vote tek transaction'da toggle / switch mantığı."""
+
+    def test_toggle_and_switch(self, db_client):
+        UserRepository(db_client).create({"slack_id": "U1", "full_name": "A"})
+        polls, votes = PollRepository(db_client), VoteRepository(db_client)
+        poll_id = polls.create({
+            "topic": "Konu", "options": '["a", "b"]', "creator_id": "U1", "allow_multiple": 0, "is_closed": 0
+        })
+        service = VotingService(None, polls, votes, None)
+
+        assert service.cast_vote(poll_id, "U1", 0)["message"] == "Oyunuz kaydedildi!"
+        assert service.cast_vote(poll_id, "U1", 1)["success"]
+        assert not votes.has_user_voted(poll_id, "U1", 0)
+        assert votes.has_user_voted(poll_id, "U1", 1)
+
+        assert service.cast_vote(poll_id, "U1", 1)["message"] == "Oyunuz geri alındı."
+        assert not votes.has_user_voted(poll_id, "U1")
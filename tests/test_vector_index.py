@@ -0,0 +1,114 @@
+"""
+FAISS indeks fabrikası (flat / ivf / hnsw / ivfpq) testleri.
+"""
+
+import faiss
+import numpy as np
+import pytest
+from src.clients.vector_index import (
+    VectorIndexConfig,
+    build_index,
+    index_kind,
+    needs_rebuild,
+    remove_ids,
+    resolve_index_type,
+    search_index,
+)
+
+DIMENSION = 32
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    """Birim uzunlukta, kümeli sentetik gömmeler (cümle gömmelerine benzer dağılım)."""
+    rng = np.random.default_rng(7)
+    centers = rng.normal(size=(20, DIMENSION))
+    vectors = centers[rng.integers(0, 20, size=3000)] + 0.3 * rng.normal(size=(3000, DIMENSION))
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors.astype("float32")
+
+
+class TestIndexSelection:
+    """Korpus boyutuna göre indeks tipi seçimi"""
+
+    def test_auto_switches_to_ivf(self):
+        """auto: eşiğin altında flat, üstünde ivf."""
+        config = VectorIndexConfig(auto_ivf_threshold=5000)
+        assert resolve_index_type(config, 4999) == "flat"
+        assert resolve_index_type(config, 5000) == "ivf"
+
+    def test_trained_types_fall_back_on_small_corpus(self):
+        """Eğitim için yeterli vektör yoksa ivf -> flat, ivfpq -> ivf."""
+        assert resolve_index_type(VectorIndexConfig(index_type="ivf"), 10) == "flat"
+        assert resolve_index_type(VectorIndexConfig(index_type="ivfpq"), 2000) == "ivf"
+        assert resolve_index_type(VectorIndexConfig(index_type="ivfpq", pq_bits=4), 2000) == "ivfpq"
+
+    def test_invalid_type(self):
+        with pytest.raises(ValueError):
+            resolve_index_type(VectorIndexConfig(index_type="lsh"), 100)
+
+
+class TestBuildIndex:
+    """İndeks kurma, arama ayarları ve yeniden eğitim kararı"""
+
+    @pytest.mark.parametrize("index_type, options", [
+        ("flat", {}),
+        ("ivf", {"nprobe": 8}),
+        ("hnsw", {"ef_search": 32}),
+        ("ivfpq", {"pq_m": 8, "pq_bits": 4, "nprobe": 8}),
+    ])
+    def test_finds_nearest_neighbors(self, corpus, index_type, options):
+        """Her tip, korpustaki bir vektörle yapılan sorguda çoğunlukla kendisini ilk sırada bulur."""
+        index = build_index(VectorIndexConfig(index_type=index_type, **options), DIMENSION, corpus)
+        assert index_kind(index) == index_type
+        assert index.ntotal == len(corpus)
+
+        _, ids = index.search(corpus[:100], 1)
+        assert (ids[:, 0] == np.arange(100)).mean() >= 0.9
+
+    def test_nprobe_survives_reload(self, corpus):
+        """nprobe küme sayısıyla sınırlanır ve diske yazılıp okunduktan sonra korunur."""
+        index = build_index(VectorIndexConfig(index_type="ivf", nlist=16, nprobe=64), DIMENSION, corpus)
+        reloaded = faiss.deserialize_index(faiss.serialize_index(index))
+        assert faiss.extract_index_ivf(reloaded).nprobe == 16
+
+    def test_remove_ids(self, corpus):
+        """Silinen parça id'leri aramada dönmez; HNSW silmeyi desteklemez (yeniden kurulur)."""
+        ids = np.arange(100, 100 + len(corpus))
+        index = build_index(VectorIndexConfig(index_type="ivf", nlist=16, nprobe=16), DIMENSION, corpus, ids)
+        assert remove_ids(index, [100, 101])
+
+        _, found = index.search(corpus[:3], 1)
+        assert found[:, 0].tolist()[2] == 102
+        assert not {100, 101} & set(found.ravel().tolist())
+        assert index.ntotal == len(corpus) - 2
+
+        hnsw = build_index(VectorIndexConfig(index_type="hnsw"), DIMENSION, corpus[:200])
+        assert not remove_ids(hnsw, [0])
+
+    def test_needs_rebuild(self, corpus):
+        """Tip değişince veya IVF korpusu retrain_growth katına ulaşınca yeniden kurulur."""
+        auto = VectorIndexConfig(auto_ivf_threshold=2000)
+        flat = build_index(auto, DIMENSION, corpus[:1000])
+        assert not needs_rebuild(flat, auto, 1000, 1999)
+        assert needs_rebuild(flat, auto, 1000, 2000)
+
+        ivf = build_index(auto, DIMENSION, corpus[:2000])
+        assert not needs_rebuild(ivf, auto, 2000, 3999)
+        assert needs_rebuild(ivf, auto, 2000, 4000)
+        assert needs_rebuild(None, auto, 0, 10)
+
+    def test_pq_refine_restores_exact_order(self, corpus):
+        """IVF-PQ adayları ham vektörlerle yeniden sıralanınca ilk k, flat indeksle aynı çıkar."""
+        config = VectorIndexConfig(index_type="ivfpq", pq_m=4, pq_bits=4, nprobe=16, pq_refine=20)
+        index = build_index(config, DIMENSION, corpus)
+        _, truth = build_index(VectorIndexConfig(index_type="flat"), DIMENSION, corpus).search(corpus[:50], 5)
+
+        _, approx = search_index(index, config._replace(pq_refine=0), corpus[:50], 5, corpus)
+        _, refined = search_index(index, config, corpus[:50], 5, corpus)
+
+        def recall(ids):
+            return np.mean([len(set(a) & set(b)) / 5 for a, b in zip(ids, truth)])
+
+        assert recall(refined) >= 0.95
+        assert recall(refined) > recall(approx)